@@ -1,6 +1,26 @@
 """
 Seedline Activity Logger
 Tracks user sessions, page views, API calls, and suspicious behavior.
+
+Writes are write-behind: create_session, update_session_user, log_page_view,
+update_page_time and log_api_call put an event on a bounded in-memory queue
+and return. One background writer drains it every FLUSH_INTERVAL seconds (or
+as soon as BATCH_SIZE events are waiting) and writes each batch in a single
+transaction:
+
+  - inserts go through executemany (sessions, page_views, api_calls)
+  - per-session page view / API call counters are summed per batch, so a busy
+    session costs one UPDATE per flush instead of one per event
+  - blocklist checks for new sessions and sequential-browsing checks for page
+    views run on the writer, after the batch commits
+  - IP geolocation lookups (an HTTP call) run on their own thread and update
+    the session row when they finish
+
+When the queue is full, log_page_view / log_api_call / update_page_time events
+are dropped and counted; session events wait up to BACKPRESSURE_WAIT seconds
+first. Page view ids are allocated in memory so log_page_view can still return
+one. flush() / shutdown() (also registered with atexit) write everything that
+is queued. writer_stats() reports queue depth, batches and drops.
 """
 
 import sqlite3
@@ -10,11 +30,17 @@ import hashlib
 import uuid
 import urllib.request
 import ssl
-from datetime import datetime, timedelta
+import atexit
+import queue
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from collections import defaultdict
 from threading import Lock
 from pathlib import Path
 
+from rate_limiter import RateLimiter
+
 # Cache for IP info lookups to avoid repeated API calls
 _ip_info_cache = {}
 _ip_cache_lock = Lock()
@@ -26,9 +52,8 @@ SCHEMA_PATH = Path(__file__).parent / "seedline_activity.db.sql"
 # Thread lock for database writes
 db_lock = Lock()
 
-# In-memory rate limiting cache
-rate_limit_cache = defaultdict(list)  # ip -> [timestamps]
-rate_limit_lock = Lock()
+# Per-IP request limits (token buckets, idle IPs evicted)
+IP_RATE_LIMITER = RateLimiter()
 
 # Suspicious behavior thresholds
 SUSPICIOUS_RULES = {
@@ -59,14 +84,12 @@ SUSPICIOUS_RULES = {
     }
 }
 
-# Rate limits by account type
-RATE_LIMITS = {
-    "guest": 30,      # requests per minute
-    "free": 60,
-    "paid": 120,
-    "coach": 120,
-    "admin": 300
-}
+# Write-behind logging
+QUEUE_SIZE = 20000         # Events held in memory before dropping
+BATCH_SIZE = 500           # Events written per transaction (at most)
+FLUSH_INTERVAL = 0.5       # Seconds between flushes when the queue is quiet
+BACKPRESSURE_WAIT = 1.0    # Seconds session events wait for room in a full queue
+IP_LOOKUP_QUEUE_SIZE = 1000
 
 
 def init_database():
@@ -95,21 +118,10 @@ def generate_session_id():
     return str(uuid.uuid4())
 
 
-def check_ip_info(ip_address):
+def cached_ip_info(ip_address):
     """
-    Check IP address for VPN/proxy/hosting detection using ip-api.com.
-
-    Returns dict with:
-    - is_vpn: bool
-    - is_proxy: bool
-    - is_hosting: bool (datacenter IP)
-    - is_mobile: bool
-    - country: str
-    - region: str
-    - city: str
-    - isp: str
-    - org: str
-    - as_name: str (ASN name)
+    IP info without a network call: fixed values for local addresses, the
+    cached lookup if it is under 24 hours old, otherwise None.
     """
     if not ip_address or ip_address in ('127.0.0.1', 'localhost', 'unknown', '::1'):
         return {
@@ -125,13 +137,34 @@ def check_ip_info(ip_address):
             'as_name': ''
         }
 
-    # Check cache first
     with _ip_cache_lock:
-        if ip_address in _ip_info_cache:
-            cached = _ip_info_cache[ip_address]
-            # Cache for 24 hours
-            if cached.get('_cached_at', 0) > datetime.now().timestamp() - 86400:
-                return cached
+        cached = _ip_info_cache.get(ip_address)
+        # Cache for 24 hours
+        if cached and cached.get('_cached_at', 0) > datetime.now().timestamp() - 86400:
+            return cached
+    return None
+
+
+def check_ip_info(ip_address):
+    """
+    Check IP address for VPN/proxy/hosting detection using ip-api.com.
+
+    Returns dict with:
+    - is_vpn: bool
+    - is_proxy: bool
+    - is_hosting: bool (datacenter IP)
+    - is_mobile: bool
+    - country: str
+    - region: str
+    - city: str
+    - isp: str
+    - org: str
+    - as_name: str (ASN name)
+    """
+    # Local addresses and the cache first
+    cached = cached_ip_info(ip_address)
+    if cached is not None:
+        return cached
 
     try:
         # Use ip-api.com with extended fields for VPN/proxy detection
@@ -222,6 +255,20 @@ def hash_fingerprint(fingerprint_data):
     return hashlib.sha256(fingerprint_data.encode()).hexdigest()
 
 
+def _utc_now():
+    """Timestamp in the format the schema's datetime('now') defaults use"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _flag(value):
+    return 1 if value else (0 if value is False else None)
+
+
+def _id_text(value):
+    # Entity ids come straight from request JSON and may be numbers
+    return None if value is None else str(value)
+
+
 def create_session(device_info, ip_address=None, user_id=None, firebase_uid=None, account_type='guest'):
     """
     Create a new session and return the session_id.
@@ -248,92 +295,62 @@ def create_session(device_info, ip_address=None, user_id=None, firebase_uid=None
     }
     fingerprint_hash = hash_fingerprint(fingerprint_data)
 
-    # Check IP for VPN/proxy detection (async-friendly, with caching)
-    ip_info = check_ip_info(ip_address)
-
-    with db_lock:
-        conn = get_db_connection()
-        try:
-            conn.execute("""
-                INSERT INTO sessions (
-                    session_id, user_id, firebase_uid, account_type,
-                    ip_address, user_agent, screen_width, screen_height,
-                    color_depth, pixel_ratio, timezone, timezone_offset,
-                    language, languages, platform, vendor,
-                    hardware_concurrency, max_touch_points, cookies_enabled,
-                    do_not_track, fingerprint_hash, referrer, landing_page,
-                    utm_source, utm_medium, utm_campaign, utm_term, utm_content,
-                    ip_country, ip_region, ip_city, ip_isp, ip_org, ip_asn,
-                    is_vpn, is_proxy, is_hosting, is_mobile
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                session_id, user_id, firebase_uid, account_type,
-                ip_address,
-                device_info.get("userAgent"),
-                device_info.get("screenWidth"),
-                device_info.get("screenHeight"),
-                device_info.get("colorDepth"),
-                device_info.get("pixelRatio"),
-                device_info.get("timezone"),
-                device_info.get("timezoneOffset"),
-                device_info.get("language"),
-                json.dumps(device_info.get("languages", [])),
-                device_info.get("platform"),
-                device_info.get("vendor"),
-                device_info.get("hardwareConcurrency"),
-                device_info.get("maxTouchPoints"),
-                1 if device_info.get("cookiesEnabled") else 0,
-                device_info.get("doNotTrack"),
-                fingerprint_hash,
-                device_info.get("referrer"),
-                device_info.get("landingPage"),
-                device_info.get("utm_source"),
-                device_info.get("utm_medium"),
-                device_info.get("utm_campaign"),
-                device_info.get("utm_term"),
-                device_info.get("utm_content"),
-                # IP geolocation and VPN detection
-                ip_info.get('country'),
-                ip_info.get('region'),
-                ip_info.get('city'),
-                ip_info.get('isp'),
-                ip_info.get('org'),
-                ip_info.get('as_name'),
-                1 if ip_info.get('is_vpn') else (0 if ip_info.get('is_vpn') is False else None),
-                1 if ip_info.get('is_proxy') else (0 if ip_info.get('is_proxy') is False else None),
-                1 if ip_info.get('is_hosting') else (0 if ip_info.get('is_hosting') is False else None),
-                1 if ip_info.get('is_mobile') else (0 if ip_info.get('is_mobile') is False else None)
-            ))
-            conn.commit()
-
-            # Check if IP or fingerprint is blocked
-            is_blocked = check_blocklist(conn, ip_address, fingerprint_hash)
-            if is_blocked:
-                conn.execute("""
-                    UPDATE sessions SET is_blocked = 1, blocked_reason = ?
-                    WHERE session_id = ?
-                """, (is_blocked, session_id))
-                conn.commit()
-
-        finally:
-            conn.close()
-
+    # IP geolocation / VPN detection: cached or local answers go in now,
+    # anything else is looked up off the request thread
+    ip_info = cached_ip_info(ip_address)
+    lookup_needed = ip_info is None
+    if lookup_needed:
+        ip_info = {}
+
+    row = (
+        session_id, user_id, firebase_uid, account_type,
+        ip_address,
+        device_info.get("userAgent"),
+        device_info.get("screenWidth"),
+        device_info.get("screenHeight"),
+        device_info.get("colorDepth"),
+        device_info.get("pixelRatio"),
+        device_info.get("timezone"),
+        device_info.get("timezoneOffset"),
+        device_info.get("language"),
+        json.dumps(device_info.get("languages", [])),
+        device_info.get("platform"),
+        device_info.get("vendor"),
+        device_info.get("hardwareConcurrency"),
+        device_info.get("maxTouchPoints"),
+        1 if device_info.get("cookiesEnabled") else 0,
+        device_info.get("doNotTrack"),
+        fingerprint_hash,
+        device_info.get("referrer"),
+        device_info.get("landingPage"),
+        device_info.get("utm_source"),
+        device_info.get("utm_medium"),
+        device_info.get("utm_campaign"),
+        device_info.get("utm_term"),
+        device_info.get("utm_content"),
+        # IP geolocation and VPN detection
+        ip_info.get('country'),
+        ip_info.get('region'),
+        ip_info.get('city'),
+        ip_info.get('isp'),
+        ip_info.get('org'),
+        ip_info.get('as_name'),
+        _flag(ip_info.get('is_vpn')),
+        _flag(ip_info.get('is_proxy')),
+        _flag(ip_info.get('is_hosting')),
+        _flag(ip_info.get('is_mobile')),
+        _utc_now(),
+    )
+    _writer.submit('session', row, wait=True)
+    # Queued after the session row so its UPDATE never runs before the INSERT
+    if lookup_needed:
+        _writer.lookup_ip(session_id, ip_address)
     return session_id
 
 
 def update_session_user(session_id, user_id, firebase_uid, account_type):
     """Update session with authenticated user info."""
-    with db_lock:
-        conn = get_db_connection()
-        try:
-            conn.execute("""
-                UPDATE sessions
-                SET user_id = ?, firebase_uid = ?, account_type = ?, last_activity = datetime('now')
-                WHERE session_id = ?
-            """, (user_id, firebase_uid, account_type, session_id))
-            conn.commit()
-        finally:
-            conn.close()
+    _writer.submit('session_user', (user_id, firebase_uid, account_type, _utc_now(), session_id), wait=True)
 
 
 def log_page_view(session_id, page_type, page_path, entity_type=None, entity_id=None,
@@ -343,89 +360,352 @@ def log_page_view(session_id, page_type, page_path, entity_type=None, entity_id=
     Log a page view event.
 
     Returns:
-        page_view_id: int
+        page_view_id: int (allocated now; the row is written on the next flush)
     """
-    with db_lock:
-        conn = get_db_connection()
-        try:
-            cursor = conn.execute("""
-                INSERT INTO page_views (
-                    session_id, user_id, page_type, page_path, page_params,
-                    entity_type, entity_id, entity_name,
-                    previous_page, previous_entity_id, navigation_method
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                session_id, user_id, page_type, page_path,
-                json.dumps(page_params) if page_params else None,
-                entity_type, entity_id, entity_name,
-                previous_page, previous_entity_id, navigation_method
-            ))
-            page_view_id = cursor.lastrowid
-
-            # Update session stats
-            conn.execute("""
-                UPDATE sessions
-                SET page_view_count = page_view_count + 1, last_activity = datetime('now')
-                WHERE session_id = ?
-            """, (session_id,))
-
-            conn.commit()
-
-            # Check for suspicious patterns (async-safe)
-            check_suspicious_patterns(conn, session_id, entity_type, entity_id, previous_entity_id)
-
-        finally:
-            conn.close()
-
+    page_view_id = _writer.next_page_view_id()
+    _writer.submit('page_view', (
+        page_view_id, session_id, user_id, page_type, page_path,
+        json.dumps(page_params) if page_params else None,
+        entity_type, entity_id, entity_name,
+        previous_page, previous_entity_id, navigation_method,
+        _utc_now()
+    ))
     return page_view_id
 
 
 def update_page_time(page_view_id, time_on_page_ms, max_scroll_depth=None):
     """Update time spent on a page (called when user leaves page)."""
-    with db_lock:
-        conn = get_db_connection()
-        try:
-            conn.execute("""
-                UPDATE page_views
-                SET time_on_page_ms = ?, max_scroll_depth = ?
-                WHERE id = ?
-            """, (time_on_page_ms, max_scroll_depth, page_view_id))
-            conn.commit()
-        finally:
-            conn.close()
+    _writer.submit('page_time', (time_on_page_ms, max_scroll_depth, page_view_id))
 
 
 def log_api_call(endpoint, method, session_id=None, user_id=None, ip_address=None,
                  params=None, status_code=None, response_time_ms=None,
                  response_size_bytes=None, error_message=None, was_rate_limited=False):
     """Log an API call."""
-    with db_lock:
-        conn = get_db_connection()
+    _writer.submit('api_call', (
+        session_id, user_id, ip_address, endpoint, method,
+        json.dumps(params) if params else None,
+        status_code, response_time_ms, response_size_bytes,
+        error_message, 1 if was_rate_limited else 0,
+        _utc_now()
+    ))
+
+
+# ============================================================================
+# WRITE-BEHIND WRITER
+# ============================================================================
+
+SESSION_INSERT = """
+    INSERT INTO sessions (
+        session_id, user_id, firebase_uid, account_type,
+        ip_address, user_agent, screen_width, screen_height,
+        color_depth, pixel_ratio, timezone, timezone_offset,
+        language, languages, platform, vendor,
+        hardware_concurrency, max_touch_points, cookies_enabled,
+        do_not_track, fingerprint_hash, referrer, landing_page,
+        utm_source, utm_medium, utm_campaign, utm_term, utm_content,
+        ip_country, ip_region, ip_city, ip_isp, ip_org, ip_asn,
+        is_vpn, is_proxy, is_hosting, is_mobile, created_at, last_activity
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+PAGE_VIEW_INSERT = """
+    INSERT INTO page_views (
+        id, session_id, user_id, page_type, page_path, page_params,
+        entity_type, entity_id, entity_name,
+        previous_page, previous_entity_id, navigation_method, timestamp
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+API_CALL_INSERT = """
+    INSERT INTO api_calls (
+        session_id, user_id, ip_address, endpoint, method, params,
+        status_code, response_time_ms, response_size_bytes,
+        error_message, was_rate_limited, timestamp
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class ActivityWriter:
+    """Bounded event queue drained in batches by one background thread"""
+
+    def __init__(self, queue_size=QUEUE_SIZE, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._ip_queue = queue.Queue(maxsize=IP_LOOKUP_QUEUE_SIZE)
+        self._lock = Lock()
+        self._thread = None
+        self._ip_thread = None
+        self._stopping = False
+        self._next_page_view_id = None
+        self._flushed = threading.Condition(self._lock)
+        self._submitted = 0
+        self._written = 0
+        self.stats = {
+            'enqueued': 0, 'written': 0, 'batches': 0, 'largest_batch': 0,
+            'dropped': defaultdict(int), 'errors': 0, 'flush_seconds': 0.0,
+            'ip_lookups': 0, 'ip_lookups_dropped': 0,
+        }
+
+    # ─── Producer side (request threads) ─────────────────────────────────────
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='activity-writer', daemon=True)
+                    self._thread.start()
+
+    def submit(self, kind, row, wait=False):
+        """Queue one event. Returns False if it was dropped (queue full)."""
+        self._ensure_started()
         try:
-            conn.execute("""
-                INSERT INTO api_calls (
-                    session_id, user_id, ip_address, endpoint, method, params,
-                    status_code, response_time_ms, response_size_bytes,
-                    error_message, was_rate_limited
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                session_id, user_id, ip_address, endpoint, method,
-                json.dumps(params) if params else None,
-                status_code, response_time_ms, response_size_bytes,
-                error_message, 1 if was_rate_limited else 0
-            ))
-
-            # Update session API call count
-            if session_id:
-                conn.execute("""
-                    UPDATE sessions
-                    SET api_call_count = api_call_count + 1, last_activity = datetime('now')
+            if wait:
+                self._queue.put((kind, row), timeout=BACKPRESSURE_WAIT)
+            else:
+                self._queue.put_nowait((kind, row))
+        except queue.Full:
+            with self._lock:
+                self.stats['dropped'][kind] += 1
+            return False
+        with self._lock:
+            self._submitted += 1
+            self.stats['enqueued'] += 1
+        return True
+
+    def next_page_view_id(self):
+        """Allocate a page_views id (continuing from the table's highest)"""
+        with self._lock:
+            if self._next_page_view_id is None:
+                conn = get_db_connection()
+                try:
+                    row = conn.execute("SELECT MAX(id) FROM page_views").fetchone()
+                    seq = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'page_views'").fetchone()
+                finally:
+                    conn.close()
+                self._next_page_view_id = max(row[0] or 0, seq[0] if seq else 0) + 1
+            page_view_id = self._next_page_view_id
+            self._next_page_view_id += 1
+            return page_view_id
+
+    def lookup_ip(self, session_id, ip_address):
+        """Queue an IP geolocation lookup; the session row is updated when it finishes"""
+        if self._ip_thread is None:
+            with self._lock:
+                if self._ip_thread is None:
+                    self._ip_thread = threading.Thread(target=self._run_ip_lookups, name='activity-ip', daemon=True)
+                    self._ip_thread.start()
+        try:
+            self._ip_queue.put_nowait((session_id, ip_address))
+        except queue.Full:
+            with self._lock:
+                self.stats['ip_lookups_dropped'] += 1
+
+    # ─── Writer thread ───────────────────────────────────────────────────────
+
+    def _run(self):
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                if self._stopping:
+                    return
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            start = time.perf_counter()
+            try:
+                self._write(batch)
+            except Exception as e:
+                # Never let one bad batch kill the writer: later events would only pile up
+                print(f"[WARN] Activity log writer error ({len(batch)} events): {e!r}")
+                with self._lock:
+                    self.stats['errors'] += 1
+            finally:
+                with self._lock:
+                    self._written += len(batch)
+                    self.stats['written'] += len(batch)
+                    self.stats['batches'] += 1
+                    self.stats['largest_batch'] = max(self.stats['largest_batch'], len(batch))
+                    self.stats['flush_seconds'] += time.perf_counter() - start
+                    self._flushed.notify_all()
+
+    def _write(self, batch):
+        """One transaction for the batch; if it fails, one per event so a bad row only loses itself"""
+        try:
+            rows = self._commit(batch)
+        except Exception as e:  # sqlite3.Error, or a malformed row
+            if len(batch) == 1:
+                print(f"[WARN] Activity log write failed ({batch[0][0]}): {e}")
+                with self._lock:
+                    self.stats['errors'] += 1
+                return
+            print(f"[WARN] Activity log batch failed ({len(batch)} events), retrying one by one: {e}")
+            for event in batch:
+                self._write([event])
+            return
+
+        # Off the request path: blocklist and browsing-pattern checks
+        try:
+            with db_lock:
+                conn = get_db_connection()
+                try:
+                    self._check_new_sessions(conn, rows['session'])
+                    for row in rows['page_view']:
+                        check_suspicious_patterns(conn, row[1], row[6], _id_text(row[7]), _id_text(row[10]))
+                finally:
+                    conn.close()
+        except Exception as e:
+            print(f"[WARN] Activity pattern checks failed ({len(batch)} events): {e}")
+            with self._lock:
+                self.stats['errors'] += 1
+
+    def _commit(self, batch):
+        """Write the batch in one transaction; returns its rows grouped by event type"""
+        rows = defaultdict(list)
+        for kind, row in batch:
+            rows[kind].append(row)
+
+        # Session counters: one UPDATE per session per batch
+        counters = {}
+        for row in rows['page_view']:
+            count = counters.setdefault(row[1], [0, 0, row[12]])
+            count[0] += 1
+            count[2] = max(count[2], row[12])
+        for row in rows['api_call']:
+            if row[0]:
+                count = counters.setdefault(row[0], [0, 0, row[11]])
+                count[1] += 1
+                count[2] = max(count[2], row[11])
+        # Only the last time-on-page update per page view matters
+        page_times = {row[2]: row for row in rows['page_time']}
+
+        with db_lock:
+            conn = get_db_connection()
+            try:
+                with conn:
+                    if rows['session']:
+                        conn.executemany(SESSION_INSERT, [row + (row[-1],) for row in rows['session']])
+                    if rows['session_user']:
+                        conn.executemany("""
+                            UPDATE sessions
+                            SET user_id = ?, firebase_uid = ?, account_type = ?, last_activity = ?
+                            WHERE session_id = ?
+                        """, rows['session_user'])
+                    if rows['session_ip']:
+                        conn.executemany("""
+                            UPDATE sessions
+                            SET ip_country = ?, ip_region = ?, ip_city = ?, ip_isp = ?, ip_org = ?, ip_asn = ?,
+                                is_vpn = ?, is_proxy = ?, is_hosting = ?, is_mobile = ?
+                            WHERE session_id = ?
+                        """, rows['session_ip'])
+                    if rows['page_view']:
+                        conn.executemany(PAGE_VIEW_INSERT, rows['page_view'])
+                    if rows['api_call']:
+                        conn.executemany(API_CALL_INSERT, rows['api_call'])
+                    if counters:
+                        conn.executemany("""
+                            UPDATE sessions
+                            SET page_view_count = page_view_count + ?,
+                                api_call_count = api_call_count + ?,
+                                last_activity = MAX(COALESCE(last_activity, ''), ?)
+                            WHERE session_id = ?
+                        """, [(pv, api, at, sid) for sid, (pv, api, at) in counters.items()])
+                    if page_times:
+                        conn.executemany("""
+                            UPDATE page_views
+                            SET time_on_page_ms = ?, max_scroll_depth = ?
+                            WHERE id = ?
+                        """, list(page_times.values()))
+            finally:
+                conn.close()
+        return rows
+
+    def _check_new_sessions(self, conn, session_rows):
+        blocked = []
+        for row in session_rows:
+            reason = check_blocklist(conn, row[4], row[20])
+            if reason:
+                blocked.append((reason, row[0]))
+        if blocked:
+            with conn:
+                conn.executemany("""
+                    UPDATE sessions SET is_blocked = 1, blocked_reason = ?
                     WHERE session_id = ?
-                """, (session_id,))
-
-            conn.commit()
-        finally:
-            conn.close()
+                """, blocked)
+
+    def _run_ip_lookups(self):
+        while True:
+            session_id, ip_address = self._ip_queue.get()
+            info = check_ip_info(ip_address)
+            with self._lock:
+                self.stats['ip_lookups'] += 1
+            self.submit('session_ip', (
+                info.get('country'), info.get('region'), info.get('city'),
+                info.get('isp'), info.get('org'), info.get('as_name'),
+                _flag(info.get('is_vpn')), _flag(info.get('is_proxy')),
+                _flag(info.get('is_hosting')), _flag(info.get('is_mobile')),
+                session_id
+            ), wait=True)
+
+    # ─── Flush / shutdown ────────────────────────────────────────────────────
+
+    def flush(self, timeout=10.0):
+        """Wait until everything queued so far is written. Returns True if it was."""
+        if self._thread is None:
+            return True
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            target = self._submitted
+            while self._written < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._thread.is_alive():
+                    return False
+                self._flushed.wait(remaining)
+        return True
+
+    def shutdown(self, timeout=10.0):
+        """Write what is queued and stop the writer"""
+        flushed = self.flush(timeout)
+        self._stopping = True
+        if self._thread is not None:
+            self._thread.join(self.flush_interval * 2)
+        return flushed
+
+    def snapshot_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['dropped'] = dict(self.stats['dropped'])
+            stats['dropped_total'] = sum(stats['dropped'].values())
+            stats['queued'] = self._queue.qsize()
+            stats['ip_lookups_queued'] = self._ip_queue.qsize()
+            stats['flush_seconds'] = round(stats['flush_seconds'], 3)
+            return stats
+
+
+_writer = ActivityWriter()
+
+
+def flush(timeout=10.0):
+    """Block until queued activity events are written"""
+    return _writer.flush(timeout)
+
+
+def shutdown(timeout=10.0):
+    """Flush queued activity events and stop the writer (server shutdown)"""
+    return _writer.shutdown(timeout)
+
+
+def writer_stats():
+    """Queue depth, batches written, drops by event type"""
+    return _writer.snapshot_stats()
+
+
+atexit.register(shutdown)
 
 
 def check_rate_limit(ip_address, account_type='guest'):
@@ -435,29 +715,12 @@ def check_rate_limit(ip_address, account_type='guest'):
     Returns:
         (allowed: bool, remaining: int, reset_seconds: int)
     """
-    limit = RATE_LIMITS.get(account_type, RATE_LIMITS['guest'])
-    window_seconds = 60
-    now = datetime.now()
-    window_start = now - timedelta(seconds=window_seconds)
-
-    with rate_limit_lock:
-        # Clean old entries
-        rate_limit_cache[ip_address] = [
-            t for t in rate_limit_cache[ip_address]
-            if t > window_start
-        ]
-
-        current_count = len(rate_limit_cache[ip_address])
-
-        if current_count >= limit:
-            # Calculate reset time
-            oldest = min(rate_limit_cache[ip_address]) if rate_limit_cache[ip_address] else now
-            reset_seconds = int((oldest + timedelta(seconds=window_seconds) - now).total_seconds())
-            return False, 0, max(1, reset_seconds)
-
-        rate_limit_cache[ip_address].append(now)
-        remaining = limit - current_count - 1
-        return True, remaining, window_seconds
+    return IP_RATE_LIMITER.check(ip_address, account_type)
+
+
+def rate_limit_stats():
+    """Counters of the per-IP limiter (see rate_limiter.RateLimiter.stats)"""
+    return IP_RATE_LIMITER.stats()
 
 
 def check_suspicious_patterns(conn, session_id, entity_type, entity_id, previous_entity_id):
@@ -10,6 +10,8 @@ Provides API endpoints for database stats, scraper management, and user manageme
 USAGE:
     python admin_server.py                    # Start server on port 5050
     python admin_server.py --port 8080        # Custom port
+    python admin_server.py --threads 32       # Worker threads (default: 16)
+    python admin_server.py --single-threaded  # Old one-request-at-a-time server
 
 Then open admin_dashboard.html in your browser.
 
@@ -22,8 +24,11 @@ import json
 import sqlite3
 import subprocess
 import threading
+import select
+import socket
 import argparse
 import re
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from http.server import HTTPServer, BaseHTTPRequestHandler
@@ -36,11 +41,13 @@ try:
         init_database as init_activity_db,
         create_session, update_session_user, log_page_view, update_page_time,
         log_api_call, check_rate_limit, get_session_stats, get_suspicious_activity,
-        get_daily_stats, add_to_blocklist, ACTIVITY_DB_PATH
+        get_daily_stats, add_to_blocklist, ACTIVITY_DB_PATH,
+        writer_stats as activity_writer_stats, shutdown as shutdown_activity_writer,
+        rate_limit_stats, IP_RATE_LIMITER
     )
     from auth_middleware import (
         get_auth_from_request, verify_firebase_token, get_account_type_from_user,
-        check_user_rate_limit
+        check_user_rate_limit, user_rate_limit_stats, token_cache_stats
     )
     ACTIVITY_TRACKING_ENABLED = True
     print("[INFO] Activity tracking and auth middleware loaded")
@@ -49,6 +56,17 @@ except ImportError as e:
     print(f"[WARN] Activity tracking not available: {e}")
 import webbrowser
 
+from rankings_store import RankingsStore
+from search_index import DatabaseSearchIndex
+from response_cache import (
+    RESPONSE_CACHE, negotiate_encoding, compress, make_etag, representation_etag,
+    etag_matches, not_modified_since, http_date, database_version
+)
+from pooled_server import (
+    PooledHTTPServer, JobLimiter, install_shutdown_handlers,
+    DEFAULT_WORKERS, DEFAULT_BACKLOG, DEFAULT_REQUEST_TIMEOUT, DEFAULT_MAX_LONG_JOBS, SHUTDOWN_GRACE
+)
+
 # ============================================================================
 # CONFIGURATION - ADJUST THESE PATHS FOR YOUR SETUP
 # ============================================================================
@@ -233,6 +251,140 @@ def find_team_ranker():
 RANKER_PATH = find_team_ranker()
 RANKINGS_OUTPUT = SCRAPERS_FOLDER / "Run Rankings" / "rankings_for_react.json"
 
+# Columnar rankings reader (scrapers and data/Run Rankings/rankings_artifact.py).
+# Lets the API memory-map just the tables it needs instead of json.load-ing everything.
+try:
+    sys.path.append(str(SCRAPERS_FOLDER / "Run Rankings"))
+    import rankings_artifact
+    if not rankings_artifact.PYARROW_AVAILABLE:
+        print("[INFO] pyarrow not installed - rankings API will read rankings_for_react.json")
+except ImportError as e:
+    rankings_artifact = None
+    print(f"[WARN] Columnar rankings reader not available: {e}")
+
+try:
+    import rankings_shards
+except ImportError as e:
+    rankings_shards = None
+    print(f"[WARN] Sharded rankings layout not available: {e}")
+
+from user_store import UserStore
+from db_pool import DatabasePool, SLOW_QUERY_MS
+from pagination import (
+    CountCache, SORT_KEYS, cursor_scope, decode_cursor, encode_cursor, keyset_clause, ensure_indexes
+)
+from stats_snapshot import StatsSnapshot
+from log_tail import tail_lines, read_from, LINE_COUNTER
+from metrics import MetricsRegistry, CountingWriter, CONTENT_TYPE as METRICS_CONTENT_TYPE
+
+try:
+    import rankings_history
+except ImportError as e:
+    rankings_history = None
+    print(f"[WARN] Rankings history store not available: {e}")
+
+
+def get_rankings_path():
+    """Rankings JSON served by the API: the React public copy, else the ranker output"""
+    rankings_path = SCRIPT_DIR / "public" / "rankings_for_react.json"
+    if not rankings_path.exists():
+        rankings_path = RANKINGS_OUTPUT
+    return rankings_path
+
+
+def load_rankings_data(tables=('teamsData',), rankings_path=None):
+    """
+    Load only the given rankings tables (teamsData/gamesData/playersData) plus metadata.
+    Uses the columnar artifact next to the JSON when it is current, otherwise json.load.
+    Returns None if there is no rankings data.
+    """
+    rankings_path = rankings_path or get_rankings_path()
+    if rankings_artifact is not None:
+        return rankings_artifact.load_rankings(rankings_path, tables=tables)
+    if not rankings_path.exists():
+        return None
+    with open(rankings_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Process-wide rankings store for the /api/v1/rankings endpoints: loaded once,
+# indexed, and swapped for a new snapshot when the rankings file changes
+RANKINGS_STORE = RankingsStore(
+    get_rankings_path,
+    lambda path: load_rankings_data(['teamsData', 'playersData'], rankings_path=path))
+
+# FTS5 search tables over teams/players in the database (kept in sync incrementally)
+_db_search = None
+
+def get_db_search():
+    """Search index for DATABASE_PATH (re-created if the database path changes)"""
+    global _db_search
+    if _db_search is None or _db_search.db_path != Path(DATABASE_PATH):
+        _db_search = DatabaseSearchIndex(DATABASE_PATH)
+    return _db_search
+
+# Pooled connections for the admin queries against DATABASE_PATH
+_db_pool = None
+_db_pool_lock = threading.Lock()
+DB_SLOW_QUERY_MS = SLOW_QUERY_MS
+
+def get_db_pool():
+    """Connection pool for DATABASE_PATH (re-created if the database path changes)"""
+    global _db_pool
+    pool = _db_pool
+    if pool is None or pool.db_path != Path(DATABASE_PATH):
+        with _db_pool_lock:
+            if _db_pool is None or _db_pool.db_path != Path(DATABASE_PATH):
+                if _db_pool is not None:
+                    _db_pool.close()
+                _db_pool = DatabasePool(DATABASE_PATH, slow_query_ms=DB_SLOW_QUERY_MS)
+            pool = _db_pool
+    return pool
+
+# Cached COUNT(*) per list filter (see pagination.CountCache)
+COUNT_CACHE = CountCache()
+
+def ensure_list_indexes():
+    """Create the sort/filter indexes the keyset-paged admin lists use (once per database)"""
+    if not DATABASE_PATH.exists():
+        return
+    pool = get_db_pool()
+    try:
+        with pool.writer() as conn:
+            created = ensure_indexes(conn, lambda table: pool.columns(conn, table))
+        if created:
+            print(f"[OK] Created list indexes: {', '.join(created)}")
+    except sqlite3.Error as e:
+        print(f"[WARN] Could not create list indexes: {e}")
+
+def ensure_rankings_history():
+    """Create the rankings_history table once, so /api/v1/rankings/history only reads"""
+    if rankings_history is None or not DATABASE_PATH.exists():
+        return
+    try:
+        rankings_history.RankingsHistoryStore(DATABASE_PATH)
+    except sqlite3.Error as e:
+        print(f"[WARN] Could not prepare rankings history table: {e}")
+
+
+def read_rankings_history(key, limit):
+    """One team's history through this thread's pooled read-only connection"""
+    pool = get_db_pool()
+    conn = pool.reader()
+    if not pool.has_table(conn, rankings_history.HISTORY_TABLE):
+        return []
+    return rankings_history.RankingsHistoryStore.team_history_from(conn, key, limit)
+
+# Materialized /api/stats (see stats_snapshot.StatsSnapshot)
+_db_stats = None
+
+def get_db_stats_snapshot():
+    """Stats snapshot for DATABASE_PATH (re-created if the database path changes)"""
+    global _db_stats
+    if _db_stats is None or _db_stats.db_path != Path(DATABASE_PATH):
+        _db_stats = StatsSnapshot(DATABASE_PATH, compute=compute_database_stats)
+    return _db_stats
+
 # React app location
 REACT_APP_PATH = SCRIPT_DIR
 
@@ -284,6 +436,9 @@ CONFIG_FILE = get_data_file_path("admin_config.json")
 # Separate users file for persistence across app updates
 USERS_FILE = get_data_file_path("seedline_users.json")
 
+# Accounts and per-user saved data (imported once from USERS_FILE / CONFIG_FILE)
+USERS_DB_FILE = get_data_file_path("seedline_users.db")
+
 # GA Events config file
 GA_EVENTS_CONFIG = get_data_file_path("ga_events_config.json")
 
@@ -369,8 +524,8 @@ def update_paths(new_paths):
 # DATABASE OPERATIONS
 # ============================================================================
 
-def get_database_stats():
-    """Get comprehensive database statistics"""
+def compute_database_stats():
+    """Get comprehensive database statistics (full queries; get_database_stats serves the snapshot)"""
     stats = {
         "connected": False,
         "path": str(DATABASE_PATH),
@@ -396,13 +551,12 @@ def get_database_stats():
         stats["size_mb"] = round(DATABASE_PATH.stat().st_size / (1024 * 1024), 2)
         stats["last_modified"] = datetime.fromtimestamp(DATABASE_PATH.stat().st_mtime).isoformat()
         
-        conn = sqlite3.connect(str(DATABASE_PATH))
+        conn = get_db_pool().reader()
         cursor = conn.cursor()
         stats["connected"] = True
         
         # Get tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        stats["tables"] = [row[0] for row in cursor.fetchall()]
+        stats["tables"] = get_db_pool().tables(conn)
         
         # Total games
         if 'games' in stats["tables"]:
@@ -450,9 +604,7 @@ def get_database_stats():
             
             # Recent games - use game_date_iso column for proper sorting
             # First check if game_date_iso column exists and has data
-            cursor.execute("PRAGMA table_info(games)")
-            columns = [row[1] for row in cursor.fetchall()]
-            has_iso_column = 'game_date_iso' in columns
+            has_iso_column = 'game_date_iso' in get_db_pool().columns(conn, 'games')
             
             today = datetime.now().strftime("%Y-%m-%d")
             
@@ -565,12 +717,41 @@ def get_database_stats():
             """)
             stats["players_by_league"] = dict(cursor.fetchall())
         
-        conn.close()
     except Exception as e:
         stats["error"] = str(e)
     
     return stats
 
+def stats_snapshot_headers():
+    """X-Stats-* headers with the snapshot's live age / stale / refreshing"""
+    if not DATABASE_PATH.exists():
+        return {}
+    status = get_db_stats_snapshot().status()
+    return {
+        'X-Stats-Age': '' if status['age_seconds'] is None else str(status['age_seconds']),
+        'X-Stats-Stale': '1' if status['stale'] else '0',
+        'X-Stats-Refreshing': '1' if status['refreshing'] else '0',
+    }
+
+
+def get_database_stats(force=False):
+    """
+    Database statistics from the materialized snapshot: answered without
+    scanning the games table, recomputed in the background once the database
+    has changed (force=True recomputes first).
+    """
+    if not DATABASE_PATH.exists():
+        return compute_database_stats()
+    stats = get_db_stats_snapshot().get(force=force)
+    # File size and modification time are one stat() call; report them live
+    try:
+        file_stat = DATABASE_PATH.stat()
+        stats["size_mb"] = round(file_stat.st_size / (1024 * 1024), 2)
+        stats["last_modified"] = datetime.fromtimestamp(file_stat.st_mtime).isoformat()
+    except OSError:
+        pass
+    return stats
+
 def get_filter_options():
     """Get available filter options from database"""
     options = {
@@ -585,7 +766,7 @@ def get_filter_options():
         return options
     
     try:
-        conn = sqlite3.connect(str(DATABASE_PATH))
+        conn = get_db_pool().reader()
         cursor = conn.cursor()
         
         # Get unique leagues from BOTH teams AND games tables
@@ -612,7 +793,6 @@ def get_filter_options():
         cursor.execute("SELECT DISTINCT position FROM players WHERE position IS NOT NULL AND position != '' ORDER BY position")
         options["positions"] = [row[0] for row in cursor.fetchall()]
         
-        conn.close()
     except Exception as e:
         options["error"] = str(e)
     
@@ -648,19 +828,55 @@ def normalize_age_group_for_sql(age_group):
     
     return formats
 
-def get_all_teams(limit=100, offset=0, league=None, age_group=None, search=None, gender=None):
+def _keyset_page(conn, table, where_clauses, params, sort_key, direction, limit, offset, after):
+    """
+    One page of `table` ordered by (sort_key, rowid). Continues from cursor
+    `after` when given, else skips `offset` rows. The filter count comes from
+    COUNT_CACHE. Returns (rows, total, total_approximate, next_cursor);
+    raises ValueError for a bad cursor.
+    """
+    where_sql = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+    scope = cursor_scope(table, where_sql, params, direction)
+    position = decode_cursor(after, scope)
+
+    total, approximate = COUNT_CACHE.get(
+        (table, where_sql, tuple(params)), database_version(DATABASE_PATH)[0],
+        lambda: conn.execute(f"SELECT COUNT(*) FROM {table}{where_sql}", params).fetchone()[0])
+
+    page_clauses, page_params = list(where_clauses), list(params)
+    if position is not None:
+        clause, clause_params = keyset_clause(sort_key, position, direction)
+        page_clauses.append(clause)
+        page_params.extend(clause_params)
+        offset = 0
+    page_where = " WHERE " + " AND ".join(page_clauses) if page_clauses else ""
+    order = "DESC" if direction == 'desc' else "ASC"
+
+    # One extra row tells whether there is a next page; the trailing column is the sort key
+    cursor = conn.execute(f"""
+        SELECT rowid, *, {sort_key} FROM {table}{page_where}
+        ORDER BY {sort_key} {order}, rowid {order}
+        LIMIT ? OFFSET ?
+    """, page_params + [limit + 1, offset])
+    columns = ['rowid'] + [desc[0] for desc in cursor.description][1:-1]
+    rows = cursor.fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][-1], rows[-1][0], scope)
+    return [dict(zip(columns, row[:-1])) for row in rows], total, approximate, next_cursor
+
+def get_all_teams(limit=100, offset=0, league=None, age_group=None, search=None, gender=None, after=None):
     """Get teams from database with filtering"""
     if not DATABASE_PATH.exists():
         return {"teams": [], "total": 0}
     
     try:
-        conn = sqlite3.connect(str(DATABASE_PATH))
-        cursor = conn.cursor()
+        conn = get_db_pool().reader()
         
         # Check if teams table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='teams'")
-        if not cursor.fetchone():
-            conn.close()
+        if not get_db_pool().has_table(conn, 'teams'):
             return {"teams": [], "total": 0}
         
         # Build query
@@ -688,43 +904,33 @@ def get_all_teams(limit=100, offset=0, league=None, age_group=None, search=None,
             elif gender.lower() in ['boys', 'b']:
                 where_clauses.append("age_group LIKE 'B%'")
         if search:
-            where_clauses.append("(team_name LIKE ? OR club LIKE ?)")
-            params.extend([f"%{search}%", f"%{search}%"])
-        
-        where_sql = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
-        
-        # Get total count
-        cursor.execute(f"SELECT COUNT(*) FROM teams{where_sql}", params)
-        total = cursor.fetchone()[0]
-        
-        # Get teams with rowid for editing
-        cursor.execute(f"""
-            SELECT rowid, * FROM teams{where_sql}
-            ORDER BY team_name
-            LIMIT ? OFFSET ?
-        """, params + [limit, offset])
+            # Trigram index for 3+ characters, LIKE scan otherwise
+            fts_clause, fts_params = get_db_search().where_clause('teams', search)
+            if fts_clause:
+                where_clauses.append(fts_clause)
+                params.extend(fts_params)
+            else:
+                where_clauses.append("(team_name LIKE ? OR club LIKE ?)")
+                params.extend([f"%{search}%", f"%{search}%"])
         
-        columns = ['rowid'] + [desc[0] for desc in cursor.description][1:]
-        teams = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        # Teams with rowid for editing, by name; `after` is the previous page's next_cursor
+        teams, total, approximate, next_cursor = _keyset_page(
+            conn, 'teams', where_clauses, params, SORT_KEYS['teams'], 'asc', limit, offset, after)
         
-        conn.close()
-        return {"teams": teams, "total": total}
+        return {"teams": teams, "total": total, "total_approximate": approximate, "next_cursor": next_cursor}
     except Exception as e:
         return {"teams": [], "total": 0, "error": str(e)}
 
-def get_all_players(limit=100, offset=0, league=None, age_group=None, search=None, position=None, gender=None):
+def get_all_players(limit=100, offset=0, league=None, age_group=None, search=None, position=None, gender=None, after=None):
     """Get players from database with filtering"""
     if not DATABASE_PATH.exists():
         return {"players": [], "total": 0}
     
     try:
-        conn = sqlite3.connect(str(DATABASE_PATH))
-        cursor = conn.cursor()
+        conn = get_db_pool().reader()
         
         # Check if players table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='players'")
-        if not cursor.fetchone():
-            conn.close()
+        if not get_db_pool().has_table(conn, 'players'):
             return {"players": [], "total": 0}
         
         # Build query
@@ -754,27 +960,20 @@ def get_all_players(limit=100, offset=0, league=None, age_group=None, search=Non
             elif gender.lower() in ['boys', 'b']:
                 where_clauses.append("age_group LIKE 'B%'")
         if search:
-            where_clauses.append("(player_name LIKE ? OR team_name LIKE ?)")
-            params.extend([f"%{search}%", f"%{search}%"])
-        
-        where_sql = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
-        
-        # Get total count
-        cursor.execute(f"SELECT COUNT(*) FROM players{where_sql}", params)
-        total = cursor.fetchone()[0]
-        
-        # Get players with rowid for editing
-        cursor.execute(f"""
-            SELECT rowid, * FROM players{where_sql}
-            ORDER BY player_name
-            LIMIT ? OFFSET ?
-        """, params + [limit, offset])
+            # Trigram index for 3+ characters, LIKE scan otherwise
+            fts_clause, fts_params = get_db_search().where_clause('players', search)
+            if fts_clause:
+                where_clauses.append(fts_clause)
+                params.extend(fts_params)
+            else:
+                where_clauses.append("(player_name LIKE ? OR team_name LIKE ?)")
+                params.extend([f"%{search}%", f"%{search}%"])
         
-        columns = ['rowid'] + [desc[0] for desc in cursor.description][1:]
-        players = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        # Players with rowid for editing, by name; `after` is the previous page's next_cursor
+        players, total, approximate, next_cursor = _keyset_page(
+            conn, 'players', where_clauses, params, SORT_KEYS['players'], 'asc', limit, offset, after)
         
-        conn.close()
-        return {"players": players, "total": total}
+        return {"players": players, "total": total, "total_approximate": approximate, "next_cursor": next_cursor}
     except Exception as e:
         return {"players": [], "total": 0, "error": str(e)}
 
@@ -788,25 +987,23 @@ def update_team(rowid, updates):
         return {"success": False, "error": "Database not found"}
     
     try:
-        conn = sqlite3.connect(str(DATABASE_PATH))
-        cursor = conn.cursor()
+        with get_db_pool().writer() as conn:
+            cursor = conn.cursor()
         
-        # Build update query
-        set_clauses = []
-        params = []
-        for key, value in updates.items():
-            if key not in ['rowid', 'id']:
-                set_clauses.append(f"{key} = ?")
-                params.append(value)
+            # Build update query
+            set_clauses = []
+            params = []
+            for key, value in updates.items():
+                if key not in ['rowid', 'id']:
+                    set_clauses.append(f"{key} = ?")
+                    params.append(value)
         
-        if not set_clauses:
-            return {"success": False, "error": "No valid fields to update"}
+            if not set_clauses:
+                return {"success": False, "error": "No valid fields to update"}
         
-        params.append(rowid)
-        cursor.execute(f"UPDATE teams SET {', '.join(set_clauses)} WHERE rowid = ?", params)
-        conn.commit()
-        updated = cursor.rowcount
-        conn.close()
+            params.append(rowid)
+            cursor.execute(f"UPDATE teams SET {', '.join(set_clauses)} WHERE rowid = ?", params)
+            updated = cursor.rowcount
         
         return {"success": updated > 0, "updated": updated}
     except Exception as e:
@@ -818,37 +1015,34 @@ def update_player(rowid, updates):
         return {"success": False, "error": "Database not found"}
     
     try:
-        conn = sqlite3.connect(str(DATABASE_PATH))
-        cursor = conn.cursor()
+        with get_db_pool().writer() as conn:
+            cursor = conn.cursor()
         
-        # Get actual columns in the players table
-        cursor.execute("PRAGMA table_info(players)")
-        valid_columns = {row[1] for row in cursor.fetchall()}
+            # Get actual columns in the players table
+            valid_columns = set(get_db_pool().columns(conn, 'players'))
         
-        set_clauses = []
-        params = []
-        skipped = []
-        for key, value in updates.items():
-            if key in ['rowid', 'id']:
-                continue
-            # Only update columns that exist in the table
-            if key in valid_columns:
-                set_clauses.append(f"{key} = ?")
-                params.append(value)
-            else:
-                skipped.append(key)
+            set_clauses = []
+            params = []
+            skipped = []
+            for key, value in updates.items():
+                if key in ['rowid', 'id']:
+                    continue
+                # Only update columns that exist in the table
+                if key in valid_columns:
+                    set_clauses.append(f"{key} = ?")
+                    params.append(value)
+                else:
+                    skipped.append(key)
         
-        if not set_clauses:
-            error_msg = "No valid fields to update"
-            if skipped:
-                error_msg += f". Columns not in table: {', '.join(skipped)}"
-            return {"success": False, "error": error_msg}
+            if not set_clauses:
+                error_msg = "No valid fields to update"
+                if skipped:
+                    error_msg += f". Columns not in table: {', '.join(skipped)}"
+                return {"success": False, "error": error_msg}
         
-        params.append(rowid)
-        cursor.execute(f"UPDATE players SET {', '.join(set_clauses)} WHERE rowid = ?", params)
-        conn.commit()
-        updated = cursor.rowcount
-        conn.close()
+            params.append(rowid)
+            cursor.execute(f"UPDATE players SET {', '.join(set_clauses)} WHERE rowid = ?", params)
+            updated = cursor.rowcount
         
         result = {"success": updated > 0, "updated": updated}
         if skipped:
@@ -863,24 +1057,22 @@ def update_game(rowid, updates):
         return {"success": False, "error": "Database not found"}
     
     try:
-        conn = sqlite3.connect(str(DATABASE_PATH))
-        cursor = conn.cursor()
+        with get_db_pool().writer() as conn:
+            cursor = conn.cursor()
         
-        set_clauses = []
-        params = []
-        for key, value in updates.items():
-            if key not in ['rowid', 'id']:
-                set_clauses.append(f"{key} = ?")
-                params.append(value)
+            set_clauses = []
+            params = []
+            for key, value in updates.items():
+                if key not in ['rowid', 'id']:
+                    set_clauses.append(f"{key} = ?")
+                    params.append(value)
         
-        if not set_clauses:
-            return {"success": False, "error": "No valid fields to update"}
+            if not set_clauses:
+                return {"success": False, "error": "No valid fields to update"}
         
-        params.append(rowid)
-        cursor.execute(f"UPDATE games SET {', '.join(set_clauses)} WHERE rowid = ?", params)
-        conn.commit()
-        updated = cursor.rowcount
-        conn.close()
+            params.append(rowid)
+            cursor.execute(f"UPDATE games SET {', '.join(set_clauses)} WHERE rowid = ?", params)
+            updated = cursor.rowcount
         
         return {"success": updated > 0, "updated": updated}
     except Exception as e:
@@ -892,37 +1084,31 @@ def delete_game(rowid):
         return {"success": False, "error": "Database not found"}
     
     try:
-        conn = sqlite3.connect(str(DATABASE_PATH))
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM games WHERE rowid = ?", [rowid])
-        conn.commit()
-        deleted = cursor.rowcount
-        conn.close()
+        with get_db_pool().writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM games WHERE rowid = ?", [rowid])
+            deleted = cursor.rowcount
         
         return {"success": deleted > 0, "deleted": deleted}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
-def get_all_games(limit=100, offset=0, league=None, age_group=None, search=None, status=None, gender=None, sort='desc'):
+def get_all_games(limit=100, offset=0, league=None, age_group=None, search=None, status=None, gender=None, sort='desc',
+                  after=None):
     """Get games from database with filtering and sorting"""
     if not DATABASE_PATH.exists():
         return {"games": [], "total": 0}
     
     try:
-        conn = sqlite3.connect(str(DATABASE_PATH))
+        conn = get_db_pool().reader()
         cursor = conn.cursor()
         
         # Check if games table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='games'")
-        if not cursor.fetchone():
-            conn.close()
+        if not get_db_pool().has_table(conn, 'games'):
             return {"games": [], "total": 0}
         
         # Check if game_date_iso column exists
-        cursor.execute("PRAGMA table_info(games)")
-        columns_info = cursor.fetchall()
-        column_names = [col[1] for col in columns_info]
-        has_iso_column = 'game_date_iso' in column_names
+        has_iso_column = 'game_date_iso' in get_db_pool().columns(conn, 'games')
         
         # Build query
         where_clauses = []
@@ -953,25 +1139,19 @@ def get_all_games(limit=100, offset=0, league=None, age_group=None, search=None,
             where_clauses.append("(home_team LIKE ? OR away_team LIKE ?)")
             params.extend([f"%{search}%", f"%{search}%"])
         
-        where_sql = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
-        
-        # Get total count
-        cursor.execute(f"SELECT COUNT(*) FROM games{where_sql}", params)
-        total = cursor.fetchone()[0]
-        
         # Use game_date_iso for sorting if available
         if has_iso_column:
-            sort_order = "ASC" if sort == 'asc' else "DESC"
-            cursor.execute(f"""
-                SELECT rowid, * FROM games{where_sql}
-                ORDER BY COALESCE(game_date_iso, game_date) {sort_order}
-                LIMIT ? OFFSET ?
-            """, params + [limit, offset])
-            
-            columns = ['rowid'] + [desc[0] for desc in cursor.description][1:]
-            games = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            # `after` is the previous page's next_cursor
+            games, total, approximate, next_cursor = _keyset_page(
+                conn, 'games', where_clauses, params, SORT_KEYS['games'],
+                'asc' if sort == 'asc' else 'desc', limit, offset, after)
+            return {"games": games, "total": total, "total_approximate": approximate, "next_cursor": next_cursor}
         else:
-            # Fallback: Get all and sort in Python
+            where_sql = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+            cursor.execute(f"SELECT COUNT(*) FROM games{where_sql}", params)
+            total = cursor.fetchone()[0]
+
+            # Fallback: Get all and sort in Python (offset paging only)
             cursor.execute(f"SELECT rowid, * FROM games{where_sql}", params)
             columns = ['rowid'] + [desc[0] for desc in cursor.description][1:]
             all_games = [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -1006,116 +1186,66 @@ def get_all_games(limit=100, offset=0, league=None, age_group=None, search=None,
             sorted_games = sorted(all_games, key=parse_date_for_sort, reverse=reverse_sort)
             games = sorted_games[offset:offset + limit]
         
-        conn.close()
         return {"games": games, "total": total}
     except Exception as e:
         return {"games": [], "total": 0, "error": str(e)}
 
+_user_store = None
+_user_store_lock = threading.Lock()
+
+def get_user_store():
+    """UserStore for USERS_DB_FILE, migrating the JSON users/user_data on first use"""
+    global _user_store
+    if _user_store is None:
+        with _user_store_lock:
+            if _user_store is None:
+                store = UserStore(USERS_DB_FILE)
+                if not store.migrated():
+                    config = load_config()  # Also moves legacy config users to USERS_FILE
+                    result = store.migrate_from_json(load_users(), config.get("user_data", {}))
+                    if result:
+                        print(f"[OK] Migrated {result[0]} users and {result[1]} user data entries to {USERS_DB_FILE}")
+                _user_store = store
+    return _user_store
+
 def get_users():
-    """Get all users from persistent file"""
-    return load_users()
+    """Get all users"""
+    return get_user_store().list_users()
 
 def authenticate_user(username, password):
     """Authenticate a user by username and password"""
-    users = load_users()
-    
-    for user in users:
-        if user["username"].lower() == username.lower():
-            if user.get("password") == password:
-                # Update last login
-                user["last_login"] = datetime.now().isoformat()
-                save_users(users)
-                # Return user without password
-                safe_user = {k: v for k, v in user.items() if k != "password"}
-                return {"success": True, "user": safe_user}
-            else:
-                return {"success": False, "error": "Invalid password"}
-    
-    return {"success": False, "error": "User not found"}
+    return get_user_store().authenticate(username, password)
 
 def get_user_by_email(email):
     """Find a user by email"""
-    users = load_users()
-    
-    for user in users:
-        if user.get("email", "").lower() == email.lower():
-            return user
-    return None
+    return get_user_store().get_by_email(email)
 
 def get_user_data(username):
     """Get user's saved data (players, badges, teams)"""
-    config = load_config()
-    user_data = config.get("user_data", {})
-    return user_data.get(username, {"players": [], "badges": {}, "myTeams": []})
+    return get_user_store().get_data(username)
 
 def save_user_data(username, data):
     """Save user's data"""
-    config = load_config()
-    if "user_data" not in config:
-        config["user_data"] = {}
-    config["user_data"][username] = data
-    save_config(config)
-    return {"success": True}
+    return get_user_store().save_data(username, data)
 
 def add_user(username, email="", account_type="free", notes="", password=""):
     """Add a new user"""
-    users = load_users()
-    
     # Check for duplicate
-    if any(u["username"].lower() == username.lower() for u in users):
+    if get_user_store().get_by_username(username):
         return {"success": False, "error": f"User '{username}' already exists"}
-    
+
     # Password required for free and pro accounts
     if account_type in ["free", "pro"] and not password:
         return {"success": False, "error": f"Password required for {account_type} accounts"}
-    
-    # Generate unique ID
-    max_id = max([u.get("id", 0) for u in users], default=0)
-    
-    user = {
-        "id": max_id + 1,
-        "username": username,
-        "email": email,
-        "password": password,
-        "account_type": account_type,
-        "notes": notes,
-        "created_at": datetime.now().isoformat(),
-        "last_login": None,
-        "teams_saved": 0,
-        "games_submitted": 0
-    }
-    
-    users.append(user)
-    save_users(users)
-    
-    return {"success": True, "user": user}
+    return get_user_store().add(username, email, account_type, notes, password)
 
 def update_user(user_id, updates):
     """Update a user"""
-    users = load_users()
-    
-    for user in users:
-        if user["id"] == user_id:
-            for key, value in updates.items():
-                if key != "id":
-                    user[key] = value
-            save_users(users)
-            return {"success": True, "user": user}
-    
-    return {"success": False, "error": "User not found"}
+    return get_user_store().update(user_id, updates)
 
 def delete_user(user_id):
     """Delete a user"""
-    users = load_users()
-    
-    original_count = len(users)
-    users = [u for u in users if u["id"] != user_id]
-    
-    if len(users) == original_count:
-        return {"success": False, "error": "User not found"}
-    
-    save_users(users)
-    return {"success": True}
+    return get_user_store().delete(user_id)
 
 # ============================================================================
 # SCHEDULE MANAGEMENT
@@ -1172,29 +1302,33 @@ def save_schedule_settings(settings):
     except Exception as e:
         return {"success": False, "error": str(e)}
 
-def get_scraper_logs(scraper_id=None, lines=100):
-    """Get recent scraper log entries"""
-    logs = {}
-    log_files = {
+def get_scraper_log_files():
+    """Scheduled-scrape log files by name"""
+    return {
         "schedule": SCRAPERS_FOLDER / "scraper_schedule.log",
         "ecnl": SCRAPERS_FOLDER / "scraper_ecnl.log",
         "ga": SCRAPERS_FOLDER / "scraper_ga.log",
         "aspire": SCRAPERS_FOLDER / "scraper_aspire.log",
     }
 
+def get_scraper_logs(scraper_id=None, lines=100):
+    """Get recent scraper log entries (read backwards from the end, see log_tail)"""
+    logs = {}
+    log_files = get_scraper_log_files()
+
     files_to_read = {scraper_id: log_files[scraper_id]} if scraper_id and scraper_id in log_files else log_files
 
     for name, log_path in files_to_read.items():
         if log_path.exists():
             try:
-                with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    all_lines = f.readlines()
-                    logs[name] = {
-                        "path": str(log_path),
-                        "lines": all_lines[-lines:] if len(all_lines) > lines else all_lines,
-                        "total_lines": len(all_lines),
-                        "last_modified": datetime.fromtimestamp(log_path.stat().st_mtime).isoformat()
-                    }
+                tail, size = tail_lines(log_path, lines)
+                logs[name] = {
+                    "path": str(log_path),
+                    "lines": tail,
+                    "total_lines": LINE_COUNTER.count(log_path),
+                    "size": size,  # Byte offset to stream new lines from (/api/scraper/stream?log=...&offset=)
+                    "last_modified": datetime.fromtimestamp(log_path.stat().st_mtime).isoformat()
+                }
             except Exception as e:
                 logs[name] = {"error": str(e)}
         else:
@@ -1334,7 +1468,7 @@ def get_games_needing_scrape():
         return {"error": "Database not found"}
 
     try:
-        conn = sqlite3.connect(str(DATABASE_PATH))
+        conn = get_db_pool().reader()
         cursor = conn.cursor()
 
         today = datetime.now().strftime("%Y-%m-%d")
@@ -1370,8 +1504,6 @@ def get_games_needing_scrape():
         """, (week_ago, today))
         by_league = dict(cursor.fetchall())
 
-        conn.close()
-
         return {
             "missing_results": missing_results,
             "today_games": today_games,
@@ -1424,8 +1556,42 @@ def run_scrape_now(scrape_type="full"):
 # SCRAPER MANAGEMENT
 # ============================================================================
 
+SCRAPER_OUTPUT_LINES = 5000  # Lines kept per scraper for the dashboard; the log file has the rest
+
+class ScraperOutput:
+    """
+    The last SCRAPER_OUTPUT_LINES lines of one scraper's output. Positions
+    count every line ever added, so a stream resuming from a position whose
+    lines have been dropped carries on from the oldest line still kept.
+    """
+
+    def __init__(self, lines=(), maxlen=SCRAPER_OUTPUT_LINES):
+        self._lines = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self.end = 0   # Position after the newest line
+        for line in lines:
+            self.append(line)
+
+    def append(self, line):
+        with self._lock:
+            self._lines.append(line)
+            self.end += 1
+
+    def lines(self):
+        with self._lock:
+            return list(self._lines)
+
+    def since(self, position):
+        """(lines after position, next position); a position past the end starts over"""
+        with self._lock:
+            if position > self.end:
+                position = 0  # Scraper was restarted
+            skip = max(position - (self.end - len(self._lines)), 0)
+            return list(self._lines)[skip:], self.end
+
 scraper_processes = {}
-scraper_output = {}
+scraper_output = {}         # scraper id -> ScraperOutput
+scraper_output_pumps = {}   # scraper id -> thread copying a background scraper's output
 
 def get_scraper_status():
     """Get status of all scrapers"""
@@ -1620,13 +1786,13 @@ def run_scraper(scraper_id, settings=None):
     # Start process
     try:
         # Initialize output for dashboard display
-        scraper_output[scraper_id] = [
+        scraper_output[scraper_id] = ScraperOutput([
             f"[{datetime.now().strftime('%H:%M:%S')}] ═══════════════════════════════════════",
             f"[{datetime.now().strftime('%H:%M:%S')}] Starting {scraper['name']}",
             f"[{datetime.now().strftime('%H:%M:%S')}] ═══════════════════════════════════════",
             f"[{datetime.now().strftime('%H:%M:%S')}] Scraper file: {scraper_path}",
             f"[{datetime.now().strftime('%H:%M:%S')}] Working dir: {scraper_path.parent}",
-        ]
+        ])
         
         # Build the Python command
         python_cmd = f'"{sys.executable}" -X utf8 -u "{scraper_path}" {" ".join(args)}'
@@ -1696,7 +1862,7 @@ def run_scraper(scraper_id, settings=None):
                     process = subprocess.Popen(
                         cmd,
                         stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
                         text=True,
                         encoding='utf-8',
                         errors='replace',
@@ -1706,6 +1872,9 @@ def run_scraper(scraper_id, settings=None):
                     )
                     scraper_processes[scraper_id] = process
                     scraper_output[scraper_id].append(f"[{datetime.now().strftime('%H:%M:%S')}] Running in background (no terminal available)")
+                    pump = threading.Thread(target=_pump_scraper_output, args=(scraper_id, process), daemon=True)
+                    scraper_output_pumps[scraper_id] = pump
+                    pump.start()
         
         # Log start
         config = load_config()
@@ -1720,12 +1889,34 @@ def run_scraper(scraper_id, settings=None):
         
         return {"success": True, "message": f"Started {scraper['name']} in CMD window"}
     except Exception as e:
-        scraper_output[scraper_id] = scraper_output.get(scraper_id, []) + [f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: {str(e)}"]
+        scraper_output.setdefault(scraper_id, ScraperOutput()).append(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: {str(e)}")
         return {"success": False, "error": str(e)}
 
+def _pump_scraper_output(scraper_id, process):
+    """Copy a background scraper's output into scraper_output as it is printed"""
+    output = scraper_output[scraper_id]
+    for line in process.stdout:
+        output.append(f"[{datetime.now().strftime('%H:%M:%S')}] {line.rstrip()}")
+    process.wait()
+    output.append(f"[{datetime.now().strftime('%H:%M:%S')}] Finished (exit code {process.returncode})")
+
 def get_scraper_output(scraper_id):
     """Get output from a running scraper"""
-    return scraper_output.get(scraper_id, [])
+    output = scraper_output.get(scraper_id)
+    return output.lines() if output else []
+
+def parse_stream_position(value):
+    """A Last-Event-ID / offset as a position, or None if missing or malformed"""
+    try:
+        position = int(value)
+    except (TypeError, ValueError):
+        return None
+    return position if position >= 0 else None
+
+def scraper_output_running(scraper_id):
+    """True while a scraper started in the background can still add output"""
+    pump = scraper_output_pumps.get(scraper_id)
+    return pump is not None and pump.is_alive()
 
 def stop_scraper(scraper_id):
     """Stop a running scraper"""
@@ -1793,6 +1984,17 @@ def export_to_react():
                 dest = react_public / "rankings_for_react.json"
                 shutil.copy(RANKINGS_OUTPUT, dest)
                 results["rankings"] = {"success": True, "path": str(dest)}
+                # Columnar artifact goes along with the JSON (copied after it, so it stays current)
+                artifact_src = rankings_artifact.artifact_dir_for(RANKINGS_OUTPUT) if rankings_artifact else None
+                if artifact_src and rankings_artifact.artifact_is_current(RANKINGS_OUTPUT, artifact_src):
+                    rankings_artifact.copy_artifact(artifact_src, rankings_artifact.artifact_dir_for(dest))
+                    results["rankings"]["columnar"] = str(rankings_artifact.artifact_dir_for(dest))
+                # Sharded per-age-group/per-team layout (content-hashed, only new files are copied)
+                if rankings_shards is not None:
+                    shards_src = rankings_shards.shards_dir_for(RANKINGS_OUTPUT)
+                    if rankings_shards.read_index(shards_src):
+                        rankings_shards.sync_shards(shards_src, react_public / rankings_shards.SHARDS_DIR_NAME)
+                        results["rankings"]["shards"] = str(react_public / rankings_shards.SHARDS_DIR_NAME)
             else:
                 results["rankings"] = {"success": False, "error": "React public folder not found"}
         except Exception as e:
@@ -2332,21 +2534,137 @@ def delete_team_rating(rating_id: str, user_id: str) -> dict:
 # HTTP SERVER
 # ============================================================================
 
+# Ranker runs and exports hold a worker for minutes; cap how many run at once
+LONG_JOBS = JobLimiter(DEFAULT_MAX_LONG_JOBS)
+
+# Live log / scraper output streams (Server-Sent Events). Each open stream
+# holds a worker thread, so they are capped and closed after a while; the
+# browser's EventSource reconnects and resumes from Last-Event-ID.
+MAX_STREAMS = 4
+STREAM_MAX_SECONDS = 300
+STREAM_POLL_INTERVAL = 0.5
+STREAM_KEEPALIVE = 15
+STREAMS = JobLimiter(MAX_STREAMS)
+
+# Per-route request metrics (/api/metrics). Routes with an id in the path are
+# labelled by pattern so each team/user/game doesn't become its own series.
+METRICS = MetricsRegistry(route_prefixes=[
+    ('/api/user/lookup', '/api/user/lookup'),
+    ('/api/user/', '/api/user/{username}/data'),
+    ('/api/users/', '/api/users/{id}'),
+    ('/api/teams/', '/api/teams/{rowid}'),
+    ('/api/players/', '/api/players/{rowid}'),
+    ('/api/games/', '/api/games/{rowid}'),
+    ('/api/v1/rankings/team/', '/api/v1/rankings/team/{id}'),
+    ('/api/v1/rankings/club/', '/api/v1/rankings/club/{name}'),
+    ('/api/v1/activity/session/', '/api/v1/activity/session/{id}'),
+    ('/api/v1/ratings/team/', '/api/v1/ratings/team/{id}'),
+    ('/api/v1/ratings/', '/api/v1/ratings/{id}'),
+])
+
 class AdminHandler(BaseHTTPRequestHandler):
     """HTTP request handler for the admin API"""
+
+    timeout = DEFAULT_REQUEST_TIMEOUT  # Socket timeout - a stalled client can't hold a worker
+
+    # ─── Request metrics ─────────────────────────────────────────────────────
+
+    def setup(self):
+        super().setup()
+        self.wfile = CountingWriter(self.wfile)
+        self._started = None
+        self._status = None
+
+    def parse_request(self):
+        # The request line has been read; time from here to the last byte written
+        self._started = time.perf_counter()
+        self._status = None
+        self.wfile.bytes = 0
+        pool = _db_pool
+        self._db_before = pool.thread_db_seconds() if pool is not None else 0.0
+        return super().parse_request()
+
+    def send_response(self, code, message=None):
+        self._status = code
+        super().send_response(code, message)
+
+    def handle_one_request(self):
+        super().handle_one_request()
+        if self._started is not None and self._status is not None and self.command:
+            pool = _db_pool
+            db_seconds = pool.thread_db_seconds() - self._db_before if pool is not None else 0.0
+            METRICS.record(self.command, urlparse(self.path).path, self._status,
+                           time.perf_counter() - self._started, self.wfile.bytes, max(db_seconds, 0.0))
+        self._started = None
+        self._status = None
     
     def _set_headers(self, status=200, content_type='application/json', extra_headers=None):
         self.send_response(status)
-        self.send_header('Content-type', content_type)
+        if content_type:
+            self.send_header('Content-type', content_type)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-Session-ID')
-        self.send_header('Access-Control-Expose-Headers', 'X-RateLimit-Limit, X-RateLimit-Remaining, X-RateLimit-Reset')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-Session-ID, If-None-Match')
+        self.send_header('Access-Control-Expose-Headers', 'X-RateLimit-Limit, X-RateLimit-Remaining, X-RateLimit-Reset, ETag, X-Stats-Age, X-Stats-Stale, X-Stats-Refreshing')
         if extra_headers:
             for key, value in extra_headers.items():
                 self.send_header(key, value)
         self.end_headers()
 
+    def _send_json(self, data=None, status=200, extra_headers=None, etag=None, last_modified=None, build=None):
+        """
+        Send a JSON response, compressed if the client accepts it.
+
+        With an etag (see _rankings_etag / _database_etag) the response carries
+        ETag / Last-Modified, a matching If-None-Match or If-Modified-Since gets
+        304 without building the body, and the encoded body is cached per
+        (etag, encoding). Pass build (a function returning the data) instead of
+        data so cache hits and 304s skip the work. Returns the body size sent.
+        """
+        headers = dict(extra_headers or {})
+        if etag:
+            headers['Cache-Control'] = 'no-cache'  # Cache, but revalidate every time
+            if last_modified is not None:
+                headers['Last-Modified'] = http_date(last_modified)
+            if_none_match = self.headers.get('If-None-Match')
+            matched = etag_matches(if_none_match, etag) if if_none_match else None
+            if matched or (not if_none_match and
+                           not_modified_since(self.headers.get('If-Modified-Since'), last_modified)):
+                headers['ETag'] = matched or etag
+                self._set_headers(304, content_type=None, extra_headers=headers)
+                return 0
+
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding'))
+        cached = RESPONSE_CACHE.get(etag, encoding) if etag and status == 200 else None
+        if cached:
+            body, applied = cached
+        else:
+            raw = json.dumps(build() if build else data).encode()
+            body, applied = compress(raw, encoding)
+            if etag and status == 200:
+                RESPONSE_CACHE.put(etag, encoding, body, applied)
+
+        if etag:
+            headers['ETag'] = representation_etag(etag, applied)
+        if applied:
+            headers['Content-Encoding'] = applied
+        headers['Vary'] = 'Accept-Encoding'
+        headers['Content-Length'] = str(len(body))
+        self._set_headers(status, extra_headers=headers)
+        self.wfile.write(body)
+        return len(body)
+
+    def _rankings_etag(self, snapshot):
+        """(etag, last_modified) for a response built from a rankings snapshot and this URL"""
+        return make_etag(snapshot.version, self.path), snapshot.modified_at
+
+    def _database_etag(self, *extra):
+        """(etag, last_modified) for a response built from the database and this URL"""
+        version, modified = database_version(DATABASE_PATH)
+        if version is None:
+            return None, None
+        return make_etag(version, self.path, *extra), modified
+
     def _get_client_ip(self):
         """Get client IP address, checking X-Forwarded-For for proxied requests."""
         forwarded = self.headers.get('X-Forwarded-For')
@@ -2374,12 +2692,124 @@ class AdminHandler(BaseHTTPRequestHandler):
             return True, 999, 60, {}
         allowed, remaining, reset = check_rate_limit(ip_address, account_type)
         headers = {
-            'X-RateLimit-Limit': str(check_rate_limit.__code__.co_freevars),  # Will be fixed
+            'X-RateLimit-Limit': str(IP_RATE_LIMITER.limit_for(account_type)),
             'X-RateLimit-Remaining': str(remaining),
             'X-RateLimit-Reset': str(reset)
         }
         return allowed, remaining, reset, headers
     
+    def _stream_events(self, read, position):
+        """
+        Stream lines as Server-Sent Events. read(position) returns
+        (new lines, next position, finished); each batch is one event whose
+        data is a JSON list of lines and whose id is the next position. Ends
+        when read() reports finished ("end" event), the client disconnects,
+        the server stops, or after STREAM_MAX_SECONDS.
+        """
+        name = f"stream-{threading.get_ident()}"
+        if not STREAMS.acquire(name):
+            self._set_headers(429, extra_headers={'Retry-After': '30'})
+            self.wfile.write(json.dumps({
+                "success": False,
+                "error": "Too many live streams open",
+                "code": "STREAMS_BUSY"
+            }).encode())
+            return
+        self.close_connection = True
+        try:
+            self._set_headers(content_type='text/event-stream',
+                              extra_headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+            self.wfile.write(b"retry: 2000\n\n")
+            self.wfile.flush()
+            started = last_sent = time.monotonic()
+            while time.monotonic() - started < STREAM_MAX_SECONDS and not getattr(self.server, '_stopping', False):
+                if self._client_closed():
+                    break
+                lines, position, finished = read(position)
+                if lines:
+                    self.wfile.write(f"id: {position}\ndata: {json.dumps(lines)}\n\n".encode())
+                    last_sent = time.monotonic()
+                elif finished:
+                    self.wfile.write(f"id: {position}\nevent: end\ndata: {{}}\n\n".encode())
+                    self.wfile.flush()
+                    break
+                elif time.monotonic() - last_sent >= STREAM_KEEPALIVE:
+                    self.wfile.write(b": keepalive\n\n")
+                    last_sent = time.monotonic()
+                self.wfile.flush()
+                time.sleep(STREAM_POLL_INTERVAL)
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass  # Client went away
+        finally:
+            STREAMS.release(name)
+
+    def _metrics_gauges(self):
+        """Server, queue and cache counters for /api/metrics, as MetricsRegistry.render extras"""
+        gauges = []
+        server_stats = getattr(self.server, 'stats', None)
+        if server_stats is not None:
+            gauges.append(('seedline_http_in_flight', 'gauge', 'Requests running or waiting for a worker',
+                           [({}, self.server.in_flight)]))
+            gauges.append(('seedline_http_connections_total', 'counter', 'Connections by outcome',
+                           [({"outcome": outcome}, count) for outcome, count in server_stats.items()]))
+        gauges.append(('seedline_long_jobs_running', 'gauge', 'Ranker/export jobs running',
+                       [({}, len(LONG_JOBS.running()))]))
+        gauges.append(('seedline_streams_open', 'gauge', 'Live log/output streams open',
+                       [({}, len(STREAMS.running()))]))
+        cache = RESPONSE_CACHE.stats()
+        gauges.append(('seedline_response_cache_lookups_total', 'counter', 'Encoded response cache lookups',
+                       [({"result": "hit"}, cache['hits']), ({"result": "miss"}, cache['misses'])]))
+        gauges.append(('seedline_response_cache_bytes', 'gauge', 'Bytes held by the encoded response cache',
+                       [({}, cache['bytes'])]))
+        snapshot = _db_stats
+        if snapshot is not None and snapshot.key is not None:
+            gauges.append(('seedline_stats_snapshot_age_seconds', 'gauge', 'Age of the /api/stats snapshot',
+                           [({}, time.time() - snapshot.key)]))
+        if ACTIVITY_TRACKING_ENABLED:
+            writer = activity_writer_stats()
+            gauges.append(('seedline_activity_queue_depth', 'gauge', 'Activity events waiting to be written',
+                           [({}, writer['queued'])]))
+            gauges.append(('seedline_activity_events_total', 'counter', 'Activity events by outcome',
+                           [({"outcome": "written"}, writer['written']),
+                            ({"outcome": "dropped"}, writer['dropped_total']),
+                            ({"outcome": "error"}, writer['errors'])]))
+            samples = []
+            for scope, limiter in (("ip", rate_limit_stats()), ("user", user_rate_limit_stats())):
+                for outcome in ('allowed', 'limited'):
+                    samples += [({"scope": scope, "account_type": account_type, "outcome": outcome}, count)
+                                for account_type, count in limiter[outcome].items()]
+            gauges.append(('seedline_rate_limit_checks_total', 'counter', 'Rate limit checks by outcome', samples))
+            tokens = token_cache_stats()
+            gauges.append(('seedline_auth_token_cache_lookups_total', 'counter', 'Verified-token cache lookups',
+                           [({"result": "hit"}, tokens['hits']), ({"result": "miss"}, tokens['misses'])]))
+        return gauges
+
+    def _client_closed(self):
+        """True once the client has closed its end (it sends nothing else on a stream)"""
+        try:
+            readable, _, _ = select.select([self.connection], [], [], 0)
+            return bool(readable) and not self.connection.recv(1, socket.MSG_PEEK)
+        except (OSError, ValueError):
+            return True
+
+    def _run_long_job(self, name, func, *args):
+        """Run a long job if LONG_JOBS has room, else answer 429 right away"""
+        if not LONG_JOBS.acquire(name):
+            self._set_headers(429, extra_headers={'Retry-After': '30'})
+            self.wfile.write(json.dumps({
+                "success": False,
+                "error": "Another long-running job is in progress",
+                "code": "JOB_BUSY",
+                "running": LONG_JOBS.running()
+            }).encode())
+            return
+        try:
+            result = func(*args)
+        finally:
+            LONG_JOBS.release(name)
+        self._set_headers()
+        self.wfile.write(json.dumps(result).encode())
+
     def do_OPTIONS(self):
         self._set_headers()
     
@@ -2401,9 +2831,31 @@ class AdminHandler(BaseHTTPRequestHandler):
                 self._set_headers()
                 self.wfile.write(json.dumps({"message": "New code is loaded!"}).encode())
 
-            elif path == '/api/stats':
+            elif path == '/api/metrics':
+                # Prometheus text format: per-route requests/latency/bytes/SQLite time + server gauges
+                body = METRICS.render(self._metrics_gauges()).encode('utf-8')
+                self._set_headers(content_type=METRICS_CONTENT_TYPE,
+                                  extra_headers={'Content-Length': str(len(body)), 'Cache-Control': 'no-cache'})
+                self.wfile.write(body)
+
+            elif path == '/api/db/queries':
+                # Timing of the admin SQL statements (slowest total first)
                 self._set_headers()
-                self.wfile.write(json.dumps(get_database_stats()).encode())
+                self.wfile.write(json.dumps(get_db_pool().query_stats(int(get_param('limit', 25)))).encode())
+
+            elif path == '/api/stats':
+                # Served from the stats snapshot; refresh=1 recomputes it first
+                if get_param('refresh') in ('1', 'true'):
+                    stats = get_database_stats(force=True)
+                    self._send_json(stats, extra_headers=stats_snapshot_headers())
+                else:
+                    snapshot = get_db_stats_snapshot()
+                    snapshot.maybe_refresh()
+                    # Some counts are relative to today. The snapshot's live age/stale/refreshing
+                    # go in headers: they change every call, the cached body must not
+                    etag, modified = self._database_etag(datetime.now().strftime("%Y-%m-%d"), snapshot.key)
+                    self._send_json(build=get_database_stats, etag=etag, last_modified=modified,
+                                    extra_headers=stats_snapshot_headers())
             
             elif path == '/api/scrapers':
                 self._set_headers()
@@ -2413,6 +2865,37 @@ class AdminHandler(BaseHTTPRequestHandler):
                 scraper_id = get_param('id')
                 self._set_headers()
                 self.wfile.write(json.dumps(get_scraper_output(scraper_id)).encode())
+
+            elif path == '/api/scraper/stream':
+                # Live output as Server-Sent Events: ?id=<scraper> streams its output
+                # (position = line index), ?log=<name> a log file (position = byte offset)
+                resume = parse_stream_position(self.headers.get('Last-Event-ID') or get_param('offset'))
+                log_name = get_param('log')
+                if log_name:
+                    log_path = get_scraper_log_files().get(log_name)
+                    if log_path is None:
+                        self._set_headers(404)
+                        self.wfile.write(json.dumps({"error": f"Unknown log: {log_name}"}).encode())
+                        return
+
+                    def read_log(offset):
+                        if not log_path.exists():
+                            return [], offset, False
+                        lines, offset = read_from(log_path, offset)
+                        return lines, offset, False
+
+                    if resume is None:  # Start at the tail
+                        resume = log_path.stat().st_size if log_path.exists() else 0
+                    self._stream_events(read_log, resume)
+                else:
+                    scraper_id = get_param('id')
+
+                    def read_output(index):
+                        output = scraper_output.get(scraper_id)
+                        lines, index = output.since(index) if output else ([], 0)
+                        return lines, index, not scraper_output_running(scraper_id)
+
+                    self._stream_events(read_output, resume or 0)
             
             elif path == '/api/users':
                 self._set_headers()
@@ -2455,8 +2938,10 @@ class AdminHandler(BaseHTTPRequestHandler):
                 age_group = get_param('age_group')
                 gender = get_param('gender')
                 search = get_param('search')
-                self._set_headers()
-                self.wfile.write(json.dumps(get_all_teams(limit, offset, league, age_group, search, gender)).encode())
+                etag, modified = self._database_etag()
+                after = get_param('cursor')
+                self._send_json(build=lambda: get_all_teams(limit, offset, league, age_group, search, gender, after),
+                                etag=etag, last_modified=modified)
             
             elif path == '/api/players':
                 limit = int(get_param('limit', 100))
@@ -2466,8 +2951,11 @@ class AdminHandler(BaseHTTPRequestHandler):
                 position = get_param('position')
                 gender = get_param('gender')
                 search = get_param('search')
-                self._set_headers()
-                self.wfile.write(json.dumps(get_all_players(limit, offset, league, age_group, search, position, gender)).encode())
+                etag, modified = self._database_etag()
+                after = get_param('cursor')
+                self._send_json(build=lambda: get_all_players(limit, offset, league, age_group, search, position, gender,
+                                                              after),
+                                etag=etag, last_modified=modified)
             
             elif path == '/api/games':
                 limit = int(get_param('limit', 100))
@@ -2478,8 +2966,11 @@ class AdminHandler(BaseHTTPRequestHandler):
                 gender = get_param('gender')
                 search = get_param('search')
                 sort = get_param('sort', 'desc')
-                self._set_headers()
-                self.wfile.write(json.dumps(get_all_games(limit, offset, league, age_group, search, status, gender, sort)).encode())
+                etag, modified = self._database_etag()
+                after = get_param('cursor')
+                self._send_json(build=lambda: get_all_games(limit, offset, league, age_group, search, status, gender, sort,
+                                                            after),
+                                etag=etag, last_modified=modified)
             
             elif path == '/api/file-info':
                 # Get file info for the Files & Folders page
@@ -2581,59 +3072,31 @@ class AdminHandler(BaseHTTPRequestHandler):
                 offset = int(get_param('offset', 0))
                 search = get_param('search')
 
-                # Load rankings from JSON file (for now)
-                rankings_path = SCRIPT_DIR / "public" / "rankings_for_react.json"
-                if not rankings_path.exists():
-                    rankings_path = RANKINGS_OUTPUT
-
-                if rankings_path.exists():
-                    with open(rankings_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-
-                    all_teams = data.get('teamsData', [])
-
-                    # Extract metadata from FULL dataset before filtering
-                    all_age_groups = sorted(set(t.get('ageGroup', '') for t in all_teams if t.get('ageGroup')),
-                                           key=lambda x: (x[0] != 'G', -int(x[1:]) if x[1:].isdigit() else 0))
-                    all_genders = sorted(set(t.get('gender', '') for t in all_teams if t.get('gender')))
-                    all_leagues = sorted(set(t.get('league', '') for t in all_teams if t.get('league')))
-                    all_states = sorted(set(t.get('state', '') for t in all_teams if t.get('state')))
-
-                    teams = all_teams
-
-                    # Apply filters
-                    if gender:
-                        teams = [t for t in teams if t.get('gender', '').lower() == gender.lower()]
-                    if age_group:
-                        age_groups = [a.strip() for a in age_group.split(',')]
-                        teams = [t for t in teams if t.get('age_group') in age_groups]
-                    if league:
-                        leagues = [l.strip() for l in league.split(',')]
-                        teams = [t for t in teams if t.get('league') in leagues]
-                    if state:
-                        states = [s.strip().upper() for s in state.split(',')]
-                        teams = [t for t in teams if t.get('state', '').upper() in states]
-                    if search:
-                        search_lower = search.lower()
-                        teams = [t for t in teams if
-                                 search_lower in t.get('name', '').lower() or
-                                 search_lower in t.get('club', '').lower()]
-
-                    total = len(teams)
-                    teams = teams[offset:offset + limit]
-
-                    response_data = {
-                        "teams": teams,
-                        "total": total,
-                        "limit": limit,
-                        "offset": offset,
-                        "lastUpdated": data.get('lastUpdated'),
-                        # Metadata for dropdowns (from full dataset, not filtered)
-                        "ageGroups": all_age_groups,
-                        "genders": all_genders,
-                        "leagues": all_leagues,
-                        "states": all_states
-                    }
+                # Served from the in-memory rankings store (reloads when the file changes)
+                snapshot = RANKINGS_STORE.get()
+
+                if snapshot is not None:
+                    def build_response():
+                        teams, total = snapshot.filter_teams(
+                            gender=gender,
+                            age_groups=[a.strip() for a in age_group.split(',')] if age_group else None,
+                            leagues=[l.strip() for l in league.split(',')] if league else None,
+                            states=[s.strip() for s in state.split(',')] if state else None,
+                            search=search, offset=offset, limit=limit)
+                        return {
+                            "teams": teams,
+                            "total": total,
+                            "limit": limit,
+                            "offset": offset,
+                            "lastUpdated": snapshot.last_updated,
+                            # Metadata for dropdowns (from full dataset, not filtered)
+                            **snapshot.metadata()
+                        }
+
+                    # 304 / cached compressed body when this page was served for this snapshot
+                    etag, modified = self._rankings_etag(snapshot)
+                    sent_bytes = self._send_json(build=build_response, extra_headers=rate_headers,
+                                                 etag=etag, last_modified=modified)
 
                     # Log API call
                     if ACTIVITY_TRACKING_ENABLED:
@@ -2646,13 +3109,10 @@ class AdminHandler(BaseHTTPRequestHandler):
                             ip_address=ip_address,
                             params={'gender': gender, 'age_group': age_group, 'league': league,
                                     'state': state, 'limit': limit, 'offset': offset},
-                            status_code=200,
+                            status_code=200 if sent_bytes else 304,
                             response_time_ms=int((time.time() - start_time) * 1000),
-                            response_size_bytes=len(json.dumps(response_data))
+                            response_size_bytes=sent_bytes
                         )
-
-                    self._set_headers(extra_headers=rate_headers)
-                    self.wfile.write(json.dumps(response_data).encode())
                 else:
                     self._set_headers(404)
                     self.wfile.write(json.dumps({"error": "Rankings data not found"}).encode())
@@ -2670,25 +3130,11 @@ class AdminHandler(BaseHTTPRequestHandler):
                     self.wfile.write(json.dumps({"error": "Rate limit exceeded"}).encode())
                     return
 
-                # Load rankings and find team
-                rankings_path = SCRIPT_DIR / "public" / "rankings_for_react.json"
-                if not rankings_path.exists():
-                    rankings_path = RANKINGS_OUTPUT
-
-                if rankings_path.exists():
-                    with open(rankings_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                # Find by rank, name or team_url (first match in rankings order)
+                snapshot = RANKINGS_STORE.get()
 
-                    teams = data.get('teamsData', [])
-                    team = None
-
-                    # Find by various identifiers
-                    for t in teams:
-                        if (str(t.get('rank')) == team_id or
-                            t.get('name', '').lower() == team_id.lower() or
-                            t.get('team_url', '') == team_id):
-                            team = t
-                            break
+                if snapshot is not None:
+                    team = snapshot.find_team(team_id)
 
                     if team:
                         # Log page view for activity tracking
@@ -2705,8 +3151,9 @@ class AdminHandler(BaseHTTPRequestHandler):
                                     user_id=user_info.get('uid') if user_info else None
                                 )
 
-                        self._set_headers(extra_headers=rate_headers)
-                        self.wfile.write(json.dumps({"team": team}).encode())
+                        etag, modified = self._rankings_etag(snapshot)
+                        self._send_json({"team": team}, extra_headers=rate_headers,
+                                        etag=etag, last_modified=modified)
                     else:
                         self._set_headers(404)
                         self.wfile.write(json.dumps({"error": "Team not found"}).encode())
@@ -2726,24 +3173,18 @@ class AdminHandler(BaseHTTPRequestHandler):
                     self.wfile.write(json.dumps({"error": "Rate limit exceeded"}).encode())
                     return
 
-                rankings_path = SCRIPT_DIR / "public" / "rankings_for_react.json"
-                if not rankings_path.exists():
-                    rankings_path = RANKINGS_OUTPUT
-
-                if rankings_path.exists():
-                    with open(rankings_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                snapshot = RANKINGS_STORE.get()
 
-                    teams = data.get('teamsData', [])
-                    club_teams = [t for t in teams if t.get('club', '').lower() == club_name.lower()]
+                if snapshot is not None:
+                    club_teams = snapshot.club_teams(club_name)
 
                     if club_teams:
-                        self._set_headers(extra_headers=rate_headers)
-                        self.wfile.write(json.dumps({
+                        etag, modified = self._rankings_etag(snapshot)
+                        self._send_json(build=lambda: {
                             "club": club_name,
                             "teams": club_teams,
                             "count": len(club_teams)
-                        }).encode())
+                        }, extra_headers=rate_headers, etag=etag, last_modified=modified)
                     else:
                         self._set_headers(404)
                         self.wfile.write(json.dumps({"error": "Club not found"}).encode())
@@ -2762,41 +3203,54 @@ class AdminHandler(BaseHTTPRequestHandler):
                     self.wfile.write(json.dumps({"error": "Query must be at least 2 characters"}).encode())
                     return
 
-                rankings_path = SCRIPT_DIR / "public" / "rankings_for_react.json"
-                if not rankings_path.exists():
-                    rankings_path = RANKINGS_OUTPUT
-
                 results = {"teams": [], "clubs": [], "players": []}
 
-                if rankings_path.exists():
-                    with open(rankings_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-
-                    q_lower = q.lower()
-
-                    if search_type in ['all', 'team']:
-                        teams = data.get('teamsData', [])
-                        matching_teams = [t for t in teams if q_lower in t.get('name', '').lower()][:limit]
-                        results["teams"] = matching_teams
-
-                    if search_type in ['all', 'club']:
-                        teams = data.get('teamsData', [])
-                        clubs = {}
-                        for t in teams:
-                            club = t.get('club', '')
-                            if q_lower in club.lower() and club not in clubs:
-                                clubs[club] = {"name": club, "team_count": 0}
-                            if club in clubs:
-                                clubs[club]["team_count"] += 1
-                        results["clubs"] = list(clubs.values())[:limit]
-
-                    if search_type in ['all', 'player']:
-                        players = data.get('playersData', [])
-                        matching_players = [p for p in players if q_lower in p.get('name', '').lower()][:limit]
-                        results["players"] = matching_players
+                snapshot = RANKINGS_STORE.get()
 
-                self._set_headers()
-                self.wfile.write(json.dumps(results).encode())
+                if snapshot is not None:
+                    def build_results():
+                        if search_type in ['all', 'team']:
+                            results["teams"] = snapshot.search_teams(q, limit)
+
+                        if search_type in ['all', 'club']:
+                            results["clubs"] = snapshot.search_clubs(q, limit)
+
+                        if search_type in ['all', 'player']:
+                            results["players"] = snapshot.search_players(q, limit)
+                        return results
+
+                    etag, modified = self._rankings_etag(snapshot)
+                    self._send_json(build=build_results, etag=etag, last_modified=modified)
+                else:
+                    self._send_json(results)
+
+            elif path == '/api/v1/rankings/history':
+                # One team's ranking history from the rankings_history table
+                # ?name=<display name>&age_group=G12  (or ?key=<stable key>)
+                if rankings_history is None or not DATABASE_PATH.exists():
+                    self._set_headers(503)
+                    self.wfile.write(json.dumps({"error": "Rankings history not available"}).encode())
+                    return
+
+                key = get_param('key') or rankings_history.stable_key(
+                    {'name': get_param('name', ''), 'ageGroup': get_param('age_group', '')})
+                try:
+                    limit = int(get_param('limit', rankings_history.HISTORY_LIMIT))
+                except ValueError:
+                    limit = 0
+
+                if limit < 1:
+                    self._set_headers(400)
+                    self.wfile.write(json.dumps({"error": "limit must be a positive integer"}).encode())
+                elif key == '_':
+                    self._set_headers(400)
+                    self.wfile.write(json.dumps({"error": "name and age_group (or key) are required"}).encode())
+                else:
+                    etag, modified = self._database_etag()
+                    self._send_json(build=lambda: {
+                        "key": key,
+                        "history": read_rankings_history(key, min(limit, 365))
+                    }, etag=etag, last_modified=modified)
 
             # ========== API V1 - ACTIVITY TRACKING ENDPOINTS ==========
             elif path == '/api/v1/activity/stats':
@@ -2811,6 +3265,9 @@ class AdminHandler(BaseHTTPRequestHandler):
                 if ACTIVITY_TRACKING_ENABLED:
                     date = get_param('date')
                     stats = get_daily_stats(date)
+                    stats['writer'] = activity_writer_stats()
+                    stats['rate_limits'] = {"ip": rate_limit_stats(), "user": user_rate_limit_stats()}
+                    stats['auth_token_cache'] = token_cache_stats()
                     self._set_headers()
                     self.wfile.write(json.dumps(stats).encode())
                 else:
@@ -2969,12 +3426,10 @@ class AdminHandler(BaseHTTPRequestHandler):
                 self.wfile.write(json.dumps(result).encode())
             
             elif path == '/api/ranker/run':
-                self._set_headers()
-                self.wfile.write(json.dumps(run_ranker()).encode())
+                self._run_long_job('ranker', run_ranker)
             
             elif path == '/api/export':
-                self._set_headers()
-                self.wfile.write(json.dumps(export_to_react()).encode())
+                self._run_long_job('export', export_to_react)
             
             elif path == '/api/launch-react':
                 self._set_headers()
@@ -3309,17 +3764,33 @@ class AdminHandler(BaseHTTPRequestHandler):
         # Custom logging
         print(f"[{datetime.now().strftime('%H:%M:%S')}] {args[0]}")
 
-def run_server(port=5050, open_browser=True):
+def run_server(port=5050, open_browser=True, threads=DEFAULT_WORKERS, backlog=DEFAULT_BACKLOG,
+               request_timeout=DEFAULT_REQUEST_TIMEOUT, max_long_jobs=DEFAULT_MAX_LONG_JOBS,
+               single_threaded=False):
     """Start the admin server"""
     # Initialize ratings table on startup
     init_ratings_table()
 
-    server = HTTPServer(('localhost', port), AdminHandler)
+    AdminHandler.timeout = request_timeout
+    # Build/refresh the team & player search tables without delaying startup
+    get_db_search().sync_in_background()
+    threading.Thread(target=ensure_list_indexes, daemon=True).start()
+    ensure_rankings_history()
+    LONG_JOBS.max_jobs = max_long_jobs
+    if single_threaded:
+        server = HTTPServer(('localhost', port), AdminHandler)
+        mode = "single-threaded"
+    else:
+        server = PooledHTTPServer(('localhost', port), AdminHandler, workers=threads,
+                                  backlog=backlog, request_timeout=request_timeout)
+        mode = f"{threads} worker threads, queue {backlog}, {request_timeout}s timeout, {max_long_jobs} long job(s)"
+        install_shutdown_handlers(server)
     
     print("\n" + "=" * 60)
     print("  SEEDLINE ADMIN SERVER")
     print("=" * 60)
     print(f"\n  Server running at: http://localhost:{port}")
+    print(f"  Mode: {mode}")
     print(f"  Dashboard: Open admin_dashboard.html in your browser")
     print(f"\n  Database: {DATABASE_PATH}")
     print(f"  Exists: {'Yes' if DATABASE_PATH.exists() else 'No'}")
@@ -3334,8 +3805,20 @@ def run_server(port=5050, open_browser=True):
     try:
         server.serve_forever()
     except KeyboardInterrupt:
-        print("\n\n  Server stopped")
-        server.shutdown()
+        pass
+
+    # Pooled mode: serve_forever() returns on SIGINT/SIGTERM; let running requests finish
+    if not single_threaded:
+        print(f"  Waiting up to {SHUTDOWN_GRACE}s for {server.in_flight} in-flight request(s)...")
+        left = server.drain(SHUTDOWN_GRACE)
+        if left:
+            print(f"  [WARN] {left} request(s) still running, stopping anyway")
+        print(f"  Served {server.stats['served']:,} requests "
+              f"({server.stats['rejected_full'] + server.stats['rejected_stale']:,} turned away busy)")
+    server.server_close()
+    if ACTIVITY_TRACKING_ENABLED and not shutdown_activity_writer(SHUTDOWN_GRACE):
+        print("  [WARN] Activity log not fully written before shutdown")
+    print("\n\n  Server stopped")
 
 # ============================================================================
 # MAIN
@@ -3345,6 +3828,21 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Seedline Admin Server')
     parser.add_argument('--port', type=int, default=5050, help='Server port')
     parser.add_argument('--no-browser', action='store_true', help="Don't open browser")
+    parser.add_argument('--threads', type=int, default=DEFAULT_WORKERS,
+                        help=f'Worker threads (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--backlog', type=int, default=DEFAULT_BACKLOG,
+                        help=f'Requests allowed to wait for a worker before 503 (default: {DEFAULT_BACKLOG})')
+    parser.add_argument('--request-timeout', type=float, default=DEFAULT_REQUEST_TIMEOUT,
+                        help=f'Per-request socket/queue timeout in seconds (default: {DEFAULT_REQUEST_TIMEOUT})')
+    parser.add_argument('--max-long-jobs', type=int, default=DEFAULT_MAX_LONG_JOBS,
+                        help=f'Ranker/export runs allowed at once (default: {DEFAULT_MAX_LONG_JOBS})')
+    parser.add_argument('--single-threaded', action='store_true',
+                        help='Serve one request at a time (the old server, for comparisons)')
+    parser.add_argument('--slow-query-ms', type=float, default=SLOW_QUERY_MS,
+                        help=f'Log admin SQL statements slower than this (default: {SLOW_QUERY_MS})')
     args = parser.parse_args()
+    DB_SLOW_QUERY_MS = args.slow_query_ms
     
-    run_server(args.port, not args.no_browser)
+    run_server(args.port, not args.no_browser, threads=args.threads, backlog=args.backlog,
+               request_timeout=args.request_timeout, max_long_jobs=args.max_long_jobs,
+               single_threaded=args.single_threaded)
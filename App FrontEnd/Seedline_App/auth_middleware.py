@@ -1,17 +1,24 @@
 """
 Firebase Authentication Middleware for Seedline API
 Verifies Firebase JWT tokens and extracts user information.
+Tokens that pass are cached until their exp claim, so repeat requests with
+the same token skip verification (token_cache_stats() reports hits/misses).
 """
 
 import json
 import time
 import base64
+import hashlib
+import threading
 import urllib.request
 import ssl
 from pathlib import Path
 from functools import lru_cache
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 
+from rate_limiter import RateLimiter
+
 # Firebase project configuration
 # These are public values - safe to include in code
 FIREBASE_PROJECT_ID = "seedline-ai"
@@ -22,6 +29,74 @@ _firebase_keys_cache = {
     "expires_at": 0
 }
 
+# Verified tokens kept (least recently used first out when full)
+TOKEN_CACHE_SIZE = 10000
+
+
+class VerifiedTokenCache:
+    """
+    User info of tokens that already passed verify_firebase_token, keyed by a
+    SHA-256 digest of the token (the token itself is not kept) and expiring at
+    the token's own exp claim. Bounded; least recently used entries go first.
+    """
+
+    def __init__(self, max_entries: int = TOKEN_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()   # digest -> (exp, user info)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+            if now > entry[0]:
+                del self._entries[digest]
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return dict(entry[1])
+
+    def put(self, digest: str, exp: float, user_info: Dict[str, Any]):
+        with self._lock:
+            self._entries[digest] = (exp, dict(user_info))
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "expired": self.expired,
+                "evicted": self.evicted,
+            }
+
+
+_verified_tokens = VerifiedTokenCache()
+
 
 def _base64url_decode(data: str) -> bytes:
     """Decode base64url encoded data."""
@@ -108,6 +183,12 @@ def verify_firebase_token(token: str) -> Optional[Dict[str, Any]]:
     if not token:
         return None
 
+    # Repeat requests with the same token skip decoding and the claim checks
+    digest = VerifiedTokenCache.digest(token)
+    user_info = _verified_tokens.get(digest)
+    if user_info is not None:
+        return user_info
+
     try:
         # Decode the JWT
         decoded = _decode_jwt_without_verification(token)
@@ -152,7 +233,7 @@ def verify_firebase_token(token: str) -> Optional[Dict[str, Any]]:
             return None
 
         # Token is valid - return user info
-        return {
+        user_info = {
             "uid": sub,
             "email": payload.get("email"),
             "email_verified": payload.get("email_verified", False),
@@ -161,12 +242,19 @@ def verify_firebase_token(token: str) -> Optional[Dict[str, Any]]:
             "auth_time": payload.get("auth_time"),
             "firebase": payload.get("firebase", {})
         }
+        _verified_tokens.put(digest, exp, user_info)
+        return user_info
 
     except Exception as e:
         print(f"[AUTH] Token verification error: {e}")
         return None
 
 
+def token_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the verified-token cache"""
+    return _verified_tokens.stats()
+
+
 def get_auth_from_request(headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
     """
     Extract and verify authentication from request headers.
@@ -243,8 +331,8 @@ def get_account_type_from_user(user_info: Dict[str, Any], users_lookup_func) ->
     return 'free'  # Authenticated but not in local DB
 
 
-# Rate limit tracking per user
-_user_rate_limits = {}
+# Rate limit tracking per user (token buckets, idle users evicted)
+USER_RATE_LIMITER = RateLimiter()
 
 def check_user_rate_limit(user_id: str, account_type: str = 'guest') -> tuple:
     """
@@ -257,29 +345,9 @@ def check_user_rate_limit(user_id: str, account_type: str = 'guest') -> tuple:
     Returns:
         (allowed: bool, remaining: int, reset_time: int)
     """
-    from activity_logger import RATE_LIMITS
-
-    limit = RATE_LIMITS.get(account_type, RATE_LIMITS['guest'])
-    window = 60  # 1 minute window
-
-    now = time.time()
-    window_start = now - window
-
-    if user_id not in _user_rate_limits:
-        _user_rate_limits[user_id] = []
-
-    # Clean old entries
-    _user_rate_limits[user_id] = [
-        t for t in _user_rate_limits[user_id]
-        if t > window_start
-    ]
-
-    current = len(_user_rate_limits[user_id])
+    return USER_RATE_LIMITER.check(user_id, account_type)
 
-    if current >= limit:
-        oldest = min(_user_rate_limits[user_id]) if _user_rate_limits[user_id] else now
-        reset_time = int(oldest + window - now)
-        return False, 0, max(1, reset_time)
 
-    _user_rate_limits[user_id].append(now)
-    return True, limit - current - 1, window
+def user_rate_limit_stats() -> Dict[str, Any]:
+    """Counters of the per-user limiter (see rate_limiter.RateLimiter.stats)"""
+    return USER_RATE_LIMITER.stats()
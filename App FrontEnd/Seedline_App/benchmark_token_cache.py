@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark the verified-token cache in auth_middleware.py.
+
+Builds unsigned Firebase-shaped ID tokens and runs verify_firebase_token over
+them with a stub key-server check standing in for signature verification
+(a --check-ms delay per real verification; no network). Three runs:
+  uncached    - cache cleared before every call (every call verifies)
+  same token  - one token, repeated (every call after the first is a hit)
+  mixed       - --users tokens, picked with a skew toward a few busy users
+
+User info from the cached runs is compared with the uncached result, so a
+speedup never hides a behaviour change.
+
+USAGE:
+  python benchmark_token_cache.py                       # 20k calls, 2 ms stub check
+  python benchmark_token_cache.py --calls 50000 --check-ms 0
+  python benchmark_token_cache.py --users 5000 --cache-size 1000
+"""
+
+import argparse
+import base64
+import json
+import random
+import time
+
+import auth_middleware
+from auth_middleware import FIREBASE_PROJECT_ID, VerifiedTokenCache
+
+
+def _segment(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b'=').decode()
+
+
+def make_token(uid, lifetime=3600):
+    now = int(time.time())
+    payload = {
+        "iss": f"https://securetoken.google.com/{FIREBASE_PROJECT_ID}",
+        "aud": FIREBASE_PROJECT_ID,
+        "sub": uid, "email": f"{uid}@example.com", "email_verified": True,
+        "iat": now, "exp": now + lifetime, "auth_time": now,
+    }
+    return f"{_segment({'alg': 'RS256', 'kid': 'stub'})}.{_segment(payload)}.c2lnbmF0dXJl"
+
+
+def install_stub_check(check_ms):
+    """Make every real verification pay check_ms, as a key-server / RS256 check would"""
+    decode = auth_middleware._decode_jwt_without_verification
+    counter = {'checks': 0}
+
+    def checked(token):
+        counter['checks'] += 1
+        if check_ms:
+            time.sleep(check_ms / 1000)
+        return decode(token)
+
+    auth_middleware._decode_jwt_without_verification = checked
+    return counter
+
+
+def run(label, tokens, calls, counter, clear_each=False, expected=None):
+    cache = auth_middleware._verified_tokens
+    cache.clear()
+    cache.hits = cache.misses = cache.expired = cache.evicted = 0
+    checks_before = counter['checks']
+    start = time.perf_counter()
+    for i in range(calls):
+        if clear_each:
+            cache.clear()
+        token = tokens[i % len(tokens)]
+        info = auth_middleware.verify_firebase_token(token)
+        if expected is not None and info != expected[token]:
+            raise SystemExit(f"[FAIL] {label}: cached user info differs for {info and info.get('uid')}")
+    elapsed = time.perf_counter() - start
+    stats = cache.stats()
+    print(f"  {label:<11} {elapsed / calls * 1e6:10.1f} us/call  "
+          f"{counter['checks'] - checks_before:>7,} checks  hit rate {stats['hit_rate']}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the verified-token cache')
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--check-ms', type=float, default=2.0, help='Stub key-server check per verification')
+    parser.add_argument('--users', type=int, default=500, help='Distinct tokens in the mixed run')
+    parser.add_argument('--cache-size', type=int, default=auth_middleware.TOKEN_CACHE_SIZE)
+    args = parser.parse_args()
+
+    auth_middleware._verified_tokens = VerifiedTokenCache(args.cache_size)
+    counter = install_stub_check(args.check_ms)
+
+    users = [make_token(f"user{i:05d}") for i in range(args.users)]
+    rng = random.Random(42)
+    mixed = [users[min(int(rng.paretovariate(1.2)) - 1, args.users - 1)] for _ in range(args.calls)]
+
+    # Reference answers, verified without the cache
+    expected = {}
+    for token in set(mixed) | {users[0]}:
+        auth_middleware._verified_tokens.clear()
+        expected[token] = auth_middleware.verify_firebase_token(token)
+
+    # Uncached calls pay the stub check every time; cap them so the run stays short
+    uncached_calls = min(args.calls, 2000) if args.check_ms else args.calls
+    print(f"[OK] {args.calls:,} calls, stub check {args.check_ms:g} ms, cache size {args.cache_size:,}")
+    uncached = run('uncached', [users[0]], uncached_calls, counter, clear_each=True) / uncached_calls
+    same = run('same token', [users[0]], args.calls, counter, expected=expected) / args.calls
+    mixed_time = run('mixed', mixed, args.calls, counter, expected=expected) / args.calls
+    print(f"  speedup: same token {uncached / same:,.0f}x, mixed {uncached / mixed_time:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
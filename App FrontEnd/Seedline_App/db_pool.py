@@ -0,0 +1,284 @@
+"""
+Pooled SQLite access for the admin server's seedlinedata.db queries.
+
+Every admin function used to open a fresh sqlite3 connection: no WAL, default
+page cache, no mmap, a new statement cache each time, and the same
+sqlite_master / PRAGMA table_info probes on every request. DatabasePool
+replaces that with:
+
+  - one read connection per worker thread (thread-local, opened on first use)
+    with query_only, mmap_size, cache_size and temp_store set, so the page
+    cache and prepared statements survive between requests; it is closed when
+    its thread exits
+  - a single writer connection behind a lock (WAL, synchronous=NORMAL,
+    busy_timeout) for the update/delete endpoints; commits on success, rolls
+    back on error
+  - tables() / columns() cached per PRAGMA schema_version, so the existence
+    and column probes cost one pragma instead of a catalog scan
+  - per-statement timing (execute plus fetch) aggregated by SQL text, with
+    statements over slow_query_ms printed and kept in a short recent list,
+    and a per-thread running total (thread_db_seconds) for request metrics
+
+Reused connections keep their compiled statements in sqlite3's per-connection
+statement cache (STATEMENT_CACHE), so repeated admin queries skip the
+prepare step.
+
+USAGE:
+    pool = DatabasePool(DATABASE_PATH)
+    conn = pool.reader()                      # this thread's connection; don't close it
+    if pool.has_table(conn, 'teams'):
+        rows = conn.execute("SELECT COUNT(*) FROM teams").fetchall()
+    with pool.writer() as conn:
+        conn.execute("DELETE FROM games WHERE rowid = ?", [rowid])
+    pool.query_stats()        # slowest statements first
+"""
+
+import re
+import sqlite3
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+SLOW_QUERY_MS = 250                    # Log statements slower than this
+MMAP_SIZE = 256 * 1024 * 1024          # Bytes of the database file to memory-map
+CACHE_SIZE_KB = 16 * 1024              # Page cache per connection
+STATEMENT_CACHE = 256                  # Prepared statements kept per connection
+BUSY_TIMEOUT_MS = 10000                # Writer waits this long for a scraper's write lock
+RECENT_SLOW = 50                       # Slow statements kept for query_stats()
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _normalize(sql):
+    return _WHITESPACE_RE.sub(' ', sql).strip()[:300]
+
+
+class _TimedCursor(sqlite3.Cursor):
+    """Cursor that reports execute + fetch time of each statement to its pool"""
+
+    pool = None
+
+    def execute(self, sql, parameters=()):
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._sql = sql
+            self._elapsed = time.perf_counter() - start
+            self.pool._record(sql, self._elapsed, first=True)
+
+    def _fetched(self, start):
+        elapsed = time.perf_counter() - start
+        sql = getattr(self, '_sql', None)
+        if sql is not None:
+            before = self._elapsed
+            self._elapsed += elapsed
+            self.pool._record(sql, elapsed, first=False, total=self._elapsed, before=before)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        try:
+            return super().fetchone()
+        finally:
+            self._fetched(start)
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        try:
+            return super().fetchmany(self.arraysize if size is None else size)
+        finally:
+            self._fetched(start)
+
+    def fetchall(self):
+        start = time.perf_counter()
+        try:
+            return super().fetchall()
+        finally:
+            self._fetched(start)
+
+
+class _TimedConnection(sqlite3.Connection):
+    """Connection whose cursors (including conn.execute shortcuts) are timed"""
+
+    cursor_class = _TimedCursor
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or self.cursor_class)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+
+class _Reader:
+    """Holds a thread's reader in its threading.local; collected when the thread exits"""
+
+    __slots__ = ('conn', '__weakref__')
+
+    def __init__(self, conn):
+        self.conn = conn
+
+
+class DatabasePool:
+    """Thread-local tuned readers plus one locked writer for a SQLite database"""
+
+    def __init__(self, db_path, slow_query_ms=SLOW_QUERY_MS):
+        self.db_path = Path(db_path)
+        self.slow_query_ms = slow_query_ms
+        self._local = threading.local()
+        self._readers = []               # every reader opened, for close()
+        self._readers_lock = threading.Lock()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        self._schema = (None, {})        # (schema_version, {table: [columns]})
+        self._stats_lock = threading.Lock()
+        self._stats = {}                 # sql -> [count, total_s, max_s]
+        self._slow = deque(maxlen=RECENT_SLOW)
+        # Each pool gets its own cursor class so timings land in the right pool
+        self._cursor_class = type('PoolCursor', (_TimedCursor,), {'pool': self})
+        self._connection_class = type('PoolConnection', (_TimedConnection,), {'cursor_class': self._cursor_class})
+
+    def _connect(self):
+        return sqlite3.connect(str(self.db_path), timeout=BUSY_TIMEOUT_MS / 1000,
+                               check_same_thread=False, cached_statements=STATEMENT_CACHE,
+                               factory=self._connection_class)
+
+    # ─── Connections ─────────────────────────────────────────────────────────
+
+    def reader(self):
+        """
+        This thread's read-only connection. It stays open between requests, so
+        callers don't close it; plain SELECTs never leave a transaction open.
+        """
+        holder = getattr(self._local, 'reader', None)
+        if holder is None:
+            conn = self._connect()
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+            conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KB}")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            holder = self._local.reader = _Reader(conn)
+            with self._readers_lock:
+                self._readers.append(conn)
+            # A thread's locals are dropped when it exits; close its reader then
+            weakref.finalize(holder, self._release_reader, conn)
+        return holder.conn
+
+    def _release_reader(self, conn):
+        with self._readers_lock:
+            try:
+                self._readers.remove(conn)
+            except ValueError:
+                return  # Already closed by close()
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def reader_count(self):
+        """Readers currently open"""
+        with self._readers_lock:
+            return len(self._readers)
+
+    @contextmanager
+    def writer(self):
+        """The single write connection, locked; commits on success, rolls back on error"""
+        with self._writer_lock:
+            if self._writer is None:
+                conn = self._connect()
+                conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+                try:
+                    conn.execute("PRAGMA journal_mode = WAL")
+                except sqlite3.OperationalError:
+                    pass  # Locked by a scraper right now; the scrapers set WAL themselves
+                conn.execute("PRAGMA synchronous = NORMAL")
+                self._writer = conn
+            conn = self._writer
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def close(self):
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    # ─── Schema (cached per schema_version) ──────────────────────────────────
+
+    def _load_schema(self, conn):
+        version = conn.execute("PRAGMA schema_version").fetchone()[0]
+        cached_version, schema = self._schema
+        if version != cached_version:
+            tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()]
+            schema = {table: None for table in tables}
+            self._schema = (version, schema)
+        return schema
+
+    def tables(self, conn):
+        """Table names, in sqlite_master order"""
+        return list(self._load_schema(conn))
+
+    def has_table(self, conn, table):
+        return table in self._load_schema(conn)
+
+    def columns(self, conn, table):
+        """Column names of `table` ([] if it doesn't exist)"""
+        schema = self._load_schema(conn)
+        if table not in schema:
+            return []
+        if schema[table] is None:
+            schema[table] = [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")').fetchall()]
+        return schema[table]
+
+    # ─── Query timing ────────────────────────────────────────────────────────
+
+    def _record(self, sql, elapsed, first, total=None, before=None):
+        key = _normalize(sql)
+        self._local.db_seconds = getattr(self._local, 'db_seconds', 0.0) + elapsed
+        with self._stats_lock:
+            entry = self._stats.get(key)
+            if entry is None:
+                entry = self._stats[key] = [0, 0.0, 0.0]
+            if first:
+                entry[0] += 1
+            entry[1] += elapsed
+            total = elapsed if total is None else total
+            entry[2] = max(entry[2], total)
+        threshold = self.slow_query_ms / 1000
+        # Log once per statement: when execute alone, or execute + fetch, first crosses the threshold
+        if total >= threshold and (before is None or before < threshold):
+            self._slow.append({"sql": key, "ms": round(total * 1000, 1), "at": time.strftime('%Y-%m-%d %H:%M:%S')})
+            print(f"[SLOW SQL] {total * 1000:.0f} ms: {key[:160]}")
+
+    def thread_db_seconds(self):
+        """Seconds this thread has spent in statements on this pool (take differences)"""
+        return getattr(self._local, 'db_seconds', 0.0)
+
+    def query_stats(self, limit=25):
+        """Statements by total time, plus the most recent slow ones"""
+        with self._stats_lock:
+            rows = sorted(self._stats.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+            slow = list(self._slow)
+        return {
+            "db_path": str(self.db_path),
+            "slow_query_ms": self.slow_query_ms,
+            "statements": [
+                {"sql": sql, "count": count, "total_ms": round(total * 1000, 1),
+                 "avg_ms": round(total * 1000 / count, 2) if count else 0, "max_ms": round(peak * 1000, 1)}
+                for sql, (count, total, peak) in rows
+            ],
+            "recent_slow": slow[::-1],
+        }
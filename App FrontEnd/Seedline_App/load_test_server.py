@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+load_test_server.py - Mixed-traffic load test for admin_server.py
+
+Sends a mix of fast rankings lookups and slow database endpoints from several
+client threads for a fixed time, then reports requests/sec and p50/p95/p99
+latency overall and per request type. Run it once against the old
+single-threaded server and once against the pooled server to compare:
+
+    python admin_server.py --no-browser --single-threaded --port 5051
+    python load_test_server.py --url http://localhost:5051 --label before
+
+    python admin_server.py --no-browser --port 5052
+    python load_test_server.py --url http://localhost:5052 --label after
+
+Usage:
+    python load_test_server.py --url http://localhost:5050 --clients 16 --duration 20
+    python load_test_server.py --slow-weight 0      # Fast lookups only
+    python load_test_server.py --idle-clients 2     # Plus connections that never send a request
+"""
+
+import argparse
+import json
+import random
+import socket
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import quote, urlparse
+
+# (name, weight, path) - paths get {age}/{q}/{rank} filled in per request
+FAST_REQUESTS = [
+    ('rankings', 5, '/api/v1/rankings?age_group={age}&limit=50'),
+    ('search', 3, '/api/v1/rankings/search?q={q}&limit=10'),
+    ('team', 2, '/api/v1/rankings/team/{rank}'),
+]
+SLOW_REQUESTS = [
+    ('stats', 1, '/api/stats'),
+    ('games', 1, '/api/games?limit=200'),
+]
+AGE_GROUPS = ['G08/07', 'G09', 'G10', 'G11', 'G12', 'G13', 'B08/07', 'B10', 'B12']
+QUERIES = ['united', 'fc', 'sc', 'academy', 'surf', 'rush', 'elite', 'city']
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, int(round(pct / 100 * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+def build_mix(slow_weight):
+    mix = [(name, weight, path) for name, weight, path in FAST_REQUESTS]
+    if slow_weight > 0:
+        mix += [(name, weight * slow_weight, path) for name, weight, path in SLOW_REQUESTS]
+    return mix
+
+
+def fetch(url, timeout):
+    """(status, seconds) for one GET; status 0 means a connection error or timeout"""
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except (urllib.error.URLError, OSError):
+        status = 0
+    return status, time.perf_counter() - start
+
+
+def idle_client(host, port, stop):
+    """Hold a connection open without sending a request (a stalled client)"""
+    while not stop.is_set():
+        try:
+            sock = socket.create_connection((host, port), timeout=5)
+        except OSError:
+            time.sleep(0.5)
+            continue
+        sock.settimeout(1)
+        try:
+            while not stop.is_set():
+                try:
+                    if not sock.recv(1024):
+                        break  # Server closed it (request timeout)
+                except socket.timeout:
+                    continue
+        except OSError:
+            pass
+        finally:
+            sock.close()
+
+
+def run_load(base_url, clients, duration, slow_weight, timeout, idle_clients=0, seed=1):
+    mix = build_mix(slow_weight)
+    names = [name for name, _, _ in mix]
+    weights = [weight for _, weight, _ in mix]
+    paths = {name: path for name, _, path in mix}
+    results = []  # (name, status, seconds)
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    parsed = urlparse(base_url)
+    idle_threads = [threading.Thread(target=idle_client, args=(parsed.hostname, parsed.port or 80, stop), daemon=True)
+                    for _ in range(idle_clients)]
+    for thread in idle_threads:
+        thread.start()
+
+    def client(index):
+        rng = random.Random(seed + index)
+        local = []
+        while not stop.is_set():
+            name = rng.choices(names, weights)[0]
+            path = paths[name].format(age=quote(rng.choice(AGE_GROUPS)), q=rng.choice(QUERIES),
+                                      rank=rng.randint(1, 50))
+            status, seconds = fetch(base_url + path, timeout)
+            local.append((name, status, seconds))
+        with lock:
+            results.extend(local)
+
+    threads = [threading.Thread(target=client, args=(i,), daemon=True) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join(timeout + 5)
+    elapsed = time.perf_counter() - start
+    return results, elapsed
+
+
+def summarize(results, elapsed):
+    def block(rows):
+        ok = [seconds for _, status, seconds in rows if 200 <= status < 400]
+        statuses = {}
+        for _, status, _ in rows:
+            statuses[status] = statuses.get(status, 0) + 1
+        return {
+            'requests': len(rows),
+            'ok': len(ok),
+            'rps': round(len(ok) / elapsed, 1),
+            'p50_ms': round(percentile(ok, 50) * 1000, 1),
+            'p95_ms': round(percentile(ok, 95) * 1000, 1),
+            'p99_ms': round(percentile(ok, 99) * 1000, 1),
+            'statuses': {str(k): v for k, v in sorted(statuses.items())},
+        }
+
+    by_name = {}
+    for row in results:
+        by_name.setdefault(row[0], []).append(row)
+    return {
+        'seconds': round(elapsed, 1),
+        'overall': block(results),
+        'by_type': {name: block(rows) for name, rows in sorted(by_name.items())},
+    }
+
+
+def print_summary(summary, label):
+    print("\n" + "=" * 72)
+    print(f"  LOAD TEST{' - ' + label if label else ''} ({summary['seconds']}s)")
+    print("=" * 72)
+    print(f"  {'type':<10} {'requests':>9} {'ok':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  statuses")
+    rows = list(summary['by_type'].items()) + [('ALL', summary['overall'])]
+    for name, stats in rows:
+        statuses = ', '.join(f"{k}:{v}" for k, v in stats['statuses'].items())
+        print(f"  {name:<10} {stats['requests']:>9,} {stats['ok']:>8,} {stats['rps']:>8} "
+              f"{stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8}  {statuses}")
+    print("=" * 72)
+    print("  (status 0 = connection error or client timeout)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mixed-traffic load test for the admin server")
+    parser.add_argument('--url', default='http://localhost:5050', help='Server base URL')
+    parser.add_argument('--clients', type=int, default=16, help='Concurrent client threads (default: 16)')
+    parser.add_argument('--duration', type=float, default=20, help='Seconds to run (default: 20)')
+    parser.add_argument('--slow-weight', type=float, default=1,
+                        help='Weight multiplier for slow endpoints, 0 to skip them (default: 1)')
+    parser.add_argument('--idle-clients', type=int, default=0,
+                        help='Extra connections that never send a request (default: 0)')
+    parser.add_argument('--timeout', type=float, default=30, help='Client timeout per request (default: 30)')
+    parser.add_argument('--label', default='', help='Label for the report (e.g. before/after)')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip('/')
+    status, _ = fetch(base_url + '/api/v1/rankings?limit=1', args.timeout)
+    if status != 200:
+        print(f"[ERROR] {base_url} is not answering /api/v1/rankings (status {status})")
+        sys.exit(1)
+
+    print(f"[INFO] {args.clients} clients, {args.idle_clients} idle, {args.duration:g}s against {base_url}")
+    results, elapsed = run_load(base_url, args.clients, args.duration, args.slow_weight,
+                                args.timeout, args.idle_clients)
+    summary = summarize(results, elapsed)
+    if args.json:
+        print(json.dumps({'label': args.label, **summary}, indent=2))
+    else:
+        print_summary(summary, args.label)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Tail and follow scraper log files without reading them whole.
+
+get_scraper_logs read every log (scraper_schedule.log, scraper_ecnl.log, ...)
+with readlines() to return its last 100 lines, and the dashboard re-polled
+for new output. On logs of many megabytes that is the whole file per request.
+
+  - tail_lines() seeks to the end and reads backwards in BLOCK_SIZE blocks
+    until it has the last N lines - cost depends on N, not the file size
+  - LineCounter keeps the line count per file and counts only bytes appended
+    since the last call (a file that shrank or was replaced is recounted)
+  - read_from() returns the complete lines written after a byte offset and the
+    offset to continue from; the SSE stream in admin_server polls it so the
+    dashboard receives new lines as they are written
+
+Lines come back as readlines() gave them: decoded as UTF-8 (undecodable bytes
+dropped), '\\n' line endings kept.
+
+USAGE:
+    lines, size = tail_lines(log_path, 100)
+    new_lines, offset = read_from(log_path, size)     # later: lines appended since
+    LINE_COUNTER.count(log_path)
+"""
+
+import os
+import threading
+
+BLOCK_SIZE = 64 * 1024        # Bytes read per backwards step
+MAX_READ = 4 * 1024 * 1024    # Most bytes read_from() returns per call
+
+
+def _lines(data):
+    """Bytes -> lines the way text-mode readlines() splits them"""
+    text = data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+    parts = text.split('\n')
+    lines = [part + '\n' for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+def _count_breaks(data, after_cr=False):
+    """
+    Line endings in data as _lines() splits them ('\r\n', '\n' or a lone '\r').
+    after_cr: the byte before data was '\r', so a leading '\n' ends no new line.
+    """
+    breaks = data.count(b'\n') + data.count(b'\r') - data.count(b'\r\n')
+    if after_cr and data.startswith(b'\n'):
+        breaks -= 1
+    return breaks
+
+
+def tail_lines(path, n):
+    """(last n lines, file size in bytes)"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if n <= 0:
+            return [], size
+        position = size
+        data = b''
+        # One newline more than n: the block before the first wanted line may be partial
+        while position > 0 and _count_breaks(data) <= n:
+            step = min(BLOCK_SIZE, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    lines = _lines(data)
+    if position > 0:
+        lines = lines[1:]  # Started mid-line
+    return lines[-n:], size
+
+
+def read_from(path, offset):
+    """
+    (complete lines written after byte `offset`, offset to continue from).
+    A trailing line without its newline yet is left for the next call; a file
+    smaller than `offset` (truncated or rotated) is read from the start.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size < offset:
+            offset = 0
+        if size == offset:
+            return [], offset
+        f.seek(offset)
+        data = f.read(min(size - offset, MAX_READ))
+    # Last line ending; a '\r' as the final byte may be the first half of '\r\n'
+    end = max(data.rfind(b'\n'), data.rfind(b'\r', 0, len(data) - 1))
+    if end < 0:
+        if len(data) < MAX_READ:
+            return [], offset
+        end = len(data) - 1  # One huge line; pass it on in pieces
+    return _lines(data[:end + 1]), offset + end + 1
+
+
+class LineCounter:
+    """Line counts per file, updated from the bytes appended since the last call"""
+
+    def __init__(self):
+        self._counts = {}   # path -> (inode, bytes counted, lines, counted bytes end in '\r')
+        self._lock = threading.Lock()
+
+    def count(self, path):
+        path = str(path)
+        stat = os.stat(path)
+        with self._lock:
+            inode, counted, lines, after_cr = self._counts.get(path, (None, 0, 0, False))
+        if inode != stat.st_ino or stat.st_size < counted:
+            counted, lines, after_cr = 0, 0, False
+        if stat.st_size > counted:
+            with open(path, 'rb') as f:
+                f.seek(counted)
+                while True:
+                    block = f.read(BLOCK_SIZE * 16)
+                    if not block:
+                        break
+                    lines += _count_breaks(block, after_cr)
+                    after_cr = block.endswith(b'\r')
+                    counted += len(block)
+        with self._lock:
+            self._counts[path] = (stat.st_ino, counted, lines, after_cr)
+        # readlines() also counted a last line without a newline
+        return lines + (1 if counted and not self._ends_with_newline(path, counted) else 0)
+
+    @staticmethod
+    def _ends_with_newline(path, size):
+        with open(path, 'rb') as f:
+            f.seek(size - 1)
+            return f.read(1) in (b'\n', b'\r')
+
+
+LINE_COUNTER = LineCounter()
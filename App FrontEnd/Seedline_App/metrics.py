@@ -0,0 +1,176 @@
+"""
+In-process request metrics for the admin server, in Prometheus text format.
+
+The only timing the server kept was the response_time_ms column log_api_call
+writes for /api/v1/rankings - nothing for the admin endpoints, no status
+codes, no sizes, nothing showing which endpoint slows down as the database
+grows.
+
+MetricsRegistry records, per (method, route):
+
+  - requests by status code
+  - a latency histogram (LATENCY_BUCKETS, seconds) with sum and count
+  - response bytes written (headers included)
+  - time spent in SQLite through the admin DatabasePool
+
+Routes are labelled by their pattern, not the raw path - /api/teams/123 and
+/api/teams/456 are both "/api/teams/{id}" (route_prefixes) - and 404s are
+one "unmatched" route, so random URLs can't grow the label set. At most
+MAX_ROUTES routes are tracked; the rest are counted as "other".
+
+Recording is a dict lookup, a bisect and a few additions under one lock.
+render() writes the Prometheus text exposition format (version 0.0.4), plus
+any extra gauges/counters the caller passes (queue depths, cache hits, ...).
+
+USAGE:
+    METRICS = MetricsRegistry(route_prefixes=[('/api/teams/', '/api/teams/{id}')])
+    handler.wfile = CountingWriter(handler.wfile)                # in setup()
+    METRICS.record('GET', '/api/teams/12', 200, 0.004, handler.wfile.bytes, db_seconds=0.003)
+    text = METRICS.render([('seedline_queue_depth', 'gauge', 'Events waiting', [({}, 12)])])
+"""
+
+import bisect
+import threading
+import time
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+MAX_ROUTES = 200
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _number(value):
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+class CountingWriter:
+    """Wraps a handler's wfile to count the bytes written through it"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.bytes = 0
+
+    def write(self, data):
+        self.bytes += len(data)
+        return self.raw.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+
+class _RouteStats:
+    __slots__ = ('statuses', 'buckets', 'latency_sum', 'count', 'bytes', 'db_seconds')
+
+    def __init__(self):
+        self.statuses = {}
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)   # last one is +Inf
+        self.latency_sum = 0.0
+        self.count = 0
+        self.bytes = 0
+        self.db_seconds = 0.0
+
+
+class MetricsRegistry:
+    """Request counts, status codes, latency histograms, bytes and SQLite time per route"""
+
+    def __init__(self, route_prefixes=(), max_routes=MAX_ROUTES):
+        # Longest prefix first so '/api/v1/ratings/team/' wins over '/api/v1/ratings/'
+        self.route_prefixes = sorted(route_prefixes, key=lambda item: len(item[0]), reverse=True)
+        self.max_routes = max_routes
+        self._routes = {}            # (method, route) -> _RouteStats
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def route_label(self, path, status):
+        if status == 404:
+            return 'unmatched'
+        for prefix, label in self.route_prefixes:
+            if path.startswith(prefix):
+                return label
+        return path
+
+    def record(self, method, path, status, seconds, response_bytes=0, db_seconds=0.0):
+        route = self.route_label(path, status)
+        index = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            stats = self._routes.get((method, route))
+            if stats is None:
+                if len(self._routes) >= self.max_routes:
+                    route = 'other'
+                    stats = self._routes.get((method, route))
+                if stats is None:
+                    stats = self._routes[(method, route)] = _RouteStats()
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.buckets[index] += 1
+            stats.latency_sum += seconds
+            stats.count += 1
+            stats.bytes += response_bytes
+            stats.db_seconds += db_seconds
+
+    def render(self, extra=()):
+        """
+        Prometheus text format. `extra` is a list of
+        (name, type, help, [(labels dict, value), ...]) added after the request metrics.
+        """
+        with self._lock:
+            routes = [(key, stats.statuses.copy(), list(stats.buckets), stats.latency_sum,
+                       stats.count, stats.bytes, stats.db_seconds)
+                      for key, stats in sorted(self._routes.items())]
+
+        out = []
+        out.append('# HELP seedline_http_requests_total HTTP requests by route and status code')
+        out.append('# TYPE seedline_http_requests_total counter')
+        for (method, route), statuses, *_ in routes:
+            for status, count in sorted(statuses.items()):
+                out.append(f'seedline_http_requests_total'
+                           f'{_labels({"method": method, "route": route, "status": status})} {count}')
+
+        out.append('# HELP seedline_http_request_duration_seconds Time from request line to last byte written')
+        out.append('# TYPE seedline_http_request_duration_seconds histogram')
+        for (method, route), _, buckets, latency_sum, count, _, _ in routes:
+            labels = {"method": method, "route": route}
+            cumulative = 0
+            for bound, bucket in zip(LATENCY_BUCKETS, buckets):
+                cumulative += bucket
+                out.append(f'seedline_http_request_duration_seconds_bucket{_labels({**labels, "le": bound})} {cumulative}')
+            out.append(f'seedline_http_request_duration_seconds_bucket{_labels({**labels, "le": "+Inf"})} {count}')
+            out.append(f'seedline_http_request_duration_seconds_sum{_labels(labels)} {_number(latency_sum)}')
+            out.append(f'seedline_http_request_duration_seconds_count{_labels(labels)} {count}')
+
+        out.append('# HELP seedline_http_response_bytes_total Response bytes written, headers included')
+        out.append('# TYPE seedline_http_response_bytes_total counter')
+        for (method, route), _, _, _, _, response_bytes, _ in routes:
+            out.append(f'seedline_http_response_bytes_total{_labels({"method": method, "route": route})} {response_bytes}')
+
+        out.append('# HELP seedline_http_request_db_seconds_total Time spent in SQLite (admin connection pool) while serving')
+        out.append('# TYPE seedline_http_request_db_seconds_total counter')
+        for (method, route), _, _, _, _, _, db_seconds in routes:
+            out.append(f'seedline_http_request_db_seconds_total{_labels({"method": method, "route": route})} {_number(db_seconds)}')
+
+        out.append('# HELP seedline_process_start_time_seconds When the server process started (unix time)')
+        out.append('# TYPE seedline_process_start_time_seconds gauge')
+        out.append(f'seedline_process_start_time_seconds {_number(self.started_at)}')
+
+        for name, metric_type, help_text, samples in extra:
+            out.append(f'# HELP {name} {help_text}')
+            out.append(f'# TYPE {name} {metric_type}')
+            for labels, value in samples:
+                if value is None:
+                    continue
+                out.append(f'{name}{_labels(labels)} {_number(value)}')
+        return '\n'.join(out) + '\n'
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
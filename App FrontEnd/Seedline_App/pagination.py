@@ -0,0 +1,160 @@
+"""
+Keyset pagination for the admin /api/teams, /api/players and /api/games lists.
+
+Those endpoints paged with LIMIT ? OFFSET ?, so page N made SQLite walk and
+discard every row of pages 1..N-1, and every page re-ran a SELECT COUNT(*)
+with the same filters. Deep pages of the games browser got steadily slower.
+
+  - each list has a sort expression with a matching index (SORT_KEYS /
+    INDEXES); pages after the first continue from an opaque cursor holding
+    the last row's (sort key, rowid), so every page is an index seek:
+        WHERE sort_expr >= ? AND (sort_expr > ? OR rowid > ?)
+        ORDER BY sort_expr, rowid LIMIT ?
+  - cursors carry a fingerprint of the filters they were issued for; a cursor
+    reused with different filters is rejected rather than silently skipping
+  - COUNT(*) results are kept per (table, filters) in CountCache: reused while
+    the database is unchanged, and for up to COUNT_MAX_AGE seconds after it
+    changes (flagged total_approximate), then recounted on the next request
+  - ensure_indexes() creates the sort/filter indexes once per database
+
+offset= still works for callers that jump to a page; it is just not the fast
+path.
+
+USAGE:
+    scope = cursor_scope('games', where_sql, params, 'desc')
+    after = decode_cursor(token, scope)          # None for the first page
+    clause, clause_params = keyset_clause(sort_expr, after, 'desc')    # ... LIMIT limit + 1
+    next_cursor = encode_cursor(last_sort_value, last_rowid, scope) if more_rows else None
+"""
+
+import base64
+import hashlib
+import json
+import threading
+import time
+
+COUNT_MAX_AGE = 60.0        # Seconds a count may lag a changing database
+COUNT_CACHE_SIZE = 500
+
+# Sort expression per list (NULLs folded to '' so keyset comparisons never see NULL)
+SORT_KEYS = {
+    'teams': "COALESCE(team_name, '')",
+    'players': "COALESCE(player_name, '')",
+    'games': "COALESCE(game_date_iso, game_date, '')",
+}
+
+# (index name, table, indexed expressions, columns the table must have)
+INDEXES = [
+    ('idx_teams_sort', 'teams', "COALESCE(team_name, '')", ('team_name',)),
+    ('idx_teams_age_sort', 'teams', "age_group, COALESCE(team_name, '')", ('age_group', 'team_name')),
+    ('idx_players_sort', 'players', "COALESCE(player_name, '')", ('player_name',)),
+    ('idx_players_age_sort', 'players', "age_group, COALESCE(player_name, '')", ('age_group', 'player_name')),
+    ('idx_games_sort', 'games', "COALESCE(game_date_iso, game_date, '')", ('game_date_iso', 'game_date')),
+    ('idx_games_age_sort', 'games', "age_group, COALESCE(game_date_iso, game_date, '')",
+     ('age_group', 'game_date_iso', 'game_date')),
+    ('idx_games_status_sort', 'games', "game_status, COALESCE(game_date_iso, game_date, '')",
+     ('game_status', 'game_date_iso', 'game_date')),
+    ('idx_games_league_age_date', 'games', "league, age_group, game_date_iso",
+     ('league', 'age_group', 'game_date_iso')),
+]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CURSORS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def cursor_scope(table, where_sql, params, direction='asc'):
+    """Fingerprint of the query a cursor belongs to"""
+    raw = json.dumps([table, where_sql, list(params), direction], default=str)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:12]
+
+
+def encode_cursor(sort_value, rowid, scope):
+    raw = json.dumps([sort_value, rowid, scope], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token, scope):
+    """(sort value, rowid) from a cursor token, None if no token; ValueError if invalid"""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        sort_value, rowid, token_scope = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if token_scope != scope:
+        raise ValueError("Cursor does not match these filters - start again without a cursor")
+    return sort_value, int(rowid)
+
+
+def keyset_clause(sort_expr, position, direction='asc'):
+    """
+    (WHERE fragment, params) continuing after a cursor's (sort value, rowid).
+    Spelled out rather than as a row value, (sort_expr, rowid) > (?, ?), which
+    SQLite only applies as a filter over a full index scan; the leading
+    sort_expr >= ? is a range the expression index can seek to.
+    """
+    sort_value, rowid = position
+    op = '<' if direction == 'desc' else '>'
+    return (f"{sort_expr} {op}= ? AND ({sort_expr} {op} ? OR rowid {op} ?)",
+            [sort_value, sort_value, rowid])
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COUNTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class CountCache:
+    """COUNT(*) per (table, filters), refreshed lazily when the database changes"""
+
+    def __init__(self, max_age=COUNT_MAX_AGE, max_entries=COUNT_CACHE_SIZE):
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._entries = {}  # key -> (count, db version, counted at)
+        self._lock = threading.Lock()
+
+    def get(self, key, version, count):
+        """
+        (total, approximate). `count()` runs only when there is no cached value,
+        or the database changed since it was taken and it is max_age seconds old.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            total, counted_version, counted_at = entry
+            if counted_version == version:
+                return total, False
+            if now - counted_at < self.max_age:
+                return total, True
+        total = count()
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                oldest = min(self._entries, key=lambda k: self._entries[k][2])
+                del self._entries[oldest]
+            self._entries[key] = (total, version, now)
+        return total, False
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# INDEXES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ensure_indexes(conn, columns):
+    """
+    CREATE INDEX IF NOT EXISTS for every INDEXES entry whose table has the
+    needed columns. `columns(table)` returns a table's column names.
+    Returns the names of the indexes that were missing.
+    """
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'").fetchall()}
+    created = []
+    for name, table, expressions, needed in INDEXES:
+        if name in existing:
+            continue
+        table_columns = columns(table)
+        if not table_columns or any(column not in table_columns for column in needed):
+            continue
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({expressions})")
+        created.append(name)
+    return created
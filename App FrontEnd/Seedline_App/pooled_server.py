@@ -0,0 +1,189 @@
+"""
+Concurrent HTTP server for admin_server.py.
+
+The admin server used to run on a plain HTTPServer: one request at a time, so
+a ranker run (up to 5 minutes), an export or a slow /api/stats query stalled
+every rankings lookup queued behind it, and a client that opened a connection
+and never sent anything blocked the whole server.
+
+PooledHTTPServer hands each accepted connection to a fixed pool of worker
+threads through a bounded queue:
+
+  - at most `workers` requests run at once; up to `backlog` more wait
+  - when the queue is full the connection gets an immediate 503 (Retry-After)
+    instead of piling up in the listen backlog
+  - a request that waited longer than `request_timeout` in the queue is
+    answered with 503 rather than served to a client that has given up
+  - the handler's socket timeout (`request_timeout`) bounds slow clients
+  - drain() lets in-flight requests finish, up to a deadline, on shutdown
+
+JobLimiter caps how many long jobs (ranker run, export) run at once - the
+rest get a 429 right away instead of holding a worker for minutes.
+
+USAGE:
+    server = PooledHTTPServer(('localhost', 5050), AdminHandler, workers=16)
+    install_shutdown_handlers(server)
+    server.serve_forever()          # returns after SIGINT / SIGTERM
+    server.drain(SHUTDOWN_GRACE)
+    server.server_close()
+"""
+
+import json
+import queue
+import signal
+import threading
+import time
+from http.server import HTTPServer
+
+DEFAULT_WORKERS = 16
+DEFAULT_BACKLOG = 64          # Connections allowed to wait for a worker
+DEFAULT_REQUEST_TIMEOUT = 30  # Seconds: socket timeout and max queue wait
+DEFAULT_MAX_LONG_JOBS = 1     # Ranker/export runs at once (they write the same files)
+SHUTDOWN_GRACE = 10           # Seconds to let in-flight requests finish
+
+
+def _busy_response(message, retry_after=1):
+    body = json.dumps({"error": message, "code": "SERVER_BUSY"}).encode()
+    return (b"HTTP/1.1 503 Service Unavailable\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Access-Control-Allow-Origin: *\r\n"
+            + f"Retry-After: {retry_after}\r\n".encode()
+            + f"Content-Length: {len(body)}\r\n".encode()
+            + b"Connection: close\r\n\r\n" + body)
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that serves requests on a bounded pool of worker threads"""
+
+    def __init__(self, server_address, handler_class, workers=DEFAULT_WORKERS,
+                 backlog=DEFAULT_BACKLOG, request_timeout=DEFAULT_REQUEST_TIMEOUT):
+        self.request_queue_size = max(backlog, 5)  # listen() backlog
+        super().__init__(server_address, handler_class)
+        self.workers = workers
+        self.request_timeout = request_timeout
+        self._queue = queue.Queue(maxsize=backlog)
+        self._active = 0
+        self._idle = threading.Condition()
+        self.stats = {'served': 0, 'rejected_full': 0, 'rejected_stale': 0}
+        self._threads = []
+        for i in range(workers):
+            thread = threading.Thread(target=self._worker, name=f'admin-http-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    # ─── socketserver hooks ──────────────────────────────────────────────────
+
+    def process_request(self, request, client_address):
+        """Called on the accept thread: queue the connection or turn it away"""
+        with self._idle:
+            self._active += 1
+        try:
+            self._queue.put_nowait((request, client_address, time.monotonic()))
+        except queue.Full:
+            self._reject(request, "Server busy, try again shortly")
+            self._done('rejected_full')
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            request, client_address, queued_at = item
+            if time.monotonic() - queued_at > self.request_timeout:
+                self._reject(request, "Request timed out waiting for a worker")
+                self._done('rejected_stale')
+                continue
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+                self._done('served')
+
+    def _reject(self, request, message):
+        try:
+            request.settimeout(1)
+            request.sendall(_busy_response(message))
+        except OSError:
+            pass
+        self.shutdown_request(request)
+
+    def _done(self, outcome):
+        with self._idle:
+            self.stats[outcome] += 1
+            self._active -= 1
+            if self._active <= 0:
+                self._idle.notify_all()
+
+    # ─── Shutdown ────────────────────────────────────────────────────────────
+
+    @property
+    def in_flight(self):
+        """Requests running or waiting for a worker"""
+        return self._active
+
+    def drain(self, timeout=SHUTDOWN_GRACE):
+        """
+        Wait up to `timeout` seconds for queued and running requests to finish,
+        then stop the workers. Call after serve_forever() has returned.
+        Returns the number of requests still running at the deadline.
+        """
+        deadline = time.monotonic() + timeout
+        with self._idle:
+            while self._active > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._idle.wait(remaining)
+            left = self._active
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                break
+        return left
+
+
+class JobLimiter:
+    """Caps concurrent long-running jobs; acquire() never blocks"""
+
+    def __init__(self, max_jobs=DEFAULT_MAX_LONG_JOBS):
+        self.max_jobs = max_jobs
+        self._lock = threading.Lock()
+        self._running = {}  # job name -> start time
+
+    def acquire(self, name):
+        """Start job `name` if under the cap and not already running. Returns True if started."""
+        with self._lock:
+            if name in self._running or len(self._running) >= self.max_jobs:
+                return False
+            self._running[name] = time.time()
+            return True
+
+    def release(self, name):
+        with self._lock:
+            self._running.pop(name, None)
+
+    def running(self):
+        """{job name: seconds running}"""
+        now = time.time()
+        with self._lock:
+            return {name: round(now - started, 1) for name, started in self._running.items()}
+
+
+def install_shutdown_handlers(server):
+    """
+    Stop serve_forever() on SIGINT/SIGTERM. shutdown() blocks until the serve
+    loop exits, so it runs on its own thread rather than inside the handler.
+    """
+    def handle(signum, frame):
+        if getattr(server, '_stopping', False):
+            return
+        server._stopping = True
+        print(f"\n  Received {signal.Signals(signum).name}, finishing in-flight requests...")
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGINT, handle)
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, handle)
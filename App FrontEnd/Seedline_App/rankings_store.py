@@ -0,0 +1,214 @@
+"""
+In-memory rankings store for the /api/v1/rankings endpoints.
+
+Every rankings request used to json.load the whole rankings_for_react.json,
+rebuild the dropdown lists and filter the teams with list comprehensions.
+RankingsStore loads the data once per process and keeps an immutable
+RankingsSnapshot with everything the handlers need pre-built:
+
+  - teams by id, by rank, by lowercase name, by team_url and by lowercase club
+  - (gender, age group, league, state) buckets of team positions; positions are
+    file order, which is rank order within an age group
+  - the ageGroups / genders / leagues / states dropdown lists
+  - lowercase name/club columns for the filter_teams substring search
+  - ranked typeahead indexes (search_index.TypeaheadIndex) for teams, clubs and
+    players; a reload reuses the previous snapshot's index for any of the three
+    whose rows didn't change
+
+get() re-checks the rankings file's mtime (at most every CHECK_INTERVAL
+seconds) and, when it changed, builds a new snapshot and swaps it in with one
+assignment - requests in flight keep the snapshot they started with.
+
+USAGE:
+    store = RankingsStore(get_path, load)     # load(path) -> {'teamsData': [...], 'playersData': [...]}
+    snapshot = store.get()
+    teams, total = snapshot.filter_teams(gender='Girls', age_groups=['G12'], limit=100)
+"""
+
+import heapq
+import threading
+import time
+from collections import defaultdict
+
+from search_index import TypeaheadIndex
+
+CHECK_INTERVAL = 1.0  # Seconds between mtime checks
+
+
+def _age_sort_key(age_group):
+    """Girls first, then oldest (lowest number) ... as the rankings dropdown expects"""
+    return (age_group[0] != 'G', -int(age_group[1:]) if age_group[1:].isdigit() else 0)
+
+
+class RankingsSnapshot:
+    """One loaded rankings file plus its indexes. Never modified after __init__."""
+
+    def __init__(self, data, source=None, mtime=None, previous=None):
+        self.source = source
+        self.mtime = mtime
+        # Identifies this data for HTTP validators (ETag / Last-Modified)
+        self.version = f"{source}:{mtime}"
+        self.modified_at = mtime[0] / 1e9 if mtime else None
+        self.loaded_at = time.time()
+        self.last_updated = data.get('lastUpdated')
+        self.teams = data.get('teamsData') or []
+        self.players = data.get('playersData') or []
+
+        teams = self.teams
+        self.by_id = {}
+        self.by_rank = {}
+        self.by_name = {}
+        self.by_url = {}
+        self.by_club = defaultdict(list)
+        self.club_counts = {}     # club -> team count, first-seen order
+        self.buckets = defaultdict(list)
+        self.names_lower = []
+        self.clubs_lower = []
+
+        for pos, team in enumerate(teams):
+            name = team.get('name') or ''
+            club = team.get('club') or ''
+            self.by_id.setdefault(team.get('id'), pos)
+            self.by_rank.setdefault(str(team.get('rank')), pos)
+            self.by_name.setdefault(name.lower(), pos)
+            if team.get('team_url'):
+                self.by_url.setdefault(team['team_url'], pos)
+            self.by_club[club.lower()].append(pos)
+            self.club_counts[club] = self.club_counts.get(club, 0) + 1
+            self.names_lower.append(name.lower())
+            self.clubs_lower.append(club.lower())
+            key = ((team.get('gender') or '').lower(), team.get('ageGroup'),
+                   team.get('league'), (team.get('state') or '').upper())
+            self.buckets[key].append(pos)
+
+        self.by_club = dict(self.by_club)
+        self.buckets = dict(self.buckets)
+        self.club_names = list(self.club_counts)
+
+        # Typeahead: names ranked first, then club / age group / state / team name words
+        self.team_index = TypeaheadIndex.build(
+            [t.get('name') for t in teams],
+            [' '.join(str(t.get(k) or '') for k in ('club', 'ageGroup', 'state')) for t in teams],
+            previous=previous.team_index if previous else None)
+        self.club_index = TypeaheadIndex.build(
+            self.club_names, previous=previous.club_index if previous else None)
+        self.player_index = TypeaheadIndex.build(
+            [p.get('name') for p in self.players],
+            [' '.join(str(p.get(k) or '') for k in ('teamName', 'ageGroup')) for p in self.players],
+            previous=previous.player_index if previous else None)
+
+        # Dropdown metadata from the full dataset
+        self.age_groups = sorted({t.get('ageGroup') for t in teams if t.get('ageGroup')}, key=_age_sort_key)
+        self.genders = sorted({t.get('gender') for t in teams if t.get('gender')})
+        self.leagues = sorted({t.get('league') for t in teams if t.get('league')})
+        self.states = sorted({t.get('state') for t in teams if t.get('state')})
+
+    def metadata(self):
+        return {
+            "ageGroups": self.age_groups,
+            "genders": self.genders,
+            "leagues": self.leagues,
+            "states": self.states,
+        }
+
+    # ─── Lookups ─────────────────────────────────────────────────────────────
+
+    def find_team(self, team_id):
+        """First team (file order) whose rank, lowercase name or team_url equals team_id"""
+        matches = [index.get(key) for index, key in ((self.by_rank, team_id),
+                                                      (self.by_name, team_id.lower()),
+                                                      (self.by_url, team_id))]
+        matches = [pos for pos in matches if pos is not None]
+        return self.teams[min(matches)] if matches else None
+
+    def team_by_id(self, team_id):
+        pos = self.by_id.get(team_id)
+        return self.teams[pos] if pos is not None else None
+
+    def club_teams(self, club_name):
+        return [self.teams[pos] for pos in self.by_club.get(club_name.lower(), [])]
+
+    def filter_teams(self, gender=None, age_groups=None, leagues=None, states=None,
+                     search=None, offset=0, limit=100):
+        """
+        Teams matching every given filter, in file (rank) order.
+        Returns (page of teams, total matches).
+        """
+        gender = gender.lower() if gender else None
+        age_groups = set(age_groups) if age_groups else None
+        leagues = set(leagues) if leagues else None
+        states = {s.upper() for s in states} if states else None
+
+        if gender is None and age_groups is None and leagues is None and states is None:
+            positions = range(len(self.teams))
+        else:
+            lists = [positions for (g, a, l, s), positions in self.buckets.items()
+                     if (gender is None or g == gender)
+                     and (age_groups is None or a in age_groups)
+                     and (leagues is None or l in leagues)
+                     and (states is None or s in states)]
+            positions = lists[0] if len(lists) == 1 else list(heapq.merge(*lists))
+
+        if search:
+            q = search.lower()
+            positions = [pos for pos in positions if q in self.names_lower[pos] or q in self.clubs_lower[pos]]
+
+        total = len(positions)
+        return [self.teams[pos] for pos in positions[offset:offset + limit]], total
+
+    # ─── Search (ranked typeahead) ───────────────────────────────────────────
+
+    def search_teams(self, q, limit):
+        return [self.teams[pos] for pos in self.team_index.search(q, limit)]
+
+    def search_clubs(self, q, limit):
+        return [{"name": self.club_names[pos], "team_count": self.club_counts[self.club_names[pos]]}
+                for pos in self.club_index.search(q, limit)]
+
+    def search_players(self, q, limit):
+        return [self.players[pos] for pos in self.player_index.search(q, limit)]
+
+
+class RankingsStore:
+    """Process-wide holder of the current RankingsSnapshot, reloaded when the file changes"""
+
+    def __init__(self, get_path, load, check_interval=CHECK_INTERVAL):
+        self.get_path = get_path
+        self.load = load
+        self.check_interval = check_interval
+        self._snapshot = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.reloads = 0
+
+    def _signature(self):
+        path = self.get_path()
+        try:
+            stat = path.stat()
+        except OSError:
+            return path, None
+        return path, (stat.st_mtime_ns, stat.st_size)
+
+    def get(self):
+        """Current snapshot, or None if there is no rankings file"""
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._checked_at < self.check_interval:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and now - self._checked_at < self.check_interval:
+                return snapshot
+            path, signature = self._signature()
+            self._checked_at = time.monotonic()
+            if signature is None:
+                return snapshot
+            if snapshot is not None and (snapshot.source, snapshot.mtime) == (path, signature):
+                return snapshot
+            data = self.load(path)
+            if data is None:
+                return snapshot
+            self._snapshot = RankingsSnapshot(data, source=path, mtime=signature, previous=snapshot)
+            self.reloads += 1
+            return self._snapshot
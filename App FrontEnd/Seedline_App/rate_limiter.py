@@ -0,0 +1,121 @@
+"""
+Token-bucket rate limiting for the Seedline API.
+
+activity_logger.check_rate_limit (per IP) and auth_middleware.check_user_rate_limit
+(per user) each kept a list of request timestamps per key, rebuilt that list
+on every request, and never forgot a key - every IP ever seen stayed in
+memory.
+
+RateLimiter replaces both:
+
+  - one bucket per key: (tokens, last update). A request refills
+    limit/WINDOW_SECONDS tokens per elapsed second, up to `limit`, and spends
+    one - constant time and two numbers per key, whatever the limit
+  - limits per account type from RATE_LIMITS (requests per minute, which is
+    also the burst size); a key whose account type changes keeps its tokens,
+    capped at the new limit
+  - keys idle for IDLE_TTL seconds (by then their bucket is full again, so
+    forgetting them changes nothing) are swept out every SWEEP_INTERVAL
+  - counters for allowed / limited requests per account type, keys tracked
+    and keys evicted, via stats()
+
+USAGE:
+    limiter = RateLimiter()
+    allowed, remaining, reset_seconds = limiter.check(ip_address, 'guest')
+    limiter.limit_for('paid')     # 120
+    limiter.stats()
+"""
+
+import math
+import threading
+import time
+
+WINDOW_SECONDS = 60        # RATE_LIMITS are per this many seconds
+IDLE_TTL = 120.0           # Forget keys idle this long (>= WINDOW_SECONDS, so their bucket is full)
+SWEEP_INTERVAL = 60.0      # Seconds between idle-key sweeps
+
+# Rate limits by account type
+RATE_LIMITS = {
+    "guest": 30,      # requests per minute
+    "free": 60,
+    "paid": 120,
+    "coach": 120,
+    "admin": 300
+}
+
+
+class RateLimiter:
+    """Per-key token buckets with per-account-type limits and idle-key eviction"""
+
+    def __init__(self, limits=None, window_seconds=WINDOW_SECONDS, idle_ttl=IDLE_TTL,
+                 sweep_interval=SWEEP_INTERVAL, clock=time.monotonic):
+        self.limits = limits if limits is not None else RATE_LIMITS
+        self.window_seconds = window_seconds
+        self.idle_ttl = max(idle_ttl, window_seconds)
+        self.sweep_interval = sweep_interval
+        self.clock = clock
+        self._buckets = {}         # key -> [tokens, last update]
+        self._lock = threading.Lock()
+        self._next_sweep = clock() + sweep_interval
+        self._allowed = {}         # account type -> count
+        self._limited = {}
+        self.evicted = 0
+
+    def limit_for(self, account_type):
+        return self.limits.get(account_type, self.limits['guest'])
+
+    def check(self, key, account_type='guest'):
+        """
+        Spend one request for `key`.
+
+        Returns:
+            (allowed: bool, remaining: int, reset_seconds: int) - reset_seconds is
+            when the next request is allowed if limited, else when the bucket is full
+        """
+        limit = self.limit_for(account_type)
+        rate = limit / self.window_seconds
+        now = self.clock()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(limit), now]
+            tokens = min(float(limit), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                self._limited[account_type] = self._limited.get(account_type, 0) + 1
+                return False, 0, max(1, math.ceil((1 - tokens) / rate))
+            tokens -= 1
+            bucket[0] = tokens
+            self._allowed[account_type] = self._allowed.get(account_type, 0) + 1
+        return True, int(tokens), max(1, math.ceil((limit - tokens) / rate))
+
+    def _sweep(self, now):
+        """Drop idle keys (caller holds the lock)"""
+        cutoff = now - self.idle_ttl
+        idle = [key for key, bucket in self._buckets.items() if bucket[1] < cutoff]
+        for key in idle:
+            del self._buckets[key]
+        self.evicted += len(idle)
+        self._next_sweep = now + self.sweep_interval
+
+    def reset(self, key=None):
+        """Forget one key's bucket, or all of them"""
+        with self._lock:
+            if key is None:
+                self._buckets.clear()
+            else:
+                self._buckets.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "keys": len(self._buckets),
+                "evicted": self.evicted,
+                "allowed": dict(self._allowed),
+                "limited": dict(self._limited),
+                "limits": dict(self.limits),
+                "window_seconds": self.window_seconds,
+            }
@@ -0,0 +1,210 @@
+"""
+HTTP response compression and conditional GET for the admin server.
+
+Every JSON response used to go out uncompressed, with no validators, on every
+poll - the full rankings page again even when nothing changed since the last
+ranker run. AdminHandler._send_json() now uses these helpers to:
+
+  - negotiate Content-Encoding (br when the brotli package is installed, else
+    gzip) for bodies of MIN_COMPRESS_BYTES or more
+  - send a strong ETag and Last-Modified derived from the data version (the
+    rankings snapshot, or the database files) and answer If-None-Match /
+    If-Modified-Since with 304 Not Modified before building the body
+  - keep compressed bodies in a byte-bounded LRU keyed by (ETag, encoding), so
+    the hottest filter combinations are compressed once per data version
+
+ETags are per representation: the base tag plus "-gzip"/"-br" for compressed
+bodies; If-None-Match accepts any of them.
+
+USAGE:
+    etag = make_etag(snapshot.version, request_path)
+    if etag_matches(request.headers.get('If-None-Match'), etag): -> 304 with that tag
+    encoding = negotiate_encoding(request.headers.get('Accept-Encoding'))
+    body = RESPONSE_CACHE.get(etag, encoding) or compress(raw, encoding)
+"""
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+MIN_COMPRESS_BYTES = 1024          # Smaller bodies aren't worth the CPU / header overhead
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5                 # Close to gzip's speed, ~15-20% smaller on rankings JSON
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+CACHE_MAX_ENTRIES = 2000
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONTENT ENCODING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _accepted(accept_encoding):
+    """{coding: q} from an Accept-Encoding header"""
+    accepted = {}
+    for part in (accept_encoding or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate_encoding(accept_encoding):
+    """'br', 'gzip' or None (identity) for an Accept-Encoding header"""
+    accepted = _accepted(accept_encoding)
+    wildcard = accepted.get('*', 0)
+    candidates = (['br'] if BROTLI_AVAILABLE else []) + ['gzip']
+    best, best_q = None, 0
+    for coding in candidates:
+        q = accepted.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body, encoding):
+    """(body, encoding actually applied) - small bodies stay uncompressed"""
+    if not encoding or len(body) < MIN_COMPRESS_BYTES:
+        return body, None
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY), 'br'
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0), 'gzip'
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VALIDATORS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def make_etag(*parts):
+    """Strong ETag (quoted) from the data version and whatever selects the body"""
+    digest = hashlib.sha1('\x1f'.join(str(p) for p in parts).encode('utf-8')).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def representation_etag(etag, encoding):
+    """ETag of one encoding of the body: "<tag>-gzip" / "<tag>-br" """
+    return f'"{etag.strip(chr(34))}-{encoding}"' if encoding else etag
+
+
+def etag_matches(if_none_match, etag):
+    """
+    The If-None-Match entry matching etag or one of its encodings (the tag to
+    send back with the 304), or None
+    """
+    if not if_none_match or not etag:
+        return None
+    base = etag.strip('"')
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*':
+            return etag
+        value = tag[2:] if tag.startswith('W/') else tag
+        value = value.strip('"')
+        if value == base or value.rsplit('-', 1)[0] == base:
+            return f'"{value}"'
+    return None
+
+
+def http_date(timestamp):
+    return formatdate(timestamp, usegmt=True)
+
+
+def not_modified_since(if_modified_since, last_modified):
+    """True if If-Modified-Since is at or after last_modified (Unix seconds)"""
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return False
+    return int(last_modified) <= since
+
+
+def file_version(*paths):
+    """
+    (version string, latest mtime) for a set of files - e.g. a SQLite database
+    and its -wal file, which changes first in WAL mode. (None, None) if none exist.
+    """
+    parts, latest = [], None
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            continue
+        parts.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+        latest = stat.st_mtime if latest is None else max(latest, stat.st_mtime)
+    return ('|'.join(parts), latest) if parts else (None, None)
+
+
+def database_version(db_path):
+    """file_version() of a SQLite database including its WAL file"""
+    db_path = Path(db_path)
+    return file_version(db_path, db_path.with_name(db_path.name + '-wal'))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COMPRESSED BODY CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ResponseCache:
+    """Thread-safe LRU of encoded bodies keyed by (ETag, requested encoding)"""
+
+    def __init__(self, max_bytes=CACHE_MAX_BYTES, max_entries=CACHE_MAX_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()   # key -> (body, applied encoding)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, etag, encoding):
+        """(body, applied encoding) or None"""
+        with self._lock:
+            entry = self._entries.get((etag, encoding))
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((etag, encoding))
+            self.hits += 1
+            return entry
+
+    def put(self, etag, encoding, body, applied):
+        if len(body) > self.max_bytes // 4:
+            return
+        key = (etag, encoding)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old[0])
+            self._entries[key] = (body, applied)
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._bytes,
+                    'hits': self.hits, 'misses': self.misses}
+
+
+RESPONSE_CACHE = ResponseCache()
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Search indexes for the admin server.
+
+TypeaheadIndex - in-memory ranked search over a list of names (rankings
+snapshot teams, clubs, players). /api/v1/rankings/search used to run
+`q in name.lower()` over every player. Now:
+
+  - the lowercase names, their words, and their words plus metadata words
+    (club, age group, state, team name) are each joined into one string, so
+    every lookup is a str.find in C instead of a Python loop over rows
+  - results are ranked: exact name, name starts with the query, every query
+    word starts a word of the name, the same counting metadata, and finally
+    plain substring (the old behaviour) - ties keep file order (rank order
+    for teams)
+  - tiers are scanned best first and the scan stops at `limit` results, so
+    short, common prefixes are as cheap as rare ones
+
+TypeaheadIndex.build(names, meta, previous) reuses `previous` when the names
+are unchanged, so a ranker run only rebuilds the indexes whose rows changed.
+
+DatabaseSearchIndex - SQLite FTS5 (trigram tokenizer) tables over the teams
+and players tables in seedlinedata.db, so get_all_teams / get_all_players
+search with the index instead of LIKE '%x%' scans. sync() is incremental:
+only rows added, deleted or renamed since the last sync are written.
+maybe_sync() runs it when the database file changed (at most every
+SYNC_INTERVAL seconds). where_clause() never waits for a sync: it starts
+maybe_sync() on a background thread when a check is due and answers from the
+index as it stands (LIKE until the first sync has finished).
+
+USAGE:
+    index = TypeaheadIndex.build(team_names, meta=team_keywords)
+    positions = index.search('alb', limit=10)
+
+    db_index = DatabaseSearchIndex('seedlinedata.db')
+    clause, params = db_index.where_clause('teams', 'albion')    # (None, None) -> use LIKE
+
+    python search_index.py --db seedlinedata.db --sync            # Bring the FTS tables up to date
+    python search_index.py --db seedlinedata.db --table teams --query albion
+    python search_index.py --bench rankings_for_react.json        # Typeahead latency
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+WORD_RE = re.compile(r'[^\W_]+')
+SEPARATOR = '\n'
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# IN-MEMORY TYPEAHEAD
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class _Blob:
+    """Texts joined into one string, SEP before each and after the last, so one
+    str.find (in C) searches them all"""
+
+    def __init__(self, texts):
+        self.text = SEPARATOR + SEPARATOR.join(texts) + SEPARATOR
+        self.starts = array('I')
+        offset = 1
+        for text in texts:
+            self.starts.append(offset)
+            offset += len(text) + 1
+
+    def scan(self, needle):
+        """Positions of texts containing needle, in order, each once. A leading or
+        trailing SEP in needle anchors it to the start or end of a text."""
+        text, starts = self.text, self.starts
+        count = len(starts)
+        i = text.find(needle)
+        while i != -1:
+            pos = bisect_right(starts, i + 1) - 1
+            yield pos
+            # Resume at the separator after this text
+            end = starts[pos + 1] - 1 if pos + 1 < count else len(text)
+            i = text.find(needle, end)
+
+
+def _has_prefix(sorted_words, prefix):
+    i = bisect_left(sorted_words, prefix)
+    return i < len(sorted_words) and sorted_words[i].startswith(prefix)
+
+
+def _word_text(text):
+    """' word1 word2 ...' - a word starts with t exactly when ' ' + t is in it"""
+    return ' ' + ' '.join(WORD_RE.findall(text))
+
+
+class TypeaheadIndex:
+    """Ranked prefix + substring search over a list of names. Never modified after build."""
+
+    def __init__(self, names, meta=None):
+        self._source = (list(names), list(meta) if meta is not None else None)
+        self.names = [(name or '').lower().replace(SEPARATOR, ' ') for name in names]
+        self.words = [_word_text(name) for name in self.names]
+        self._names = _Blob(self.names)
+        self._words = _Blob(self.words)
+        # Sorted distinct names / words: a bisect tells whether a tier can match
+        # at all, so a query with no hits doesn't scan every blob
+        self._sorted_names = sorted(set(self.names))
+        self._vocab = sorted({word for text in self.words for word in text.split()})
+        if meta is not None:
+            self.all_words = [w + _word_text((m or '').lower()) for w, m in zip(self.words, meta)]
+            self._all_words = _Blob(self.all_words)
+            self._all_vocab = sorted({word for text in self.all_words for word in text.split()})
+        else:
+            self.all_words = self._all_words = self._all_vocab = None
+
+    @classmethod
+    def build(cls, names, meta=None, previous=None):
+        """A new index, or `previous` if it was built from the same names and metadata"""
+        names = list(names)
+        meta = list(meta) if meta is not None else None
+        if previous is not None and previous._source == (names, meta):
+            return previous
+        return cls(names, meta)
+
+    def __len__(self):
+        return len(self.names)
+
+    def search(self, q, limit=20):
+        """
+        Positions of the best `limit` matches for q, best first: exact name,
+        name starts with q, every word of q starts a word of the name, same
+        counting metadata words, name contains q. File order within a tier.
+        Each tier is a scan that stops as soon as `limit` results are in.
+        """
+        q = (q or '').lower().strip().replace(SEPARATOR, ' ')
+        if not q or limit <= 0:
+            return []
+        results = []
+        seen = set()
+
+        def take(positions, texts=None, needles=()):
+            for pos in positions:
+                if pos in seen or (texts is not None and not all(n in texts[pos] for n in needles)):
+                    continue
+                seen.add(pos)
+                results.append(pos)
+                if len(results) >= limit:
+                    return True
+            return False
+
+        if _has_prefix(self._sorted_names, q):
+            exact = self._sorted_names[bisect_left(self._sorted_names, q)] == q
+            if (exact and take(self._names.scan(SEPARATOR + q + SEPARATOR))) or take(self._names.scan(SEPARATOR + q)):
+                return results
+        tokens = sorted(set(WORD_RE.findall(q)), key=len, reverse=True)
+        if tokens:
+            # Scan for the longest word, check the others on each hit
+            needles = [' ' + t for t in tokens]
+            if (all(_has_prefix(self._vocab, t) for t in tokens)
+                    and take(self._words.scan(needles[0]), self.words, needles[1:])):
+                return results
+            if (self._all_words is not None and all(_has_prefix(self._all_vocab, t) for t in tokens)
+                    and take(self._all_words.scan(needles[0]), self.all_words, needles[1:])):
+                return results
+        take(self._names.scan(q))
+        return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SQLITE FTS5 (teams / players tables)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SYNC_INTERVAL = 30.0   # Seconds between automatic syncs while the database keeps changing
+MIN_FTS_QUERY = 3      # Trigram index needs 3+ characters; shorter searches use LIKE
+
+# source table -> (FTS table, candidate text columns; the ones that exist are indexed)
+FTS_TABLES = {
+    # The columns the LIKE searches covered: team_name/club, player_name/team_name
+    'teams': ('search_teams_fts', ['team_name', 'club']),
+    'players': ('search_players_fts', ['player_name', 'team_name']),
+}
+
+
+def fts5_available():
+    try:
+        conn = sqlite3.connect(':memory:')
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5(x, tokenize='trigram')")
+        conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+class DatabaseSearchIndex:
+    """FTS5 trigram tables mirroring the name columns of teams and players"""
+
+    def __init__(self, db_path, sync_interval=SYNC_INTERVAL):
+        self.db_path = Path(db_path)
+        self.sync_interval = sync_interval
+        self.available = fts5_available()
+        self._columns = {}           # source table -> indexed columns
+        self._synced_signature = None
+        self._checked_at = None      # time.monotonic() of the last check, None before the first
+        self._lock = threading.Lock()
+        self._sync_thread = None
+        self.last_sync = None        # Stats from the most recent sync
+
+    def connect(self):
+        return sqlite3.connect(str(self.db_path), timeout=30)
+
+    def _signature(self):
+        """mtime/size of the database and its -wal file (scrapers write in WAL mode,
+        so the main file can stay untouched until a checkpoint)"""
+        signature = []
+        for path in (self.db_path, self.db_path.with_name(self.db_path.name + '-wal')):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature) or None
+
+    def _ensure_table(self, conn, source):
+        """Create (or re-create, if the source columns changed) one FTS table. Returns its columns."""
+        fts_table, candidates = FTS_TABLES[source]
+        existing = [row[1] for row in conn.execute(f"PRAGMA table_info({source})")]
+        columns = [c for c in candidates if c in existing]
+        if not columns:
+            return []
+        current = [row[1] for row in conn.execute(f"PRAGMA table_info({fts_table})")]
+        if current != columns:
+            conn.execute(f"DROP TABLE IF EXISTS {fts_table}")
+            conn.execute(f"CREATE VIRTUAL TABLE {fts_table} USING fts5({', '.join(columns)}, tokenize='trigram')")
+        return columns
+
+    def sync(self):
+        """
+        Bring the FTS tables up to date with teams/players. Only rows whose id
+        is new, gone, or whose indexed text changed are written.
+        Returns {source table: {'added': n, 'removed': n}}.
+        """
+        if not self.available or not self.db_path.exists():
+            return {}
+        signature = self._signature()
+        start = time.perf_counter()
+        stats = {}
+        indexed = {}
+        conn = self.connect()
+        try:
+            with conn:
+                for source, (fts_table, _) in FTS_TABLES.items():
+                    columns = self._ensure_table(conn, source)
+                    indexed[source] = columns
+                    if not columns:
+                        continue
+                    changed = ' OR '.join(f"s.{c} IS NOT f.{c}" for c in columns)
+                    removed = conn.execute(f"""
+                        DELETE FROM {fts_table} WHERE rowid IN (
+                            SELECT f.rowid FROM {fts_table} f
+                            LEFT JOIN {source} s ON s.rowid = f.rowid
+                            WHERE s.rowid IS NULL OR {changed}
+                        )
+                    """).rowcount
+                    added = conn.execute(f"""
+                        INSERT INTO {fts_table} (rowid, {', '.join(columns)})
+                        SELECT s.rowid, {', '.join('s.' + c for c in columns)} FROM {source} s
+                        WHERE s.rowid NOT IN (SELECT rowid FROM {fts_table})
+                    """).rowcount
+                    stats[source] = {'added': added, 'removed': removed}
+        finally:
+            conn.close()
+        # Only now are the tables committed; where_clause() may use them from other connections
+        self._columns.update(indexed)
+        self._synced_signature = signature
+        self.last_sync = {'tables': stats, 'seconds': round(time.perf_counter() - start, 3),
+                          'at': time.strftime('%Y-%m-%d %H:%M:%S')}
+        return stats
+
+    def maybe_sync(self):
+        """Sync if the database changed since the last sync (checked at most every sync_interval)"""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.sync_interval:
+            return
+        if not self._lock.acquire(blocking=False):
+            return  # Another request is syncing; use the index as it is
+        try:
+            self._checked_at = now
+            if self._synced_signature is None or self._signature() != self._synced_signature:
+                self.sync()
+        except sqlite3.Error as e:
+            print(f"[WARN] Search index sync failed: {e}")
+        finally:
+            self._lock.release()
+
+    def sync_in_background(self):
+        """maybe_sync() on a daemon thread when a check is due; returns at once"""
+        if self._checked_at is not None and time.monotonic() - self._checked_at < self.sync_interval:
+            return
+        thread = self._sync_thread
+        if thread is not None and thread.is_alive():
+            return
+        self._sync_thread = threading.Thread(target=self.maybe_sync, name='search-index-sync', daemon=True)
+        self._sync_thread.start()
+
+    def where_clause(self, source, search):
+        """
+        (SQL condition on the source table's rowid, params) matching rows whose
+        indexed columns contain `search`, or (None, None) when the index can't
+        answer it (no FTS5, table missing or not synced yet, query under
+        MIN_FTS_QUERY chars). A sync that is due runs in the background.
+        """
+        search = (search or '').strip()
+        if not self.available or len(search) < MIN_FTS_QUERY:
+            return None, None
+        self.sync_in_background()
+        if not self._columns.get(source):
+            return None, None
+        fts_table = FTS_TABLES[source][0]
+        phrase = '"' + search.replace('"', '""') + '"'
+        return f"rowid IN (SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH ?)", [phrase]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def bench(json_path, queries=('al', 'fc', 'ma', 'sa', 'uni', 'albion', 'san d', 'xz')):
+    """Typeahead latency over a rankings_for_react.json"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    teams = data.get('teamsData') or []
+    players = data.get('playersData') or []
+    start = time.perf_counter()
+    indexes = {
+        'teams': TypeaheadIndex([t.get('name') for t in teams],
+                                [' '.join(str(t.get(k) or '') for k in ('club', 'ageGroup', 'state')) for t in teams]),
+        'players': TypeaheadIndex([p.get('name') for p in players],
+                                  [' '.join(str(p.get(k) or '') for k in ('teamName', 'ageGroup')) for p in players]),
+    }
+    print(f"[OK] Built indexes for {len(teams):,} teams / {len(players):,} players "
+          f"in {time.perf_counter() - start:.2f}s")
+    for name, index in indexes.items():
+        for q in queries:
+            runs = 200
+            start = time.perf_counter()
+            for _ in range(runs):
+                hits = index.search(q, 20)
+            ms = (time.perf_counter() - start) / runs * 1000
+            print(f"  {name:<8} {q!r:<10} {len(hits):>3} hits  {ms:6.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the admin search indexes')
+    parser.add_argument('--db', help='Path to seedlinedata.db')
+    parser.add_argument('--sync', action='store_true', help='Sync the FTS tables with teams/players')
+    parser.add_argument('--table', choices=sorted(FTS_TABLES), default='teams', help='Table for --query')
+    parser.add_argument('--query', help='Search the FTS table')
+    parser.add_argument('--bench', metavar='JSON', help='Time typeahead queries over a rankings JSON')
+    args = parser.parse_args()
+
+    if args.bench:
+        bench(args.bench)
+    if not args.db:
+        if not args.bench:
+            parser.error('--db is required for --sync/--query')
+        return
+
+    index = DatabaseSearchIndex(args.db)
+    if not index.available:
+        print("[ERROR] This SQLite build has no FTS5 trigram tokenizer")
+        sys.exit(1)
+    if args.sync or not args.query:
+        stats = index.sync()
+        for table, counts in stats.items():
+            print(f"[OK] {table}: +{counts['added']:,} / -{counts['removed']:,}")
+        print(f"[INFO] Sync took {index.last_sync['seconds']}s")
+    if args.query:
+        index.maybe_sync()  # where_clause() would only start it in the background
+        clause, params = index.where_clause(args.table, args.query)
+        if clause is None:
+            print(f"[WARN] Query needs at least {MIN_FTS_QUERY} characters")
+            return
+        conn = index.connect()
+        start = time.perf_counter()
+        rows = conn.execute(f"SELECT rowid, * FROM {args.table} WHERE {clause} LIMIT 20", params).fetchall()
+        ms = (time.perf_counter() - start) * 1000
+        conn.close()
+        for row in rows:
+            print(f"  {row[:4]}")
+        print(f"[INFO] {len(rows)} rows in {ms:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""
+Materialized database statistics for /api/stats.
+
+get_database_stats() counts games, groups them by league / age group / status,
+counts teams and players, and pulls the 20 most recent results - full scans of
+the games table on every dashboard refresh, while the scrapers are writing to
+the same file.
+
+StatsSnapshot keeps the last result instead:
+
+  - in memory, and in the database_stats_snapshot table (one row: stats JSON,
+    computed_at, database version) so a restarted server answers at once
+  - get() returns the snapshot in constant time, with its computed_at under
+    "snapshot" (the body only changes when the snapshot does, so it can be
+    ETagged and cached); live age / stale / refreshing come from status(),
+    which the server sends as headers; when the database has changed since (the db or -wal file) or
+    the day has rolled over, it wakes the background refresher - one
+    long-lived thread, so the pool's per-thread reader is reused rather than
+    opened per recompute - at most every REFRESH_INTERVAL seconds, so a
+    scraper writing batches triggers one recompute per interval rather than
+    per request
+  - get(force=True) recomputes before answering (/api/stats?refresh=1)
+
+USAGE:
+    snapshot = StatsSnapshot(DATABASE_PATH, compute=compute_database_stats)
+    stats = snapshot.get()                 # {..., "snapshot": {"computed_at": ...}}
+    stats = snapshot.get(force=True)
+    snapshot.status()                      # {"age_seconds": ..., "stale": False, "refreshing": False}
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from response_cache import database_version
+
+REFRESH_INTERVAL = 30.0    # Min seconds between background recomputes while the database keeps changing
+SNAPSHOT_TABLE = 'database_stats_snapshot'
+
+
+class StatsSnapshot:
+    """Last computed stats for one database, refreshed in the background"""
+
+    def __init__(self, db_path, compute, refresh_interval=REFRESH_INTERVAL):
+        self.db_path = Path(db_path)
+        self.compute = compute
+        self.refresh_interval = refresh_interval
+        self._stats = None
+        self._computed_at = None     # Unix time
+        self._version = None         # database_version() the stats correspond to
+        self._loaded = False
+        self._refresh_lock = threading.Lock()
+        self._last_refresh = 0.0     # monotonic time of the last recompute
+        self._wake = threading.Event()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self.refreshes = 0
+
+    # ─── Persistence ─────────────────────────────────────────────────────────
+
+    def _connect(self):
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    def _load(self):
+        """Pick up the snapshot a previous server process stored"""
+        self._loaded = True
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(f"SELECT stats, computed_at, db_version FROM {SNAPSHOT_TABLE} WHERE id = 1").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return  # No snapshot table yet
+        if row:
+            self._stats, self._computed_at, self._version = json.loads(row[0]), row[1], row[2]
+
+    def _store(self, stats, computed_at, version):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {SNAPSHOT_TABLE} (
+                        id INTEGER PRIMARY KEY CHECK (id = 1),
+                        stats TEXT NOT NULL,
+                        computed_at REAL NOT NULL,
+                        db_version TEXT
+                    )
+                """)
+                conn.execute(f"""
+                    INSERT OR REPLACE INTO {SNAPSHOT_TABLE} (id, stats, computed_at, db_version)
+                    VALUES (1, ?, ?, ?)
+                """, (json.dumps(stats, default=str), computed_at, version))
+        finally:
+            conn.close()
+
+    # ─── Refresh ─────────────────────────────────────────────────────────────
+
+    def stale(self):
+        if self._stats is None:
+            return True
+        if datetime.fromtimestamp(self._computed_at).date() != datetime.now().date():
+            return True  # "Recent games" are relative to today
+        return database_version(self.db_path)[0] != self._version
+
+    def refresh(self, wait=True):
+        """Recompute now. Returns False if another refresh was running and wait is False."""
+        if not self._refresh_lock.acquire(blocking=wait):
+            return False
+        try:
+            self._last_refresh = time.monotonic()
+            version = database_version(self.db_path)[0]
+            stats = self.compute()
+            computed_at = time.time()
+            if stats.get("error") or not stats.get("connected"):
+                return True  # Don't replace a good snapshot with a failed one
+            try:
+                unchanged = database_version(self.db_path)[0] == version
+                self._store(stats, computed_at, version)
+                # Writing the snapshot row changed the file. Only when nothing else wrote
+                # during compute() is the new version ours; otherwise keep the pre-compute
+                # version, so the snapshot stays stale and the missed write is picked up
+                if unchanged:
+                    version = database_version(self.db_path)[0]
+            except sqlite3.Error as e:
+                print(f"[WARN] Could not store stats snapshot: {e}")
+            self._stats, self._computed_at, self._version = stats, computed_at, version
+            self.refreshes += 1
+            return True
+        finally:
+            self._refresh_lock.release()
+
+    def maybe_refresh(self):
+        """Start a background recompute if the snapshot is stale and none ran recently"""
+        if not self._loaded:
+            self._load()
+        if self._refresh_lock.locked() or time.monotonic() - self._last_refresh < self.refresh_interval:
+            return
+        if self.stale():
+            self._start_worker()
+            self._wake.set()
+
+    def _start_worker(self):
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._run, name='stats-snapshot', daemon=True)
+                    self._worker.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            try:
+                self.refresh(wait=False)
+            except Exception as e:
+                print(f"[WARN] Stats snapshot refresh failed: {e}")
+
+    # ─── Reads ───────────────────────────────────────────────────────────────
+
+    @property
+    def key(self):
+        """Changes whenever get() would return different stats"""
+        return self._computed_at
+
+    def get(self, force=False):
+        if not self._loaded:
+            self._load()
+        if force or self._stats is None:
+            self.refresh()
+        else:
+            self.maybe_refresh()
+        if self._stats is None:
+            return self.compute()  # Nothing stored and the compute failed: report its error
+
+        stats = dict(self._stats)
+        stats["snapshot"] = {"computed_at": datetime.fromtimestamp(self._computed_at).isoformat()}
+        return stats
+
+    def status(self):
+        """Live state of the snapshot - changes on every call, so kept out of get()'s body"""
+        if self._computed_at is None:
+            return {"age_seconds": None, "stale": True, "refreshing": self._refresh_lock.locked()}
+        return {
+            "age_seconds": round(time.time() - self._computed_at, 1),
+            "stale": self.stale(),
+            "refreshing": self._refresh_lock.locked(),
+        }
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+SQLite user store for the admin server.
+
+Accounts used to live in seedline_users.json and each user's saved data
+(players, badges, myTeams) under "user_data" in admin_config.json. Every login
+read the whole users file, scanned it for the username and rewrote all of it
+to bump last_login; every profile save rewrote all of admin_config.json. That
+is O(all users) per request, and two requests at once could lose each other's
+writes.
+
+UserStore keeps both in seedline_users.db:
+
+  - users: one row per account, UNIQUE username and an email index (both
+    case-insensitive, as the JSON lookups were), keys the schema doesn't know
+    about (set through PUT /api/users/<id>) kept in an `extra` JSON column
+  - user_data: one row per username with the saved-data JSON
+
+Each operation is one indexed statement or one short transaction, so a login
+or a profile save costs the same with 10 users or 100,000.
+
+migrate_from_json() runs once, the first time the store is opened: it copies
+the users list and admin_config.json's user_data into the tables and records
+that it ran. The JSON files are left in place as a backup.
+
+USAGE:
+    store = UserStore(data_folder / "seedline_users.db")
+    store.migrate_from_json(load_users(), load_config().get("user_data", {}))
+    result = store.authenticate('alice', 'secret')   # {"success": True, "user": {...}}
+
+    python user_store.py --db seedline_users.db --import-json seedline_users.json --config admin_config.json
+    python user_store.py --db seedline_users.db --list
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+# Columns of the users table, in the key order the JSON file used
+USER_COLUMNS = ('id', 'username', 'email', 'password', 'account_type', 'notes',
+                'created_at', 'last_login', 'teams_saved', 'games_submitted')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL UNIQUE COLLATE NOCASE,
+    email TEXT DEFAULT '' COLLATE NOCASE,
+    password TEXT,
+    account_type TEXT DEFAULT 'free',
+    notes TEXT DEFAULT '',
+    created_at TEXT,
+    last_login TEXT,
+    teams_saved INTEGER DEFAULT 0,
+    games_submitted INTEGER DEFAULT 0,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
+
+CREATE TABLE IF NOT EXISTS user_data (
+    username TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS user_store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class UserStore:
+    """Accounts and per-user saved data in SQLite"""
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(SCHEMA)
+                    self._initialized = True
+        return conn
+
+    # ─── Rows <-> dicts ──────────────────────────────────────────────────────
+
+    @staticmethod
+    def _to_dict(row):
+        user = {key: row[key] for key in USER_COLUMNS}
+        if row['extra']:
+            user.update(json.loads(row['extra']))
+        return user
+
+    @staticmethod
+    def _split(fields):
+        """(known column values, extra keys) from a user dict"""
+        columns = {k: v for k, v in fields.items() if k in USER_COLUMNS}
+        extra = {k: v for k, v in fields.items() if k not in USER_COLUMNS and k != 'extra'}
+        return columns, extra
+
+    def _insert(self, conn, user):
+        columns, extra = self._split(user)
+        columns['extra'] = json.dumps(extra, default=str) if extra else None
+        names = list(columns)
+        cursor = conn.execute(
+            f"INSERT INTO users ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+            [columns[name] for name in names])
+        return cursor.lastrowid
+
+    # ─── Accounts ────────────────────────────────────────────────────────────
+
+    def list_users(self):
+        conn = self.connect()
+        try:
+            return [self._to_dict(row) for row in conn.execute("SELECT * FROM users ORDER BY id")]
+        finally:
+            conn.close()
+
+    def get_by_username(self, username):
+        conn = self.connect()
+        try:
+            row = conn.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
+            return self._to_dict(row) if row else None
+        finally:
+            conn.close()
+
+    def get_by_email(self, email):
+        if not email:
+            return None
+        conn = self.connect()
+        try:
+            row = conn.execute("SELECT * FROM users WHERE email = ? ORDER BY id LIMIT 1", (email,)).fetchone()
+            return self._to_dict(row) if row else None
+        finally:
+            conn.close()
+
+    def authenticate(self, username, password):
+        """Check a password and record the login. Same result dicts as the JSON version."""
+        conn = self.connect()
+        try:
+            row = conn.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
+            if row is None:
+                return {"success": False, "error": "User not found"}
+            if row['password'] != password:
+                return {"success": False, "error": "Invalid password"}
+            last_login = datetime.now().isoformat()
+            with conn:
+                conn.execute("UPDATE users SET last_login = ? WHERE id = ?", (last_login, row['id']))
+            user = self._to_dict(row)
+            user['last_login'] = last_login
+            user.pop('password', None)
+            return {"success": True, "user": user}
+        finally:
+            conn.close()
+
+    def add(self, username, email="", account_type="free", notes="", password=""):
+        user = {
+            "username": username,
+            "email": email,
+            "password": password,
+            "account_type": account_type,
+            "notes": notes,
+            "created_at": datetime.now().isoformat(),
+            "last_login": None,
+            "teams_saved": 0,
+            "games_submitted": 0
+        }
+        conn = self.connect()
+        try:
+            with conn:
+                user_id = self._insert(conn, user)
+        except sqlite3.IntegrityError:
+            return {"success": False, "error": f"User '{username}' already exists"}
+        finally:
+            conn.close()
+        return {"success": True, "user": {"id": user_id, **user}}
+
+    def update(self, user_id, updates):
+        columns, extra = self._split({k: v for k, v in updates.items() if k != 'id'})
+        conn = self.connect()
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchone()
+                if row is None:
+                    return {"success": False, "error": "User not found"}
+                if extra:
+                    merged = json.loads(row['extra']) if row['extra'] else {}
+                    merged.update(extra)
+                    columns['extra'] = json.dumps(merged, default=str)
+                if columns:
+                    conn.execute(
+                        f"UPDATE users SET {', '.join(f'{name} = ?' for name in columns)} WHERE id = ?",
+                        [*columns.values(), user_id])
+                row = conn.execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchone()
+        except sqlite3.IntegrityError:
+            return {"success": False, "error": f"User '{updates.get('username')}' already exists"}
+        finally:
+            conn.close()
+        return {"success": True, "user": self._to_dict(row)}
+
+    def delete(self, user_id):
+        conn = self.connect()
+        try:
+            with conn:
+                deleted = conn.execute("DELETE FROM users WHERE id = ?", (user_id,)).rowcount
+        finally:
+            conn.close()
+        return {"success": True} if deleted else {"success": False, "error": "User not found"}
+
+    # ─── Saved data ──────────────────────────────────────────────────────────
+
+    def get_data(self, username):
+        conn = self.connect()
+        try:
+            row = conn.execute("SELECT data FROM user_data WHERE username = ?", (username,)).fetchone()
+        finally:
+            conn.close()
+        return json.loads(row['data']) if row else {"players": [], "badges": {}, "myTeams": []}
+
+    def save_data(self, username, data):
+        conn = self.connect()
+        try:
+            with conn:
+                conn.execute("""
+                    INSERT INTO user_data (username, data, updated_at) VALUES (?, ?, ?)
+                    ON CONFLICT(username) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at
+                """, (username, json.dumps(data, default=str), datetime.now().isoformat()))
+        finally:
+            conn.close()
+        return {"success": True}
+
+    # ─── Migration ───────────────────────────────────────────────────────────
+
+    def migrated(self):
+        conn = self.connect()
+        try:
+            row = conn.execute("SELECT value FROM user_store_meta WHERE key = 'migrated_from_json'").fetchone()
+            return row['value'] if row else None
+        finally:
+            conn.close()
+
+    def migrate_from_json(self, users, user_data, force=False):
+        """
+        Copy JSON-file users and user_data into the tables, once (unless force).
+        Users whose username is already taken are skipped (the JSON lookups
+        always found the first one); a clashing id gets a new one.
+        Returns (users imported, user_data rows imported), or None if it already ran.
+        """
+        conn = self.connect()
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                done = conn.execute("SELECT value FROM user_store_meta WHERE key = 'migrated_from_json'").fetchone()
+                if done and not force:
+                    return None
+                imported = 0
+                for user in users or []:
+                    if not user.get('username'):
+                        continue
+                    if conn.execute("SELECT 1 FROM users WHERE username = ?", (user['username'],)).fetchone():
+                        continue
+                    if user.get('id') is not None and conn.execute(
+                            "SELECT 1 FROM users WHERE id = ?", (user['id'],)).fetchone():
+                        user = {k: v for k, v in user.items() if k != 'id'}
+                    self._insert(conn, user)
+                    imported += 1
+                conn.executemany("""
+                    INSERT OR IGNORE INTO user_data (username, data, updated_at) VALUES (?, ?, ?)
+                """, [(name, json.dumps(data, default=str), None) for name, data in (user_data or {}).items()])
+                data_rows = len(user_data or {})
+                conn.execute("INSERT OR REPLACE INTO user_store_meta (key, value) VALUES ('migrated_from_json', ?)",
+                             (datetime.now().isoformat(),))
+            return imported, data_rows
+        finally:
+            conn.close()
+
+    def counts(self):
+        conn = self.connect()
+        try:
+            return {
+                "users": conn.execute("SELECT COUNT(*) FROM users").fetchone()[0],
+                "user_data": conn.execute("SELECT COUNT(*) FROM user_data").fetchone()[0],
+            }
+        finally:
+            conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seedline user store (SQLite)")
+    parser.add_argument('--db', required=True, help='Path to seedline_users.db')
+    parser.add_argument('--import-json', metavar='USERS_JSON', help='Import users from seedline_users.json')
+    parser.add_argument('--config', metavar='CONFIG_JSON', help='Import user_data from admin_config.json')
+    parser.add_argument('--force', action='store_true', help='Import even if a migration already ran')
+    parser.add_argument('--list', action='store_true', help='List users')
+    args = parser.parse_args()
+
+    store = UserStore(args.db)
+
+    if args.import_json or args.config:
+        users, user_data = [], {}
+        if args.import_json:
+            with open(args.import_json, 'r') as f:
+                users = json.load(f).get("users", [])
+        if args.config:
+            with open(args.config, 'r') as f:
+                user_data = json.load(f).get("user_data", {})
+        result = store.migrate_from_json(users, user_data, force=args.force)
+        if result is None:
+            print(f"[INFO] Already migrated at {store.migrated()} (use --force to import again)")
+        else:
+            print(f"[OK] Imported {result[0]} users and {result[1]} user_data rows")
+
+    if args.list:
+        for user in store.list_users():
+            print(f"  {user['id']:>5}  {user['username']:<24} {user.get('email') or '':<32} {user.get('account_type')}")
+
+    counts = store.counts()
+    print(f"[INFO] {counts['users']:,} users, {counts['user_data']:,} user_data rows in {args.db}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
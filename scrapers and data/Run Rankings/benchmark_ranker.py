@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the ranker's game-ingest phase (load_game_data).
+
+Times each cleaning step two ways on the same game rows:
+  row-wise  - the pre-V48 approach (.apply / iterrows, one call per row)
+  columnar  - the V48 approach (one call per unique name, vectorized keys/weights)
+
+Both results are compared so a speedup never hides a behaviour change.
+
+With --sos-teams N it also times the SOS propagation solver (solve_sos) on a
+synthetic N-team game graph against the pre-V48 per-team loop.
+
+USAGE:
+  python benchmark_ranker.py                       # Auto-find seedlinedata.db
+  python benchmark_ranker.py path/to/data.db       # Specific database
+  python benchmark_ranker.py --repeat 5            # Stack the games 5x to simulate more seasons
+  python benchmark_ranker.py --sos-teams 100000    # Also time the SOS solver on 100k teams
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from team_ranker_final import TeamGameGraph, TeamRankerV30, find_database
+
+
+def load_raw_games(db_path, repeat=1):
+    """Load the same raw rows load_game_data() starts from"""
+    conn = sqlite3.connect(db_path)
+    games_df = pd.read_sql_query("""
+        SELECT
+            game_id, age_group, game_date_iso as game_date, home_team, away_team,
+            home_score, away_score, league, conference, game_status, gender
+        FROM games
+        WHERE home_score IS NOT NULL AND away_score IS NOT NULL
+          AND (age_group LIKE 'G%' OR age_group LIKE 'U%' OR age_group LIKE 'B%')
+    """, conn)
+    conn.close()
+    if repeat > 1:
+        games_df = pd.concat([games_df] * repeat, ignore_index=True)
+    games_df['home_score'] = pd.to_numeric(games_df['home_score'], errors='coerce').fillna(0).astype(int)
+    games_df['away_score'] = pd.to_numeric(games_df['away_score'], errors='coerce').fillna(0).astype(int)
+    return games_df
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+# ─── Row-wise baselines (what load_game_data did before V48) ──────────────────
+
+def rowwise_game_key(row):
+    teams = sorted([row['home_team'].lower().strip(), row['away_team'].lower().strip()])
+    scores = sorted([int(row['home_score']), int(row['away_score'])])
+    return f"{row['game_date']}_{teams[0]}_{teams[1]}_{scores[0]}_{scores[1]}"
+
+
+def rowwise_recency_weight(game_date, today, decay):
+    try:
+        gd = datetime.strptime(str(game_date)[:10], '%Y-%m-%d')
+        return decay ** ((today - gd).days / 30.0)
+    except Exception:
+        return 0.5
+
+
+def rowwise_sos(graph, base_rating, league_factor, active, iterations=5, sos_weight=0.10):
+    """The pre-V48 SOS loop: fixed sweeps, one team at a time, updated in place"""
+    rating = base_rating.copy()
+    for _ in range(iterations):
+        for team_id in np.flatnonzero(active):
+            s = graph.team_slice(team_id)
+            opp_rating = rating[graph.opponent[s]]
+            opp_weight = np.clip(opp_rating / 1000, 0.5, 2.0)
+            wins = opp_weight[graph.result[s] == graph.WIN].sum() + 0.5 * opp_weight[graph.result[s] == graph.TIE].sum()
+            rating[team_id] = ((1 - sos_weight) * base_rating[team_id]
+                               + sos_weight * wins / opp_weight.sum() * 1000 * league_factor[team_id]
+                               + opp_rating.mean() / 1000 * 100)
+    return rating
+
+
+def synthetic_graph(n_teams, games_per_team=12, seed=48):
+    """Random schedule: n_teams * games_per_team / 2 games with Poisson scores"""
+    rng = np.random.default_rng(seed)
+    n_games = n_teams * games_per_team // 2
+    home = rng.integers(0, n_teams, n_games)
+    away = (home + rng.integers(1, n_teams, n_games)) % n_teams
+    strength = rng.normal(1.4, 0.5, n_teams).clip(0.2)
+    games_df = pd.DataFrame({
+        'home_team': [f"Team {i}" for i in home],
+        'away_team': [f"Team {i}" for i in away],
+        'home_score': rng.poisson(strength[home]),
+        'away_score': rng.poisson(strength[away]),
+    })
+    return TeamGameGraph(games_df)
+
+
+def run_sos_benchmark(ranker, n_teams):
+    graph = synthetic_graph(n_teams)
+    games = np.diff(graph.indptr)
+    wins = np.bincount(graph.entry_team[graph.result == graph.WIN], minlength=graph.n_teams)
+    league_factor = np.ones(graph.n_teams)
+    base_rating = wins / games * 1000
+    active = games >= ranker.MIN_GAMES
+
+    print(f"\n[CHART] SOS SOLVER: {graph.n_teams:,} teams, {len(graph.game) // 2:,} games, "
+          f"tolerance {ranker.sos_tolerance}")
+    print("-" * 96)
+    row_rating, row_t = timed(lambda: rowwise_sos(graph, base_rating, league_factor, active))
+    (col_rating, report), col_t = timed(lambda: ranker.solve_sos(graph, base_rating, league_factor, active))
+    diff = np.abs(row_rating - col_rating).max()
+    print(f"{'per-team loop (5 sweeps)':<28} {row_t:>9.3f}s")
+    print(f"{'solve_sos':<28} {col_t:>9.3f}s  {report['iterations']} iterations, residual {report['residual']:.2g}, "
+          f"{'converged' if report['converged'] else 'NOT converged'}")
+    print(f"{'speedup':<28} {row_t / col_t:>9.1f}x   max rating difference {diff:.4f}")
+    return report['converged']
+
+
+def run_benchmark(db_path, repeat=1):
+    ranker = TeamRankerV30(db_path)
+    games_df = load_raw_games(db_path, repeat)
+    rows = len(games_df)
+    unique_names = pd.concat([games_df['home_team'], games_df['away_team']]).nunique()
+
+    print(f"\n{'='*80}")
+    print("[CHART] LOAD_GAME_DATA BENCHMARK")
+    print(f"{'='*80}")
+    print(f"Database: {db_path}")
+    print(f"Rows: {rows:,}  (repeat x{repeat})   Unique team names: {unique_names:,}")
+
+    steps = []
+    today = datetime.now()
+
+    # Step 2: clean names
+    names = games_df['home_team']
+    row_clean, row_t = timed(lambda: names.apply(lambda x: ranker.clean_team_name(x)[0]))
+    col_clean, col_t = timed(lambda: ranker.clean_team_names(names))
+    steps.append(('clean_team_name', row_t, col_t, row_clean.equals(col_clean)))
+
+    # Step 4: bad-name filter
+    row_bad, row_t = timed(lambda: names.apply(lambda x: ranker.is_bad_team_name(x)[0]))
+    col_bad, col_t = timed(lambda: ranker.find_bad_team_names(names)[0])
+    steps.append(('is_bad_team_name', row_t, col_t, row_bad.astype(bool).equals(col_bad)))
+
+    # Step 6/6b: case + alias
+    row_norm, row_t = timed(lambda: names.apply(ranker.normalize_team_case).apply(ranker.apply_team_alias))
+    col_norm, col_t = timed(lambda: ranker._map_unique(ranker._map_unique(names, ranker.normalize_team_case),
+                                                        ranker.apply_team_alias))
+    steps.append(('normalize_case+alias', row_t, col_t, row_norm.equals(col_norm)))
+
+    # Step 7: dedup keys (bad names dropped first, same as the real pipeline)
+    is_bad = ranker.find_bad_team_names(games_df['home_team'])[0] | ranker.find_bad_team_names(games_df['away_team'])[0]
+    keyed = games_df[~is_bad & games_df['game_date'].notna()]
+    row_keys, row_t = timed(lambda: keyed.apply(rowwise_game_key, axis=1))
+    col_keys, col_t = timed(lambda: ranker.make_game_keys(keyed))
+    steps.append(('game keys', row_t, col_t, list(row_keys) == list(col_keys)))
+
+    # Step 8: recency weights
+    dates = games_df['game_date']
+    row_w, row_t = timed(lambda: dates.apply(lambda d: rowwise_recency_weight(d, today, ranker.RECENCY_DECAY)))
+    col_w, col_t = timed(lambda: ranker.calculate_recency_weights(dates, today))
+    steps.append(('recency weights', row_t, col_t, bool(((row_w - col_w).abs() < 1e-9).all())))
+
+    print(f"\n{'Step':<24} {'Row-wise':>10} {'Columnar':>10} {'Rows/s (row)':>14} {'Rows/s (col)':>14} {'Speedup':>8}  Match")
+    print("-" * 96)
+    total_row = total_col = 0
+    for step, row_t, col_t, match in steps:
+        total_row += row_t
+        total_col += col_t
+        print(f"{step:<24} {row_t:>9.3f}s {col_t:>9.3f}s {rows / row_t:>14,.0f} {rows / col_t:>14,.0f} "
+              f"{row_t / col_t:>7.1f}x  {'OK' if match else 'MISMATCH'}")
+    print("-" * 96)
+    print(f"{'TOTAL':<24} {total_row:>9.3f}s {total_col:>9.3f}s {rows / total_row:>14,.0f} {rows / total_col:>14,.0f} "
+          f"{total_row / total_col:>7.1f}x")
+
+    return all(match for *_, match in steps)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the ranker game-ingest phase')
+    parser.add_argument('db_path', nargs='?', default=None, help='Path to database file')
+    parser.add_argument('--repeat', '-r', type=int, default=1,
+                        help='Stack the game rows N times to simulate a larger database')
+    parser.add_argument('--sos-teams', type=int, default=0,
+                        help='Also benchmark the SOS solver on a synthetic graph of N teams')
+    args = parser.parse_args()
+
+    db_path = args.db_path or find_database()
+    if not db_path:
+        print("[ERROR] Database not found. Please provide path as argument.")
+        sys.exit(1)
+
+    if not run_benchmark(db_path, args.repeat):
+        print("\n[ERROR] Row-wise and columnar results differ")
+        sys.exit(1)
+
+    if args.sos_teams and not run_sos_benchmark(TeamRankerV30(db_path), args.sos_teams):
+        print("\n[ERROR] SOS solver did not converge")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON writer for the ranker's exports.
+
+json.dump(react_data, f, indent=2) needs every table as a list of dicts in
+memory at once and, with indent set, runs the pure-Python encoder over all of
+it. StreamingJSONWriter writes one top-level key at a time and one array item
+at a time, so arrays can come from generators (see RowStream) and are never
+held twice. Each item is encoded with orjson when it is installed, else with
+the stdlib encoder; stdlib output is byte-identical to json.dump(..., indent=2).
+orjson output parses to the same values but is not byte-identical (it writes
+1e16 where json writes 1e+16, and null for NaN). Both encoders take numpy
+scalars/arrays and non-string dict keys, which json.dump alone would not.
+
+The file is written to <name>.tmp and renamed into place on close, so readers
+(the admin server, the React dev server) never see a half-written file.
+
+USAGE:
+    with StreamingJSONWriter('rankings_for_react.json', indent=2) as writer:
+        writer.write_array('teamsData', teams_data)
+        writer.write_array('playersData', RowStream(iter_players, len(players_df)))
+        writer.write_value('lastUpdated', timestamp)
+    print(writer.stats)       # {'bytes', 'seconds', 'items', 'encoder'}
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# numpy values and int/float dict keys, as the stdlib encoder (with _default) takes them
+ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if ORJSON_AVAILABLE else 0
+
+BUFFER_SIZE = 1024 * 1024
+
+
+def _default(value):
+    """numpy scalars and arrays for the stdlib encoder (orjson takes them natively)"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class RowStream:
+    """
+    Re-iterable, sized view over a generator function.
+
+    Every iteration calls the factory again, so several exports (JSON, columnar
+    artifact, shards) can each walk the rows without a shared list of dicts.
+    """
+
+    def __init__(self, factory, length):
+        self.factory = factory
+        self.length = length
+
+    def __iter__(self):
+        return iter(self.factory())
+
+    def __len__(self):
+        return self.length
+
+
+class StreamingJSONWriter:
+    """Write one JSON object key by key; arrays are encoded item by item."""
+
+    def __init__(self, path, indent=None, use_orjson=True):
+        self.path = Path(path)
+        self.indent = indent
+        self.use_orjson = use_orjson and ORJSON_AVAILABLE and indent in (None, 2)
+        self.stats = {'bytes': 0, 'seconds': 0.0, 'items': 0,
+                      'encoder': 'orjson' if self.use_orjson else 'json'}
+        self._tmp_path = self.path.with_name(self.path.name + '.tmp')
+        self._file = None
+        self._keys = 0
+        self._start = None
+
+    # ─── Encoding ────────────────────────────────────────────────────────────
+
+    def _encode(self, value, depth):
+        """Encode one value as it would appear `depth` levels deep in an indent=N dump"""
+        if self.use_orjson:
+            option = ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if self.indent else 0)
+            text = orjson.dumps(value, option=option).decode('utf-8')
+        elif self.indent:
+            text = json.dumps(value, indent=self.indent, default=_default)
+        else:
+            text = json.dumps(value, separators=(',', ':'), default=_default)
+        if self.indent and depth and '\n' in text:
+            text = text.replace('\n', '\n' + ' ' * (self.indent * depth))
+        return text
+
+    def _newline(self, depth):
+        return '\n' + ' ' * (self.indent * depth) if self.indent else ''
+
+    def _write(self, text):
+        self._file.write(text)
+
+    def _begin_key(self, key):
+        sep = ': ' if self.indent else ':'
+        self._write((',' if self._keys else '') + self._newline(1) + json.dumps(key) + sep)
+        self._keys += 1
+
+    # ─── Public API ──────────────────────────────────────────────────────────
+
+    def open(self):
+        self._start = time.perf_counter()
+        self._file = open(self._tmp_path, 'w', encoding='utf-8', buffering=BUFFER_SIZE)
+        self._write('{')
+        return self
+
+    def write_value(self, key, value):
+        """Write a key whose value is encoded in one piece (metadata lists, scalars)"""
+        self._begin_key(key)
+        self._write(self._encode(value, 1))
+
+    def write_array(self, key, items):
+        """Write a key whose value is an array, pulling items from any iterable"""
+        self._begin_key(key)
+        first = True
+        for item in items:
+            self._write(('[' if first else ',') + self._newline(2) + self._encode(item, 2))
+            first = False
+            self.stats['items'] += 1
+        self._write('[]' if first else self._newline(1) + ']')
+
+    def close(self):
+        self._write(self._newline(0) + '}' if self._keys else '}')
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp_path, self.path)
+        self.stats['bytes'] = self.path.stat().st_size
+        self.stats['seconds'] = time.perf_counter() - self._start
+
+    def abort(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self._tmp_path.exists():
+            self._tmp_path.unlink()
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def summary(self):
+        """One-line throughput report"""
+        seconds = max(self.stats['seconds'], 1e-9)
+        return (f"{self.stats['bytes'] / (1024 * 1024):.1f} MB in {seconds:.2f}s "
+                f"({self.stats['bytes'] / (1024 * 1024) / seconds:.1f} MB/s, {self.stats['encoder']})")
+
+
+def write_json(path, obj, indent=None, array_keys=()):
+    """Stream a top-level dict: keys in array_keys are written item by item"""
+    with StreamingJSONWriter(path, indent=indent) as writer:
+        for key, value in obj.items():
+            if key in array_keys:
+                writer.write_array(key, value)
+            else:
+                writer.write_value(key, value)
+    return writer
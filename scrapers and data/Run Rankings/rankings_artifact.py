@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Columnar rankings artifact - Arrow IPC tables written next to rankings_for_react.json.
+
+rankings_for_react.json is one indented JSON document; every consumer has to
+parse all of teamsData, gamesData and playersData to read any of it. The ranker
+now also writes:
+
+    rankings_columnar/
+        manifest.json   - format version, lastUpdated, ageGroups/leagues/states/genders,
+                          row count + columns + size for each table
+        teams.arrow     - teamsData
+        games.arrow     - gamesData
+        players.arrow   - playersData
+
+Arrow IPC files are memory-mapped on read, so a reader that asks for three
+columns of teams.arrow only touches those pages and never builds the other
+tables at all.
+
+A JSON column holding both ints and floats (or ints and NaN) becomes a double
+column in Arrow. So that rows read back value-identical to the JSON (0, not
+0.0), such a column gets a hidden boolean __int__<name> column marking the
+values that were ints; table_to_rows() turns those back into ints.
+
+pyarrow is optional. Without it write_artifact() does nothing and
+load_rankings() reads the JSON as before.
+
+USAGE:
+    from rankings_artifact import load_rankings
+
+    data = load_rankings('rankings_for_react.json', tables=['teamsData'],
+                         columns={'teamsData': ['name', 'club', 'state']})
+    teams = data['teamsData']          # list of dicts, like the JSON
+
+    python rankings_artifact.py [rankings_for_react.json]   # Build from an existing JSON + compare load time/memory
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    PYARROW_AVAILABLE = False
+
+ARTIFACT_DIR_NAME = 'rankings_columnar'
+FORMAT_VERSION = 2  # 2: __int__ mask columns
+CHUNK_ROWS = 50000  # Rows converted to Arrow at a time
+
+# JSON key -> table file stem
+TABLES = {
+    'teamsData': 'teams',
+    'gamesData': 'games',
+    'playersData': 'players',
+}
+METADATA_KEYS = ['ageGroups', 'leagues', 'states', 'genders', 'lastUpdated']
+INT_MASK_PREFIX = '__int__'
+
+
+def artifact_dir_for(json_path):
+    """The artifact lives in a folder beside the JSON it mirrors"""
+    return Path(json_path).with_name(ARTIFACT_DIR_NAME)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# WRITING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _column(values):
+    """Build one Arrow column; mixed types that Arrow can't unify are stored as strings"""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _int_mask_name(name):
+    return INT_MASK_PREFIX + name
+
+
+def rows_to_table(rows, chunk_rows=CHUNK_ROWS):
+    """
+    Iterable of flat dicts -> (pyarrow.Table, sparse column names).
+    Rows are converted chunk_rows at a time, so a generator never has to be
+    materialized as one big list. Columns are in first-seen key order. A sparse
+    column is one some rows don't have (e.g. gamesData 'status'); table_to_rows()
+    leaves it out of those rows again. Columns that end up floating point but
+    held ints get an __int__<name> mask column (see the module docstring).
+    """
+    counts = {}
+    total = 0
+    chunks = []
+    chunk = []
+    int_masks = []  # per chunk: {column: bool mask of int values, or True if the chunk column is integer}
+
+    def convert(chunk):
+        names = {}
+        for row in chunk:
+            for key in row:
+                names.setdefault(key, None)
+        columns, masks = {}, {}
+        for name in names:
+            values = [row.get(name) for row in chunk]
+            column = columns[name] = _column(values)
+            if pa.types.is_integer(column.type):
+                masks[name] = True
+            elif pa.types.is_floating(column.type):
+                mask = [_is_int(v) for v in values]
+                if any(mask):
+                    masks[name] = mask
+        int_masks.append(masks)
+        return pa.table(columns)
+
+    for row in rows:
+        for key in row:
+            counts[key] = counts.get(key, 0) + 1
+        chunk.append(row)
+        total += 1
+        if len(chunk) >= chunk_rows:
+            chunks.append(convert(chunk))
+            chunk = []
+    if chunk or not chunks:
+        chunks.append(convert(chunk))
+
+    table = chunks[0] if len(chunks) == 1 else _concat(chunks)
+    table = table.select(list(counts))
+
+    for name in list(counts):
+        if not pa.types.is_floating(table.schema.field(name).type):
+            continue
+        if not any(name in masks for masks in int_masks):
+            continue
+        mask = []
+        for piece, masks in zip(chunks, int_masks):
+            chunk_mask = masks.get(name, False)
+            mask.extend(chunk_mask if isinstance(chunk_mask, list) else [chunk_mask] * piece.num_rows)
+        table = table.append_column(_int_mask_name(name), pa.array(mask, type=pa.bool_()))
+    return table, [name for name, count in counts.items() if count < total]
+
+
+def _concat(tables):
+    """Concatenate chunk tables; columns whose types still disagree become strings"""
+    try:
+        return pa.concat_tables(tables, promote_options='permissive')
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    types = {}
+    for table in tables:
+        for field in table.schema:
+            if not pa.types.is_null(field.type):
+                types.setdefault(field.name, set()).add(field.type)
+    mixed = {name for name, seen in types.items() if len(seen) > 1}
+    fixed = []
+    for table in tables:
+        for name in mixed & set(table.column_names):
+            i = table.column_names.index(name)
+            values = [None if v is None else str(v) for v in table.column(i).to_pylist()]
+            table = table.set_column(i, name, pa.array(values, type=pa.string()))
+        fixed.append(table)
+    return pa.concat_tables(fixed, promote_options='permissive')
+
+
+def data_columns(table):
+    """Column names without the __int__ masks"""
+    return [name for name in table.column_names if not name.startswith(INT_MASK_PREFIX)]
+
+
+def table_to_rows(table, sparse=()):
+    """pyarrow.Table -> list of dicts shaped like the JSON rows"""
+    names = data_columns(table)
+    masks = {name: table.column(_int_mask_name(name)).to_pylist()
+             for name in names if _int_mask_name(name) in table.column_names}
+    if masks:
+        table = table.select(names)
+    rows = table.to_pylist()
+    for name, mask in masks.items():
+        for row, was_int in zip(rows, mask):
+            if was_int and row[name] is not None:
+                row[name] = int(row[name])
+    sparse = [name for name in sparse if name in table.column_names]
+    if sparse:
+        for row in rows:
+            for name in sparse:
+                if row[name] is None:
+                    del row[name]
+    return rows
+
+
+def _write_atomic(path, write):
+    tmp_path = path.with_name(path.name + '.tmp')
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def write_artifact(react_data, out_dir):
+    """
+    Write the tables and manifest for a rankings_for_react.json payload.
+    Table values may be lists or any re-iterable of row dicts (json_stream.RowStream).
+    Returns the manifest dict, or None if pyarrow is not installed.
+    The manifest is written last, so a reader never sees a half-written artifact.
+    """
+    if not PYARROW_AVAILABLE:
+        return None
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest = {
+        'format': 'arrow-ipc',
+        'formatVersion': FORMAT_VERSION,
+        'tables': {},
+    }
+    manifest.update({key: react_data.get(key) for key in METADATA_KEYS})
+
+    for key, stem in TABLES.items():
+        table, sparse = rows_to_table(react_data.get(key) or [])
+        path = out_dir / f'{stem}.arrow'
+
+        def write(tmp_path, table=table):
+            with pa.OSFile(str(tmp_path), 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+
+        _write_atomic(path, write)
+        manifest['tables'][key] = {
+            'file': path.name,
+            'rows': table.num_rows,
+            'columns': data_columns(table),
+            'sparseColumns': sparse,
+            'bytes': path.stat().st_size,
+        }
+
+    def write_manifest(tmp_path):
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+    _write_atomic(out_dir / 'manifest.json', write_manifest)
+    return manifest
+
+
+def copy_artifact(src_dir, dest_dir):
+    """Copy an artifact folder (e.g. into the React public folder), manifest last.
+    Call after copying the JSON: copies get fresh mtimes, so the artifact stays current."""
+    src_dir, dest_dir = Path(src_dir), Path(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    names = [f'{stem}.arrow' for stem in TABLES.values()] + ['manifest.json']
+    for name in names:
+        _write_atomic(dest_dir / name, lambda tmp_path, name=name: shutil.copyfile(src_dir / name, tmp_path))
+    return dest_dir
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# READING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def read_manifest(artifact_dir):
+    """Manifest dict, or None if the artifact is missing or unreadable"""
+    try:
+        with open(Path(artifact_dir) / 'manifest.json', 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('formatVersion') != FORMAT_VERSION:
+        return None
+    return manifest
+
+
+def read_table(artifact_dir, key, columns=None):
+    """Memory-map one table (by JSON key, e.g. 'teamsData') as a pyarrow.Table.
+    Unknown columns are ignored; the __int__ masks of requested columns come along."""
+    path = Path(artifact_dir) / f'{TABLES[key]}.arrow'
+    with pa.memory_map(str(path), 'r') as source:
+        table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        wanted = [c for c in columns if c in table.column_names]
+        wanted += [_int_mask_name(c) for c in wanted if _int_mask_name(c) in table.column_names]
+        table = table.select(wanted)
+    return table
+
+
+def artifact_is_current(json_path, artifact_dir=None):
+    """True if the artifact exists and was written no earlier than the JSON it mirrors.
+    (A JSON edited or copied after the artifact was built wins.)"""
+    if not PYARROW_AVAILABLE:
+        return False
+    artifact_dir = Path(artifact_dir) if artifact_dir else artifact_dir_for(json_path)
+    manifest_path = artifact_dir / 'manifest.json'
+    try:
+        json_mtime = Path(json_path).stat().st_mtime
+    except OSError:
+        return manifest_path.exists()
+    return manifest_path.exists() and manifest_path.stat().st_mtime >= json_mtime
+
+
+def load_rankings(json_path, tables=None, columns=None):
+    """
+    Load rankings data shaped like rankings_for_react.json.
+
+    tables:  JSON keys to load (default: all three). Other tables are not read.
+    columns: optional {table key: [column, ...]} to load only some columns.
+
+    Uses the columnar artifact when it is current, otherwise parses the JSON.
+    Returns None if neither exists.
+    """
+    tables = list(TABLES) if tables is None else list(tables)
+    columns = columns or {}
+    artifact_dir = artifact_dir_for(json_path)
+
+    if artifact_is_current(json_path, artifact_dir):
+        manifest = read_manifest(artifact_dir)
+        if manifest:
+            try:
+                data = {key: manifest.get(key) for key in METADATA_KEYS}
+                for key in tables:
+                    table = read_table(artifact_dir, key, columns.get(key))
+                    data[key] = table_to_rows(table, manifest['tables'][key].get('sparseColumns', []))
+                return data
+            except (OSError, pa.ArrowException) as e:
+                print(f"[WARN] Columnar rankings unreadable ({e}) - falling back to JSON")
+
+    json_path = Path(json_path)
+    if not json_path.exists():
+        return None
+    with open(json_path, 'r', encoding='utf-8') as f:
+        full = json.load(f)
+    data = {key: full.get(key) for key in METADATA_KEYS}
+    for key in tables:
+        rows = full.get(key, [])
+        wanted = columns.get(key)
+        if wanted is not None:
+            rows = [{c: row[c] for c in wanted if c in row} for row in rows]
+        data[key] = rows
+    return data
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI - build from an existing JSON and compare load times
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the columnar rankings artifact from rankings_for_react.json')
+    parser.add_argument('json_path', nargs='?', default='rankings_for_react.json',
+                        help='Path to rankings_for_react.json (default: current folder)')
+    args = parser.parse_args()
+
+    if not PYARROW_AVAILABLE:
+        print("[ERROR] pyarrow is not installed (pip install pyarrow)")
+        sys.exit(1)
+    json_path = Path(args.json_path)
+    if not json_path.exists():
+        print(f"[ERROR] Not found: {json_path}")
+        sys.exit(1)
+
+    data, json_t, json_peak = _measure(lambda: _read_json(json_path))
+
+    out_dir = artifact_dir_for(json_path)
+    manifest = write_artifact(data, out_dir)
+    del data
+    print(f"[OK] Wrote {out_dir}")
+    for key, info in manifest['tables'].items():
+        print(f"   {key:<12} {info['rows']:>9,} rows  {len(info['columns']):>3} columns  {info['bytes'] / 1e6:>7.1f} MB")
+
+    columns = {'teamsData': ['name', 'club', 'state', 'ageGroup', 'rank']}
+    _, teams_t, teams_peak = _measure(lambda: load_rankings(json_path, ['teamsData']))
+    _, cols_t, cols_peak = _measure(lambda: load_rankings(json_path, ['teamsData'], columns))
+
+    print(f"\n{'Load':<36} {'Time':>9} {'Peak heap':>11}")
+    print("-" * 58)
+    print(f"{'json.load (all tables)':<36} {json_t:>8.3f}s {json_peak / 1e6:>9.1f}MB")
+    print(f"{'artifact: teamsData':<36} {teams_t:>8.3f}s {teams_peak / 1e6:>9.1f}MB")
+    print(f"{'artifact: teamsData, 5 columns':<36} {cols_t:>8.3f}s {cols_peak / 1e6:>9.1f}MB")
+
+
+def _read_json(json_path):
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _measure(func):
+    """(result, seconds, peak Python heap bytes) - Arrow's mapped pages are not heap"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+if __name__ == '__main__':
+    main()
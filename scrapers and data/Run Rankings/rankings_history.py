@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Team ranking history stored in SQLite (table rankings_history in seedlinedata.db).
+
+The ranker used to load rankings_history.json, rebuild a dict of every team's
+history, trim each to 30 entries and rewrite the whole file with indent=2 on
+every run. History now lives in one indexed table:
+
+    rankings_history(stable_key, date, rank, power_score, offensive_rank, defensive_rank)
+    PRIMARY KEY (stable_key, date), index on date (record() counts one day's rows)
+
+stable_key is "<display name>_<age group>" lowercased - team ids change every
+run, names don't. A run bulk-inserts one row per team for today (a second run
+on the same day replaces today's row, as before). Nothing is trimmed; readers
+ask for the last N entries of the teams they need.
+
+On first use the existing rankings_history.json ('stableHistory') is imported.
+
+USAGE:
+    store = RankingsHistoryStore('seedlinedata.db')
+    store.record(teams_data)                          # after a ranking run
+    store.team_history('albion sc_g12')               # one team's slice
+    store.histories_for(keys)                         # {key: [entries]} for many teams
+
+    python rankings_history.py --team "Albion SC" --age G12     # Print one team's history
+    python rankings_history.py --import rankings_history.json   # Import a legacy file
+    python rankings_history.py --stats
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+HISTORY_TABLE = 'rankings_history'
+HISTORY_LIMIT = 30  # Entries per team served to the app (the old file's cap)
+QUERY_BATCH = 500   # Keys per IN (...) query, under SQLite's variable limit
+
+# (column, JSON key) pairs - entries keep the JSON shape the React app reads
+COLUMNS = [
+    ('date', 'date'),
+    ('rank', 'rank'),
+    ('power_score', 'powerScore'),
+    ('offensive_rank', 'offensiveRank'),
+    ('defensive_rank', 'defensiveRank'),
+]
+
+
+def stable_key(team):
+    """V46 stable identifier for a teamsData row: name + age group, lowercased"""
+    name = (team.get('name') or '').lower().strip()
+    age = (team.get('ageGroup') or '').lower().strip()
+    return f"{name}_{age}"
+
+
+class RankingsHistoryStore:
+    """Indexed per-team ranking history in the rankings database"""
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.ensure_schema()
+
+    def connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def ensure_schema(self):
+        conn = self.connect()
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {HISTORY_TABLE} (
+                stable_key TEXT NOT NULL,
+                date TEXT NOT NULL,
+                rank INTEGER,
+                power_score REAL,
+                offensive_rank INTEGER,
+                defensive_rank INTEGER,
+                PRIMARY KEY (stable_key, date)
+            ) WITHOUT ROWID
+        """)
+        # record() counts one date's rows before and after a run; without this
+        # that is a scan of every team's whole history, twice per run
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{HISTORY_TABLE}_date ON {HISTORY_TABLE}(date)")
+        conn.commit()
+        conn.close()
+
+    # ─── Writing ─────────────────────────────────────────────────────────────
+
+    def _insert(self, rows):
+        """Bulk upsert (stable_key, date, rank, power_score, offensive_rank, defensive_rank) rows"""
+        conn = self.connect()
+        with conn:
+            conn.executemany(f"""
+                INSERT INTO {HISTORY_TABLE}
+                    (stable_key, date, rank, power_score, offensive_rank, defensive_rank)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (stable_key, date) DO UPDATE SET
+                    rank = excluded.rank,
+                    power_score = excluded.power_score,
+                    offensive_rank = excluded.offensive_rank,
+                    defensive_rank = excluded.defensive_rank
+            """, rows)
+        conn.close()
+        return len(rows)
+
+    def record(self, teams_data, date=None):
+        """Add (or replace) today's entry for every team. Teams sharing a stable key
+        keep the last one, as before. Returns (rows written, new entries)."""
+        date = date or datetime.now().strftime('%Y-%m-%d')
+        rows = []
+        for team in teams_data:
+            key = stable_key(team)
+            if not key or key == '_':
+                continue
+            rows.append((key, date, team.get('rank'), team.get('powerScore'),
+                         team.get('offensiveRank'), team.get('defensiveRank')))
+        before = self._count_date(date)
+        written = self._insert(rows)
+        return written, self._count_date(date) - before
+
+    def _count_date(self, date):
+        conn = self.connect()
+        count = conn.execute(f"SELECT COUNT(*) FROM {HISTORY_TABLE} WHERE date = ?", (date,)).fetchone()[0]
+        conn.close()
+        return count
+
+    def import_json(self, history_path):
+        """Import a legacy rankings_history.json ('stableHistory', or stable keys in 'history').
+        Returns the number of entries imported."""
+        with open(history_path, 'r', encoding='utf-8') as f:
+            history_data = json.load(f)
+        stable = history_data.get('stableHistory')
+        if stable is None:
+            stable = {k: v for k, v in history_data.get('history', {}).items() if '_' in k and not k.isdigit()}
+        rows = [(key, entry['date'], entry.get('rank'), entry.get('powerScore'),
+                 entry.get('offensiveRank'), entry.get('defensiveRank'))
+                for key, entries in stable.items() for entry in entries if entry.get('date')]
+        return self._insert(rows)
+
+    def is_empty(self):
+        conn = self.connect()
+        row = conn.execute(f"SELECT 1 FROM {HISTORY_TABLE} LIMIT 1").fetchone()
+        conn.close()
+        return row is None
+
+    # ─── Reading (per-team slices) ───────────────────────────────────────────
+
+    def team_history(self, key, limit=HISTORY_LIMIT):
+        """Last `limit` entries for one team, oldest first"""
+        return self.histories_for([key], limit).get(key, [])
+
+    def histories_for(self, keys, limit=HISTORY_LIMIT):
+        """{stable_key: [entries, oldest first]} for the given keys (last `limit` each)"""
+        conn = self.connect()
+        try:
+            return self.histories_from(conn, keys, limit)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def team_history_from(conn, key, limit=HISTORY_LIMIT):
+        """team_history() on a connection the caller owns (e.g. a pooled read-only one)"""
+        return RankingsHistoryStore.histories_from(conn, [key], limit).get(key, [])
+
+    @staticmethod
+    def histories_from(conn, keys, limit=HISTORY_LIMIT):
+        """histories_for() on a connection the caller owns; only reads"""
+        keys = list(dict.fromkeys(keys))
+        select = ', '.join(column for column, _ in COLUMNS)
+        result = {}
+        for i in range(0, len(keys), QUERY_BATCH):
+            batch = keys[i:i + QUERY_BATCH]
+            rows = conn.execute(f"""
+                SELECT stable_key, {select} FROM (
+                    SELECT *, ROW_NUMBER() OVER (PARTITION BY stable_key ORDER BY date DESC) AS recent
+                    FROM {HISTORY_TABLE}
+                    WHERE stable_key IN ({','.join('?' * len(batch))})
+                )
+                WHERE recent <= ?
+                ORDER BY stable_key, date
+            """, (*batch, limit)).fetchall()
+            for key, *values in rows:
+                result.setdefault(key, []).append({name: value for (_, name), value in zip(COLUMNS, values)})
+        return result
+
+    def stats(self):
+        conn = self.connect()
+        teams, entries, first, last = conn.execute(
+            f"SELECT COUNT(DISTINCT stable_key), COUNT(*), MIN(date), MAX(date) FROM {HISTORY_TABLE}").fetchone()
+        conn.close()
+        return {'teams': teams, 'entries': entries, 'first_date': first, 'last_date': last}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query or import team ranking history')
+    parser.add_argument('--db', default=None, help='Path to seedlinedata.db (default: auto-find)')
+    parser.add_argument('--team', help='Team display name (as in rankings_for_react.json)')
+    parser.add_argument('--age', help='Age group of --team, e.g. G12')
+    parser.add_argument('--limit', type=int, default=HISTORY_LIMIT, help=f'Entries to show (default: {HISTORY_LIMIT})')
+    parser.add_argument('--import', dest='import_path', help='Import a legacy rankings_history.json')
+    parser.add_argument('--stats', action='store_true', help='Show table size')
+    args = parser.parse_args()
+
+    db_path = args.db
+    if not db_path:
+        from team_ranker_final import find_database
+        db_path = find_database()
+    if not db_path:
+        print("[ERROR] Database not found. Please provide --db.")
+        sys.exit(1)
+
+    store = RankingsHistoryStore(db_path)
+    if args.import_path:
+        print(f"[OK] Imported {store.import_json(args.import_path):,} history entries")
+    if args.team:
+        key = stable_key({'name': args.team, 'ageGroup': args.age})
+        print(json.dumps(store.team_history(key, args.limit), indent=2))
+    if args.stats or not (args.team or args.import_path):
+        print(store.stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Sharded static rankings layout for the React app.
+
+rankings_for_react.json (and rankings_light.json) hold every team in the
+country, so first paint on a phone waits for all of it, and team pages filter
+the whole gamesData array client-side. save_outputs() also writes this layout:
+
+    rankings_shards/
+        index.json                  - the only fixed name: metadata lists + file names below
+        age/G12.<hash>.json         - one rankings table per age group (gender is part of it)
+        teams/<hash>.json           - one team: its row, schedule/results and rank history
+        search.<hash>.json          - team/club search index
+        players.<hash>.json         - playersData
+
+Every file except index.json is named by a hash of its content, so it can be
+served with a long cache lifetime (Cache-Control: immutable) and is never
+rewritten - unchanged teams keep their file from run to run. index.json is
+written last, so clients never see a partial update. Files referenced by
+neither the current nor the previous index are pruned, so a client holding the
+previous index can still finish loading.
+
+Table-like files (age shards, search index) are compact: {"fields": [...],
+"rows": [[...], ...]} instead of repeating every key on every row.
+
+USAGE:
+    from rankings_shards import write_shards, sync_shards
+
+    manifest = write_shards(react_data, team_names, id_history, 'rankings_shards')
+    sync_shards('rankings_shards', public_folder / 'rankings_shards')
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+
+SHARDS_DIR_NAME = 'rankings_shards'
+INDEX_FILE = 'index.json'
+FORMAT_VERSION = 1
+HASH_LENGTH = 16
+
+# Team fields in the search index (the rest are in the age shard / team file)
+SEARCH_FIELDS = ['id', 'name', 'club', 'state', 'ageGroup', 'league', 'rank', 'file']
+METADATA_KEYS = ['ageGroups', 'leagues', 'states', 'genders', 'lastUpdated']
+
+
+def shards_dir_for(json_path):
+    """The shards live in a folder beside the JSON they are built from"""
+    return Path(json_path).with_name(SHARDS_DIR_NAME)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONTENT-HASHED FILES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _encode(obj):
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _write_atomic(path, payload):
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def write_hashed(out_dir, subdir, stem, obj):
+    """
+    Write obj as compact JSON to <subdir>/<stem>.<hash>.json (or <subdir>/<hash>.json
+    without a stem). An existing file with that name already has this content and
+    is left alone. Returns (relative path, size in bytes, written?).
+    """
+    payload = _encode(obj)
+    digest = hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+    name = f"{stem}.{digest}.json" if stem else f"{digest}.json"
+    rel_path = f"{subdir}/{name}" if subdir else name
+    path = Path(out_dir) / rel_path
+    if path.exists():
+        return rel_path, len(payload), False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(path, payload)
+    return rel_path, len(payload), True
+
+
+def _compact(rows, fields=None):
+    """List of dicts -> {"fields": [...], "rows": [[...], ...]}"""
+    if fields is None:
+        fields = {}
+        for row in rows:
+            for key in row:
+                fields.setdefault(key, None)
+        fields = list(fields)
+    return {'fields': fields, 'rows': [[row.get(f) for f in fields] for row in rows]}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEAM SCHEDULES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _age_key(age_group):
+    """('G', {'08', '07'}) for 'G08/07' - combined groups rank games from each year"""
+    age_group = age_group or ''
+    return age_group[:1], frozenset(re.findall(r'\d+', age_group))
+
+
+def games_by_team(games_data, team_names, teams_data):
+    """
+    Map each team (by index into teams_data) to its games.
+
+    team_names[i] is the name teams_data[i] has in gamesData (the ranker's
+    cleaned name, not the display name). A game belongs to a team when either
+    side has that name and the game's age group is one of the team's years.
+    """
+    games_by_name = defaultdict(list)
+    for game in games_data:
+        games_by_name[game.get('homeTeam')].append(game)
+        if game.get('awayTeam') != game.get('homeTeam'):
+            games_by_name[game.get('awayTeam')].append(game)
+
+    team_games = []
+    for name, team in zip(team_names, teams_data):
+        prefix, years = _age_key(team.get('ageGroup'))
+        games = []
+        for game in games_by_name.get(name, ()):
+            game_prefix, game_years = _age_key(game.get('ageGroup'))
+            if not game.get('ageGroup') or (game_prefix == prefix and game_years <= years):
+                games.append(game)
+        games.sort(key=lambda g: (g.get('date') or '', g.get('id') or 0))
+        team_games.append(games)
+    return team_games
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# WRITING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def write_shards(react_data, team_names, histories, out_dir):
+    """
+    Write the sharded layout for a rankings_for_react.json payload.
+
+    react_data: the teamsData/gamesData/playersData dict save_outputs() builds
+    team_names: gamesData team name for each teamsData row (same order)
+    histories:  {str(team id): [history entries]} - may be empty
+
+    Returns the index dict plus 'stats' (file counts, sizes) for reporting.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    previous_index = read_index(out_dir)
+
+    teams_data = react_data.get('teamsData') or []
+    histories = histories or {}
+    stats = {'team_files': 0, 'team_files_written': 0, 'team_bytes': 0, 'largest_age_bytes': 0}
+
+    # One file per team: row + schedule + history
+    team_files = []
+    for team, games in zip(teams_data, games_by_team(react_data.get('gamesData') or [], team_names, teams_data)):
+        rel_path, size, written = write_hashed(out_dir, 'teams', None, {
+            'team': team,
+            'games': games,
+            'history': histories.get(str(team.get('id')), []),
+        })
+        team_files.append(rel_path)
+        stats['team_files'] += 1
+        stats['team_files_written'] += written
+        stats['team_bytes'] += size
+
+    # One rankings table per age group, in ranker order
+    rows_by_age = defaultdict(list)
+    for team, rel_path in zip(teams_data, team_files):
+        rows_by_age[team.get('ageGroup')].append({**team, 'file': rel_path})
+
+    age_groups = {}
+    for age_group, rows in rows_by_age.items():
+        stem = re.sub(r'[^A-Za-z0-9]+', '-', age_group or 'unknown')
+        rel_path, size, _ = write_hashed(out_dir, 'age', stem, {
+            'ageGroup': age_group,
+            'gender': rows[0].get('gender'),
+            **_compact(rows),
+        })
+        age_groups[age_group] = {'file': rel_path, 'teams': len(rows), 'bytes': size,
+                                 'gender': rows[0].get('gender')}
+        stats['largest_age_bytes'] = max(stats['largest_age_bytes'], size)
+
+    # Search index: one short row per team plus club team counts
+    clubs = defaultdict(int)
+    for team in teams_data:
+        if team.get('club'):
+            clubs[team['club']] += 1
+    search_rows = [{**team, 'file': rel_path} for team, rel_path in zip(teams_data, team_files)]
+    search_path, search_bytes, _ = write_hashed(out_dir, None, 'search', {
+        'teams': _compact(search_rows, SEARCH_FIELDS),
+        'clubs': sorted([name, count] for name, count in clubs.items()),
+    })
+    players_path, players_bytes, _ = write_hashed(out_dir, None, 'players',
+                                                  _compact(react_data.get('playersData') or []))
+
+    index = {
+        'formatVersion': FORMAT_VERSION,
+        'ageGroupFiles': age_groups,
+        'search': {'file': search_path, 'bytes': search_bytes},
+        'players': {'file': players_path, 'bytes': players_bytes},
+    }
+    index.update({key: react_data.get(key) for key in METADATA_KEYS})
+    _write_atomic(out_dir / INDEX_FILE, json.dumps(index, indent=2).encode('utf-8'))
+
+    stats['pruned'] = prune(out_dir, [index, previous_index])
+    return {**index, 'stats': stats}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# INDEX / PRUNING / COPYING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def read_index(shards_dir):
+    """index.json as a dict, or None"""
+    try:
+        with open(Path(shards_dir) / INDEX_FILE, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return index if index.get('formatVersion') == FORMAT_VERSION else None
+
+
+def referenced_files(shards_dir, index):
+    """Every file an index points at, directly or through its age shards"""
+    if not index:
+        return set()
+    files = {index['search']['file'], index['players']['file']}
+    for info in index['ageGroupFiles'].values():
+        files.add(info['file'])
+        try:
+            with open(Path(shards_dir) / info['file'], 'r', encoding='utf-8') as f:
+                shard = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if 'file' in shard.get('fields', []):
+            col = shard['fields'].index('file')
+            files.update(row[col] for row in shard['rows'])
+    return files
+
+
+def prune(shards_dir, indexes):
+    """Delete hashed files not referenced by any of the given indexes. Returns the count."""
+    shards_dir = Path(shards_dir)
+    keep = set()
+    for index in indexes:
+        keep |= referenced_files(shards_dir, index)
+    removed = 0
+    for path in shards_dir.rglob('*.json'):
+        rel_path = path.relative_to(shards_dir).as_posix()
+        if rel_path != INDEX_FILE and rel_path not in keep:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def sync_shards(src_dir, dest_dir):
+    """
+    Copy a shards folder (e.g. into the React public folder). Hashed files that
+    already exist in dest are skipped, index.json goes last, then dest is pruned
+    the same way as the source. Returns the number of files copied.
+    """
+    src_dir, dest_dir = Path(src_dir), Path(dest_dir)
+    index = read_index(src_dir)
+    if not index:
+        return 0
+    previous_index = read_index(dest_dir)
+    copied = 0
+    for rel_path in sorted(referenced_files(src_dir, index)):
+        dest = dest_dir / rel_path
+        if not dest.exists():
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(dest, (src_dir / rel_path).read_bytes())
+            copied += 1
+    _write_atomic(dest_dir / INDEX_FILE, (src_dir / INDEX_FILE).read_bytes())
+    prune(dest_dir, [index, previous_index])
+    return copied
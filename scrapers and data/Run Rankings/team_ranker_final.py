@@ -29,6 +29,67 @@ SOCCER TEAM RANKING SYSTEM - V46 (ADDRESS FALLBACK)
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+V48 CHANGES (PERFORMANCE):
+  [OK] COLUMNAR GAME INGEST - load_game_data() cleans, filters, normalizes and
+       aliases each UNIQUE team name once and maps the result back, instead of
+       running the regex rules on every row. Dedup keys and recency weights are
+       built with pandas/NumPy column ops. Output is identical to V47.
+       Benchmark: python benchmark_ranker.py [db_path] [--repeat N]
+  [OK] ARRAY-BACKED TEAM/GAME GRAPH - calculate_rankings() builds a TeamGameGraph
+       (integer team ids, CSR adjacency, NumPy result/margin/weight arrays) once
+       per age group. Stats, conference strength, quality wins, bonuses,
+       predictability, rank-tier records and off/def power are array passes
+       instead of per-team loops over opponent lists. The competitive pass keeps
+       its in-place team order.
+  [OK] CONVERGENT SOS SOLVER - The fixed 5-sweep per-team SOS loop is now
+       solve_sos(): whole-graph segment-sum sweeps until no rating moves more
+       than SOS_TOLERANCE (default 0.01, cap SOS_MAX_ITERATIONS). Iterations and
+       residual are printed per age group and kept in diagnostics.
+       Each sweep is a Jacobi update (every team from the previous sweep's
+       ratings) where V47 updated teams in place (Gauss-Seidel, later teams saw
+       earlier teams' new ratings) for 5 sweeps, so ratings differ slightly from
+       V47: both approach the same fixed point, but this one runs until sweeps
+       move no rating more than SOS_TOLERANCE. Teams with near-equal ratings
+       can swap ranks.
+       CLI: --sos-tolerance X --sos-max-iterations N
+       Benchmark: python benchmark_ranker.py --sos-teams 100000
+  [OK] PARALLEL AGE GROUPS - run_all_age_groups(workers=N) / --workers N ranks
+       the age groups in a process pool. Results (and each worker's console
+       output) are merged back in age group order, so the JSON/Excel output is
+       byte-identical to the serial run.
+  [OK] INCREMENTAL RE-RANKING - Each run saves rankings_cache.pkl with a
+       fingerprint per age group (game count, max scraped_at, hash of the
+       cleaned game slice) plus its calculate_rankings() output. --incremental
+       reuses groups whose fingerprint is unchanged and re-ranks the rest; a
+       missing cache or any change to this file/solver settings forces a full run.
+  [OK] SHARED NAME NORMALIZATION - The four nested address/state/club lookup
+       normalizers are replaced by normalize_team_for_lookup(), backed by the
+       compiled, memoized 'lookup' profile in ../team_names.py (also used by
+       the league scrapers' normalize_team_for_id and cleanup_duplicate_games).
+  [OK] COLUMNAR RANKINGS ARTIFACT - save_outputs() also writes
+       rankings_columnar/ (teams/games/players Arrow IPC tables + manifest.json)
+       next to rankings_for_react.json and copies it with the JSON. Readers use
+       rankings_artifact.load_rankings() to memory-map only the tables/columns
+       they need; without pyarrow it falls back to the JSON.
+  [OK] SHARDED STATIC LAYOUT - save_outputs() also writes rankings_shards/:
+       one compact rankings file per age group, one file per team (row,
+       schedule, rank history), a search index and players, all named by
+       content hash behind a small index.json. First paint needs one age group,
+       not the whole country; unchanged files are never rewritten.
+  [OK] STREAMING JSON EXPORT - rankings_for_react.json and rankings_light.json
+       are written by json_stream.StreamingJSONWriter one row at a time (orjson
+       when installed - same values, float formatting may differ; byte-identical
+       to json.dump otherwise), via tmp file +
+       rename. Players stream from the query result instead of a list of dicts.
+       save_outputs() reports JSON MB/s and peak memory.
+       CLI: --profile-export (trace peak Python memory of the export phase)
+  [OK] RANKING HISTORY IN SQLITE - History is a rankings_history table
+       (stable_key, date, rank, powerScore, offensive/defensive rank) in the
+       database instead of a rewritten rankings_history.json. Each run
+       bulk-inserts today's rows and reads back only the current teams' last
+       30 entries for the team shards and the ID-based rankings_history.json.
+       The old file's stableHistory is imported on first run.
+
 V47 CHANGES (TRUST DATABASE LEAGUE):
   [OK] TRUST DATABASE LEAGUE - The ranker now trusts the league field from the
        database instead of trying to detect/override it from team names. The
@@ -143,7 +204,6 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 import sqlite3
-import json
 import sys
 import re
 import argparse
@@ -151,6 +211,13 @@ from dateutil import parser as date_parser
 import os
 import shutil
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import hashlib
+import io
+import pickle
+import time
+import tracemalloc
 
 
 def normalize_date_to_iso(date_value):
@@ -216,6 +283,133 @@ if not CLEANUP_AVAILABLE:
     print("WARNING:  Warning: cleanup_database_final.py not found. Cleanup features disabled.")
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# V48: SHARED TEAM-NAME NORMALIZATION (scrapers and data/team_names.py)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+import team_names
+
+# V48: Columnar (Arrow IPC) copy of rankings_for_react.json - optional, needs pyarrow
+import rankings_artifact
+# V48: Content-hashed per-age-group / per-team files for the React app
+import rankings_shards
+
+# V48: Streaming JSON writer (uses orjson when installed)
+import json_stream
+
+# V48: Team ranking history in SQLite
+import rankings_history
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB, or None where the resource
+    module is unavailable (Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def normalize_team_for_lookup(name):
+    """V43: Drop the age/league tail ("Beach FC 12G GA" -> "beach fc") for address,
+    state and club lookups. Compiled and memoized in team_names ('lookup' profile)."""
+    return team_names.normalize(name, 'lookup')
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# V48: TEAM/GAME GRAPH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TeamGameGraph:
+    """
+    V48: Compact array model of one age group's games.
+
+    Teams get integer IDs in order of first appearance (the same order the
+    team_stats dict has always used). Each game adds two entries, one per side,
+    stored CSR-style: team t's entries are [indptr[t], indptr[t+1]), in game order.
+
+    Per-entry arrays:
+      entry_team, opponent          - int32 team IDs
+      goals_for, goals_against      - int32
+      margin                        - goals_for - goals_against
+      result                        - int8: WIN=1, TIE=0, LOSS=-1
+      weight                        - float64 recency weight
+      game                          - int32 row position in the games DataFrame
+
+    This replaces the per-team 'opponents', 'game_margins' and 'game_details'
+    lists (three list slots plus a 5-key dict per game side) with ~30 bytes.
+    """
+
+    WIN, TIE, LOSS = 1, 0, -1
+
+    def __init__(self, games_df):
+        n_games = len(games_df)
+        sides = np.empty(2 * n_games, dtype=object)
+        sides[0::2] = games_df['home_team'].to_numpy(dtype=object)
+        sides[1::2] = games_df['away_team'].to_numpy(dtype=object)
+        # factorize keeps first-appearance order: home before away, game by game
+        codes, names = pd.factorize(sides)
+        self.teams = list(names)
+        self.team_index = {team: i for i, team in enumerate(self.teams)}
+
+        home_id, away_id = codes[0::2], codes[1::2]
+        home_score = games_df['home_score'].to_numpy(dtype=np.int64)
+        away_score = games_df['away_score'].to_numpy(dtype=np.int64)
+        if 'recency_weight' in games_df.columns:
+            game_weight = games_df['recency_weight'].to_numpy(dtype=float)
+        else:
+            game_weight = np.ones(n_games)
+        game_idx = np.arange(n_games)
+
+        team = np.concatenate([home_id, away_id])
+        game = np.concatenate([game_idx, game_idx])
+        order = np.lexsort((game, team))
+
+        self.entry_team = team[order].astype(np.int32)
+        self.opponent = np.concatenate([away_id, home_id])[order].astype(np.int32)
+        self.goals_for = np.concatenate([home_score, away_score])[order].astype(np.int32)
+        self.goals_against = np.concatenate([away_score, home_score])[order].astype(np.int32)
+        self.margin = self.goals_for - self.goals_against
+        self.result = np.sign(self.margin).astype(np.int8)
+        self.weight = np.concatenate([game_weight, game_weight])[order]
+        self.game = game[order].astype(np.int32)
+
+        self.indptr = np.zeros(len(self.teams) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.entry_team, minlength=len(self.teams)), out=self.indptr[1:])
+
+    @property
+    def n_teams(self):
+        return len(self.teams)
+
+    def team_slice(self, team_id):
+        """Entry range for one team"""
+        return slice(self.indptr[team_id], self.indptr[team_id + 1])
+
+    def team_sum(self, values):
+        """Per-team sum of a per-entry array (summed in game order)"""
+        return np.bincount(self.entry_team, weights=values, minlength=self.n_teams)
+
+    def team_count(self, mask):
+        """Per-team count of entries where mask is True"""
+        return np.bincount(self.entry_team[mask], minlength=self.n_teams)
+
+    def column(self, team_stats, key, default=0):
+        """Gather one team_stats field into an array in team-ID order"""
+        return np.array([team_stats[team].get(key, default) for team in self.teams])
+
+    def store(self, team_stats, key, values, mask=None, digits=None):
+        """Scatter an array back into team_stats[team][key] as plain Python values.
+        Teams where mask is False are left untouched."""
+        values = values.tolist() if hasattr(values, 'tolist') else list(values)
+        keep = mask.tolist() if mask is not None else None
+        for i, team in enumerate(self.teams):
+            if keep is None or keep[i]:
+                team_stats[team][key] = round(values[i], digits) if digits is not None else values[i]
+
+
 class TeamRankerV30:
     """
     Youth Soccer Team Ranking System V31
@@ -741,6 +935,18 @@ class TeamRankerV30:
     SOS_PENALTY_MAX = 200           # Maximum penalty points for very weak schedule
     SOS_BONUS_FACTOR = 0.08         # V33: Reduced from 0.10 (was avg_opp/1000 * 100)
     
+    # V48: SOS propagation solver (see solve_sos)
+    SOS_WEIGHT = 0.10               # V32: How much SOS affects rating each iteration (10%)
+    SOS_TOLERANCE = 0.01            # Stop when no rating moves more than this between sweeps
+    SOS_MAX_ITERATIONS = 100        # Safety cap; the update contracts, so this is rarely hit
+    
+    # V48: Incremental re-ranking cache (see run_all_age_groups(incremental=True))
+    RANKINGS_CACHE_FILE = 'rankings_cache.pkl'
+    RANKINGS_CACHE_VERSION = 1
+    # Columns calculate_rankings() reads; a change to any of them re-ranks the age group
+    FINGERPRINT_COLUMNS = ['game_date', 'home_team', 'away_team', 'home_score', 'away_score',
+                           'league', 'conference']
+    
     # V30: Predictability score weights
     PRED_GAMES_WEIGHT = 30          # V33: Reduced from 40 to make room for opponent quality
     PRED_CONSISTENCY_WEIGHT = 25    # V33: Reduced from 30
@@ -748,7 +954,8 @@ class TeamRankerV30:
     PRED_OPP_QUALITY_WEIGHT = 25    # V33: NEW - points for playing ranked opponents
     PRED_IDEAL_GAMES = 15           # Games needed for full games score
     
-    def __init__(self, db_path='../seedlinedata.db', verbose=False):
+    def __init__(self, db_path='../seedlinedata.db', verbose=False,
+                 sos_tolerance=None, sos_max_iterations=None, profile_export=False):
         self.db_path = Path(db_path)
         self.games_df = None
         # V39: Added Boys age groups
@@ -773,6 +980,12 @@ class TeamRankerV30:
         self.partial_score_stats = {}
         self.verbose = verbose
         
+        # V48: SOS solver settings and the last solve's convergence report
+        self.sos_tolerance = self.SOS_TOLERANCE if sos_tolerance is None else sos_tolerance
+        self.sos_max_iterations = self.SOS_MAX_ITERATIONS if sos_max_iterations is None else sos_max_iterations
+        self.profile_export = profile_export  # V48: trace peak Python memory in save_outputs()
+        self.last_sos_report = None
+        
         # V39: Store team state lookup from database
         self.team_states = {}
 
@@ -791,6 +1004,7 @@ class TeamRankerV30:
             'duplicates_removed_samples': [],
             'gender_filtered_count': 0,
             'age_group_gender_breakdown': {},
+            'sos_convergence': {},  # V48: age_group -> solve_sos() report
         }
         
         self._bad_patterns = [re.compile(p, re.IGNORECASE) for p in self.BAD_TEAM_PATTERNS]
@@ -1193,10 +1407,82 @@ class TeamRankerV30:
 
         return result
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # V48: COLUMNAR NAME CLEANING
+    # Every per-name rule runs once per UNIQUE name and is mapped back onto the
+    # column. A season has ~20x more game rows than distinct team names, so this
+    # is where most of the load phase used to go.
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _map_unique(names, func):
+        """Apply func once per distinct non-null value in names and map it back.
+        Nulls are passed through untouched."""
+        uniques = names.dropna().unique()
+        mapping = {name: func(name) for name in uniques}
+        return names.map(mapping).where(names.notna(), names)
+
+    def clean_team_names(self, names):
+        """Columnar clean_team_name(): returns the cleaned Series.
+        cleanup_stats are still counted per row, same as the row-wise version."""
+        cleaned = {}
+        for name, count in names.value_counts().items():
+            before = dict(self.cleanup_stats)
+            cleaned[name] = self.clean_team_name(name)[0]
+            # clean_team_name counted this name once - count its other rows too
+            for key in ('names_cleaned', 'league_detected_from_name'):
+                self.cleanup_stats[key] += (self.cleanup_stats[key] - before[key]) * (count - 1)
+        return names.map(cleaned).where(names.notna(), names)
+
+    def find_bad_team_names(self, names):
+        """Columnar is_bad_team_name(): returns (is_bad, reason) Series.
+        Null names are bad, matching the row-wise check."""
+        verdicts = {name: self.is_bad_team_name(name) for name in names.dropna().unique()}
+        is_bad = names.map({name: v[0] for name, v in verdicts.items()}).fillna(True).astype(bool)
+        reasons = names.map({name: v[1] for name, v in verdicts.items()})
+        reasons = reasons.where(names.notna(), "Empty or null")
+        return is_bad, reasons
+
+    @staticmethod
+    def _sorted_pair(a, b):
+        """Element-wise (min, max) of two string Series - sorted([a, b]) per row."""
+        a_first = a <= b
+        return a.where(a_first, b), b.where(a_first, a)
+
+    def make_game_keys(self, df, include_scores=True):
+        """
+        Vectorized game keys for deduplication.
+
+        include_scores=True  -> "{date}_{team1}_{team2}_{score1}_{score2}" (Step 7)
+        include_scores=False -> "{date}_{age_group}_{team1}_{team2}"        (Step 7b)
+        Team names are lowercased/stripped and sorted so home/away order doesn't matter.
+        """
+        home = df['home_team'].astype(str).str.lower().str.strip()
+        away = df['away_team'].astype(str).str.lower().str.strip()
+        team1, team2 = self._sorted_pair(home, away)
+        date = df['game_date'].astype(str)
+
+        if not include_scores:
+            return date + '_' + df['age_group'].astype(str) + '_' + team1 + '_' + team2
+
+        home_score = df['home_score'].astype(int).to_numpy()
+        away_score = df['away_score'].astype(int).to_numpy()
+        score1 = pd.Series(np.minimum(home_score, away_score), index=df.index).astype(str)
+        score2 = pd.Series(np.maximum(home_score, away_score), index=df.index).astype(str)
+        return date + '_' + team1 + '_' + team2 + '_' + score1 + '_' + score2
+
+    def calculate_recency_weights(self, game_dates, today=None):
+        """Vectorized recency weight: RECENCY_DECAY ** months_ago (0.5 for unparseable dates)"""
+        today = pd.Timestamp(today or datetime.now())
+        parsed = pd.to_datetime(game_dates.astype(str).str[:10], format='%Y-%m-%d', errors='coerce')
+        months_ago = (today - parsed).dt.days / 30.0
+        weights = np.power(self.RECENCY_DECAY, months_ago.to_numpy(dtype=float))
+        return pd.Series(weights, index=game_dates.index).fillna(0.5)
+
     # ═══════════════════════════════════════════════════════════════════════════
     # DATA LOADING - V29: WITH GENDER FILTERING
     # ═══════════════════════════════════════════════════════════════════════════
-    
+
     def load_game_data(self):
         """Load game data with runtime cleanup - V29: Gender filtered"""
         print(f"\n{'='*80}")
@@ -1232,10 +1518,13 @@ class TeamRankerV30:
         
         # V39: Load BOTH Boys and Girls games
         # Boys games have age_group starting with 'B', Girls with 'G' or 'U'
-        query = """
+        # V48: scraped_at feeds the incremental re-ranking fingerprint (older databases may lack it)
+        game_columns = {row[1] for row in conn.execute("PRAGMA table_info(games)")}
+        scraped_at = "scraped_at" if 'scraped_at' in game_columns else "NULL as scraped_at"
+        query = f"""
             SELECT
                 game_id, age_group, game_date_iso as game_date, home_team, away_team,
-                home_score, away_score, league, conference, game_status, gender
+                home_score, away_score, league, conference, game_status, gender, {scraped_at}
             FROM games
             WHERE home_score IS NOT NULL AND away_score IS NOT NULL
               AND (age_group LIKE 'G%' OR age_group LIKE 'U%' OR age_group LIKE 'B%')
@@ -1251,15 +1540,6 @@ class TeamRankerV30:
             WHERE team_name IS NOT NULL AND team_name != ''
         """
         address_df = pd.read_sql_query(address_query, conn)
-        # V43: Also store normalized names for better matching
-        import re as _re
-        def normalize_team_for_state(name):
-            if not name:
-                return name
-            name = name.lower().strip()
-            name = _re.sub(r'\s+(\d+g|g\d+|b\d+)(\s+ga|\s+ecnl|\s+rl)?\s*$', '', name, flags=_re.IGNORECASE)
-            name = _re.sub(r'\s+(ga|ecnl|ecnl-rl|rl|aspire|npl)\s*$', '', name, flags=_re.IGNORECASE)
-            return name.strip()
 
         # V46: Validate address data - reject invalid entries like "None" strings, empty cities, placeholders
         def is_valid_city(city_value):
@@ -1346,7 +1626,7 @@ class TeamRankerV30:
                 if address_data['state']:
                     self.team_states[team_key] = address_data['state']
                 # Store under normalized name too
-                normalized = normalize_team_for_state(team_name)
+                normalized = normalize_team_for_lookup(team_name)
                 if normalized and normalized != team_key:
                     if normalized in self.team_addresses:
                         if is_better_address(address_data, self.team_addresses[normalized]):
@@ -1397,41 +1677,37 @@ class TeamRankerV30:
         # teams like "Middle GA" (Middle Georgia) as Girls Academy
         print("Step 2: Cleaning team names...")
 
-        home_cleaned = self.games_df['home_team'].apply(lambda x: self.clean_team_name(x)[0])
-        away_cleaned = self.games_df['away_team'].apply(lambda x: self.clean_team_name(x)[0])
-
-        self.games_df['home_team'] = home_cleaned
-        self.games_df['away_team'] = away_cleaned
+        # V48: Clean each distinct name once and map back onto both columns
+        self.games_df['home_team'] = self.clean_team_names(self.games_df['home_team'])
+        self.games_df['away_team'] = self.clean_team_names(self.games_df['away_team'])
         
         # Step 4: Filter bad team names - V29: WITH DIAGNOSTICS
         print("Step 4: Filtering bad team names...")
-        bad_teams_detail = []
+        # V48: One is_bad_team_name() call per distinct name instead of two per row
+        bad_home, reason_home = self.find_bad_team_names(self.games_df['home_team'])
+        bad_away, reason_away = self.find_bad_team_names(self.games_df['away_team'])
         
-        for idx, row in self.games_df.iterrows():
-            is_bad_home, reason_home = self.is_bad_team_name(row['home_team'])
-            is_bad_away, reason_away = self.is_bad_team_name(row['away_team'])
-            
-            if is_bad_home:
+        bad_teams_detail = []
+        bad_rows = self.games_df.loc[bad_home | bad_away, ['home_team', 'away_team', 'game_date']]
+        for idx, home, away, game_date in bad_rows.itertuples():
+            if bad_home[idx]:
                 bad_teams_detail.append({
-                    'team': row['home_team'],
-                    'reason': reason_home,
+                    'team': home,
+                    'reason': reason_home[idx],
                     'position': 'home',
-                    'game_date': row['game_date']
+                    'game_date': game_date
                 })
-            if is_bad_away:
+            if bad_away[idx]:
                 bad_teams_detail.append({
-                    'team': row['away_team'],
-                    'reason': reason_away,
+                    'team': away,
+                    'reason': reason_away[idx],
                     'position': 'away',
-                    'game_date': row['game_date']
+                    'game_date': game_date
                 })
         
         # Store for diagnostics report
         self.diagnostics['bad_team_names_found'] = bad_teams_detail
         
-        bad_home = self.games_df['home_team'].apply(lambda x: self.is_bad_team_name(x)[0])
-        bad_away = self.games_df['away_team'].apply(lambda x: self.is_bad_team_name(x)[0])
-        
         games_with_bad_teams = (bad_home | bad_away).sum()
         self.games_df = self.games_df[~bad_home & ~bad_away]
         
@@ -1460,14 +1736,14 @@ class TeamRankerV30:
         
         # Step 6: Normalize case
         print("Step 6: Normalizing team name case...")
-        self.games_df['home_team'] = self.games_df['home_team'].apply(self.normalize_team_case)
-        self.games_df['away_team'] = self.games_df['away_team'].apply(self.normalize_team_case)
+        self.games_df['home_team'] = self._map_unique(self.games_df['home_team'], self.normalize_team_case)
+        self.games_df['away_team'] = self._map_unique(self.games_df['away_team'], self.normalize_team_case)
         
         # V30b: Apply team aliases to merge duplicates
         print("Step 6b: Applying team name aliases...")
         before_alias = len(self.games_df['home_team'].unique()) + len(self.games_df['away_team'].unique())
-        self.games_df['home_team'] = self.games_df['home_team'].apply(self.apply_team_alias)
-        self.games_df['away_team'] = self.games_df['away_team'].apply(self.apply_team_alias)
+        self.games_df['home_team'] = self._map_unique(self.games_df['home_team'], self.apply_team_alias)
+        self.games_df['away_team'] = self._map_unique(self.games_df['away_team'], self.apply_team_alias)
         after_alias = len(self.games_df['home_team'].unique()) + len(self.games_df['away_team'].unique())
         print(f"  Team names merged: {before_alias - after_alias} duplicates resolved")
         
@@ -1518,21 +1794,14 @@ class TeamRankerV30:
         
         # Pattern: team name ending in " GA" (but not part of the team name like "Tophat GA Gold")
         # We only strip if it ends with a age group + " GA" pattern like "13G GA", "12G GA", etc.
-        import re
-        ga_suffix_pattern = re.compile(r'^(.+\d+G) GA$')
-        
-        def strip_ga_suffix(name):
-            match = ga_suffix_pattern.match(name)
-            if match:
-                return match.group(1)  # Return without " GA"
-            return name
+        ga_suffix_pattern = r'^(.+\d+G) GA$'
         
         ga_mask = self.games_df['league'] == 'GA'
         ga_home_before = self.games_df.loc[ga_mask, 'home_team'].copy()
         ga_away_before = self.games_df.loc[ga_mask, 'away_team'].copy()
         
-        self.games_df.loc[ga_mask, 'home_team'] = self.games_df.loc[ga_mask, 'home_team'].apply(strip_ga_suffix)
-        self.games_df.loc[ga_mask, 'away_team'] = self.games_df.loc[ga_mask, 'away_team'].apply(strip_ga_suffix)
+        self.games_df.loc[ga_mask, 'home_team'] = ga_home_before.str.replace(ga_suffix_pattern, r'\1', regex=True)
+        self.games_df.loc[ga_mask, 'away_team'] = ga_away_before.str.replace(ga_suffix_pattern, r'\1', regex=True)
         
         # Count changes
         home_changes = (ga_home_before != self.games_df.loc[ga_mask, 'home_team']).sum()
@@ -1547,12 +1816,8 @@ class TeamRankerV30:
         before_dedup = len(self.games_df)
         
         # V29: Include scores in dedup key to preserve doubleheaders
-        def make_game_key(row):
-            teams = sorted([row['home_team'].lower().strip(), row['away_team'].lower().strip()])
-            scores = sorted([int(row['home_score']), int(row['away_score'])])
-            return f"{row['game_date']}_{teams[0]}_{teams[1]}_{scores[0]}_{scores[1]}"
-        
-        self.games_df['game_key'] = self.games_df.apply(make_game_key, axis=1)
+        # V48: Keys are built with column string ops instead of a row-wise apply
+        self.games_df['game_key'] = self.make_game_keys(self.games_df)
         
         # V29: Track duplicates for diagnostics
         if self.verbose:
@@ -1583,11 +1848,7 @@ class TeamRankerV30:
         ecnl_games['league_priority'] = ecnl_games['league'].map(league_priority)
         ecnl_games = ecnl_games.sort_values('league_priority')
         
-        def make_cross_league_key(row):
-            teams = sorted([row['home_team'].lower().strip(), row['away_team'].lower().strip()])
-            return f"{row['game_date']}_{row['age_group']}_{teams[0]}_{teams[1]}"
-        
-        ecnl_games['cross_key'] = ecnl_games.apply(make_cross_league_key, axis=1)
+        ecnl_games['cross_key'] = self.make_game_keys(ecnl_games, include_scores=False)
         ecnl_games = ecnl_games.drop_duplicates(subset='cross_key', keep='first')
         ecnl_games = ecnl_games.drop(columns=['cross_key', 'league_priority'])
         
@@ -1600,16 +1861,7 @@ class TeamRankerV30:
         
         # Step 8: Recency weights
         print("Step 8: Calculating recency weights...")
-        today = datetime.now()
-        def calc_recency_weight(game_date):
-            try:
-                gd = datetime.strptime(str(game_date)[:10], '%Y-%m-%d')
-                months_ago = (today - gd).days / 30.0
-                return self.RECENCY_DECAY ** months_ago
-            except:
-                return 0.5
-        
-        self.games_df['recency_weight'] = self.games_df['game_date'].apply(calc_recency_weight)
+        self.games_df['recency_weight'] = self.calculate_recency_weights(self.games_df['game_date'])
         avg_weight = self.games_df['recency_weight'].mean()
         print(f"  Average recency weight: {avg_weight:.2f}")
         
@@ -1705,112 +1957,41 @@ class TeamRankerV30:
     # STATS CALCULATION
     # ═══════════════════════════════════════════════════════════════════════════
     
-    def calculate_stats(self, games_df):
+    def calculate_stats(self, games_df, graph=None):
         """Calculate team statistics with recency weighting
         
         V32: Determines team league from most recent games rather than first game.
         This handles teams that switch leagues mid-season (e.g., ECNL-RL to GA).
+        V48: Totals come from TeamGameGraph array sums. Per-game detail lives in
+        the graph, not in per-team lists.
         """
-        team_stats = {}
-        
-        # V30: Store game-level data for predictability calculation
-        team_games = defaultdict(list)
-        
-        # V32: Track all leagues for each team with game dates to determine current league
-        team_leagues = defaultdict(list)  # team -> [(date, league), ...]
-        
-        for _, game in games_df.iterrows():
-            home = game['home_team']
-            away = game['away_team']
-            hs = int(game['home_score'])
-            aws = int(game['away_score'])
-            league = game['league']
-            conference = game.get('conference', '')
-            weight = game.get('recency_weight', 1.0)
-            game_date = game.get('game_date', '')
-            
-            # Track leagues with dates for later determination
-            team_leagues[home].append((game_date, league))
-            team_leagues[away].append((game_date, league))
-            
-            for team in [home, away]:
-                if team not in team_stats:
-                    team_stats[team] = {
-                        'games_played': 0,
-                        'wins': 0,
-                        'losses': 0,
-                        'ties': 0,
-                        'goals_for': 0,
-                        'goals_against': 0,
-                        'league': league,  # Will be updated after all games processed
-                        'conference': conference,
-                        'opponents': [],
-                        'big_wins': 0,
-                        'blowout_losses': 0,
-                        'game_margins': [],
-                        'weighted_wins': 0,
-                        'weighted_games': 0,
-                    }
-            
-            margin_home = hs - aws
-            margin_away = aws - hs
-
-            # V43: Update conference if current is empty and game has one
-            if conference:
-                if not team_stats[home].get('conference'):
-                    team_stats[home]['conference'] = conference
-                if not team_stats[away].get('conference'):
-                    team_stats[away]['conference'] = conference
-
-            team_stats[home]['games_played'] += 1
-            team_stats[away]['games_played'] += 1
-            team_stats[home]['opponents'].append(away)
-            team_stats[away]['opponents'].append(home)
-            team_stats[home]['weighted_games'] += weight
-            team_stats[away]['weighted_games'] += weight
-            
-            team_stats[home]['goals_for'] += hs
-            team_stats[home]['goals_against'] += aws
-            team_stats[away]['goals_for'] += aws
-            team_stats[away]['goals_against'] += hs
-            team_stats[home]['game_margins'].append(margin_home)
-            team_stats[away]['game_margins'].append(margin_away)
-            
-            # V30: Store game-level data for predictability
-            team_games[home].append({
-                'opponent': away,
-                'margin': margin_home,
-                'result': 'W' if hs > aws else ('L' if hs < aws else 'T'),
-                'goals_for': hs,
-                'goals_against': aws
-            })
-            team_games[away].append({
-                'opponent': home,
-                'margin': margin_away,
-                'result': 'W' if aws > hs else ('L' if aws < hs else 'T'),
-                'goals_for': aws,
-                'goals_against': hs
-            })
-            
-            if hs > aws:
-                team_stats[home]['wins'] += 1
-                team_stats[home]['weighted_wins'] += weight
-                team_stats[away]['losses'] += 1
-                if margin_home >= 4:
-                    team_stats[home]['big_wins'] += 1
-                if margin_away <= -4:
-                    team_stats[away]['blowout_losses'] += 1
-            elif aws > hs:
-                team_stats[away]['wins'] += 1
-                team_stats[away]['weighted_wins'] += weight
-                team_stats[home]['losses'] += 1
-                if margin_away >= 4:
-                    team_stats[away]['big_wins'] += 1
-                if margin_home <= -4:
-                    team_stats[home]['blowout_losses'] += 1
-            else:
-                team_stats[home]['ties'] += 1
-                team_stats[away]['ties'] += 1
+        if graph is None:
+            graph = TeamGameGraph(games_df)
+        
+        won = graph.result == graph.WIN
+        lost = graph.result == graph.LOSS
+        tied = graph.result == graph.TIE
+        
+        games_played = np.diff(graph.indptr).tolist()
+        wins = graph.team_count(won).tolist()
+        losses = graph.team_count(lost).tolist()
+        ties = graph.team_count(tied).tolist()
+        goals_for = graph.team_sum(graph.goals_for).astype(np.int64).tolist()
+        goals_against = graph.team_sum(graph.goals_against).astype(np.int64).tolist()
+        big_wins = graph.team_count(won & (graph.margin >= 4)).tolist()
+        blowout_losses = graph.team_count(lost & (graph.margin <= -4)).tolist()
+        weighted_wins = graph.team_sum(np.where(won, graph.weight, 0.0)).tolist()
+        weighted_games = graph.team_sum(graph.weight).tolist()
+        
+        # Per-entry league/date/conference, looked up through the game row
+        def entry_values(column, default):
+            if column in games_df.columns:
+                return games_df[column].to_numpy(dtype=object)[graph.game].tolist()
+            return [default] * len(graph.game)
+        
+        entry_leagues = entry_values('league', None)
+        entry_dates = entry_values('game_date', '')
+        entry_confs = entry_values('conference', '')
         
         # V32: Determine each team's league using smart priority + recency
         # Logic:
@@ -1818,59 +1999,74 @@ class TeamRankerV30:
         # 2. If team switched leagues (recent games 100% in different league than history), use recent
         # 3. Otherwise use priority system (ECNL > GA > ECNL-RL)
         LEAGUE_PRIORITY = {'ECNL': 3, 'GA': 2, 'ECNL-RL': 1}
+        from collections import Counter
         
-        for team in team_stats:
-            if team in team_leagues:
-                from collections import Counter
-                
-                # Sort by date
-                sorted_games = sorted(team_leagues[team], key=lambda x: x[0], reverse=True)
-                
-                # Recent games = last 5
-                recent_leagues = [lg for _, lg in sorted_games[:5]]
-                recent_count = Counter(recent_leagues)
-                
-                # All games
-                all_league_list = [lg for _, lg in sorted_games]
-                all_counts = Counter(all_league_list)
-                
-                # Check if team SWITCHED leagues (100% recent games in one league that's NOT their historical dominant)
-                if recent_leagues and len(all_counts) > 1:
-                    most_recent_league = recent_count.most_common(1)[0][0]
-                    
-                    # Find historical dominant league (league with most total games)
-                    historical_dominant = all_counts.most_common(1)[0][0]
-                    
-                    # If ALL recent games are in a DIFFERENT league than historical, team switched
-                    if most_recent_league != historical_dominant:
-                        recent_pct = recent_count[most_recent_league] / len(recent_leagues)
-                        if recent_pct >= 1.0:  # 100% of recent games in new league
-                            team_stats[team]['league'] = most_recent_league
-                            continue
-                
-                # For established teams, use priority system
-                # Find highest-priority league with at least 3 games
-                best_league = None
-                best_priority = 0
-                
-                for league, count in all_counts.items():
-                    if count >= 3:
-                        priority = LEAGUE_PRIORITY.get(league, 0)
-                        if priority > best_priority:
-                            best_priority = priority
-                            best_league = league
+        team_stats = {}
+        for team_id, team in enumerate(graph.teams):
+            s = graph.team_slice(team_id)
+            leagues = entry_leagues[s]
+            confs = entry_confs[s]
+            
+            team_stats[team] = {
+                'games_played': games_played[team_id],
+                'wins': wins[team_id],
+                'losses': losses[team_id],
+                'ties': ties[team_id],
+                'goals_for': goals_for[team_id],
+                'goals_against': goals_against[team_id],
+                'league': leagues[0],  # Updated below
+                # V43: First non-empty conference, else whatever the first game had
+                'conference': next((c for c in confs if c), confs[0]),
+                'big_wins': big_wins[team_id],
+                'blowout_losses': blowout_losses[team_id],
+                'weighted_wins': weighted_wins[team_id],
+                'weighted_games': weighted_games[team_id],
+            }
+            
+            # Sort by date
+            sorted_games = sorted(zip(entry_dates[s], leagues), key=lambda x: x[0], reverse=True)
+            
+            # Recent games = last 5
+            recent_leagues = [lg for _, lg in sorted_games[:5]]
+            recent_count = Counter(recent_leagues)
+            
+            # All games
+            all_league_list = [lg for _, lg in sorted_games]
+            all_counts = Counter(all_league_list)
+            
+            # Check if team SWITCHED leagues (100% recent games in one league that's NOT their historical dominant)
+            if recent_leagues and len(all_counts) > 1:
+                most_recent_league = recent_count.most_common(1)[0][0]
                 
-                # If no league has 3+ games, use most common
-                if best_league is None:
-                    if all_counts:
-                        best_league = all_counts.most_common(1)[0][0]
+                # Find historical dominant league (league with most total games)
+                historical_dominant = all_counts.most_common(1)[0][0]
                 
-                if best_league:
-                    team_stats[team]['league'] = best_league
-        
-        # Store game-level data for predictability calculation
-        for team in team_stats:
-            team_stats[team]['game_details'] = team_games[team]
+                # If ALL recent games are in a DIFFERENT league than historical, team switched
+                if most_recent_league != historical_dominant:
+                    recent_pct = recent_count[most_recent_league] / len(recent_leagues)
+                    if recent_pct >= 1.0:  # 100% of recent games in new league
+                        team_stats[team]['league'] = most_recent_league
+                        continue
+            
+            # For established teams, use priority system
+            # Find highest-priority league with at least 3 games
+            best_league = None
+            best_priority = 0
+            
+            for league, count in all_counts.items():
+                if count >= 3:
+                    priority = LEAGUE_PRIORITY.get(league, 0)
+                    if priority > best_priority:
+                        best_priority = priority
+                        best_league = league
+            
+            # If no league has 3+ games, use most common
+            if best_league is None:
+                if all_counts:
+                    best_league = all_counts.most_common(1)[0][0]
+            
+            if best_league:
+                team_stats[team]['league'] = best_league
         
         return team_stats
     
@@ -1949,159 +2145,75 @@ class TeamRankerV30:
         return result
     
     def calculate_rankings(self, games_df):
-        """Calculate team rankings - V32: with iterative cross-conference calibration"""
-        team_stats = self.calculate_stats(games_df)
+        """Calculate team rankings - V32: with iterative cross-conference calibration
+        
+        V48: Passes run on TeamGameGraph arrays. Per-team scalar results are still
+        written to team_stats, so the returned (team, stats) tuples are unchanged.
+        """
+        graph = TeamGameGraph(games_df)
+        team_stats = self.calculate_stats(games_df, graph)
+        
+        team_of = graph.entry_team
+        opp_of = graph.opponent
+        won = graph.result == graph.WIN
+        lost = graph.result == graph.LOSS
+        tied = graph.result == graph.TIE
+        
+        games = graph.column(team_stats, 'games_played')
+        wins = graph.column(team_stats, 'wins')
+        losses = graph.column(team_stats, 'losses')
+        leagues = [team_stats[team]['league'] for team in graph.teams]
+        league_factor = np.array([self.LEAGUE_FACTORS.get(lg, self.DEFAULT_LEAGUE_FACTOR) for lg in leagues])
+        
+        # Teams with enough games for the full rating treatment
+        active = games >= self.MIN_GAMES
+        active_entry = active[team_of]
         
         # First pass: basic ratings (win pct * league factor + goal diff bonus)
-        for team, stats in team_stats.items():
-            games = stats['games_played']
-            wins = stats['wins']
-            gf = stats['goals_for']
-            ga = stats['goals_against']
-            
-            if games == 0:
-                stats['win_pct'] = 0
-                stats['goal_diff'] = 0
-                stats['rating'] = 0
-                stats['base_rating'] = 0
-                continue
-            
-            win_pct = wins / games
-            stats['win_pct'] = win_pct
-            stats['goal_diff'] = gf - ga
-            
-            league = stats['league']
-            league_factor = self.LEAGUE_FACTORS.get(league, self.DEFAULT_LEAGUE_FACTOR)
-            
-            base_rating = win_pct * 1000 * league_factor
-            
-            avg_gd = stats['goal_diff'] / games
-            gd_bonus = min(max(avg_gd * 10, -50), 50)
-            
-            big_win_pct = stats['big_wins'] / games if games > 0 else 0
-            big_win_bonus = big_win_pct * 30
-            
-            blowout_pct = stats['blowout_losses'] / games if games > 0 else 0
-            blowout_penalty = blowout_pct * 40
-            
-            # V30: Low game count penalty
-            games_penalty = 0
-            if games < self.IDEAL_GAMES:
-                penalty_pct = (self.IDEAL_GAMES - games) / (self.IDEAL_GAMES - self.MIN_GAMES) * 0.15
-                games_penalty = base_rating * penalty_pct
-            stats['games_penalty'] = games_penalty
-            
-            stats['base_rating'] = base_rating + gd_bonus + big_win_bonus - blowout_penalty - games_penalty
-            stats['rating'] = stats['base_rating']
-            stats['league_factor'] = league_factor
+        # (every team in the graph has at least one game)
+        win_pct = wins / games
+        goal_diff = graph.column(team_stats, 'goals_for') - graph.column(team_stats, 'goals_against')
+        base_rating = win_pct * 1000 * league_factor
+        
+        avg_gd = goal_diff / games
+        gd_bonus = np.clip(avg_gd * 10, -50, 50)
+        big_win_bonus = graph.column(team_stats, 'big_wins') / games * 30
+        blowout_penalty = graph.column(team_stats, 'blowout_losses') / games * 40
+        
+        # V30: Low game count penalty
+        penalty_pct = (self.IDEAL_GAMES - games) / (self.IDEAL_GAMES - self.MIN_GAMES) * 0.15
+        games_penalty = np.where(games < self.IDEAL_GAMES, base_rating * penalty_pct, 0)
+        
+        base_rating = base_rating + gd_bonus + big_win_bonus - blowout_penalty - games_penalty
+        rating = base_rating.copy()
+        
+        graph.store(team_stats, 'win_pct', win_pct)
+        graph.store(team_stats, 'goal_diff', goal_diff)
+        graph.store(team_stats, 'games_penalty', games_penalty)
+        graph.store(team_stats, 'base_rating', base_rating)
+        graph.store(team_stats, 'league_factor', league_factor)
         
         # V32: Iterative SOS propagation for cross-conference calibration
         # This is key for comparing teams from different conferences/regions
         # Cross-conference games (showcases, nationals) act as bridges that
         # propagate strength information between otherwise isolated groups
-        ITERATIONS = 5  # Number of iterations for rating propagation
-        SOS_WEIGHT = 0.10  # How much SOS affects rating each iteration (10%)
-        
-        for iteration in range(ITERATIONS):
-            # Store previous ratings to check convergence
-            prev_ratings = {team: stats['rating'] for team, stats in team_stats.items()}
-            
-            # Update ratings based on opponent strength
-            for team, stats in team_stats.items():
-                if stats['games_played'] < self.MIN_GAMES:
-                    continue
-                
-                # Calculate strength of schedule from current opponent ratings
-                opp_ratings = []
-                for opp in stats['opponents']:
-                    if opp in team_stats:
-                        opp_ratings.append(team_stats[opp].get('rating', 0))
-                
-                if opp_ratings:
-                    avg_opp_rating = np.mean(opp_ratings)
-                    
-                    # V32: Weight results against opponent quality
-                    # A win against a 1500-rated team is worth more than against 500-rated
-                    game_details = stats.get('game_details', [])
-                    quality_adjusted_wins = 0
-                    quality_adjusted_games = 0
-                    
-                    for game in game_details:
-                        opp = game['opponent']
-                        opp_rating = team_stats.get(opp, {}).get('rating', 500)
-                        result = game['result']
-                        
-                        # Weight by opponent strength (normalized around 1000)
-                        opp_weight = max(0.5, min(2.0, opp_rating / 1000))
-                        quality_adjusted_games += opp_weight
-                        
-                        if result == 'W':
-                            quality_adjusted_wins += opp_weight
-                        elif result == 'T':
-                            quality_adjusted_wins += opp_weight * 0.5
-                    
-                    # Quality-adjusted win rate
-                    if quality_adjusted_games > 0:
-                        quality_win_rate = quality_adjusted_wins / quality_adjusted_games
-                    else:
-                        quality_win_rate = stats['win_pct']
-                    
-                    # Blend base rating with quality-adjusted performance
-                    # This allows cross-conference results to calibrate ratings
-                    sos_adjusted_rating = quality_win_rate * 1000 * stats['league_factor']
-                    
-                    # Blend: keep most of base rating, adjust with SOS-informed rating
-                    stats['rating'] = (1 - SOS_WEIGHT) * stats['base_rating'] + SOS_WEIGHT * sos_adjusted_rating
-                    
-                    # Add SOS bonus (average opponent strength)
-                    sos_bonus = (avg_opp_rating / 1000) * 100
-                    stats['sos_bonus'] = sos_bonus
-                    stats['sos'] = avg_opp_rating / 2000
-                    stats['rating'] += sos_bonus
-                else:
-                    stats['sos_bonus'] = 0
-                    stats['sos'] = 0
-            
-            # Check convergence (optional - for debugging)
-            max_change = max(abs(team_stats[t]['rating'] - prev_ratings[t]) 
-                           for t in team_stats if t in prev_ratings)
-            # Uncomment to see convergence: print(f"  Iteration {iteration+1}: max rating change = {max_change:.1f}")
+        # V48: Solved to a tolerance with segment sums over the whole graph
+        rating, self.last_sos_report = self.solve_sos(graph, base_rating, league_factor, active)
         
         # Store final SOS values after iteration completes
-        for team, stats in team_stats.items():
-            if stats['games_played'] < self.MIN_GAMES:
-                stats['sos_bonus'] = 0
-                stats['sos'] = 0
-                continue
-            
-            opp_ratings = []
-            for opp in stats['opponents']:
-                if opp in team_stats:
-                    opp_ratings.append(team_stats[opp].get('rating', 0))
-            
-            if opp_ratings:
-                avg_opp_rating = np.mean(opp_ratings)
-                stats['sos_bonus'] = (avg_opp_rating / 1000) * 100
-                stats['sos'] = avg_opp_rating / 2000
-                stats['avg_opp_rating'] = avg_opp_rating
+        avg_opp_rating = graph.team_sum(rating[opp_of]) / games
+        graph.store(team_stats, 'sos_bonus', np.where(active, (avg_opp_rating / 1000) * 100, 0))
+        graph.store(team_stats, 'sos', np.where(active, avg_opp_rating / 2000, 0))
+        graph.store(team_stats, 'avg_opp_rating', avg_opp_rating, mask=active)
         
         # V33: SOS penalty pass - penalize teams with weak schedules
         # This prevents undefeated teams that only play weak opponents from ranking too high
-        for team, stats in team_stats.items():
-            if stats['games_played'] < self.MIN_GAMES:
-                stats['sos_penalty'] = 0
-                continue
-            
-            avg_opp = stats.get('avg_opp_rating', 0)
-            
-            if avg_opp < self.SOS_PENALTY_THRESHOLD:
-                # Scale penalty: 0 at threshold, max at 0 avg_opp_rating
-                penalty_ratio = (self.SOS_PENALTY_THRESHOLD - avg_opp) / self.SOS_PENALTY_THRESHOLD
-                penalty = penalty_ratio * self.SOS_PENALTY_MAX
-                stats['sos_penalty'] = penalty
-                stats['rating'] -= penalty
-            else:
-                stats['sos_penalty'] = 0
+        # Scale penalty: 0 at threshold, max at 0 avg_opp_rating
+        weak_schedule = active & (avg_opp_rating < self.SOS_PENALTY_THRESHOLD)
+        penalty_ratio = (self.SOS_PENALTY_THRESHOLD - avg_opp_rating) / self.SOS_PENALTY_THRESHOLD
+        sos_penalty = np.where(weak_schedule, penalty_ratio * self.SOS_PENALTY_MAX, 0)
+        rating = np.where(weak_schedule, rating - sos_penalty, rating)
+        graph.store(team_stats, 'sos_penalty', sos_penalty)
         
         # V37: Conference Strength Calibration
         # Calculate how each conference performs in cross-conference games
@@ -2109,108 +2221,60 @@ class TeamRankerV30:
         # should have their intra-conference wins devalued
         
         # Step 1: Build conference lookup and identify each team's conference
-        team_conferences = {}
-        for team, stats in team_stats.items():
-            conf = stats.get('conference', '')
-            league = stats.get('league', '')
-            # Create a unique key combining league and conference
+        # Create a unique key combining league and conference
+        conf_keys = []
+        for team, league in zip(graph.teams, leagues):
+            conf = team_stats[team].get('conference', '')
             conf_key = f"{league}|{conf}" if conf else f"{league}|Unknown"
-            team_conferences[team] = conf_key
-            stats['conf_key'] = conf_key
+            team_stats[team]['conf_key'] = conf_key
+            conf_keys.append(conf_key)
+        conf_ids, conf_names = pd.factorize(pd.Series(conf_keys, dtype=object))
+        n_confs = len(conf_names)
         
         # Step 2: Calculate cross-conference results for each conference
-        conf_cross_results = {}  # conf_key -> {'wins': 0, 'losses': 0, 'ties': 0, 'gd': 0}
-        
-        for team, stats in team_stats.items():
-            if stats['games_played'] < self.MIN_GAMES:
-                continue
-            
-            my_conf = team_conferences.get(team, '')
-            game_details = stats.get('game_details', [])
-            
-            for game in game_details:
-                opp = game['opponent']
-                opp_conf = team_conferences.get(opp, '')
-                
-                # Only count games where opponent is from a different conference
-                # and both conferences are known
-                if opp_conf and my_conf and opp_conf != my_conf:
-                    if my_conf not in conf_cross_results:
-                        conf_cross_results[my_conf] = {'wins': 0, 'losses': 0, 'ties': 0, 'gd': 0}
-                    
-                    result = game['result']
-                    gf = game.get('goals_for', 0)
-                    ga = game.get('goals_against', 0)
-                    
-                    if result == 'W':
-                        conf_cross_results[my_conf]['wins'] += 1
-                    elif result == 'L':
-                        conf_cross_results[my_conf]['losses'] += 1
-                    else:
-                        conf_cross_results[my_conf]['ties'] += 1
-                    conf_cross_results[my_conf]['gd'] += (gf - ga)
+        # Only count games where opponent is from a different conference
+        my_conf = conf_ids[team_of]
+        cross = active_entry & (my_conf != conf_ids[opp_of])
+        conf_games = np.bincount(my_conf[cross], minlength=n_confs)
+        conf_wins = np.bincount(my_conf[cross & won], minlength=n_confs)
+        conf_ties = np.bincount(my_conf[cross & tied], minlength=n_confs)
+        conf_gd = np.bincount(my_conf[cross], weights=graph.margin[cross], minlength=n_confs)
         
         # Step 3: Calculate conference strength factor
         # A conference with 60%+ cross-conference win rate gets a bonus
         # A conference with 40%- cross-conference win rate gets a penalty
-        conf_strength_factors = {}
-        
-        for conf_key, results in conf_cross_results.items():
-            total_games = results['wins'] + results['losses'] + results['ties']
-            if total_games >= 5:  # Need at least 5 cross-conference games
-                win_rate = (results['wins'] + 0.5 * results['ties']) / total_games
-                avg_gd = results['gd'] / total_games
-                
-                # V37: Conference strength factor: 1.0 is neutral
-                # STRONGER formula - Range from 0.60 (very weak) to 1.40 (very strong)
-                # Based on win rate: 0% = 0.60, 50% = 1.0, 100% = 1.40
-                strength_factor = 0.60 + (win_rate * 0.80)
-                strength_factor = max(0.60, min(1.40, strength_factor))  # Clamp to range
-                
-                # Adjust by goal difference (stronger impact)
-                gd_adjustment = max(-0.10, min(0.10, avg_gd * 0.02))
-                strength_factor += gd_adjustment
-                strength_factor = max(0.60, min(1.40, strength_factor))
-                
-                conf_strength_factors[conf_key] = {
-                    'factor': strength_factor,
-                    'win_rate': win_rate,
-                    'games': total_games,
-                    'gd': results['gd']
-                }
-            else:
-                # Not enough cross-conference games - use neutral factor
-                conf_strength_factors[conf_key] = {
-                    'factor': 1.0,
-                    'win_rate': 0.5,
-                    'games': total_games,
-                    'gd': 0
-                }
+        # Conferences with fewer than 5 cross-conference games stay neutral (1.0)
+        conf_factor = np.ones(n_confs)
+        for c in np.flatnonzero(conf_games >= 5):
+            total_games = conf_games[c]
+            win_rate = (conf_wins[c] + 0.5 * conf_ties[c]) / total_games
+            avg_gd_conf = conf_gd[c] / total_games
+            
+            # V37: Conference strength factor: 1.0 is neutral
+            # STRONGER formula - Range from 0.60 (very weak) to 1.40 (very strong)
+            # Based on win rate: 0% = 0.60, 50% = 1.0, 100% = 1.40
+            strength_factor = 0.60 + (win_rate * 0.80)
+            strength_factor = max(0.60, min(1.40, strength_factor))  # Clamp to range
+            
+            # Adjust by goal difference (stronger impact)
+            gd_adjustment = max(-0.10, min(0.10, avg_gd_conf * 0.02))
+            strength_factor += gd_adjustment
+            conf_factor[c] = max(0.60, min(1.40, strength_factor))
         
         # Step 4: Apply conference strength adjustment to team ratings
         # Teams from strong conferences get a bonus, weak conferences get a penalty
-        for team, stats in team_stats.items():
-            if stats['games_played'] < self.MIN_GAMES:
-                stats['conf_strength_adj'] = 0
-                continue
-            
-            conf_key = stats.get('conf_key', '')
-            conf_data = conf_strength_factors.get(conf_key, {'factor': 1.0})
-            strength_factor = conf_data['factor']
-            
-            # Calculate adjustment: deviation from neutral (1.0)
-            # V37: STRONGER adjustment - max ±720 rating points
-            adjustment = (strength_factor - 1.0) * 1800  # Much stronger impact
-            
-            stats['conf_strength_factor'] = strength_factor
-            stats['conf_strength_adj'] = adjustment
-            stats['rating'] += adjustment
+        # V37: STRONGER adjustment - max ±720 rating points
+        strength_factor = conf_factor[conf_ids]
+        conf_adjustment = np.where(active, (strength_factor - 1.0) * 1800, 0)
+        rating = np.where(active, rating + conf_adjustment, rating)
+        graph.store(team_stats, 'conf_strength_factor', strength_factor, mask=active)
+        graph.store(team_stats, 'conf_strength_adj', conf_adjustment)
         
         # V33: Quality Wins pass - reward wins against top-ranked opponents
         # This is more important than average opponent strength
         # First, get preliminary rankings to identify top opponents
-        prelim_sorted = sorted(team_stats.items(), key=lambda x: x[1].get('rating', 0), reverse=True)
-        prelim_ranks = {team: rank+1 for rank, (team, _) in enumerate(prelim_sorted)}
+        prelim_rank = self._rank_by(rating)
+        opp_rank = prelim_rank[opp_of]
         
         # V34: Reduced quality win point values (was 40/25/15/8)
         # These bonuses were too large and unfairly punished ECNL-RL teams
@@ -2221,190 +2285,90 @@ class TeamRankerV30:
         
         # Margin multiplier: close wins count less, blowouts count more
         # margin 1 = 0.7x, margin 2 = 0.85x, margin 3+ = 1.0x
-        def margin_multiplier(margin):
-            if margin <= 0:
-                return 0  # Ties/losses don't count
-            elif margin == 1:
-                return 0.7
-            elif margin == 2:
-                return 0.85
-            else:
-                return 1.0
+        margin_multiplier = np.select([graph.margin == 1, graph.margin == 2], [0.7, 0.85], 1.0)
+        tier_points = np.select(
+            [opp_rank <= 10, opp_rank <= 25, opp_rank <= 50, opp_rank <= 100],
+            [QW_TOP10_POINTS, QW_TOP25_POINTS, QW_TOP50_POINTS, QW_TOP100_POINTS], 0)
+        
+        active_wins = active_entry & won
+        quality_win = active_wins & (opp_rank <= 100)
+        quality_bonus = graph.team_sum(np.where(quality_win, tier_points * margin_multiplier, 0.0))
+        quality_wins_count = graph.team_count(quality_win)
+        rating = np.where(active, rating + quality_bonus, rating)
         
         # V34: Only apply quality wins penalties to ECNL/GA teams
         # ECNL-RL teams can't get quality wins because top opponents are all ECNL/GA
         NO_QUALITY_WINS_PENALTY = 75   # V34: Reduced from 100
         FEW_QUALITY_WINS_PENALTY = 35  # V34: Reduced from 50
-        
-        for team, stats in team_stats.items():
-            if stats['games_played'] < self.MIN_GAMES:
-                stats['quality_wins_bonus'] = 0
-                stats['quality_wins_penalty'] = 0
-                stats['quality_wins_count'] = 0
-                continue
-            
-            game_details = stats.get('game_details', [])
-            quality_bonus = 0
-            quality_wins_count = 0
-            
-            for game in game_details:
-                if game['result'] != 'W':
-                    continue
-                
-                opp = game['opponent']
-                opp_rank = prelim_ranks.get(opp, 999)
-                margin = game['margin']
-                mult = margin_multiplier(margin)
-                
-                if opp_rank <= 10:
-                    quality_bonus += QW_TOP10_POINTS * mult
-                    quality_wins_count += 1
-                elif opp_rank <= 25:
-                    quality_bonus += QW_TOP25_POINTS * mult
-                    quality_wins_count += 1
-                elif opp_rank <= 50:
-                    quality_bonus += QW_TOP50_POINTS * mult
-                    quality_wins_count += 1
-                elif opp_rank <= 100:
-                    quality_bonus += QW_TOP100_POINTS * mult
-                    quality_wins_count += 1
-            
-            stats['quality_wins_bonus'] = quality_bonus
-            stats['quality_wins_count'] = quality_wins_count
-            stats['rating'] += quality_bonus
-            
-            # V34: Only penalize ECNL/GA teams for no quality wins
-            # ECNL-RL teams can't get quality wins - they only play within their league
-            if stats['league'] in ['ECNL', 'GA']:
-                # Penalty for teams with few/no quality wins
-                # An undefeated team with 0 quality wins hasn't proven anything
-                if quality_wins_count == 0 and stats['wins'] >= 5:
-                    stats['quality_wins_penalty'] = NO_QUALITY_WINS_PENALTY
-                    stats['rating'] -= NO_QUALITY_WINS_PENALTY
-                elif quality_wins_count <= 2 and stats['wins'] >= 10:
-                    # Team with 10+ wins but only 1-2 quality wins
-                    stats['quality_wins_penalty'] = FEW_QUALITY_WINS_PENALTY
-                    stats['rating'] -= FEW_QUALITY_WINS_PENALTY
-                else:
-                    stats['quality_wins_penalty'] = 0
-            else:
-                stats['quality_wins_penalty'] = 0
-            
-            # V33: Quality win RATIO penalty
-            # Teams with lots of wins but few quality wins are padding stats vs weak teams
-            # A team with 13 wins but only 5 quality wins (38%) should be penalized heavily
-            # V34: Only apply quality ratio penalty to ECNL/GA teams
-            # ECNL-RL teams can't accumulate quality wins
-            if stats['league'] in ['ECNL', 'GA'] and stats['wins'] >= 8:
-                quality_ratio = quality_wins_count / stats['wins'] if stats['wins'] > 0 else 0
-                # Penalty if less than 60% of wins are quality wins
-                # V34: Reduced penalties (was 300 and 150)
-                if quality_ratio < 0.60:
-                    base_penalty = (0.60 - quality_ratio) * 200  # V34: Reduced from 300
-                    if quality_ratio < 0.40:
-                        base_penalty += (0.40 - quality_ratio) * 100  # V34: Reduced from 150
-                    stats['quality_ratio_penalty'] = base_penalty
-                    stats['rating'] -= base_penalty
-                else:
-                    stats['quality_ratio_penalty'] = 0
-            else:
-                stats['quality_ratio_penalty'] = 0
-            
-            # V34: "Unproven at Elite Level" penalty - only for ECNL/GA teams
-            # ECNL-RL teams can't play top-25 opponents
-            game_details = stats.get('game_details', [])
-            top25_wins = 0
-            top25_win_margin_total = 0
-            
-            for game in game_details:
-                if game['result'] == 'W':
-                    opp = game['opponent']
-                    opp_rank = prelim_ranks.get(opp, 999)
-                    if opp_rank <= 25:
-                        top25_wins += 1
-                        top25_win_margin_total += game['margin']
-            
-            stats['top25_wins'] = top25_wins
-            
-            # V34: Only apply unproven penalty to ECNL/GA undefeated teams
-            if stats['league'] in ['ECNL', 'GA'] and stats['wins'] >= 10 and stats['losses'] == 0:
-                if top25_wins == 0:
-                    # Undefeated with ZERO top-25 wins = heavily unproven
-                    stats['unproven_penalty'] = 200  # V34: Reduced from 250
-                    stats['rating'] -= 200
-                elif top25_wins == 1:
-                    # Only 1 top-25 win - partially unproven
-                    if top25_win_margin_total >= 3:
-                        stats['unproven_penalty'] = 60  # V34: Reduced from 80
-                    else:
-                        stats['unproven_penalty'] = 120  # V34: Reduced from 150
-                    stats['rating'] -= stats['unproven_penalty']
-                elif top25_wins == 2:
-                    if top25_win_margin_total >= 4:
-                        stats['unproven_penalty'] = 15  # V34: Reduced from 20
-                    else:
-                        stats['unproven_penalty'] = 35  # V34: Reduced from 50
-                    stats['rating'] -= stats['unproven_penalty']
-                else:
-                    stats['unproven_penalty'] = 0
-            else:
-                stats['unproven_penalty'] = 0
+        elite_league = active & np.isin(np.array(leagues, dtype=object), ['ECNL', 'GA'])
+        
+        # Penalty for teams with few/no quality wins
+        # An undefeated team with 0 quality wins hasn't proven anything
+        # (10+ wins but only 1-2 quality wins gets the smaller penalty)
+        quality_wins_penalty = np.select(
+            [elite_league & (quality_wins_count == 0) & (wins >= 5),
+             elite_league & (quality_wins_count <= 2) & (wins >= 10)],
+            [NO_QUALITY_WINS_PENALTY, FEW_QUALITY_WINS_PENALTY], 0)
+        rating = rating - quality_wins_penalty
+        
+        # V33: Quality win RATIO penalty
+        # Teams with lots of wins but few quality wins are padding stats vs weak teams
+        # A team with 13 wins but only 5 quality wins (38%) should be penalized heavily
+        # V34: Only apply quality ratio penalty to ECNL/GA teams
+        # ECNL-RL teams can't accumulate quality wins
+        # Penalty if less than 60% of wins are quality wins
+        # V34: Reduced penalties (was 300 and 150)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            quality_ratio = np.where(wins > 0, quality_wins_count / wins, 0)
+        ratio_penalized = elite_league & (wins >= 8) & (quality_ratio < 0.60)
+        quality_ratio_penalty = np.where(ratio_penalized, (0.60 - quality_ratio) * 200, 0)  # V34: Reduced from 300
+        quality_ratio_penalty = np.where(ratio_penalized & (quality_ratio < 0.40),
+                                         quality_ratio_penalty + (0.40 - quality_ratio) * 100,  # V34: Reduced from 150
+                                         quality_ratio_penalty)
+        rating = rating - quality_ratio_penalty
+        
+        # V34: "Unproven at Elite Level" penalty - only for ECNL/GA teams
+        # ECNL-RL teams can't play top-25 opponents
+        top25_win = active_wins & (opp_rank <= 25)
+        top25_wins = graph.team_count(top25_win)
+        top25_win_margin_total = graph.team_sum(np.where(top25_win, graph.margin, 0))
+        
+        # V34: Only apply unproven penalty to ECNL/GA undefeated teams
+        # 0 top-25 wins = heavily unproven; 1-2 = partially unproven
+        undefeated = elite_league & (wins >= 10) & (losses == 0)
+        unproven_penalty = np.select(
+            [undefeated & (top25_wins == 0),
+             undefeated & (top25_wins == 1),
+             undefeated & (top25_wins == 2)],
+            [200,                                                  # V34: Reduced from 250
+             np.where(top25_win_margin_total >= 3, 60, 120),       # V34: Reduced from 80/150
+             np.where(top25_win_margin_total >= 4, 15, 35)], 0)    # V34: Reduced from 20/50
+        rating = rating - unproven_penalty
+        
+        graph.store(team_stats, 'quality_wins_bonus', np.where(active, quality_bonus, 0))
+        graph.store(team_stats, 'quality_wins_count', quality_wins_count)
+        graph.store(team_stats, 'quality_wins_penalty', quality_wins_penalty)
+        graph.store(team_stats, 'quality_ratio_penalty', quality_ratio_penalty, mask=active)
+        graph.store(team_stats, 'top25_wins', top25_wins, mask=active)
+        graph.store(team_stats, 'unproven_penalty', unproven_penalty, mask=active)
         
         # Third pass: GA performance bonus
-        for team, stats in team_stats.items():
-            if stats['league'] != 'GA':
-                stats['ga_bonus'] = 0
-                continue
-            
-            games = stats['games_played']
-            if games < self.MIN_GAMES:
-                stats['ga_bonus'] = 0
-                continue
-            
-            wins = stats['wins']
-            losses = stats['losses']
-            win_rate = wins / games if games > 0 else 0
-            
-            if losses == 0 and wins > 0:
-                bonus_pct = self.GA_UNDEFEATED_BONUS
-            elif win_rate > 0.80:
-                bonus_pct = self.GA_HIGH_WIN_BONUS
-            elif win_rate > 0.70:
-                bonus_pct = self.GA_GOOD_WIN_BONUS
-            else:
-                bonus_pct = 0
-            
-            ga_bonus = stats['rating'] * bonus_pct
-            stats['ga_bonus'] = ga_bonus
-            stats['rating'] += ga_bonus
-        
         # Fourth pass: ECNL-RL performance bonus
-        for team, stats in team_stats.items():
-            if stats['league'] != 'ECNL-RL':
-                stats['ecnlrl_bonus'] = 0
-                continue
-            
-            games = stats['games_played']
-            if games < self.MIN_GAMES:
-                stats['ecnlrl_bonus'] = 0
-                continue
-            
-            wins = stats['wins']
-            losses = stats['losses']
-            win_rate = wins / games if games > 0 else 0
-            
-            if losses == 0 and wins > 0:
-                bonus_pct = self.ECNLRL_UNDEFEATED_BONUS
-            elif win_rate > 0.80:
-                bonus_pct = self.ECNLRL_HIGH_WIN_BONUS
-            elif win_rate > 0.70:
-                bonus_pct = self.ECNLRL_GOOD_WIN_BONUS
-            else:
-                bonus_pct = 0
-            
-            ecnlrl_bonus = stats['rating'] * bonus_pct
-            stats['ecnlrl_bonus'] = ecnlrl_bonus
-            stats['rating'] += ecnlrl_bonus
+        win_rate = wins / games
+        league_array = np.array(leagues, dtype=object)
+        is_ga = league_array == 'GA'
+        is_ecnlrl = league_array == 'ECNL-RL'
+        for mask, key, undefeated_bonus, high_win_bonus, good_win_bonus in (
+                (is_ga, 'ga_bonus', self.GA_UNDEFEATED_BONUS, self.GA_HIGH_WIN_BONUS, self.GA_GOOD_WIN_BONUS),
+                (is_ecnlrl, 'ecnlrl_bonus', self.ECNLRL_UNDEFEATED_BONUS, self.ECNLRL_HIGH_WIN_BONUS,
+                 self.ECNLRL_GOOD_WIN_BONUS)):
+            bonus_pct = np.select(
+                [(losses == 0) & (wins > 0), win_rate > 0.80, win_rate > 0.70],
+                [undefeated_bonus, high_win_bonus, good_win_bonus], 0)
+            eligible = mask & active
+            bonus = np.where(eligible, rating * bonus_pct, 0)
+            rating = np.where(eligible, rating + bonus, rating)
+            graph.store(team_stats, key, bonus)
         
         # V35: ECNL-RL ceiling/penalty - prevent too many ECNL-RL teams in top 100
         # ECNL-RL teams can't prove themselves against top competition
@@ -2413,40 +2377,16 @@ class TeamRankerV30:
         ECNLRL_RATING_CEILING = 850   # V35: Cap ECNL-RL ratings
         ECNLRL_CEILING_COMPRESSION = 0.08  # V35: Keep 8% of excess (compress 92%)
         
-        for team, stats in team_stats.items():
-            if stats['league'] != 'ECNL-RL':
-                stats['ecnlrl_ceiling_penalty'] = 0
-                stats['ecnlrl_flat_penalty'] = 0
-                continue
-            
-            # First apply flat penalty
-            stats['ecnlrl_flat_penalty'] = ECNLRL_FLAT_PENALTY
-            stats['rating'] -= ECNLRL_FLAT_PENALTY
-            
-            # Then apply ceiling compression
-            if stats['rating'] > ECNLRL_RATING_CEILING:
-                excess = stats['rating'] - ECNLRL_RATING_CEILING
-                compressed_excess = excess * ECNLRL_CEILING_COMPRESSION
-                penalty = excess - compressed_excess
-                stats['ecnlrl_ceiling_penalty'] = penalty
-                stats['rating'] -= penalty
-            else:
-                stats['ecnlrl_ceiling_penalty'] = 0
+        rating = np.where(is_ecnlrl, rating - ECNLRL_FLAT_PENALTY, rating)
+        rating, ecnlrl_ceiling_penalty = self._compress_above(
+            rating, is_ecnlrl, ECNLRL_RATING_CEILING, ECNLRL_CEILING_COMPRESSION)
+        graph.store(team_stats, 'ecnlrl_flat_penalty', np.where(is_ecnlrl, ECNLRL_FLAT_PENALTY, 0))
+        graph.store(team_stats, 'ecnlrl_ceiling_penalty', ecnlrl_ceiling_penalty)
         
         # V30b: Fifth pass: GA ceiling compression (prevent GA from dominating top 5)
-        for team, stats in team_stats.items():
-            if stats['league'] != 'GA':
-                stats['ga_ceiling_penalty'] = 0
-                continue
-            
-            if stats['rating'] > self.GA_RATING_CEILING:
-                excess = stats['rating'] - self.GA_RATING_CEILING
-                compressed_excess = excess * self.GA_CEILING_COMPRESSION
-                penalty = excess - compressed_excess
-                stats['ga_ceiling_penalty'] = penalty
-                stats['rating'] -= penalty
-            else:
-                stats['ga_ceiling_penalty'] = 0
+        rating, ga_ceiling_penalty = self._compress_above(
+            rating, is_ga, self.GA_RATING_CEILING, self.GA_CEILING_COMPRESSION)
+        graph.store(team_stats, 'ga_ceiling_penalty', ga_ceiling_penalty)
         
         # V32: Sixth pass: Competitive game weighting
         # Games against similarly-rated opponents count more heavily
@@ -2455,48 +2395,35 @@ class TeamRankerV30:
         COMPETITIVE_WIN_BONUS = 15   # Bonus per competitive win
         COMPETITIVE_LOSS_PENALTY = 10  # Penalty per competitive loss
         
-        for team, stats in team_stats.items():
-            if stats['games_played'] < self.MIN_GAMES:
-                stats['competitive_bonus'] = 0
-                stats['competitive_wins'] = 0
-                stats['competitive_losses'] = 0
-                stats['competitive_draws'] = 0
-                continue
-            
-            my_rating = stats['rating']
-            game_details = stats.get('game_details', [])
-            
-            comp_wins = 0
-            comp_losses = 0
-            comp_draws = 0
+        competitive_wins = np.zeros(graph.n_teams, dtype=np.int64)
+        competitive_losses = np.zeros(graph.n_teams, dtype=np.int64)
+        competitive_draws = np.zeros(graph.n_teams, dtype=np.int64)
+        competitive_bonus = np.zeros(graph.n_teams, dtype=np.int64)
+        
+        # Sequential on purpose: each team compares against opponent ratings that
+        # already include the adjustment for teams processed before it.
+        for team_id in np.flatnonzero(active):
+            s = graph.team_slice(team_id)
+            # Only count games against teams within competitive threshold
+            competitive = np.abs(rating[team_id] - rating[opp_of[s]]) <= COMPETITIVE_THRESHOLD
+            comp_wins = np.count_nonzero(competitive & won[s])
+            comp_losses = np.count_nonzero(competitive & lost[s])
+            competitive_wins[team_id] = comp_wins
+            competitive_losses[team_id] = comp_losses
+            competitive_draws[team_id] = np.count_nonzero(competitive & tied[s])
             
-            for game in game_details:
-                opp = game['opponent']
-                opp_rating = team_stats.get(opp, {}).get('rating', 0)
-                rating_diff = abs(my_rating - opp_rating)
-                
-                # Only count games against teams within competitive threshold
-                if rating_diff <= COMPETITIVE_THRESHOLD:
-                    result = game['result']
-                    if result == 'W':
-                        comp_wins += 1
-                    elif result == 'L':
-                        comp_losses += 1
-                    else:
-                        comp_draws += 1
-            
-            # Calculate competitive bonus/penalty
             # More weight to wins against comparable teams, penalty for losses
-            competitive_adjustment = (comp_wins * COMPETITIVE_WIN_BONUS) - (comp_losses * COMPETITIVE_LOSS_PENALTY)
-            
-            stats['competitive_bonus'] = competitive_adjustment
-            stats['competitive_wins'] = comp_wins
-            stats['competitive_losses'] = comp_losses
-            stats['competitive_draws'] = comp_draws
-            stats['rating'] += competitive_adjustment
+            competitive_bonus[team_id] = (comp_wins * COMPETITIVE_WIN_BONUS) - (comp_losses * COMPETITIVE_LOSS_PENALTY)
+            rating[team_id] += competitive_bonus[team_id]
+        
+        graph.store(team_stats, 'competitive_bonus', competitive_bonus)
+        graph.store(team_stats, 'competitive_wins', competitive_wins)
+        graph.store(team_stats, 'competitive_losses', competitive_losses)
+        graph.store(team_stats, 'competitive_draws', competitive_draws)
+        graph.store(team_stats, 'rating', rating)
         
         # V30: Seventh pass: Calculate predictability score
-        self.calculate_predictability_scores(team_stats)
+        self.calculate_predictability_scores(team_stats, graph)
         
         # Filter and sort - separate ranked (>=5 games) from unranked (<5 games)
         ranked_teams = {
@@ -2526,116 +2453,167 @@ class TeamRankerV30:
         sorted_teams = self.apply_min_wins_rule(sorted_teams)
         
         # V35: Eighth pass: Calculate records against different rank tiers
-        # Create rank lookup from final sorted order
-        final_ranks = {team: rank+1 for rank, (team, _) in enumerate(sorted_teams)}
+        self.calculate_rank_tier_records(sorted_teams, team_stats, graph)
         
-        for rank, (team, stats) in enumerate(sorted_teams, 1):
-            game_details = stats.get('game_details', [])
-            
-            # Initialize counters
-            within50_w, within50_l, within50_t = 0, 0, 0  # Against teams within 50 ranks
-            higher_w, higher_l, higher_t = 0, 0, 0        # Against higher ranked (lower number)
-            lower_w, lower_l, lower_t = 0, 0, 0          # Against lower ranked (higher number)
-            
-            for game in game_details:
-                opp = game['opponent']
-                opp_rank = final_ranks.get(opp, 999)
-                result = game['result']
-                
-                # Skip unranked opponents
-                if opp_rank == 999:
-                    continue
-                
-                rank_diff = abs(rank - opp_rank)
-                
-                # Record against teams within 50 spots
-                if rank_diff <= 50:
-                    if result == 'W':
-                        within50_w += 1
-                    elif result == 'L':
-                        within50_l += 1
-                    else:
-                        within50_t += 1
-                
-                # Record against higher ranked teams (opponent has lower rank number)
-                if opp_rank < rank:
-                    if result == 'W':
-                        higher_w += 1
-                    elif result == 'L':
-                        higher_l += 1
-                    else:
-                        higher_t += 1
-                
-                # Record against lower ranked teams (opponent has higher rank number)
-                elif opp_rank > rank:
-                    if result == 'W':
-                        lower_w += 1
-                    elif result == 'L':
-                        lower_l += 1
-                    else:
-                        lower_t += 1
-            
-            # Store as formatted strings
-            stats['record_within_50'] = f"{within50_w}-{within50_l}-{within50_t}"
-            stats['record_vs_higher'] = f"{higher_w}-{higher_l}-{higher_t}"
-            stats['record_vs_lower'] = f"{lower_w}-{lower_l}-{lower_t}"
-            
-            # V35: Calculate best/worst wins and losses
-            # Formula: win_value = (500 - opponent_rank) + (margin * 12)
-            # Higher value = better win
-            # For losses: loss_badness = opponent_rank + (margin * 12)
-            # Higher value = worse loss
-            
-            wins_with_value = []
-            losses_with_value = []
+        # V41: Calculate offensive and defensive power scores
+        self.calculate_offensive_defensive_power(sorted_teams, team_stats, graph)
+
+        # V44: Return both ranked and unranked teams
+        return sorted_teams, sorted_unranked
+    
+    def solve_sos(self, graph, base_rating, league_factor, active):
+        """
+        V48: Iterative SOS propagation as a fixed-point solve over the game graph.
+        
+        Each sweep updates every active team at once (Jacobi) from the previous
+        sweep's ratings:
+            rating = (1 - SOS_WEIGHT) * base + SOS_WEIGHT * quality_win_rate * 1000 * league_factor
+                     + avg_opp_rating / 1000 * 100
+        and stops when the largest rating change drops below sos_tolerance
+        (or after sos_max_iterations sweeps).
+        
+        Returns (rating, report) where report has iterations, residual, converged.
+        """
+        opp_of = graph.opponent
+        won = graph.result == graph.WIN
+        tied = graph.result == graph.TIE
+        games = np.maximum(np.diff(graph.indptr), 1)
+        
+        rating = base_rating.copy()
+        residual = 0.0
+        iterations = 0
+        
+        while iterations < self.sos_max_iterations:
+            iterations += 1
+            opp_rating = rating[opp_of]
+            avg_opp_rating = graph.team_sum(opp_rating) / games
             
-            for game in game_details:
-                opp = game['opponent']
-                opp_rank = final_ranks.get(opp, 999)
-                result = game['result']
-                my_score = game.get('goals_for', 0)
-                opp_score = game.get('goals_against', 0)
-                margin = abs(my_score - opp_score)
-                
-                # Skip unranked opponents for this calculation
-                if opp_rank == 999:
-                    continue
-                
-                if result == 'W':
-                    # win_value: higher rank opponent (lower number) + bigger margin = better
-                    win_value = (500 - opp_rank) + (margin * 12)
-                    wins_with_value.append((win_value, opp, my_score, opp_score, opp_rank))
-                elif result == 'L':
-                    # loss_badness: lower rank opponent (higher number) + bigger margin = worse
-                    loss_badness = opp_rank + (margin * 12)
-                    losses_with_value.append((loss_badness, opp, my_score, opp_score, opp_rank))
+            # V32: Weight results against opponent quality
+            # A win against a 1500-rated team is worth more than against 500-rated
+            # Weight by opponent strength (normalized around 1000)
+            opp_weight = np.clip(opp_rating / 1000, 0.5, 2.0)
+            quality_adjusted_games = graph.team_sum(opp_weight)
+            quality_adjusted_wins = graph.team_sum(np.where(won, opp_weight, 0) + np.where(tied, 0.5 * opp_weight, 0))
             
-            # Sort wins by value (descending - best first)
-            wins_with_value.sort(reverse=True)
-            # Sort losses by badness (descending - worst first)
-            losses_with_value.sort(reverse=True)
+            # Quality-adjusted win rate
+            with np.errstate(divide='ignore', invalid='ignore'):
+                quality_win_rate = quality_adjusted_wins / quality_adjusted_games
             
-            # V36: Format: "#26 Team Name (3-1)" or empty string if none
-            def format_result(data_list, index):
-                if len(data_list) > index:
-                    _, opp, my_s, opp_s, opp_r = data_list[index]
-                    # Truncate long team names
-                    opp_short = opp[:22] + "..." if len(opp) > 25 else opp
-                    return f"#{opp_r} {opp_short} ({my_s}-{opp_s})"
-                return ""
+            # Blend: keep most of base rating, adjust with SOS-informed rating
+            # plus SOS bonus (average opponent strength)
+            sos_adjusted_rating = quality_win_rate * 1000 * league_factor
+            new_rating = np.where(
+                active,
+                (1 - self.SOS_WEIGHT) * base_rating + self.SOS_WEIGHT * sos_adjusted_rating
+                + (avg_opp_rating / 1000) * 100,
+                rating)
             
-            stats['best_win'] = format_result(wins_with_value, 0)
-            stats['second_best_win'] = format_result(wins_with_value, 1)
-            stats['worst_loss'] = format_result(losses_with_value, 0)
-            stats['second_worst_loss'] = format_result(losses_with_value, 1)
+            residual = float(np.abs(new_rating - rating).max()) if len(rating) else 0.0
+            rating = new_rating
+            if residual < self.sos_tolerance:
+                break
         
-        # V41: Calculate offensive and defensive power scores
-        self.calculate_offensive_defensive_power(sorted_teams, ranked_teams)
-
-        # V44: Return both ranked and unranked teams
-        return sorted_teams, sorted_unranked
+        return rating, {
+            'iterations': iterations,
+            'residual': residual,
+            'converged': residual < self.sos_tolerance,
+        }
+    
+    @staticmethod
+    def _rank_by(rating):
+        """1-based rank of each team by rating, highest first (ties keep team order)"""
+        rank = np.empty(len(rating), dtype=np.int64)
+        rank[np.argsort(-rating, kind='stable')] = np.arange(1, len(rating) + 1)
+        return rank
+    
+    @staticmethod
+    def _compress_above(rating, mask, ceiling, compression):
+        """Keep only `compression` of each masked rating's excess over ceiling.
+        Returns (new_rating, penalty)."""
+        excess = rating - ceiling
+        over = mask & (rating > ceiling)
+        penalty = np.where(over, excess - excess * compression, 0)
+        return np.where(over, rating - penalty, rating), penalty
+    
+    def _final_ranks(self, sorted_teams, graph):
+        """Rank of each graph team in sorted_teams, 999 for teams not in it"""
+        final_rank = np.full(graph.n_teams, 999, dtype=np.int64)
+        for rank, (team, _) in enumerate(sorted_teams, 1):
+            final_rank[graph.team_index[team]] = rank
+        return final_rank
+    
+    def calculate_rank_tier_records(self, sorted_teams, team_stats, graph):
+        """
+        V35: Records against different rank tiers plus best/worst results.
+        
+        Ranks come from the final sorted order; unranked opponents are skipped.
+        """
+        team_of = graph.entry_team
+        final_rank = self._final_ranks(sorted_teams, graph)
+        my_rank = final_rank[team_of]
+        opp_rank = final_rank[graph.opponent]
+        
+        # Skip unranked teams and unranked opponents
+        counted = (my_rank != 999) & (opp_rank != 999)
+        won = counted & (graph.result == graph.WIN)
+        lost = counted & (graph.result == graph.LOSS)
+        tied = counted & (graph.result == graph.TIE)
+        
+        within50 = np.abs(my_rank - opp_rank) <= 50  # Against teams within 50 ranks
+        higher = opp_rank < my_rank                  # Against higher ranked (lower number)
+        lower = opp_rank > my_rank                   # Against lower ranked (higher number)
+        
+        def record(tier):
+            w = graph.team_count(won & tier).tolist()
+            l = graph.team_count(lost & tier).tolist()
+            t = graph.team_count(tied & tier).tolist()
+            return [f"{w[i]}-{l[i]}-{t[i]}" for i in range(graph.n_teams)]
+        
+        is_ranked = final_rank != 999
+        graph.store(team_stats, 'record_within_50', record(within50), mask=is_ranked)
+        graph.store(team_stats, 'record_vs_higher', record(higher), mask=is_ranked)
+        graph.store(team_stats, 'record_vs_lower', record(lower), mask=is_ranked)
+        
+        # V35: Calculate best/worst wins and losses
+        # Formula: win_value = (500 - opponent_rank) + (margin * 12)
+        # Higher value = better win
+        # For losses: loss_badness = opponent_rank + (margin * 12)
+        # Higher value = worse loss
+        # Ties on value fall back to opponent name, then scores (highest first)
+        abs_margin = np.abs(graph.margin)
+        name_order = np.empty(graph.n_teams, dtype=np.int64)
+        name_order[np.argsort(np.array(graph.teams, dtype=object), kind='stable')] = np.arange(graph.n_teams)
+        
+        # V36: Format: "#26 Team Name (3-1)" or empty string if none
+        def format_result(entry):
+            opp = graph.teams[graph.opponent[entry]]
+            # Truncate long team names
+            opp_short = opp[:22] + "..." if len(opp) > 25 else opp
+            return f"#{opp_rank[entry]} {opp_short} ({graph.goals_for[entry]}-{graph.goals_against[entry]})"
+        
+        for mask, value, first_key, second_key in (
+                (won, (500 - opp_rank) + abs_margin * 12, 'best_win', 'second_best_win'),
+                (lost, opp_rank + abs_margin * 12, 'worst_loss', 'second_worst_loss')):
+            entries = np.flatnonzero(mask)
+            # Sort by team, then best (or worst) first
+            entries = entries[np.lexsort((-graph.goals_against[entries], -graph.goals_for[entries],
+                                          -name_order[graph.opponent[entries]], -value[entries],
+                                          team_of[entries]))]
+            first = ['' for _ in range(graph.n_teams)]
+            second = ['' for _ in range(graph.n_teams)]
+            previous_team, position = -1, 0
+            for entry in entries.tolist():
+                team_id = team_of[entry]
+                position = position + 1 if team_id == previous_team else 0
+                previous_team = team_id
+                if position == 0:
+                    first[team_id] = format_result(entry)
+                elif position == 1:
+                    second[team_id] = format_result(entry)
+            graph.store(team_stats, first_key, first, mask=is_ranked)
+            graph.store(team_stats, second_key, second, mask=is_ranked)
     
-    def calculate_predictability_scores(self, team_stats):
+    def calculate_predictability_scores(self, team_stats, graph):
         """
         V33: Calculate predictability score (1-100) for each team
         
@@ -2645,142 +2623,91 @@ class TeamRankerV30:
         3. Margin Alignment (0-20 pts): Margins correlate with opponent strength
         4. Opponent Quality (0-25 pts): V33 NEW - Have they played ranked opponents?
         """
+        team_of = graph.entry_team
+        rating = graph.column(team_stats, 'rating').astype(float)
+        games = graph.column(team_stats, 'games_played')
+        active = games >= self.MIN_GAMES
         
         # First, calculate all teams' approximate ranks for opponent quality scoring
-        sorted_teams = sorted(team_stats.items(), key=lambda x: x[1].get('rating', 0), reverse=True)
-        team_ranks = {team: rank+1 for rank, (team, _) in enumerate(sorted_teams)}
-        
-        for team, stats in team_stats.items():
-            games = stats['games_played']
-            
-            if games < self.MIN_GAMES:
-                stats['predictability'] = 0
-                stats['pred_games_score'] = 0
-                stats['pred_consistency_score'] = 0
-                stats['pred_margin_score'] = 0
-                stats['pred_opp_quality_score'] = 0
-                continue
-            
-            # Component 1: Games played (0-30 points)
-            # Scale: 5 games = 0, 15+ games = 30
-            games_score = min(games / self.PRED_IDEAL_GAMES, 1.0) * self.PRED_GAMES_WEIGHT
-            
-            # Component 2: Result consistency (0-25 points)
-            # Do results match expectations based on opponent strength?
-            game_details = stats.get('game_details', [])
-            expected_results = 0
-            total_decisive = 0
-            
-            my_rating = stats.get('rating', 0)
-            
-            for game in game_details:
-                opp = game['opponent']
-                opp_rating = team_stats.get(opp, {}).get('rating', 0)
-                result = game['result']
-                
-                if result == 'T':
-                    continue  # Ties are neutral
-                
-                total_decisive += 1
-                rating_diff = my_rating - opp_rating
-                
-                # Expected: beat weaker teams (rating_diff > 0), lose to stronger (rating_diff < 0)
-                if result == 'W' and rating_diff > -100:
-                    # Won against weaker or roughly equal team
-                    expected_results += 1
-                elif result == 'L' and rating_diff < 100:
-                    # Lost to stronger or roughly equal team
-                    expected_results += 1
-                elif result == 'W' and rating_diff <= -100:
-                    # Upset win (beat stronger team) - partially expected
-                    expected_results += 0.5
-                elif result == 'L' and rating_diff >= 100:
-                    # Upset loss (lost to weaker team) - unexpected
-                    expected_results += 0
-            
-            if total_decisive > 0:
-                consistency_rate = expected_results / total_decisive
-                consistency_score = consistency_rate * self.PRED_CONSISTENCY_WEIGHT
-            else:
-                consistency_score = self.PRED_CONSISTENCY_WEIGHT * 0.5  # Neutral if all ties
-            
-            # Component 3: Margin alignment (0-20 points)
-            # Do margins correlate with opponent strength?
-            margins = []
-            rating_diffs = []
-            
-            for game in game_details:
-                opp = game['opponent']
-                opp_rating = team_stats.get(opp, {}).get('rating', 0)
-                margin = game['margin']
-                rating_diff = my_rating - opp_rating
-                
-                margins.append(margin)
-                rating_diffs.append(rating_diff)
-            
-            if len(margins) >= 3 and np.std(rating_diffs) > 0 and np.std(margins) > 0:
-                # Calculate correlation between margin and rating difference
-                # Expect: higher margin against weaker teams (positive correlation)
-                try:
-                    with np.errstate(divide='ignore', invalid='ignore'):
-                        correlation = np.corrcoef(margins, rating_diffs)[0, 1]
-                    if np.isnan(correlation) or np.isinf(correlation):
-                        correlation = 0
-                    # Transform correlation (-1 to 1) to score (0 to 20)
-                    # correlation of 0.5+ is good, -0.5 is bad
-                    margin_score = max(0, min(1, (correlation + 0.5) / 1.0)) * self.PRED_MARGIN_WEIGHT
-                except:
-                    margin_score = self.PRED_MARGIN_WEIGHT * 0.5
-            else:
-                # Not enough data or variance for correlation
-                margin_score = self.PRED_MARGIN_WEIGHT * 0.3
-            
-            # Component 4: V33 NEW - Opponent Quality (0-25 points)
-            # Have they played any top-ranked opponents?
-            # If all opponents are ranked 200+, we can't really predict how they'd do vs top teams
-            top50_opponents = 0
-            top100_opponents = 0
-            top200_opponents = 0
-            
-            for game in game_details:
-                opp = game['opponent']
-                opp_rank = team_ranks.get(opp, 999)
-                if opp_rank <= 50:
-                    top50_opponents += 1
-                if opp_rank <= 100:
-                    top100_opponents += 1
-                if opp_rank <= 200:
-                    top200_opponents += 1
-            
-            # Score based on quality of opponents faced
-            # Max points if played 3+ top-50 opponents OR 5+ top-100 opponents
-            if top50_opponents >= 3:
-                opp_quality_score = self.PRED_OPP_QUALITY_WEIGHT
-            elif top50_opponents >= 1:
-                opp_quality_score = self.PRED_OPP_QUALITY_WEIGHT * 0.7 + (top100_opponents / 5) * self.PRED_OPP_QUALITY_WEIGHT * 0.3
-            elif top100_opponents >= 3:
-                opp_quality_score = self.PRED_OPP_QUALITY_WEIGHT * 0.6
-            elif top100_opponents >= 1:
-                opp_quality_score = self.PRED_OPP_QUALITY_WEIGHT * 0.4
-            elif top200_opponents >= 3:
-                opp_quality_score = self.PRED_OPP_QUALITY_WEIGHT * 0.3
-            else:
-                # Never played a top-200 opponent - very low predictability
-                opp_quality_score = self.PRED_OPP_QUALITY_WEIGHT * 0.1
-            
-            opp_quality_score = min(opp_quality_score, self.PRED_OPP_QUALITY_WEIGHT)
-            
-            # Total predictability (0-100)
-            total_predictability = games_score + consistency_score + margin_score + opp_quality_score
-            
-            # Store components
-            stats['pred_games_score'] = round(games_score, 1)
-            stats['pred_consistency_score'] = round(consistency_score, 1)
-            stats['pred_margin_score'] = round(margin_score, 1)
-            stats['pred_opp_quality_score'] = round(opp_quality_score, 1)
-            stats['predictability'] = round(total_predictability, 0)
+        team_ranks = self._rank_by(rating)
+        
+        # Component 1: Games played (0-30 points)
+        # Scale: 5 games = 0, 15+ games = 30
+        games_score = np.minimum(games / self.PRED_IDEAL_GAMES, 1.0) * self.PRED_GAMES_WEIGHT
+        
+        # Component 2: Result consistency (0-25 points)
+        # Do results match expectations based on opponent strength?
+        rating_diff = rating[team_of] - rating[graph.opponent]
+        won = graph.result == graph.WIN
+        lost = graph.result == graph.LOSS
+        
+        # Expected: beat weaker teams (rating_diff > 0), lose to stronger (rating_diff < 0)
+        # Won against weaker or roughly equal team = 1, upset win = 0.5 (partially expected)
+        # Lost to stronger or roughly equal team = 1, upset loss = 0 (unexpected)
+        # Ties are neutral
+        expected = np.select([won & (rating_diff > -100), won, lost & (rating_diff < 100)], [1, 0.5, 1], 0)
+        expected_results = graph.team_sum(expected)
+        total_decisive = graph.team_count(won | lost)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            consistency_score = np.where(
+                total_decisive > 0,
+                expected_results / total_decisive * self.PRED_CONSISTENCY_WEIGHT,
+                self.PRED_CONSISTENCY_WEIGHT * 0.5)  # Neutral if all ties
+        
+        # Component 3: Margin alignment (0-20 points)
+        # Do margins correlate with opponent strength?
+        # Expect: higher margin against weaker teams (positive correlation)
+        margin = graph.margin.astype(float)
+        margin_dev = margin - (graph.team_sum(margin) / games)[team_of]
+        diff_dev = rating_diff - (graph.team_sum(rating_diff) / games)[team_of]
+        margin_var = graph.team_sum(margin_dev * margin_dev)
+        diff_var = graph.team_sum(diff_dev * diff_dev)
+        covariance = graph.team_sum(margin_dev * diff_dev)
+        has_variance = (games >= 3) & (margin_var > 0) & (diff_var > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = np.clip(covariance / np.sqrt(margin_var * diff_var), -1, 1)
+        correlation = np.where(np.isfinite(correlation), correlation, 0)
+        # Transform correlation (-1 to 1) to score (0 to 20)
+        # correlation of 0.5+ is good, -0.5 is bad
+        # Not enough data or variance for correlation = 30%
+        margin_score = np.where(
+            has_variance,
+            np.clip((correlation + 0.5) / 1.0, 0, 1) * self.PRED_MARGIN_WEIGHT,
+            self.PRED_MARGIN_WEIGHT * 0.3)
+        
+        # Component 4: V33 NEW - Opponent Quality (0-25 points)
+        # Have they played any top-ranked opponents?
+        # If all opponents are ranked 200+, we can't really predict how they'd do vs top teams
+        opp_rank = team_ranks[graph.opponent]
+        top50_opponents = graph.team_count(opp_rank <= 50)
+        top100_opponents = graph.team_count(opp_rank <= 100)
+        top200_opponents = graph.team_count(opp_rank <= 200)
+        
+        # Score based on quality of opponents faced
+        # Max points if played 3+ top-50 opponents OR 5+ top-100 opponents
+        # Never played a top-200 opponent - very low predictability
+        W = self.PRED_OPP_QUALITY_WEIGHT
+        opp_quality_score = np.select(
+            [top50_opponents >= 3, top50_opponents >= 1, top100_opponents >= 3,
+             top100_opponents >= 1, top200_opponents >= 3],
+            [W, W * 0.7 + (top100_opponents / 5) * W * 0.3, W * 0.6, W * 0.4, W * 0.3],
+            W * 0.1)
+        opp_quality_score = np.minimum(opp_quality_score, W)
+        
+        # Total predictability (0-100)
+        total_predictability = games_score + consistency_score + margin_score + opp_quality_score
+        
+        # Store components (0 for teams below MIN_GAMES)
+        inactive = ~active
+        for key, values, digits in (('pred_games_score', games_score, 1),
+                                    ('pred_consistency_score', consistency_score, 1),
+                                    ('pred_margin_score', margin_score, 1),
+                                    ('pred_opp_quality_score', opp_quality_score, 1),
+                                    ('predictability', total_predictability, 0)):
+            graph.store(team_stats, key, values, mask=active, digits=digits)
+            graph.store(team_stats, key, np.zeros(graph.n_teams, dtype=np.int64), mask=inactive)
     
-    def calculate_offensive_defensive_power(self, sorted_teams, team_stats):
+    def calculate_offensive_defensive_power(self, sorted_teams, team_stats, graph):
         """
         V41: Calculate offensive and defensive power scores and rankings.
         
@@ -2795,114 +2722,89 @@ class TeamRankerV30:
         - Clean sheet percentage (0-25 pts): % of games with 0 goals against
         - Goals allowed vs top teams (0-20 pts): Goals allowed against ranked opponents
         - Blowout loss avoidance (0-15 pts): Avoiding 4+ goal losses
+        
+        V48: Scores are computed for the ranked teams in sorted_teams only.
         """
         # Create rank lookup from sorted teams
-        team_ranks = {team: rank+1 for rank, (team, _) in enumerate(sorted_teams)}
-        
-        # First pass: calculate raw offensive and defensive scores
-        for team, stats in team_stats.items():
-            games = stats.get('games_played', 0)
-            
-            if games < self.MIN_GAMES:
-                stats['offensive_power_score'] = 0
-                stats['defensive_power_score'] = 0
-                stats['offensive_rank'] = 999
-                stats['defensive_rank'] = 999
-                stats['goals_per_game'] = 0
-                stats['goals_against_per_game'] = 0
-                stats['clean_sheets'] = 0
-                continue
-            
-            gf = stats.get('goals_for', 0)
-            ga = stats.get('goals_against', 0)
-            big_wins = stats.get('big_wins', 0)
-            blowout_losses = stats.get('blowout_losses', 0)
-            game_details = stats.get('game_details', [])
-            
-            # ═══════════════════════════════════════════════════════════════
-            # OFFENSIVE POWER CALCULATION
-            # ═══════════════════════════════════════════════════════════════
-            
-            # Component 1: Goals per game (0-40 pts)
-            # Scale: 0 goals = 0, 3+ goals/game = 40
-            goals_per_game = gf / games
-            stats['goals_per_game'] = round(goals_per_game, 2)
-            offensive_gpg_score = min(goals_per_game / 3.0, 1.0) * 40
-            
-            # Component 2: Big win percentage (0-25 pts)
-            # Winning by 4+ goals shows offensive dominance
-            big_win_pct = big_wins / games
-            offensive_big_win_score = min(big_win_pct / 0.30, 1.0) * 25  # 30% big wins = max
-            
-            # Component 3: Scoring vs ranked opponents (0-20 pts)
-            goals_vs_ranked = 0
-            games_vs_ranked = 0
-            for game in game_details:
-                opp = game['opponent']
-                opp_rank = team_ranks.get(opp, 999)
-                if opp_rank <= 100:  # Against top 100 opponents
-                    goals_vs_ranked += game.get('goals_for', 0)
-                    games_vs_ranked += 1
-            
-            if games_vs_ranked > 0:
-                gpg_vs_ranked = goals_vs_ranked / games_vs_ranked
-                offensive_vs_ranked_score = min(gpg_vs_ranked / 2.0, 1.0) * 20  # 2+ goals/game vs ranked = max
-            else:
-                offensive_vs_ranked_score = 5  # Default if no ranked opponents
-            
-            # Component 4: Multi-goal games bonus (0-15 pts)
-            # Games with 2+ goals scored
-            multi_goal_games = sum(1 for g in game_details if g.get('goals_for', 0) >= 2)
-            multi_goal_pct = multi_goal_games / games
-            offensive_multi_goal_score = min(multi_goal_pct / 0.80, 1.0) * 15  # 80% multi-goal games = max
-            
-            # Total Offensive Power (0-100)
-            offensive_power = offensive_gpg_score + offensive_big_win_score + offensive_vs_ranked_score + offensive_multi_goal_score
-            stats['offensive_power_score'] = round(min(offensive_power, 100), 1)
-            
-            # ═══════════════════════════════════════════════════════════════
-            # DEFENSIVE POWER CALCULATION
-            # ═══════════════════════════════════════════════════════════════
-            
-            # Component 1: Goals against per game (0-40 pts)
-            # Scale: 3+ goals against = 0, 0 goals against = 40
-            goals_against_per_game = ga / games
-            stats['goals_against_per_game'] = round(goals_against_per_game, 2)
-            defensive_gapg_score = max(0, (3.0 - goals_against_per_game) / 3.0) * 40
-            
-            # Component 2: Clean sheet percentage (0-25 pts)
-            clean_sheets = sum(1 for g in game_details if g.get('goals_against', 0) == 0)
-            stats['clean_sheets'] = clean_sheets
-            clean_sheet_pct = clean_sheets / games
-            defensive_clean_sheet_score = min(clean_sheet_pct / 0.40, 1.0) * 25  # 40% clean sheets = max
-            
-            # Component 3: Goals allowed vs ranked opponents (0-20 pts)
-            goals_allowed_vs_ranked = 0
-            for game in game_details:
-                opp = game['opponent']
-                opp_rank = team_ranks.get(opp, 999)
-                if opp_rank <= 100:  # Against top 100 opponents
-                    goals_allowed_vs_ranked += game.get('goals_against', 0)
-            
-            if games_vs_ranked > 0:
-                gapg_vs_ranked = goals_allowed_vs_ranked / games_vs_ranked
-                defensive_vs_ranked_score = max(0, (2.5 - gapg_vs_ranked) / 2.5) * 20  # 0 goals vs ranked = max
-            else:
-                defensive_vs_ranked_score = 5  # Default if no ranked opponents
-            
-            # Component 4: Blowout loss avoidance (0-15 pts)
-            # Not losing by 4+ goals
-            blowout_pct = blowout_losses / games
-            defensive_no_blowout_score = max(0, (0.20 - blowout_pct) / 0.20) * 15  # 0 blowouts = max
-            
-            # Total Defensive Power (0-100)
-            defensive_power = defensive_gapg_score + defensive_clean_sheet_score + defensive_vs_ranked_score + defensive_no_blowout_score
-            stats['defensive_power_score'] = round(min(defensive_power, 100), 1)
+        team_ranks = self._final_ranks(sorted_teams, graph)
+        ranked = team_ranks != 999
+        
+        games = graph.column(team_stats, 'games_played')
+        gf = graph.column(team_stats, 'goals_for')
+        ga = graph.column(team_stats, 'goals_against')
+        
+        # ═══════════════════════════════════════════════════════════════
+        # OFFENSIVE POWER CALCULATION
+        # ═══════════════════════════════════════════════════════════════
+        
+        # Component 1: Goals per game (0-40 pts)
+        # Scale: 0 goals = 0, 3+ goals/game = 40
+        goals_per_game = gf / games
+        offensive_gpg_score = np.minimum(goals_per_game / 3.0, 1.0) * 40
+        
+        # Component 2: Big win percentage (0-25 pts)
+        # Winning by 4+ goals shows offensive dominance
+        big_win_pct = graph.column(team_stats, 'big_wins') / games
+        offensive_big_win_score = np.minimum(big_win_pct / 0.30, 1.0) * 25  # 30% big wins = max
+        
+        # Component 3: Scoring vs ranked opponents (0-20 pts)
+        vs_ranked = team_ranks[graph.opponent] <= 100  # Against top 100 opponents
+        goals_vs_ranked = graph.team_sum(np.where(vs_ranked, graph.goals_for, 0))
+        games_vs_ranked = graph.team_count(vs_ranked)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gpg_vs_ranked = goals_vs_ranked / games_vs_ranked
+            # 2+ goals/game vs ranked = max, default 5 if no ranked opponents
+            offensive_vs_ranked_score = np.where(
+                games_vs_ranked > 0, np.minimum(gpg_vs_ranked / 2.0, 1.0) * 20, 5)
+        
+        # Component 4: Multi-goal games bonus (0-15 pts)
+        # Games with 2+ goals scored
+        multi_goal_pct = graph.team_count(graph.goals_for >= 2) / games
+        offensive_multi_goal_score = np.minimum(multi_goal_pct / 0.80, 1.0) * 15  # 80% multi-goal games = max
+        
+        # Total Offensive Power (0-100)
+        offensive_power = offensive_gpg_score + offensive_big_win_score + offensive_vs_ranked_score + offensive_multi_goal_score
+        
+        # ═══════════════════════════════════════════════════════════════
+        # DEFENSIVE POWER CALCULATION
+        # ═══════════════════════════════════════════════════════════════
+        
+        # Component 1: Goals against per game (0-40 pts)
+        # Scale: 3+ goals against = 0, 0 goals against = 40
+        goals_against_per_game = ga / games
+        defensive_gapg_score = np.maximum(0, (3.0 - goals_against_per_game) / 3.0) * 40
+        
+        # Component 2: Clean sheet percentage (0-25 pts)
+        clean_sheets = graph.team_count(graph.goals_against == 0)
+        defensive_clean_sheet_score = np.minimum(clean_sheets / games / 0.40, 1.0) * 25  # 40% clean sheets = max
+        
+        # Component 3: Goals allowed vs ranked opponents (0-20 pts)
+        goals_allowed_vs_ranked = graph.team_sum(np.where(vs_ranked, graph.goals_against, 0))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gapg_vs_ranked = goals_allowed_vs_ranked / games_vs_ranked
+            # 0 goals vs ranked = max, default 5 if no ranked opponents
+            defensive_vs_ranked_score = np.where(
+                games_vs_ranked > 0, np.maximum(0, (2.5 - gapg_vs_ranked) / 2.5) * 20, 5)
+        
+        # Component 4: Blowout loss avoidance (0-15 pts)
+        # Not losing by 4+ goals
+        blowout_pct = graph.column(team_stats, 'blowout_losses') / games
+        defensive_no_blowout_score = np.maximum(0, (0.20 - blowout_pct) / 0.20) * 15  # 0 blowouts = max
+        
+        # Total Defensive Power (0-100)
+        defensive_power = defensive_gapg_score + defensive_clean_sheet_score + defensive_vs_ranked_score + defensive_no_blowout_score
+        
+        graph.store(team_stats, 'goals_per_game', goals_per_game, mask=ranked, digits=2)
+        graph.store(team_stats, 'offensive_power_score', np.minimum(offensive_power, 100), mask=ranked, digits=1)
+        graph.store(team_stats, 'goals_against_per_game', goals_against_per_game, mask=ranked, digits=2)
+        graph.store(team_stats, 'clean_sheets', clean_sheets, mask=ranked)
+        graph.store(team_stats, 'defensive_power_score', np.minimum(defensive_power, 100), mask=ranked, digits=1)
         
         # Second pass: calculate rankings within this age group
         # Get all teams with valid scores
-        valid_teams = [(team, stats) for team, stats in team_stats.items() 
-                       if stats.get('games_played', 0) >= self.MIN_GAMES]
+        valid_teams = [(team, stats) for team, stats in team_stats.items()
+                       if ranked[graph.team_index[team]]]
         
         # Sort by offensive power and assign ranks
         offensive_sorted = sorted(valid_teams, key=lambda x: x[1].get('offensive_power_score', 0), reverse=True)
@@ -3007,17 +2909,6 @@ class TeamRankerV30:
         # First, try to look up from teams table
         team_key = team_name.lower().strip()
 
-        # V43: Normalize for lookup
-        import re as _re
-        def normalize_for_lookup(name):
-            if not name:
-                return name
-            name = name.lower().strip()
-            name = _re.sub(r'\s+(\d+g|g\d+|b\d+)(\s+ga|\s+ecnl|\s+rl)?\s*$', '', name, flags=_re.IGNORECASE)
-            name = _re.sub(r'\s+(ga|ecnl|ecnl-rl|rl|aspire|npl)\s*$', '', name, flags=_re.IGNORECASE)
-            return name.strip()
-
-
         # V43 Enhanced: Additional club-to-state mappings for better coverage
         CLUB_STATE_PATTERNS = {
             'alabama': 'AL',
@@ -3391,8 +3282,8 @@ class TeamRankerV30:
         state_name = None
         if team_key in self.team_states:
             state_name = self.team_states[team_key]
-        elif normalize_for_lookup(team_key) in self.team_states:
-            state_name = self.team_states[normalize_for_lookup(team_key)]
+        elif normalize_team_for_lookup(team_key) in self.team_states:
+            state_name = self.team_states[normalize_team_for_lookup(team_key)]
 
         if state_name:
             state_name = state_name.lower().strip()
@@ -3473,16 +3364,6 @@ class TeamRankerV30:
 
         team_key = team_name.lower().strip()
 
-        # V45: Normalize for lookup (same logic as get_team_state)
-        import re as _re
-        def normalize_for_lookup(name):
-            if not name:
-                return name
-            name = name.lower().strip()
-            name = _re.sub(r'\s+(\d+g|g\d+|b\d+)(\s+ga|\s+ecnl|\s+rl)?\s*$', '', name, flags=_re.IGNORECASE)
-            name = _re.sub(r'\s+(ga|ecnl|ecnl-rl|rl|aspire|npl)\s*$', '', name, flags=_re.IGNORECASE)
-            return name.strip()
-
         # Check direct key in database
         if team_key in self.team_addresses:
             addr = self.team_addresses[team_key]
@@ -3491,7 +3372,7 @@ class TeamRankerV30:
                 return addr
 
         # Check normalized key in database
-        normalized = normalize_for_lookup(team_key)
+        normalized = normalize_team_for_lookup(team_key)
         if normalized in self.team_addresses:
             addr = self.team_addresses[normalized]
             if addr.get('city') or addr.get('state'):
@@ -3516,22 +3397,12 @@ class TeamRankerV30:
 
         team_key = team_name.lower().strip()
 
-        # V45: Normalize for lookup (same logic as get_team_state)
-        import re as _re
-        def normalize_for_lookup(name):
-            if not name:
-                return name
-            name = name.lower().strip()
-            name = _re.sub(r'\s+(\d+g|g\d+|b\d+)(\s+ga|\s+ecnl|\s+rl)?\s*$', '', name, flags=_re.IGNORECASE)
-            name = _re.sub(r'\s+(ga|ecnl|ecnl-rl|rl|aspire|npl)\s*$', '', name, flags=_re.IGNORECASE)
-            return name.strip()
-
         # Check direct key
         if team_key in self.team_clubs:
             return self.team_clubs[team_key]
 
         # Check normalized key
-        normalized = normalize_for_lookup(team_key)
+        normalized = normalize_team_for_lookup(team_key)
         if normalized in self.team_clubs:
             return self.team_clubs[normalized]
 
@@ -3586,8 +3457,94 @@ class TeamRankerV30:
     # MAIN RUNNER
     # ═══════════════════════════════════════════════════════════════════════════
     
-    def run_all_age_groups(self, do_cleanup=None, dry_run=False):
-        """Generate rankings for all age groups"""
+    # ═══════════════════════════════════════════════════════════════════════════
+    # V48: INCREMENTAL RE-RANKING CACHE
+    # ═══════════════════════════════════════════════════════════════════════════
+    
+    def age_group_fingerprint(self, games):
+        """
+        V48: Fingerprint of one age group's cleaned game slice.
+        
+        Game count and max scraped_at are cheap, readable change signals; the
+        content hash covers edits that keep both the same (score fixes, renames,
+        alias changes). Row order is hashed too since it sets team order.
+        """
+        content = pd.util.hash_pandas_object(games[self.FINGERPRINT_COLUMNS], index=False)
+        max_scraped_at = games['scraped_at'].max() if 'scraped_at' in games.columns else None
+        return {
+            'games': len(games),
+            'max_scraped_at': None if pd.isna(max_scraped_at) else str(max_scraped_at),
+            'content_hash': hashlib.sha256(content.to_numpy().tobytes()).hexdigest(),
+        }
+    
+    def _ranking_settings_hash(self):
+        """Cached rankings are only valid for the same ranker code and solver settings"""
+        digest = hashlib.sha256(Path(__file__).read_bytes())
+        digest.update(repr((self.sos_tolerance, self.sos_max_iterations)).encode())
+        return digest.hexdigest()
+    
+    def load_rankings_cache(self):
+        """Return {age_group: cache entry} from the last run, or {} if it can't be used"""
+        cache_path = Path(self.RANKINGS_CACHE_FILE)
+        if not cache_path.exists():
+            print(f"  No ranking cache ({cache_path}) - ranking all age groups")
+            return {}
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except Exception as e:
+            print(f"  WARNING:  Could not read ranking cache ({e}) - ranking all age groups")
+            return {}
+        if cache.get('version') != self.RANKINGS_CACHE_VERSION or cache.get('settings') != self._ranking_settings_hash():
+            print("  Ranker code or settings changed since the cache was written - ranking all age groups")
+            return {}
+        return cache['age_groups']
+    
+    def save_rankings_cache(self, age_groups):
+        """Persist fingerprints and calculate_rankings() output for the next --incremental run"""
+        cache_path = Path(self.RANKINGS_CACHE_FILE)
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({
+                    'version': self.RANKINGS_CACHE_VERSION,
+                    'settings': self._ranking_settings_hash(),
+                    'created': datetime.now().isoformat(),
+                    'age_groups': age_groups,
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"  WARNING:  Could not save ranking cache: {e}")
+    
+    def rank_age_groups(self, game_slices, workers=1):
+        """
+        V48: Rank each age group's games, yielding (rankings, unranked, sos_report)
+        in the same order as game_slices.
+        
+        workers=1 ranks in this process, one group at a time. workers>1 ships the
+        slices to a process pool; results still come back in input order, and
+        calculate_rankings() is deterministic, so the output is identical.
+        """
+        if workers <= 1 or len(game_slices) <= 1:
+            for games in game_slices:
+                rankings, unranked = self.calculate_rankings(games)
+                yield rankings, unranked, self.last_sos_report
+            return
+        
+        with ProcessPoolExecutor(
+                max_workers=min(workers, len(game_slices)),
+                initializer=_init_rank_worker,
+                initargs=(str(self.db_path), self.sos_tolerance, self.sos_max_iterations)) as pool:
+            for rankings, unranked, sos_report, log in pool.map(_rank_age_group_worker, game_slices):
+                print(log, end='')
+                yield rankings, unranked, sos_report
+    
+    def run_all_age_groups(self, do_cleanup=None, dry_run=False, workers=1, incremental=False):
+        """Generate rankings for all age groups
+        
+        V48: incremental=True reuses the cached rankings of age groups whose
+        fingerprint matches the last run and only re-ranks the changed ones.
+        """
         print(f"\n{'='*80}")
         print("[TROPHY] SOCCER TEAM RANKING SYSTEM V42")
         print(f"{'='*80}")
@@ -3618,12 +3575,35 @@ class TeamRankerV30:
         all_rankings = {}
         all_unranked = {}  # V44: Store unranked teams separately
 
+        # V48: Slice every age group up front so they can be ranked in parallel;
+        # results are consumed (and printed) in age group order either way
+        age_group_games = {age_group: self.get_age_group_games(age_group) for age_group in self.all_age_groups}
+        rankable = [age_group for age_group, games in age_group_games.items() if len(games) >= 10]
+        fingerprints = {age_group: self.age_group_fingerprint(age_group_games[age_group]) for age_group in rankable}
+
+        # V48: Incremental mode - skip age groups whose games are unchanged since the last run
+        cached = {}
+        if incremental:
+            print(f"\n{'='*60}")
+            print(" INCREMENTAL RE-RANKING")
+            print(f"{'='*60}")
+            previous = self.load_rankings_cache()
+            cached = {age_group: previous[age_group] for age_group in rankable
+                      if age_group in previous and previous[age_group]['fingerprint'] == fingerprints[age_group]}
+            print(f"  Unchanged: {len(cached)}   Re-ranking: {len(rankable) - len(cached)}")
+        fresh = [age_group for age_group in rankable if age_group not in cached]
+
+        if workers > 1:
+            print(f"\n  Ranking {len(fresh)} age groups with {workers} worker processes")
+        results = self.rank_age_groups([age_group_games[age_group] for age_group in fresh], workers)
+        cache_entries = {}
+
         for age_group in self.all_age_groups:
             print(f"\n{'='*60}")
             print(f" RANKING: {age_group}")
             print(f"{'='*60}")
 
-            games = self.get_age_group_games(age_group)
+            games = age_group_games[age_group]
             print(f"Games: {len(games):,}")
 
             if len(games) < 10:
@@ -3635,10 +3615,21 @@ class TeamRankerV30:
                 print(f"  {league}: {count:,}")
 
             # V44: Now returns tuple of (ranked, unranked)
-            rankings, unranked = self.calculate_rankings(games)
+            if age_group in cached:
+                print("  Unchanged since last run - using cached rankings")
+                rankings, unranked, sos = (cached[age_group][key] for key in ('rankings', 'unranked', 'sos'))
+            else:
+                rankings, unranked, sos = next(results)
+            cache_entries[age_group] = {'fingerprint': fingerprints[age_group],
+                                        'rankings': rankings, 'unranked': unranked, 'sos': sos}
             all_rankings[age_group] = rankings
             all_unranked[age_group] = unranked
 
+            # V48: SOS solver convergence
+            self.diagnostics['sos_convergence'][age_group] = sos
+            status = "converged" if sos['converged'] else "NOT converged"
+            print(f"SOS solver: {status} in {sos['iterations']} iterations (residual {sos['residual']:.2g})")
+
             # V30: Updated display with predictability
             print(f"\n[TROPHY] Top 15 {age_group}:")
             print("-" * 80)
@@ -3660,6 +3651,9 @@ class TeamRankerV30:
                 league_counts[lg] = league_counts.get(lg, 0) + 1
             for lg, count in sorted(league_counts.items()):
                 print(f"  {lg}: {count}")
+        results.close()  # V48: Shuts the worker pool down
+        # V48: Written before save_outputs() so the cache holds calculate_rankings() output as-is
+        self.save_rankings_cache(cache_entries)
         
         # V29: Print diagnostics if verbose
         if self.verbose:
@@ -3678,12 +3672,20 @@ class TeamRankerV30:
         if all_unranked is None:
             all_unranked = {}
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # V48: Export-phase stats (time, JSON bytes/sec, peak memory)
+        export_start = time.perf_counter()
+        export_json_bytes = 0
+        export_json_seconds = 0.0
+        if self.profile_export:
+            tracemalloc.start()
         
         # ═══════════════════════════════════════════════════════════════════
         # BUILD teamsData - flat array with all teams across age groups
         # ═══════════════════════════════════════════════════════════════════
         
         teams_data = []
+        team_names_for_games = []  # V48: gamesData name of each teamsData row (for per-team shards)
         team_id = 1
         all_states = set()
         all_leagues = set()
@@ -3766,6 +3768,7 @@ class TeamRankerV30:
                     # V44: Flag for ranked teams
                     'isRanked': True,
                 })
+                team_names_for_games.append(team)
                 team_id += 1
 
         # V44: Add unranked teams (teams with <5 games)
@@ -3835,6 +3838,7 @@ class TeamRankerV30:
                     # V44: Flag for unranked teams
                     'isRanked': False,
                 })
+                team_names_for_games.append(team)
                 team_id += 1
                 unranked_count += 1
 
@@ -3998,7 +4002,9 @@ class TeamRankerV30:
         # V39: BUILD playersData - from players table in database
         # ═══════════════════════════════════════════════════════════════════
         
-        players_data = []
+        # V48: Players are streamed from players_df (RowStream) instead of being
+        # held as a list of dicts - each export walks the rows on its own
+        players_df = pd.DataFrame()
         print("\n Loading players from database...")
         
         try:
@@ -4013,38 +4019,40 @@ class TeamRankerV30:
             """
             players_df = pd.read_sql_query(player_query, conn)
             conn.close()
-            
-            for _, player in players_df.iterrows():
+            print(f"   Loaded {len(players_df):,} players")
+        except Exception as e:
+            print(f"   WARNING: Could not load players: {e}")
+            players_df = pd.DataFrame()
+
+        def iter_players_data():
+            for player in players_df.itertuples(index=False):
                 # Determine gender from age_group
-                age_group = player['age_group'] or ''
+                age_group = player.age_group or ''
                 if age_group.startswith('B'):
                     gender = 'Boys'
                 else:
                     gender = 'Girls'
                 
-                players_data.append({
-                    'id': int(player['id']),
-                    'name': player['player_name'] or '',
-                    'firstName': player['first_name'] or '',
-                    'lastName': player['last_name'] or '',
-                    'teamName': player['team_name'] or '',
-                    'jerseyNumber': player['jersey_number'] or '',
-                    'position': player['position'] or '',
-                    'graduationYear': player['graduation_year'] or '',
-                    'height': player['height'] or '',
-                    'hometown': player['hometown'] or '',
-                    'highSchool': player['high_school'] or '',
-                    'club': player['club'] or '',
-                    'collegeCommitment': player['college_commitment'] or '',
+                yield {
+                    'id': int(player.id),
+                    'name': player.player_name or '',
+                    'firstName': player.first_name or '',
+                    'lastName': player.last_name or '',
+                    'teamName': player.team_name or '',
+                    'jerseyNumber': player.jersey_number or '',
+                    'position': player.position or '',
+                    'graduationYear': player.graduation_year or '',
+                    'height': player.height or '',
+                    'hometown': player.hometown or '',
+                    'highSchool': player.high_school or '',
+                    'club': player.club or '',
+                    'collegeCommitment': player.college_commitment or '',
                     'ageGroup': age_group,
-                    'league': player['league'] or '',
+                    'league': player.league or '',
                     'gender': gender,
-                })
-            
-            print(f"   Loaded {len(players_data):,} players")
-        except Exception as e:
-            print(f"   WARNING: Could not load players: {e}")
-            players_data = []
+                }
+
+        players_data = json_stream.RowStream(iter_players_data, len(players_df))
         
         # ═══════════════════════════════════════════════════════════════════
         # ASSEMBLE FINAL JSON
@@ -4061,16 +4069,29 @@ class TeamRankerV30:
             'lastUpdated': datetime.now().isoformat(),
         }
         
-        # Save locally
+        # Save locally - V48: streamed key by key / row by row (indent=2; same bytes as json.dump
+        # with the stdlib encoder, same parsed values with orjson)
         json_path = Path('rankings_for_react.json')
-        with open(json_path, 'w') as f:
-            json.dump(react_data, f, indent=2)
-        print(f"\n[OK] Saved: {json_path}")
+        writer = json_stream.write_json(json_path, react_data, indent=2,
+                                        array_keys=['teamsData', 'gamesData', 'playersData'])
+        export_json_bytes += writer.stats['bytes']
+        export_json_seconds += writer.stats['seconds']
+        print(f"\n[OK] Saved: {json_path} ({writer.summary()})")
         print(f"   Teams: {len(teams_data):,}")
         print(f"   Games: {len(games_data):,}")
         print(f"   Players: {len(players_data):,}")
         print(f"   States: {len(all_states)}")
         print(f"   Genders: {list(all_genders)}")
+
+        # V48: Columnar artifact (teams/games/players tables + manifest) so the
+        # admin server and scripts can memory-map just the columns they need
+        artifact_dir = rankings_artifact.artifact_dir_for(json_path)
+        manifest = rankings_artifact.write_artifact(react_data, artifact_dir)
+        if manifest:
+            artifact_mb = sum(t['bytes'] for t in manifest['tables'].values()) / (1024 * 1024)
+            print(f"[OK] Saved columnar artifact: {artifact_dir}/ ({artifact_mb:.1f} MB)")
+        else:
+            print("[INFO] pyarrow not installed - skipping columnar artifact (pip install pyarrow)")
         
         # ═══════════════════════════════════════════════════════════════════
         # COPY TO REACT APP PUBLIC FOLDER
@@ -4080,6 +4101,10 @@ class TeamRankerV30:
             dest_path = Path(REACT_APP_PUBLIC_FOLDER) / 'rankings_for_react.json'
             shutil.copy(json_path, dest_path)
             print(f"[OK] Copied to React app: {dest_path}")
+            if manifest:
+                dest_artifact = Path(REACT_APP_PUBLIC_FOLDER) / rankings_artifact.ARTIFACT_DIR_NAME
+                rankings_artifact.copy_artifact(artifact_dir, dest_artifact)
+                print(f"[OK] Copied columnar artifact to React app: {dest_artifact}")
 
             # ═══════════════════════════════════════════════════════════════════
             # GENERATE LIGHT VERSION (teams only, for fast initial load)
@@ -4093,97 +4118,44 @@ class TeamRankerV30:
                 'lastUpdated': react_data['lastUpdated']
             }
             light_path = Path(REACT_APP_PUBLIC_FOLDER) / 'rankings_light.json'
-            with open(light_path, 'w') as f:
-                json.dump(light_data, f, separators=(',', ':'))  # Compact JSON
-            light_size_mb = os.path.getsize(light_path) / (1024 * 1024)
-            print(f"[OK] Generated light version: {light_path} ({light_size_mb:.1f} MB)")
+            writer = json_stream.write_json(light_path, light_data, array_keys=['teamsData'])  # Compact JSON
+            export_json_bytes += writer.stats['bytes']
+            export_json_seconds += writer.stats['seconds']
+            print(f"[OK] Generated light version: {light_path} ({writer.summary()})")
         else:
             print(f"WARNING:  React app folder not found: {REACT_APP_PUBLIC_FOLDER}")
             print("   Update REACT_APP_PUBLIC_FOLDER in the script to enable auto-copy")
 
         # ═══════════════════════════════════════════════════════════════════
         # UPDATE RANKINGS HISTORY - V46: Use stable team keys (name+ageGroup)
+        # V48: Stored in SQLite (rankings_history table, see rankings_history.py);
+        #      rankings_history.json is now only the current teams' slices
         # ═══════════════════════════════════════════════════════════════════
 
+        id_history = {}
         try:
             history_path = Path(REACT_APP_PUBLIC_FOLDER) / 'rankings_history.json' if os.path.exists(REACT_APP_PUBLIC_FOLDER) else Path('rankings_history.json')
-
-            # Load existing history
-            if history_path.exists():
-                with open(history_path, 'r') as f:
-                    history_data = json.load(f)
-            else:
-                history_data = {'lastUpdated': None, 'history': {}}
-
-            # Get today's date
             today = datetime.now().strftime('%Y-%m-%d')
 
-            # Build stable key to ID mapping for current run
-            # Use name+ageGroup as stable identifier
-            def get_stable_key(team):
-                name = (team.get('name') or '').lower().strip()
-                age = (team.get('ageGroup') or '').lower().strip()
-                return f"{name}_{age}"
-
-            # Convert old ID-based history to stable-key-based history
-            old_history = history_data.get('history', {})
-            new_history = {}
-
-            # First, migrate any existing stable-key entries
-            for key, entries in old_history.items():
-                if '_' in key and not key.isdigit():
-                    # Already a stable key
-                    new_history[key] = entries
-
-            # Now process current teams
-            updates_count = 0
-            for team in teams_data:
-                stable_key = get_stable_key(team)
-                if not stable_key or stable_key == '_':
-                    continue
+            store = rankings_history.RankingsHistoryStore(self.db_path)
+            if store.is_empty() and history_path.exists():
+                imported = store.import_json(history_path)
+                print(f"\n[OK] Imported {imported:,} history entries from {history_path}")
 
-                if stable_key not in new_history:
-                    new_history[stable_key] = []
-
-                entry = {
-                    'date': today,
-                    'rank': team.get('rank'),
-                    'powerScore': team.get('powerScore'),
-                    'offensiveRank': team.get('offensiveRank'),
-                    'defensiveRank': team.get('defensiveRank'),
-                }
+            # Append today's entries in one bulk insert
+            written, updates_count = store.record(teams_data, today)
 
-                # Check if we already have an entry for today
-                existing_today = next((i for i, h in enumerate(new_history[stable_key]) if h.get('date') == today), None)
-                if existing_today is not None:
-                    # Update existing entry
-                    new_history[stable_key][existing_today] = entry
-                else:
-                    # Add new entry
-                    new_history[stable_key].append(entry)
-                    updates_count += 1
-
-                # Keep only last 30 entries per team to limit file size
-                if len(new_history[stable_key]) > 30:
-                    new_history[stable_key] = new_history[stable_key][-30:]
-
-            # Now create ID-based history for React app (maps current IDs to stable key data)
-            id_history = {}
+            # Last HISTORY_LIMIT entries for each current team, mapped to this run's IDs
+            histories = store.histories_for(rankings_history.stable_key(team) for team in teams_data)
             for team in teams_data:
-                stable_key = get_stable_key(team)
-                team_id = str(team['id'])
-                if stable_key in new_history:
-                    id_history[team_id] = new_history[stable_key]
+                entries = histories.get(rankings_history.stable_key(team))
+                if entries:
+                    id_history[str(team['id'])] = entries
 
-            # Save updated history (with ID-based mapping for React)
-            history_data['lastUpdated'] = today
-            history_data['history'] = id_history
-            history_data['stableHistory'] = new_history  # Keep stable history for future migrations
+            # ID-based file the React app reads
+            json_stream.write_json(history_path, {'lastUpdated': today, 'history': id_history})
 
-            with open(history_path, 'w') as f:
-                json.dump(history_data, f, indent=2)
-
-            print(f"\n[OK] Updated rankings history: {history_path}")
+            print(f"\n[OK] Updated rankings history: {self.db_path} ({rankings_history.HISTORY_TABLE}) + {history_path}")
             print(f"   Teams tracked: {len(id_history):,}")
             if updates_count > 0:
                 print(f"   New entries added: {updates_count:,}")
@@ -4195,6 +4167,27 @@ class TeamRankerV30:
             import traceback
             traceback.print_exc()
 
+        # ═══════════════════════════════════════════════════════════════════
+        # V48: SHARDED STATIC LAYOUT - per age group / per team / search index
+        # ═══════════════════════════════════════════════════════════════════
+
+        try:
+            shards_dir = rankings_shards.shards_dir_for(json_path)
+            shards = rankings_shards.write_shards(react_data, team_names_for_games, id_history, shards_dir)
+            shard_stats = shards['stats']
+            print(f"\n[OK] Saved sharded layout: {shards_dir}/")
+            print(f"   Age group files: {len(shards['ageGroupFiles'])} "
+                  f"(largest {shard_stats['largest_age_bytes'] / 1024:.0f} KB vs "
+                  f"{os.path.getsize(json_path) / (1024 * 1024):.1f} MB full JSON)")
+            print(f"   Team files: {shard_stats['team_files']:,} "
+                  f"({shard_stats['team_files_written']:,} changed, {shard_stats['pruned']:,} old files pruned)")
+            if os.path.exists(REACT_APP_PUBLIC_FOLDER):
+                dest_shards = Path(REACT_APP_PUBLIC_FOLDER) / rankings_shards.SHARDS_DIR_NAME
+                copied = rankings_shards.sync_shards(shards_dir, dest_shards)
+                print(f"[OK] Synced sharded layout to React app: {dest_shards} ({copied:,} new files)")
+        except Exception as e:
+            print(f"WARNING: Could not write sharded layout: {e}")
+
         # ═══════════════════════════════════════════════════════════════════
         # SAVE EXCEL - V41: With offensive/defensive power scores
         # ═══════════════════════════════════════════════════════════════════
@@ -4243,6 +4236,21 @@ class TeamRankerV30:
         except Exception as e:
             print(f"WARNING: Could not save Excel: {e}")
 
+        # V48: Export-phase report
+        export_seconds = time.perf_counter() - export_start
+        print(f"\n[CHART] Export phase: {export_seconds:.1f}s")
+        if export_json_seconds > 0:
+            print(f"   JSON written: {export_json_bytes / (1024 * 1024):.1f} MB at "
+                  f"{export_json_bytes / (1024 * 1024) / export_json_seconds:.1f} MB/s "
+                  f"({'orjson' if json_stream.ORJSON_AVAILABLE else 'json'} encoder)")
+        if self.profile_export:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"   Peak Python memory during export: {peak / (1024 * 1024):.1f} MB")
+        rss = peak_rss_mb()
+        if rss is not None:
+            print(f"   Process peak RSS (whole run): {rss:.0f} MB")
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # COMMAND LINE INTERFACE
@@ -4265,6 +4273,29 @@ def find_database():
     return None
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# V48: PARALLEL AGE GROUP WORKERS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_worker_ranker = None
+
+
+def _init_rank_worker(db_path, sos_tolerance, sos_max_iterations):
+    """Process-pool initializer: one ranker per worker, reused for every age group"""
+    global _worker_ranker
+    _worker_ranker = TeamRankerV30(db_path, sos_tolerance=sos_tolerance,
+                                   sos_max_iterations=sos_max_iterations)
+
+
+def _rank_age_group_worker(games):
+    """Rank one age group's game slice in a worker process.
+    Console output is captured and returned so the parent can print it in order."""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        rankings, unranked = _worker_ranker.calculate_rankings(games)
+    return rankings, unranked, _worker_ranker.last_sos_report, log.getvalue()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Soccer Team Ranking System V41 - Offensive/Defensive Power Scores',
@@ -4301,6 +4332,19 @@ V41 Changes:
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Show detailed diagnostics about filtered data')
     
+    parser.add_argument('--sos-tolerance', type=float, default=TeamRankerV30.SOS_TOLERANCE,
+                       help='SOS solver stops when no rating changes more than this '
+                            f'(default: {TeamRankerV30.SOS_TOLERANCE})')
+    parser.add_argument('--incremental', '-i', action='store_true',
+                       help='Only re-rank age groups whose games changed since the last run '
+                            '(falls back to a full run if the cache is missing or stale)')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                       help='Rank age groups in N worker processes (default: 1, serial)')
+    parser.add_argument('--sos-max-iterations', type=int, default=TeamRankerV30.SOS_MAX_ITERATIONS,
+                       help=f'SOS solver iteration cap (default: {TeamRankerV30.SOS_MAX_ITERATIONS})')
+    parser.add_argument('--profile-export', action='store_true',
+                       help='Trace peak Python memory of the export phase (slower)')
+    
     args = parser.parse_args()
     
     if args.cleanup:
@@ -4319,8 +4363,12 @@ V41 Changes:
             sys.exit(1)
     
     try:
-        ranker = TeamRankerV30(db_path, verbose=args.verbose)
-        ranker.run_all_age_groups(do_cleanup=do_cleanup, dry_run=args.dry_run)
+        ranker = TeamRankerV30(db_path, verbose=args.verbose,
+                               sos_tolerance=args.sos_tolerance,
+                               sos_max_iterations=args.sos_max_iterations,
+                               profile_export=args.profile_export)
+        ranker.run_all_age_groups(do_cleanup=do_cleanup, dry_run=args.dry_run,
+                                  workers=args.workers, incremental=args.incremental)
     except FileNotFoundError as e:
         print(f"[ERROR] {e}")
         sys.exit(1)
@@ -63,6 +63,7 @@ CRITICAL IMPLEMENTATION NOTES - DO NOT REMOVE OR MODIFY:
   1. SMART DEDUPLICATION (save_game_to_db function):
      - Uses 3-step matching: exact game_id → fuzzy match → insert/update/skip
      - Returns Tuple[bool, str] with action type: 'inserted', 'updated', 'skipped', 'filtered'
+     - Matching and batched writes run in game_sink.GameSink (get_game_sink)
      - Checks ALL existing games (not just those without scores)
      - PRESERVE: The normalize_team_for_id() function and fuzzy matching logic
      - WHY: Prevents duplicates when team names vary between sources
@@ -111,6 +112,11 @@ from typing import List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass
 from pathlib import Path
 
+# Shared team-name normalization: "scrapers and data/team_names.py"
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+import team_names
+import game_sink
+
 # Third-party imports
 try:
     from playwright.async_api import async_playwright, Page, Browser
@@ -1109,98 +1115,37 @@ def save_game_to_db(db_path: str, game: Dict, min_date: str = None, max_retries:
     if not game_id:
         return False, 'error'
 
-    for attempt in range(max_retries):
-        try:
-            conn = get_db_connection(db_path)
-            cur = conn.cursor()
-
-            # Convert age group to proper format
-            age_group = game.get('age_group', '')
-            gender = game.get('gender', 'Girls')
-            if age_group and age_group.isdigit() and len(age_group) == 4:
-                birth_year = int(age_group)
-                current_year = datetime.now().year
-                age = current_year - birth_year
-                gender_prefix = 'B' if gender.lower().startswith('b') else 'G'
-                age_group = f"{gender_prefix}{age:02d}"
-
-            league = game.get('league', 'CCSL')
-            conference = game.get('region', '')
-            game_date_iso = game.get('game_date_iso', game.get('game_date'))
-
-            # Normalize team names for matching
-            home_norm = normalize_team_for_id(game.get('home_team', ''))
-            away_norm = normalize_team_for_id(game.get('away_team', ''))
-
-            # Step 1: Try exact game_id match
-            cur.execute("SELECT rowid, home_score, away_score FROM games WHERE game_id = ?", (game_id,))
-            ex = cur.fetchone()
-
-            # Step 2: If no exact match, fuzzy match on ALL games
-            if not ex:
-                cur.execute("""
-                    SELECT rowid, home_score, away_score, home_team, away_team FROM games
-                    WHERE game_date_iso = ? AND age_group = ? AND league = ?
-                """, (game_date_iso, age_group, league))
-
-                for row in cur.fetchall():
-                    existing_home = normalize_team_for_id(row[3] or '')
-                    existing_away = normalize_team_for_id(row[4] or '')
-                    # Match if teams match in either order
-                    if (home_norm == existing_home and away_norm == existing_away) or \
-                       (home_norm == existing_away and away_norm == existing_home):
-                        ex = (row[0], row[1], row[2])
-                        break
-
-            # Step 3: Decide action based on what we found
-            if ex:
-                existing_has_scores = ex[1] is not None and ex[2] is not None
-                new_has_scores = game.get('home_score') is not None
-
-                if new_has_scores and not existing_has_scores:
-                    # Update: existing game missing scores, new data has scores
-                    cur.execute("""UPDATE games SET
-                        home_score = ?, away_score = ?,
-                        game_status = 'completed',
-                        scraped_at = datetime('now')
-                        WHERE rowid = ?""",
-                        (game.get('home_score'), game.get('away_score'), ex[0]))
-                    conn.commit()
-                    conn.close()
-                    return True, 'updated'
-                else:
-                    # Skip: game already exists
-                    conn.close()
-                    return False, 'skipped'
-            else:
-                # Insert: no matching game found
-                cur.execute("""INSERT INTO games (game_id, game_date, game_date_iso, game_time, home_team, away_team,
-                              home_score, away_score, league, age_group, conference, location, game_status, source_url, scraped_at, gender)
-                              VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,datetime('now'),?)""",
-                           (game_id, game.get('game_date'), game_date_iso,
-                            game.get('game_time'), game.get('home_team'), game.get('away_team'),
-                            game.get('home_score'), game.get('away_score'),
-                            league, age_group, conference,
-                            game.get('location', ''), game.get('game_status', ''),
-                            game.get('source_url', ''), gender))
-                conn.commit()
-                conn.close()
-                return True, 'inserted'
-
-        except sqlite3.OperationalError as e:
-            if "locked" in str(e).lower() and attempt < max_retries - 1:
-                time.sleep(1 + attempt * 2)  # Exponential backoff: 1s, 3s, 5s
-                continue
-            else:
-                if 'conn' in locals():
-                    conn.close()
-                raise
-        except Exception:
-            if 'conn' in locals():
-                conn.close()
-            raise
-
-    return False, 'error'
+    # Convert age group to proper format
+    age_group = game.get('age_group', '')
+    gender = game.get('gender', 'Girls')
+    if age_group and age_group.isdigit() and len(age_group) == 4:
+        birth_year = int(age_group)
+        current_year = datetime.now().year
+        age = current_year - birth_year
+        gender_prefix = 'B' if gender.lower().startswith('b') else 'G'
+        age_group = f"{gender_prefix}{age:02d}"
+
+    league = game.get('league', 'CCSL')
+    conference = game.get('region', '')
+    game_date_iso = game.get('game_date_iso', game.get('game_date'))
+
+    # Steps 1-3 (game_id match, fuzzy match within the same league, insert/update/skip)
+    # run in the shared GameSink; writes are batched and retried there on lock errors
+    action = get_game_sink(db_path, max_retries).add({
+        'game_id': game_id, 'game_date': game.get('game_date'), 'game_date_iso': game_date_iso,
+        'game_time': game.get('game_time'), 'home_team': game.get('home_team'), 'away_team': game.get('away_team'),
+        'home_score': game.get('home_score'), 'away_score': game.get('away_score'),
+        'league': league, 'age_group': age_group, 'conference': conference,
+        'location': game.get('location', ''), 'game_status': game.get('game_status', ''),
+        'source_url': game.get('source_url', ''), 'gender': gender,
+    })
+    return action != 'skipped', action
+
+
+def get_game_sink(db_path: str, max_retries: int = 3) -> 'game_sink.GameSink':
+    """The run's GameSink for db_path (one connection, batched writes); flush() it after each section"""
+    return game_sink.shared(db_path, 'ca_regional', normalize=normalize_team_for_id,
+                            league_match=game_sink.LEAGUE_EXACT, max_retries=max_retries)
 
 
 def save_team_to_db(db_path: str, team: Dict, max_retries: int = 3) -> bool:
@@ -1557,42 +1502,11 @@ def extract_club_name(team_name: str) -> str:
 
 
 def normalize_team_for_id(team: str) -> str:
-    """Normalize team name for game ID generation - aggressive normalization for deduplication"""
-    if not team:
-        return "unknown"
-    normalized = team.lower().strip()
-
-    # Remove common suffixes/words that vary between sources
-    remove_patterns = [
-        r'\s*-\s*$',                    # trailing dash
-        r'\s+(sc|fc)\s*$',              # SC/FC at end
-        r'\s+soccer\s*club\s*$',        # Soccer Club
-        r'\s+futbol\s*club\s*$',        # Futbol Club
-        r'\s+football\s*club\s*$',      # Football Club
-        r'\s+academy\s*$',              # Academy
-        r'\s+united\s*$',               # United
-        r'\s+club\s*$',                 # Club alone
-        r'\s+rl\s*$',                   # RL suffix
-        r'\s+elite\s*$',                # Elite
-    ]
-    for pattern in remove_patterns:
-        normalized = re.sub(pattern, '', normalized, flags=re.I)
-
-    # Remove words that appear anywhere (not just end)
-    remove_words = ['soccer', 'futbol', 'football', 'fc', 'sc', 'academy', 'club', 'united']
-    for word in remove_words:
-        normalized = re.sub(r'\b' + word + r'\b', '', normalized, flags=re.I)
+    """Normalize team name for game ID generation - aggressive normalization for deduplication
 
-    # Remove age group patterns
-    normalized = re.sub(r'\s*\d{2}G\s*', '', normalized)
-    normalized = re.sub(r'\s*G\d{2}\s*', '', normalized)
-    normalized = re.sub(r'\s*U\d{2}\s*', '', normalized, flags=re.I)
-    normalized = re.sub(r'\s*B\d{2}\s*', '', normalized)
-
-    # Remove all non-alphanumeric and collapse spaces
-    normalized = re.sub(r'[^a-z0-9]', '', normalized)
-
-    return normalized[:30] if normalized else "unknown"
+    Rules live in team_names.py (profile 'california_id'), compiled and memoized there.
+    """
+    return team_names.normalize(team, 'california_id')
 
 
 def generate_game_id(league: str, age_group: str, game_date: str, home_team: str, away_team: str) -> str:
@@ -1694,6 +1608,8 @@ class GotSportScraper:
 
                     # Save to database
                     games_saved = sum(1 for g in section_games if save_game_to_db(self.db_path, g)[0])
+                    if self.db_path:
+                        get_game_sink(self.db_path).flush()
                     teams_saved = sum(1 for t in section_teams if save_team_to_db(self.db_path, t))
 
                     self.log(f"  Games: {len(section_games)} found, {games_saved} saved")
@@ -1736,6 +1652,8 @@ class GotSportScraper:
 
                         # Save to database
                         games_saved = sum(1 for g in section_games if save_game_to_db(self.db_path, g)[0])
+                        if self.db_path:
+                            get_game_sink(self.db_path).flush()
                         teams_saved = sum(1 for t in section_teams if save_team_to_db(self.db_path, t))
 
                         self.log(f"  Games: {len(section_games)} found, {games_saved} saved")
@@ -2105,6 +2023,8 @@ async def main():
 
             # Update event after scraping
             games_saved = sum(1 for g in games if save_game_to_db(db_path, g)[0])
+            if db_path:
+                get_game_sink(db_path).flush()
             update_event_after_scrape(
                 db_path, league.event_id,
                 games_found=len(games),
@@ -2116,6 +2036,8 @@ async def main():
 
         await browser.close()
 
+    game_sink.close_all()
+
     print(f"\n{'='*60}")
     print(f"SUMMARY")
     print(f"{'='*60}")
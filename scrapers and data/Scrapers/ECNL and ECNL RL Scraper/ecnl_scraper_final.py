@@ -42,7 +42,14 @@ transition occurs, this scraper will need to be updated accordingly.
 VERSION HISTORY & BUG FIXES:
 ═══════════════════════════════════════════════════════════════════════════════
 
-V76c (Current) - State Identifier Disambiguation:
+V77 (Current) - Concurrent Page Pool:
+  ✅ NEW: scrape_teams() runs --workers pages on one browser (page_pool.PagePool)
+  ✅ NEW: Workers take the next team from a shared queue as soon as they are free
+  ✅ NEW: Per-host limits (--host-concurrency, --min-interval + --jitter)
+          replace the fixed 2s sleep between teams
+  ✅ NOTE: Progress lines print when a team finishes, so [i/N] can be out of order
+
+V76c - State Identifier Disambiguation:
   ✅ NEW: AMBIGUOUS_TEAMS dictionary for teams that exist in multiple states
   ✅ NEW: disambiguate_team_name() adds state identifiers based on conference context
   ✅ FIX: Teams like "Beach FC" now get "(CA)" or "(VA)" suffix based on conference
@@ -150,7 +157,7 @@ CRITICAL IMPLEMENTATION NOTES - DO NOT REMOVE OR MODIFY:
   3. DATABASE RESILIENCE:
      - WAL mode (Write-Ahead Logging) enabled for better concurrency
      - busy_timeout of 30 seconds prevents "database locked" errors
-     - PRESERVE: PRAGMA statements in save_games() and update_status()
+     - PRESERVE: PRAGMA statements in game_sink.GameSink (used by save_games()) and update_status()
      - WHY: Multiple scrapers or processes may access the database simultaneously
 
   4. JAVASCRIPT REGEX ESCAPING (V72 critical fix):
@@ -177,6 +184,10 @@ ADMIN UI ARGUMENTS (all supported):
   --scrape-all                Scrape all teams
   --reset-status              Reset teams to pending before scraping
   --headless                  Hide browser window (default: visible)
+  --workers 4                 Pages scraping at once
+  --host-concurrency 4        Max pages on one site at once
+  --min-interval 2.0          Min seconds between page loads on one site
+  --jitter 1.0                Random extra seconds added to --min-interval
 
 OUTPUT FILES:
 ═══════════════════════════════════════════════════════════════════════════════
@@ -196,18 +207,25 @@ import csv
 import time
 import sqlite3
 import argparse
+import threading
 import io
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 
+# Shared modules in "scrapers and data": team_names.py, game_sink.py, page_pool.py
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+import team_names
+import game_sink
+import page_pool
+
 # Fix Windows console encoding for emojis
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 try:
-    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout, Error as PlaywrightError
 except ImportError:
     print("[ERROR] Playwright not installed. Run: pip install playwright && playwright install chromium")
     sys.exit(1)
@@ -466,46 +484,10 @@ def normalize_team_for_id(team: str) -> str:
     V76b FIX: Now removes parenthetical regional identifiers like (North), (Shore), (South)
     to prevent duplicates from the same team listed with different regional suffixes.
     e.g., "PDA Blue" and "PDA Blue (North)" now normalize to the same ID.
-    """
-    if not team:
-        return "unknown"
-    normalized = team.lower().strip()
-
-    # V76b: Remove parenthetical content entirely (regional identifiers)
-    # This handles (North), (Shore), (South), (East), (West), etc.
-    normalized = re.sub(r'\s*\([^)]*\)', '', normalized)
-
-    # Remove common suffixes/words that vary between sources
-    remove_patterns = [
-        r'\s*-\s*$',                    # trailing dash
-        r'\s+(sc|fc)\s*$',              # SC/FC at end
-        r'\s+soccer\s*club\s*$',        # Soccer Club
-        r'\s+futbol\s*club\s*$',        # Futbol Club
-        r'\s+football\s*club\s*$',      # Football Club
-        r'\s+academy\s*$',              # Academy
-        r'\s+united\s*$',               # United
-        r'\s+club\s*$',                 # Club alone
-        r'\s+rl\s*$',                   # RL suffix
-        r'\s+elite\s*$',                # Elite
-    ]
-    for pattern in remove_patterns:
-        normalized = re.sub(pattern, '', normalized, flags=re.I)
-
-    # Remove words that appear anywhere (not just end)
-    remove_words = ['soccer', 'futbol', 'football', 'fc', 'sc', 'academy', 'club', 'united']
-    for word in remove_words:
-        normalized = re.sub(r'\b' + word + r'\b', '', normalized, flags=re.I)
-
-    # Remove age group patterns
-    normalized = re.sub(r'\s*\d{2}G\s*', '', normalized)
-    normalized = re.sub(r'\s*G\d{2}\s*', '', normalized)
-    normalized = re.sub(r'\s*U\d{2}\s*', '', normalized, flags=re.I)
-    normalized = re.sub(r'\s*B\d{2}\s*', '', normalized)
 
-    # Remove all non-alphanumeric and collapse spaces
-    normalized = re.sub(r'[^a-z0-9]', '', normalized)
-
-    return normalized[:30] if normalized else "unknown"
+    Rules live in team_names.py (profile 'ecnl_id'), compiled and memoized there.
+    """
+    return team_names.normalize(team, 'ecnl_id')
 
 def clean_team_name(name: str) -> str:
     """Clean team name before saving to database.
@@ -691,82 +673,31 @@ def save_games(db_path: str, games: List[Dict], days_filter: int = None, max_ret
         cutoff_date = (datetime.now() - timedelta(days=days_filter)).strftime('%Y-%m-%d')
         games = [g for g in games if g.get('game_date_iso', '') >= cutoff_date]
 
-    for attempt in range(max_retries):
-        try:
-            conn = sqlite3.connect(db_path, timeout=30)
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA busy_timeout=30000")
-            cur = conn.cursor()
-            new_count, updated, skipped = 0, 0, 0
-
-            for g in games:
-                game_date = g.get('game_date_iso') or g.get('game_date')
-                age_group = g.get('age_group', '')
-                league = g.get('league', '')
-                home_norm = normalize_team_for_id(g.get('home_team', ''))
-                away_norm = normalize_team_for_id(g.get('away_team', ''))
-
-                # Step 1: Try exact game_id match
-                cur.execute("SELECT rowid, home_score, away_score FROM games WHERE game_id = ?", (g['game_id'],))
-                ex = cur.fetchone()
-
-                # Step 2: If no exact match, fuzzy match on ALL games (with or without scores)
-                if not ex:
-                    # Get league prefix for LIKE query (handles "ECNL", "ECNL RL", etc.)
-                    league_prefix = league.split()[0] if league else ''
-
-                    cur.execute("""
-                        SELECT rowid, home_score, away_score, home_team, away_team, game_id FROM games
-                        WHERE game_date_iso = ? AND age_group = ? AND league LIKE ?
-                    """, (game_date, age_group, f"%{league_prefix}%"))
-
-                    for row in cur.fetchall():
-                        existing_home = normalize_team_for_id(row[3] or '')
-                        existing_away = normalize_team_for_id(row[4] or '')
-                        # Match if teams match in either order
-                        if (home_norm == existing_home and away_norm == existing_away) or \
-                           (home_norm == existing_away and away_norm == existing_home):
-                            ex = (row[0], row[1], row[2])
-                            break
-
-                # Step 3: Decide action based on what we found
-                if ex:
-                    existing_has_scores = ex[1] is not None and ex[2] is not None
-                    new_has_scores = g.get('home_score') is not None
-
-                    if new_has_scores and not existing_has_scores:
-                        # Update: existing game missing scores, new data has scores
-                        cur.execute("""UPDATE games SET
-                            home_score = ?, away_score = ?,
-                            game_status = 'completed',
-                            scraped_at = datetime('now')
-                            WHERE rowid = ?""",
-                            (g.get('home_score'), g.get('away_score'), ex[0]))
-                        updated += 1
-                    else:
-                        # Skip: game already exists (with or without scores, but we have nothing new to add)
-                        skipped += 1
-                else:
-                    # Insert: no matching game found
-                    cur.execute("""INSERT INTO games (game_id, game_date, game_date_iso, game_time, home_team, away_team,
-                                  home_score, away_score, league, age_group, conference, location, game_status, source_url, scraped_at, gender)
-                                  VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,datetime('now'),?)""",
-                               (g['game_id'], g.get('game_date'), g.get('game_date_iso'), g.get('game_time'), g.get('home_team'),
-                                g.get('away_team'), g.get('home_score'), g.get('away_score'), g.get('league'), g.get('age_group'),
-                                g.get('conference'), g.get('location'), 'completed' if g.get('home_score') is not None else 'scheduled',
-                                g.get('source_url'), g.get('gender', 'Girls')))
-                    new_count += 1
-
-            conn.commit()
-            conn.close()
-            return new_count, updated
-        except sqlite3.OperationalError as e:
-            if "locked" in str(e).lower() and attempt < max_retries - 1:
-                import time
-                time.sleep(2 + attempt * 3)  # Wait 2s, 5s, 8s
-                continue
-            raise
-    return 0, 0
+    # Steps 1-3 (game_id match, fuzzy match on league LIKE '%<first word>%', insert/update/skip)
+    # run in the run's GameSink: one connection, in-memory match index, one executemany
+    # transaction per call - flushed before returning so update_status() follows the games
+    sink = game_sink.shared(db_path, 'ecnl', normalize=normalize_team_for_id,
+                            league_match=game_sink.LEAGUE_SAME_PREFIX, max_retries=max_retries)
+    failed_before = sink.failures()
+    new_count, updated = 0, 0
+    for g in games:
+        action = sink.add({
+            'game_id': g['game_id'], 'game_date': g.get('game_date'), 'game_date_iso': g.get('game_date_iso'),
+            'game_time': g.get('game_time'), 'home_team': g.get('home_team'), 'away_team': g.get('away_team'),
+            'home_score': g.get('home_score'), 'away_score': g.get('away_score'),
+            'league': g.get('league'), 'age_group': g.get('age_group'), 'conference': g.get('conference'),
+            'location': g.get('location'),
+            'game_status': 'completed' if g.get('home_score') is not None else 'scheduled',
+            'source_url': g.get('source_url'), 'gender': g.get('gender', 'Girls'),
+        }, match_date=g.get('game_date_iso') or g.get('game_date'))
+        if action == 'inserted':
+            new_count += 1
+        elif action == 'updated':
+            updated += 1
+    sink.flush()
+    # A batch the sink could not write is dropped and counted; don't report those games as saved
+    failed_inserts, failed_updates = (now - before for now, before in zip(sink.failures(), failed_before))
+    return new_count - failed_inserts, updated - failed_updates
 
 def save_team(db_path: str, team: Dict) -> bool:
     """Save team to database"""
@@ -850,6 +781,8 @@ def create_csv_with_headers(filepath: Path, fields: List[str]) -> str:
         w.writeheader()
     return str(filepath)
 
+_CSV_LOCK = threading.Lock()  # V77: Pool workers append from threads - keep each call's rows together
+
 def append_to_csv_with_retry(filepath: Path, data: List[Dict], fields: List[str], max_retries: int = 3) -> Tuple[int, str]:
     """
     V76: Append data rows to existing CSV file with retry logic.
@@ -862,7 +795,7 @@ def append_to_csv_with_retry(filepath: Path, data: List[Dict], fields: List[str]
     last_error = ""
     for attempt in range(max_retries):
         try:
-            with open(filepath, 'a', newline='', encoding='utf-8') as f:
+            with _CSV_LOCK, open(filepath, 'a', newline='', encoding='utf-8') as f:
                 w = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
                 w.writerows(data)
             return len(data), ""
@@ -921,7 +854,9 @@ def export_players_csv(players: List[Dict], output_dir: Path, prefix: str) -> st
 
 class ECNLScraper:
     def __init__(self, db_path: str, headless: bool = False, debug: bool = False, 
-                 include_players: bool = False, days_filter: int = None, output_dir: Path = None):
+                 include_players: bool = False, days_filter: int = None, output_dir: Path = None,
+                 workers: int = page_pool.WORKERS, host_concurrency: int = page_pool.HOST_CONCURRENCY,
+                 min_interval: float = page_pool.MIN_INTERVAL, jitter: float = page_pool.JITTER):
         self.db_path = db_path
         self.headless = headless  # Default to False (visible browser)
         self.debug = debug
@@ -929,11 +864,19 @@ class ECNLScraper:
         self.days_filter = days_filter
         self.output_dir = output_dir or SCRIPT_DIR
         
+        # V77: Page pool size and per-host politeness limits
+        self.workers = workers
+        self.host_concurrency = host_concurrency
+        self.min_interval = min_interval
+        self.jitter = jitter
+        
         # Tracking for counts
         self.all_games = []
         self.all_teams = []
         self.all_players = []
         self.errors = 0
+        self.total_new, self.total_upd = 0, 0
+        self.failed_teams = []
         
         # V74: CSV file paths (set when initialized)
         self.games_csv_path = None
@@ -1426,6 +1369,8 @@ class ECNLScraper:
             
             # V73: Don't print here - let scrape_teams coordinate with player output
             
+        except PlaywrightError:
+            raise  # V77: Navigation/timeout/crashed page - scrape_one_team records it, the pool replaces the page
         except Exception as e:
             print(f"Page error: {e}")
             self.errors += 1
@@ -1494,133 +1439,147 @@ class ECNLScraper:
         
         return players
 
+    async def scrape_one_team(self, page, team: Dict, i: int, total: int):
+        """V77: Schedule, details and roster of one team on a pool worker's page"""
+        failed_teams = self.failed_teams
+        team_name = team.get('team_name', 'Unknown')
+        league = team.get('league', 'ECNL')
+        age = team.get('age_group', '')
+        label = f"[{i}/{total}] {team_name} ({league} {age})"
+        
+        try:
+            games = await self.scrape_team_schedule(page, team)
+            
+            if games:
+                # V76: Add scrape_status to games
+                for g in games:
+                    g['scrape_status'] = 'complete'
+                
+                # save_games stays on the loop thread: the run's GameSink connection belongs to it.
+                # The other saves open their own connections and retry with time.sleep, so they
+                # run in a thread rather than stall every worker on the loop
+                n, u = save_games(self.db_path, games, self.days_filter)
+                self.total_new += n
+                self.total_upd += u
+                self.all_games.extend(games)
+                await asyncio.to_thread(update_status, self.db_path, team.get('url'), 'completed')
+                
+                # V76: Write games to CSV with retry logic
+                if self.games_csv_path:
+                    rows, err = await asyncio.to_thread(append_to_csv_with_retry, self.games_csv_path, games, GAMES_CSV_FIELDS)
+                    if err:
+                        print(f"[WARN] CSV write failed: {err}")
+                        failed_teams.append(('games_csv', team, games))
+                
+                # Print game summary
+                with_opponent = sum(1 for g in games if g.get('away_team') != 'Unknown')
+                with_score = sum(1 for g in games if g.get('home_score') is not None)
+                
+                # Save team details
+                team_details = await self.scrape_team_details(page, team)
+                team_data = {
+                    'team_url': team.get('url'),
+                    'club_name': team.get('club_name'),
+                    'team_name': team_name,
+                    'age_group': age,
+                    'gender': team.get('gender', 'Girls'),
+                    'league': league,
+                    'conference': team.get('conference', ''),
+                    'event_id': team.get('event_id'),
+                    'state': team_details.get('state'),
+                    'city': team_details.get('city'),
+                    'street_address': team_details.get('street_address'),
+                    'zip_code': team_details.get('zip_code'),
+                    'official_website': team_details.get('official_website'),
+                    'scrape_status': 'complete',  # V76
+                }
+                await asyncio.to_thread(save_team, self.db_path, team_data)
+                self.all_teams.append(team_data)
+                
+                # V76: Write team to CSV with retry logic
+                if self.teams_csv_path:
+                    rows, err = await asyncio.to_thread(append_to_csv_with_retry, self.teams_csv_path, [team_data], TEAMS_CSV_FIELDS)
+                    if err:
+                        print(f"[WARN] CSV write failed: {err}")
+                        failed_teams.append(('teams_csv', team, [team_data]))
+                
+                # Scrape players if requested
+                player_count = 0
+                player_data_for_csv = []
+                if self.include_players:
+                    players = await self.scrape_team_roster(page, team)
+                    if players:
+                        player_count = await asyncio.to_thread(save_players, self.db_path, players, team.get('url', ''), team_name, age, league)
+                        # Track players with team info for CSV export
+                        for p in players:
+                            p['player_name'] = p.get('name')
+                            p['team_name'] = team_name
+                            p['team_url'] = team.get('url', '')
+                            p['age_group'] = age
+                            p['league'] = league
+                            p['jersey_number'] = p.get('number')
+                            p['graduation_year'] = p.get('grad_year')
+                            p['scrape_status'] = 'complete'  # V76
+                            player_data_for_csv.append(p)
+                        self.all_players.extend(players)
+                        
+                        # V76: Write players to CSV with retry logic
+                        if self.players_csv_path and player_data_for_csv:
+                            rows, err = await asyncio.to_thread(append_to_csv_with_retry, self.players_csv_path, player_data_for_csv, PLAYERS_CSV_FIELDS)
+                            if err:
+                                print(f"[WARN] CSV write failed: {err}")
+                                failed_teams.append(('players_csv', team, player_data_for_csv))
+                
+                # Print combined output (one line per team - workers finish out of order)
+                if self.include_players:
+                    print(f"{label} OK: {len(games)} games ({with_score} scored) | {player_count} players")
+                else:
+                    print(f"{label} ✓ {len(games)} games ({with_opponent} with opponent, {with_score} with scores)")
+            else:
+                print(f"{label} - No games")
+                await asyncio.to_thread(update_status, self.db_path, team.get('url'), 'no_games')
+            
+        except Exception as e:
+            print(f"{label} [ERROR] {e}")
+            self.errors += 1
+            await asyncio.to_thread(update_status, self.db_path, team.get('url'), 'error')
+            failed_teams.append(('scrape_error', team, str(e)))
+            if isinstance(e, PlaywrightError):
+                raise  # The pool gives this worker a fresh page - a crashed one would fail every later team
+
     async def scrape_teams(self, teams: List[Dict]) -> Tuple[int, int]:
         """
         V76: Scrape games for a list of teams with retry logic.
         - Tracks failed teams and retries them at the end
         - Uses retry logic for CSV writes (handles file locking)
         - Adds scrape_status to track incomplete records
+        V77: Teams are spread over a page_pool.PagePool (self.workers pages on one
+        browser) with per-host limits instead of a fixed sleep between teams.
         """
-        total_new, total_upd = 0, 0
-        failed_teams = []  # V76: Track failed teams for retry
+        self.total_new, self.total_upd = 0, 0
+        self.failed_teams = []  # V76: Track failed teams for retry
+        failed_teams = self.failed_teams
         
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=self.headless)
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
+            limiter = page_pool.HostLimiter(max_concurrent=self.host_concurrency,
+                                            min_interval=self.min_interval, jitter=self.jitter)
             
             print(f"\nScraping {len(teams)} teams...")
             print(f"Browser: {'Hidden' if self.headless else 'Visible'}")
+            print(f"Workers: {self.workers} pages, at most {self.host_concurrency} per host, "
+                  f"{self.min_interval:g}s+{self.jitter:g}s apart")
             
-            for i, team in enumerate(teams, 1):
-                team_name = team.get('team_name', 'Unknown')
-                league = team.get('league', 'ECNL')
-                age = team.get('age_group', '')
-                
-                print(f"[{i}/{len(teams)}] {team_name} ({league} {age}) ", end="", flush=True)
-                
-                try:
-                    games = await self.scrape_team_schedule(page, team)
-                    
-                    if games:
-                        # V76: Add scrape_status to games
-                        for g in games:
-                            g['scrape_status'] = 'complete'
-                        
-                        n, u = save_games(self.db_path, games, self.days_filter)
-                        total_new += n
-                        total_upd += u
-                        self.all_games.extend(games)
-                        update_status(self.db_path, team.get('url'), 'completed')
-                        
-                        # V76: Write games to CSV with retry logic
-                        if self.games_csv_path:
-                            rows, err = append_to_csv_with_retry(self.games_csv_path, games, GAMES_CSV_FIELDS)
-                            if err:
-                                print(f"[WARN] CSV write failed: {err}")
-                                failed_teams.append(('games_csv', team, games))
-                        
-                        # Print game summary
-                        with_opponent = sum(1 for g in games if g.get('away_team') != 'Unknown')
-                        with_score = sum(1 for g in games if g.get('home_score') is not None)
-                        
-                        # Save team details
-                        team_details = await self.scrape_team_details(page, team)
-                        team_data = {
-                            'team_url': team.get('url'),
-                            'club_name': team.get('club_name'),
-                            'team_name': team_name,
-                            'age_group': age,
-                            'gender': team.get('gender', 'Girls'),
-                            'league': league,
-                            'conference': team.get('conference', ''),
-                            'event_id': team.get('event_id'),
-                            'state': team_details.get('state'),
-                            'city': team_details.get('city'),
-                            'street_address': team_details.get('street_address'),
-                            'zip_code': team_details.get('zip_code'),
-                            'official_website': team_details.get('official_website'),
-                            'scrape_status': 'complete',  # V76
-                        }
-                        save_team(self.db_path, team_data)
-                        self.all_teams.append(team_data)
-                        
-                        # V76: Write team to CSV with retry logic
-                        if self.teams_csv_path:
-                            rows, err = append_to_csv_with_retry(self.teams_csv_path, [team_data], TEAMS_CSV_FIELDS)
-                            if err:
-                                print(f"[WARN] CSV write failed: {err}")
-                                failed_teams.append(('teams_csv', team, [team_data]))
-                        
-                        # Scrape players if requested
-                        player_count = 0
-                        player_data_for_csv = []
-                        if self.include_players:
-                            players = await self.scrape_team_roster(page, team)
-                            if players:
-                                player_count = save_players(self.db_path, players, team.get('url', ''), team_name, age, league)
-                                # Track players with team info for CSV export
-                                for p in players:
-                                    p['player_name'] = p.get('name')
-                                    p['team_name'] = team_name
-                                    p['team_url'] = team.get('url', '')
-                                    p['age_group'] = age
-                                    p['league'] = league
-                                    p['jersey_number'] = p.get('number')
-                                    p['graduation_year'] = p.get('grad_year')
-                                    p['scrape_status'] = 'complete'  # V76
-                                    player_data_for_csv.append(p)
-                                self.all_players.extend(players)
-                                
-                                # V76: Write players to CSV with retry logic
-                                if self.players_csv_path and player_data_for_csv:
-                                    rows, err = append_to_csv_with_retry(self.players_csv_path, player_data_for_csv, PLAYERS_CSV_FIELDS)
-                                    if err:
-                                        print(f"[WARN] CSV write failed: {err}")
-                                        failed_teams.append(('players_csv', team, player_data_for_csv))
-                        
-                        # Print combined output
-                        if self.include_players:
-                            print(f"OK: {len(games)} games ({with_score} scored) | {player_count} players")
-                        else:
-                            print(f"✓ {len(games)} games ({with_opponent} with opponent, {with_score} with scores)")
-                    else:
-                        print("- No games")
-                        update_status(self.db_path, team.get('url'), 'no_games')
-                    
-                    await asyncio.sleep(2)
-                    
-                except Exception as e:
-                    print(f"[ERROR] {e}")
-                    self.errors += 1
-                    update_status(self.db_path, team.get('url'), 'error')
-                    failed_teams.append(('scrape_error', team, str(e)))
+            async with page_pool.PagePool(browser, workers=self.workers, limiter=limiter, context_options={
+                'viewport': {'width': 1920, 'height': 1080},
+                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36'
+            }) as pool:
+                await pool.run(teams, lambda page, team, i: self.scrape_one_team(page, team, i, len(teams)))
             
             await browser.close()
         
+        total_new, total_upd = self.total_new, self.total_upd
+        
         # V76: Retry failed teams
         if failed_teams:
             print(f"\n🔄 Retrying {len(failed_teams)} failed operations...")
@@ -1805,6 +1764,13 @@ async def main_async():
     parser.add_argument('--reset-status', action='store_true', help='Reset teams to pending')
     parser.add_argument('--validate', action='store_true', help='Check for data mismatches between tables')
     parser.add_argument('--fix-mismatches', action='store_true', help='Fix team name mismatches')
+    parser.add_argument('--workers', type=int, default=page_pool.WORKERS, help='Pages scraping at once')
+    parser.add_argument('--host-concurrency', type=int, default=page_pool.HOST_CONCURRENCY,
+                       help='Max pages on one site at once')
+    parser.add_argument('--min-interval', type=float, default=page_pool.MIN_INTERVAL,
+                       help='Min seconds between page loads on one site (plus up to --jitter)')
+    parser.add_argument('--jitter', type=float, default=page_pool.JITTER,
+                       help='Random extra seconds added to --min-interval')
     
     args = parser.parse_args()
     
@@ -1841,7 +1807,11 @@ async def main_async():
         debug=args.debug or args.verbose,
         include_players=args.players,
         days_filter=args.days,
-        output_dir=OUTPUT_DIR
+        output_dir=OUTPUT_DIR,
+        workers=args.workers,
+        host_concurrency=args.host_concurrency,
+        min_interval=args.min_interval,
+        jitter=args.jitter
     )
     
     if args.stats:
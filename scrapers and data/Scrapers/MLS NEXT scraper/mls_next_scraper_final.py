@@ -64,6 +64,10 @@ from typing import List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# Batched game writes: "scrapers and data/game_sink.py"
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+import game_sink
+
 # Third-party imports
 try:
     from playwright.async_api import async_playwright, Page, Browser
@@ -211,9 +215,6 @@ def save_mls_next_game_to_db(db_path: str, game: Dict) -> bool:
     if not db_path:
         return False
 
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-
     game_id = game.get('game_id', '')
     if not game_id:
         # Generate game ID if not provided
@@ -223,12 +224,6 @@ def save_mls_next_game_to_db(db_path: str, game: Dict) -> bool:
         game_id = f"mlsnext_{date}_{home}_{away}".replace(' ', '_').lower()
         game_id = re.sub(r'[^a-z0-9_-]', '', game_id)
 
-    # Check for existing game
-    cur.execute("SELECT id FROM games WHERE game_id = ?", (game_id,))
-    if cur.fetchone():
-        conn.close()
-        return False  # Already exists
-
     # Parse date - convert to YYYY-MM-DD format for consistency
     game_date = game.get('game_date', '')
     game_date_iso = ''
@@ -261,19 +256,19 @@ def save_mls_next_game_to_db(db_path: str, game: Dict) -> bool:
     # Conference/region
     conference = game.get('region', game.get('conference', game.get('division', '')))
 
-    cur.execute("""INSERT INTO games (game_id, game_date, game_date_iso, game_time, home_team, away_team,
-                  home_score, away_score, league, age_group, conference, location, game_status, source_url, scraped_at, gender)
-                  VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,datetime('now'),?)""",
-               (game_id, game_date, game_date_iso, game.get('game_time'),
-                game.get('home_team') or game.get('home_team_normalized'),
-                game.get('away_team') or game.get('away_team_normalized'),
-                game.get('home_score'), game.get('away_score'),
-                'MLS NEXT', age_group, conference,
-                game.get('location', ''), game.get('game_status', ''),
-                game.get('source_url', ''), game.get('gender', 'Boys')))
-    conn.commit()
-    conn.close()
-    return True
+    # Existing game_id -> skip (no fuzzy matching here); inserts are batched by the sink
+    sink = game_sink.shared(db_path, 'mls_next', update_scores=False)
+    action = sink.add({
+        'game_id': game_id, 'game_date': game_date, 'game_date_iso': game_date_iso,
+        'game_time': game.get('game_time'),
+        'home_team': game.get('home_team') or game.get('home_team_normalized'),
+        'away_team': game.get('away_team') or game.get('away_team_normalized'),
+        'home_score': game.get('home_score'), 'away_score': game.get('away_score'),
+        'league': 'MLS NEXT', 'age_group': age_group, 'conference': conference,
+        'location': game.get('location', ''), 'game_status': game.get('game_status', ''),
+        'source_url': game.get('source_url', ''), 'gender': game.get('gender', 'Boys'),
+    })
+    return action == 'inserted'
 
 
 def save_mls_next_team_to_db(db_path: str, team: Dict) -> bool:
@@ -1371,6 +1366,7 @@ class MLSNextScraper:
 
             finally:
                 await browser.close()
+                game_sink.close_all()  # Write any games still queued
 
         # Print summary
         stats = {
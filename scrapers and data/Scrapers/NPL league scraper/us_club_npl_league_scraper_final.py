@@ -154,7 +154,7 @@ CRITICAL IMPLEMENTATION NOTES - DO NOT REMOVE OR MODIFY:
   5. DATABASE RESILIENCE:
      - WAL mode enabled for better concurrency
      - 30-second busy_timeout prevents "database locked" errors
-     - PRESERVE: PRAGMA statements in save_npl_game_to_db()
+     - PRESERVE: PRAGMA statements in game_sink.GameSink (one connection per run)
      - WHY: Multiple scrapers may access the database simultaneously
 
   6. LOCATION SCRAPING (v19 feature):
@@ -182,6 +182,11 @@ from typing import List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# Shared team-name normalization: "scrapers and data/team_names.py"
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+import team_names
+import game_sink
+
 # Third-party imports
 try:
     from playwright.async_api import async_playwright, Page, Browser
@@ -753,42 +758,10 @@ def normalize_team_for_id(team: str) -> str:
 
     Used for matching games across different sources where team names may vary.
     Original team names are preserved in the database.
-    """
-    if not team:
-        return "unknown"
-    normalized = team.lower().strip()
-
-    # Remove common suffixes/words that vary between sources
-    remove_patterns = [
-        r'\s*-\s*$',                    # trailing dash
-        r'\s+(sc|fc)\s*$',              # SC/FC at end
-        r'\s+soccer\s*club\s*$',        # Soccer Club
-        r'\s+futbol\s*club\s*$',        # Futbol Club
-        r'\s+academy\s*$',              # Academy
-        r'\s+united\s*$',               # United
-        r'\s+club\s*$',                 # Club alone
-        r'\s+npl\s*$',                  # NPL
-        r'\s+premier\s*$',              # Premier
-        r'\s+elite\s*$',                # Elite
-    ]
-    for pattern in remove_patterns:
-        normalized = re.sub(pattern, '', normalized, flags=re.I)
-
-    # Remove words that appear anywhere
-    remove_words = ['soccer', 'futbol', 'fc', 'sc', 'academy', 'club', 'united', 'npl']
-    for word in remove_words:
-        normalized = re.sub(r'\b' + word + r'\b', '', normalized, flags=re.I)
-
-    # Remove age group patterns
-    normalized = re.sub(r'\s*G\d{2}\s*', '', normalized)
-    normalized = re.sub(r'\s*B\d{2}\s*', '', normalized)
-    normalized = re.sub(r'\s*U\d{2}\s*', '', normalized, flags=re.I)
-    normalized = re.sub(r'\s*\d{4}[GB]\s*', '', normalized)  # 2013G, 2014B
-
-    # Remove all non-alphanumeric
-    normalized = re.sub(r'[^a-z0-9]', '', normalized)
 
-    return normalized[:30] if normalized else "unknown"
+    Rules live in team_names.py (profile 'npl_id'), compiled and memoized there.
+    """
+    return team_names.normalize(team, 'npl_id')
 
 
 def save_npl_game_to_db(db_path: str, game: Dict) -> bool:
@@ -806,14 +779,8 @@ def save_npl_game_to_db(db_path: str, game: Dict) -> bool:
     if not db_path:
         return False
 
-    conn = sqlite3.connect(db_path)
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA busy_timeout=30000")
-    cur = conn.cursor()
-
     game_id = game.get('game_id', '')
     if not game_id:
-        conn.close()
         return False
 
     # v21 FIX: Convert 4-digit birth year to Gxx/Bxx format
@@ -840,63 +807,20 @@ def save_npl_game_to_db(db_path: str, game: Dict) -> bool:
 
     home_team = game.get('home_team') or game.get('home_team_normalized', '')
     away_team = game.get('away_team') or game.get('away_team_normalized', '')
-    home_norm = normalize_team_for_id(home_team)
-    away_norm = normalize_team_for_id(away_team)
 
-    # Step 1: Try exact game_id match
-    cur.execute("SELECT rowid, home_score, away_score FROM games WHERE game_id = ?", (game_id,))
-    existing = cur.fetchone()
-
-    # Step 2: If no exact match, fuzzy match on ALL games
-    if not existing:
-        cur.execute("""
-            SELECT rowid, home_score, away_score, home_team, away_team FROM games
-            WHERE game_date_iso = ? AND age_group = ? AND league LIKE '%NPL%'
-        """, (game_date_iso, age_group))
-
-        for row in cur.fetchall():
-            existing_home = normalize_team_for_id(row[3] or '')
-            existing_away = normalize_team_for_id(row[4] or '')
-            # Match if teams match in either order
-            if (home_norm == existing_home and away_norm == existing_away) or \
-               (home_norm == existing_away and away_norm == existing_home):
-                existing = (row[0], row[1], row[2])
-                break
-
-    # Step 3: Decide action based on what we found
-    if existing:
-        existing_has_scores = existing[1] is not None and existing[2] is not None
-        new_has_scores = game.get('home_score') is not None
-
-        if new_has_scores and not existing_has_scores:
-            # Update: existing game missing scores, new data has scores
-            cur.execute("""UPDATE games SET
-                home_score = ?, away_score = ?,
-                game_status = 'completed',
-                scraped_at = datetime('now')
-                WHERE rowid = ?""",
-                (game.get('home_score'), game.get('away_score'), existing[0]))
-            conn.commit()
-            conn.close()
-            return True  # Updated
-        else:
-            # Skip: game already exists
-            conn.close()
-            return False
-    else:
-        # Insert: no matching game found
-        cur.execute("""INSERT INTO games (game_id, game_date, game_date_iso, game_time, home_team, away_team,
-                      home_score, away_score, league, age_group, conference, location, game_status, source_url, scraped_at, gender)
-                      VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,datetime('now'),?)""",
-                   (game_id, game_date, game_date_iso, game.get('game_time'),
-                    home_team, away_team,
-                    game.get('home_score'), game.get('away_score'),
-                    league, age_group, conference,
-                    game.get('location', ''), game.get('game_status', ''),
-                    game.get('source_url', ''), game.get('gender', 'Girls')))
-        conn.commit()
-        conn.close()
-        return True
+    # Steps 1-3 (game_id match, fuzzy match on league LIKE '%NPL%', insert/update/skip)
+    # run in the shared GameSink, which batches the writes
+    sink = game_sink.shared(db_path, 'npl', normalize=normalize_team_for_id,
+                            league_match=game_sink.league_contains('NPL'))
+    action = sink.add({
+        'game_id': game_id, 'game_date': game_date, 'game_date_iso': game_date_iso,
+        'game_time': game.get('game_time'), 'home_team': home_team, 'away_team': away_team,
+        'home_score': game.get('home_score'), 'away_score': game.get('away_score'),
+        'league': league, 'age_group': age_group, 'conference': conference,
+        'location': game.get('location', ''), 'game_status': game.get('game_status', ''),
+        'source_url': game.get('source_url', ''), 'gender': game.get('gender', 'Girls'),
+    })
+    return action != 'skipped'
 
 
 # =============================================================================
@@ -3427,6 +3351,9 @@ class USClubNPLScraper:
             if retry_count >= max_retries:
                 self.logger.error(f"Max browser relaunches ({max_retries}) exceeded. Stopping.")
         
+        # Write any games still queued in the database sink
+        game_sink.close_all()
+        
         # Final stats
         self.total_stats['schedules_scraped'] = self.gotsport.stats['schedules_scraped']
         self.total_stats['games_new'] = self.csv.stats['games_written']
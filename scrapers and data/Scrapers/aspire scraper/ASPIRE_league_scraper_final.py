@@ -158,6 +158,10 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+# Shared team-name normalization: "scrapers and data/team_names.py"
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+import team_names
+
 import requests
 from bs4 import BeautifulSoup
 
@@ -298,37 +302,10 @@ def normalize_team_for_id(team: str) -> str:
 
     Used for matching games across different sources where team names may vary.
     Original team names are preserved in the database.
-    """
-    if not team:
-        return "unknown"
-    normalized = team.lower().strip()
-
-    # Remove common suffixes/words that vary between sources
-    remove_patterns = [
-        r'\s*-\s*$',                    # trailing dash
-        r'\s+(sc|fc)\s*$',              # SC/FC at end
-        r'\s+soccer\s*club\s*$',        # Soccer Club
-        r'\s+futbol\s*club\s*$',        # Futbol Club
-        r'\s+academy\s*$',              # Academy
-        r'\s+united\s*$',               # United
-        r'\s+club\s*$',                 # Club alone
-    ]
-    for pattern in remove_patterns:
-        normalized = re.sub(pattern, '', normalized, flags=re.I)
-
-    # Remove words that appear anywhere
-    remove_words = ['soccer', 'futbol', 'fc', 'sc', 'academy', 'club', 'united', 'aspire']
-    for word in remove_words:
-        normalized = re.sub(r'\b' + word + r'\b', '', normalized, flags=re.I)
 
-    # Remove age group patterns
-    normalized = re.sub(r'\s*G\d{2}\s*', '', normalized)
-    normalized = re.sub(r'\s*U\d{2}\s*', '', normalized, flags=re.I)
-
-    # Remove all non-alphanumeric
-    normalized = re.sub(r'[^a-z0-9]', '', normalized)
-
-    return normalized[:30] if normalized else "unknown"
+    Rules live in team_names.py (profile 'aspire_id'), compiled and memoized there.
+    """
+    return team_names.normalize(team, 'aspire_id')
 
 
 # =============================================================================
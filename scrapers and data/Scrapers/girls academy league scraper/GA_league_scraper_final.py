@@ -128,7 +128,7 @@ CRITICAL IMPLEMENTATION NOTES - DO NOT REMOVE OR MODIFY:
   6. DATABASE RESILIENCE:
      - WAL mode enabled for better concurrency
      - 30-second busy_timeout prevents "database locked" errors
-     - PRESERVE: PRAGMA statements in save_games_to_db()
+     - PRESERVE: PRAGMA statements in game_sink.GameSink (used by save_games_to_db())
      - WHY: Multiple scrapers may access the database simultaneously
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -168,6 +168,11 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
 
+# Shared team-name normalization: "scrapers and data/team_names.py"
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+import team_names
+import game_sink
+
 import requests
 from bs4 import BeautifulSoup
 
@@ -239,37 +244,10 @@ def normalize_team_for_id(team: str) -> str:
 
     Used for matching games across different sources where team names may vary.
     Original team names are preserved in the database.
-    """
-    if not team:
-        return "unknown"
-    normalized = team.lower().strip()
-
-    # Remove common suffixes/words that vary between sources
-    remove_patterns = [
-        r'\s*-\s*$',                    # trailing dash
-        r'\s+(sc|fc)\s*$',              # SC/FC at end
-        r'\s+soccer\s*club\s*$',        # Soccer Club
-        r'\s+futbol\s*club\s*$',        # Futbol Club
-        r'\s+academy\s*$',              # Academy
-        r'\s+united\s*$',               # United
-        r'\s+club\s*$',                 # Club alone
-    ]
-    for pattern in remove_patterns:
-        normalized = re.sub(pattern, '', normalized, flags=re.I)
-
-    # Remove words that appear anywhere
-    remove_words = ['soccer', 'futbol', 'fc', 'sc', 'academy', 'club', 'united']
-    for word in remove_words:
-        normalized = re.sub(r'\b' + word + r'\b', '', normalized, flags=re.I)
 
-    # Remove age group patterns
-    normalized = re.sub(r'\s*G\d{2}\s*', '', normalized)
-    normalized = re.sub(r'\s*U\d{2}\s*', '', normalized, flags=re.I)
-
-    # Remove all non-alphanumeric
-    normalized = re.sub(r'[^a-z0-9]', '', normalized)
-
-    return normalized[:30] if normalized else "unknown"
+    Rules live in team_names.py (profile 'ga_id'), compiled and memoized there.
+    """
+    return team_names.normalize(team, 'ga_id')
 
 
 def make_canonical_game_id(date: str, team1: str, team2: str) -> str:
@@ -1061,93 +1039,46 @@ class GAScraperV13:
             cutoff_date = (datetime.now() - timedelta(days=self.days_filter)).strftime('%Y-%m-%d')
             games = [g for g in games if g.get('game_date', '') >= cutoff_date]
 
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA busy_timeout=30000")
-        cursor = conn.cursor()
+        # Steps 1-3 (game_id match, fuzzy match on game_date + age group among league 'GA',
+        # insert/update/skip) run in the scraper's GameSink; written in one transaction per call
+        sink = game_sink.shared(self.db_path, 'ga', normalize=normalize_team_for_id, date_column='game_date',
+                                league_match=lambda existing, league: existing == 'GA')
 
         saved = 0
         merged = 0
         skipped = 0
+        failed_before = sink.failures()
 
         for game in games:
             try:
-                home_norm = normalize_team_for_id(game.get('home_team', ''))
-                away_norm = normalize_team_for_id(game.get('away_team', ''))
-
-                # Step 1: Try exact game_id match
-                cursor.execute("""
-                    SELECT rowid, home_score, away_score, home_team, away_team
-                    FROM games WHERE game_id = ?
-                """, (game['game_id'],))
-                existing = cursor.fetchone()
-
-                # Step 2: If no exact match, fuzzy match on ALL games
-                if not existing:
-                    cursor.execute("""
-                        SELECT rowid, home_score, away_score, home_team, away_team
-                        FROM games
-                        WHERE game_date = ? AND age_group = ? AND league = 'GA'
-                    """, (game['game_date'], game['age_group']))
-
-                    for row in cursor.fetchall():
-                        existing_home = normalize_team_for_id(row[3] or '')
-                        existing_away = normalize_team_for_id(row[4] or '')
-                        # Match if teams match in either order
-                        if (home_norm == existing_home and away_norm == existing_away) or \
-                           (home_norm == existing_away and away_norm == existing_home):
-                            existing = row
-                            break
-
-                # Step 3: Decide action based on what we found
-                if existing:
-                    rowid, old_home, old_away, old_home_team, old_away_team = existing
-                    existing_has_scores = old_home is not None and old_away is not None
-                    new_has_scores = game.get('home_score') is not None
-
-                    if new_has_scores and not existing_has_scores:
-                        # Update: existing game missing scores, new data has scores
-                        cursor.execute("""
-                            UPDATE games SET
-                                home_score = ?, away_score = ?,
-                                game_status = 'completed',
-                                scraped_at = ?
-                            WHERE rowid = ?
-                        """, (game.get('home_score'), game.get('away_score'),
-                              game['scraped_at'], rowid))
-                        if cursor.rowcount > 0:
-                            merged += 1
-                    else:
-                        # Skip: game already exists
-                        skipped += 1
+                action = sink.add({
+                    'game_id': game['game_id'], 'age_group': game['age_group'], 'game_date': game['game_date'],
+                    'game_time': game.get('game_time', ''), 'home_team': game['home_team'], 'away_team': game['away_team'],
+                    'home_score': game.get('home_score'), 'away_score': game.get('away_score'),
+                    'conference': game.get('conference', ''), 'location': game.get('location', ''),
+                    'scraped_at': game['scraped_at'], 'source_url': game['source_url'],
+                    'game_status': game['game_status'], 'league': game['league'], 'gender': 'Girls',
+                }, scraped_at=game['scraped_at'])
+                if action == 'inserted':
+                    saved += 1
+                elif action == 'updated':
+                    merged += 1
                 else:
-                    # Insert: no matching game found
-                    cursor.execute("""
-                        INSERT INTO games (
-                            game_id, age_group, game_date, game_time,
-                            home_team, away_team, home_score, away_score,
-                            conference, location, scraped_at, source_url,
-                            game_status, league, gender
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'Girls')
-                    """, (
-                        game['game_id'], game['age_group'], game['game_date'],
-                        game.get('game_time', ''), game['home_team'], game['away_team'],
-                        game.get('home_score'), game.get('away_score'),
-                        game.get('conference', ''), game.get('location', ''),
-                        game['scraped_at'], game['source_url'],
-                        game['game_status'], game['league']
-                    ))
-                    
-                    if cursor.rowcount > 0:
-                        saved += 1
-                        
+                    skipped += 1
             except Exception as e:
                 if self.debug:
                     print(f"    ⚠️ DB error: {e}")
-        
-        conn.commit()
-        conn.close()
-        
+
+        try:
+            sink.flush()
+        except Exception as e:
+            if self.debug:
+                print(f"    ⚠️ DB error: {e}")
+        # Games in a batch the sink could not write were dropped; count only what was written
+        failed_inserts, failed_updates = (now - before for now, before in zip(sink.failures(), failed_before))
+        saved -= failed_inserts
+        merged -= failed_updates
+
         if skipped > 0:
             print(f"    ⚠️ Skipped {skipped} duplicate games (team already has game on that date)")
         
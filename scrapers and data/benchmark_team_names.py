@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark team_names.py against the per-call re.sub loops it replaced.
+
+For every normalization profile, runs the distinct team names from the database
+(games.home_team/away_team + teams.team_name) through:
+  legacy      - the old style: re.sub(pattern_string, ...) per rule, one word at a time
+  compiled    - team_names rules, cold cache (first pass over the corpus)
+  memoized    - normalize_many() over the game rows (repeated names hit the LRU cache)
+
+Outputs are compared name by name so a speedup never hides a behaviour change.
+
+USAGE:
+  python benchmark_team_names.py                  # Auto-find seedlinedata.db
+  python benchmark_team_names.py path/to/data.db  # Specific database
+"""
+
+import argparse
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import team_names
+
+
+def find_database():
+    for candidate in [Path('seedlinedata.db'), Path(__file__).parent / 'seedlinedata.db', Path('../seedlinedata.db')]:
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def load_corpus(db_path):
+    """Return (distinct names, every game-side name) from the database"""
+    conn = sqlite3.connect(db_path)
+    game_names = [row[0] for row in conn.execute("SELECT home_team FROM games UNION ALL SELECT away_team FROM games")
+                  if row[0]]
+    team_rows = [row[0] for row in conn.execute("SELECT team_name FROM teams WHERE team_name IS NOT NULL")]
+    conn.close()
+    distinct = sorted(set(game_names) | set(team_rows))
+    return distinct, game_names
+
+
+def legacy_normalize(name, profile):
+    """The pre-team_names approach: uncompiled re.sub per rule, per call"""
+    spec = team_names.PROFILES[profile]
+    if not name:
+        return spec['empty'] if spec['empty'] is not None else name
+    result = name.lower().strip()
+    for step in spec['steps']:
+        kind = step[0]
+        if kind == 'sub':
+            result = re.sub(step[1], step[2], result, flags=step[3])
+        elif kind == 'words':
+            for word in step[1]:
+                result = re.sub(r'\b' + word + r'\b', '', result, flags=re.I)
+        elif kind == 'strip':
+            result = result.strip()
+        elif kind == 'collapse':
+            result = ' '.join(result.split())
+        elif kind == 'alnum':
+            result = re.sub(r'[^a-z0-9]', '', result)[:step[1]]
+    if spec['empty'] is not None and not result:
+        return spec['empty']
+    return result
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(db_path):
+    distinct, game_names = load_corpus(db_path)
+
+    print(f"\n{'='*80}")
+    print("[CHART] TEAM NAME NORMALIZATION BENCHMARK")
+    print(f"{'='*80}")
+    print(f"Database: {db_path}")
+    print(f"Distinct names: {len(distinct):,}   Game-side names: {len(game_names):,}")
+
+    print(f"\n{'Profile':<14} {'Legacy':>9} {'Compiled':>9} {'Names/s (legacy)':>17} {'Names/s (compiled)':>19} "
+          f"{'Speedup':>8} {'Games (memo)':>13}  Match")
+    print("-" * 104)
+    all_match = True
+    for profile in team_names.PROFILES:
+        team_names._normalize.cache_clear()
+        legacy, legacy_t = timed(lambda: [legacy_normalize(name, profile) for name in distinct])
+        compiled, compiled_t = timed(lambda: [team_names.normalize(name, profile) for name in distinct])
+        memo, memo_t = timed(lambda: team_names.normalize_many(game_names, profile))
+        expected = dict(zip(distinct, legacy))
+        match = legacy == compiled and memo == [expected[name] for name in game_names]
+        all_match &= match
+        print(f"{profile:<14} {legacy_t:>8.3f}s {compiled_t:>8.3f}s {len(distinct) / legacy_t:>17,.0f} "
+              f"{len(distinct) / compiled_t:>19,.0f} {legacy_t / compiled_t:>7.1f}x {memo_t:>12.3f}s  "
+              f"{'OK' if match else 'MISMATCH'}")
+    print("-" * 104)
+    print(f"Cache: {team_names.cache_info()}")
+    return all_match
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark shared team-name normalization')
+    parser.add_argument('db_path', nargs='?', default=None, help='Path to database file')
+    args = parser.parse_args()
+
+    db_path = args.db_path or find_database()
+    if not db_path:
+        print("[ERROR] Database not found. Please provide path as argument.")
+        sys.exit(1)
+
+    if not run_benchmark(db_path):
+        print("\n[ERROR] Legacy and compiled results differ")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
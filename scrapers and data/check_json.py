@@ -1,7 +1,11 @@
-import json
+import sys
+from pathlib import Path
 
-with open(r"C:\Users\dugan\Smart Human Dynamics Dropbox\Steve Dugan\Seedline\App FrontEnd\Seedline_App\public\rankings_for_react.json", "r") as f:
-    data = json.load(f)
+sys.path.append(str(Path(__file__).resolve().parent / 'Run Rankings'))
+from rankings_artifact import load_rankings
+
+data = load_rankings(r"C:\Users\dugan\Smart Human Dynamics Dropbox\Steve Dugan\Seedline\App FrontEnd\Seedline_App\public\rankings_for_react.json",
+                     tables=['teamsData'], columns={'teamsData': ['name', 'ageGroup']})
 
 print(f"Total teams in JSON: {len(data['teamsData'])}")
 
@@ -1,10 +1,13 @@
 """Check rank field in rankings JSON."""
-import json
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent / 'Run Rankings'))
+from rankings_artifact import load_rankings
 
 JSON_PATH = r"C:\Users\dugan\Smart Human Dynamics Dropbox\Steve Dugan\Seedline\App FrontEnd\Seedline_App\public\rankings_for_react.json"
 
-with open(JSON_PATH, 'r') as f:
-    data = json.load(f)
+data = load_rankings(JSON_PATH, tables=['teamsData'], columns={'teamsData': ['name', 'rank', 'ageGroup']})
 
 # Check first few teams for rank field
 print('Checking if teams have rank field:')
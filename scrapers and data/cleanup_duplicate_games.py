@@ -18,34 +18,19 @@ Date: 2025-12-22
 
 import sqlite3
 import argparse
-import re
 from collections import defaultdict
 
+import team_names
+
 
 def normalize_team(name):
-    """Normalize team name for duplicate comparison."""
-    name = name.lower().strip()
-
-    # Remove state/region suffixes
-    name = re.sub(r'\s*\(ca\)\s*', ' ', name)
-    name = re.sub(r'\s*\(va\)\s*', ' ', name)
-    name = re.sub(r'\s*s\.?cal\s*', ' ', name)
-    name = re.sub(r'\s*ntx\s*', ' ', name)
-    name = re.sub(r'\s*stx\s*', ' ', name)
-    name = re.sub(r'\s*stxcl\s*', ' ', name)
-    name = re.sub(r'\s*hb koge\s*', ' ', name)
-
-    # Remove ECNL RL team suffixes
-    name = re.sub(r'\s*ecnl\s*rl\s*', ' ', name)
-    name = re.sub(r'\s*g1[0-9]\s*', ' ', name)
-    name = re.sub(r'\s*b1[0-9]\s*', ' ', name)
-
-    # Remove Virginia prefix patterns
-    name = re.sub(r'^virginia', '', name)
-
-    # Remove extra spaces
-    name = ' '.join(name.split())
-    return name
+    """Normalize team name for duplicate comparison.
+
+    Strips state/region suffixes ((CA), S.Cal, NTX, HB Koge, ...), ECNL RL and
+    G1x/B1x tags, and a leading "virginia". Rules live in team_names.py
+    (profile 'duplicate').
+    """
+    return team_names.normalize(name, 'duplicate')
 
 
 def find_duplicates_with_normalization(cursor):
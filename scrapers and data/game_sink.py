@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Batched game writes for the league scrapers.
+
+save_npl_game_to_db, save_mls_next_game_to_db, the California scraper's
+save_game_to_db, ECNL's save_games and GA's save_games_to_db all wrote the
+same way: open a connection per game (or per team), set WAL and busy_timeout,
+SELECT by game_id, then SELECT every game on that date and age group and run
+normalize_team_for_id over each candidate in Python, and commit per row.
+
+GameSink keeps one connection for the whole run and does the matching in
+memory:
+
+  - existing games are indexed by (date, age group) bucket, then by the
+    normalized team pair (either order), plus a game_id map. A bucket is
+    loaded with one query the first time a game lands in it (served by
+    idx_games_<date column>_age, created if missing); preload(since) loads
+    every bucket from a date on in one query
+  - add() decides insert / update / skip immediately - same rules as the old
+    functions: exact game_id first, then the fuzzy team-pair match within the
+    league filter; an existing game only gets scores if it had none - and
+    queues the write
+  - queued writes go out in one executemany transaction every flush_size
+    games or flush_interval seconds, on flush() / close(), and at exit;
+    "database is locked" is retried with backoff
+  - a batch that still fails is dropped, not re-queued: the loss is printed,
+    counted in .stats (failed_inserts / failed_updates) and returned by
+    flush(), and the lost games are taken out of the match index so a later
+    scrape of them is inserted again. add() and close_all() never raise for it
+  - counts of inserted / updated / skipped games in .stats
+
+League filters (league_match) mirror the old SQL: LEAGUE_EXACT for
+league = ?, league_contains('NPL') for LIKE '%NPL%', LEAGUE_SAME_PREFIX for
+ECNL's LIKE '%<first word>%'. Matching is case-insensitive for the LIKE
+forms, as SQLite's LIKE was.
+
+One sink per process and database; it is not thread-safe (the scrapers save
+from one thread).
+
+USAGE:
+    from game_sink import GameSink, league_contains
+
+    sink = GameSink(db_path, normalize_team_for_id, league_match=league_contains('NPL'))
+    action = sink.add({'game_id': ..., 'game_date_iso': ..., 'age_group': 'G12',
+                       'home_team': ..., 'away_team': ..., 'league': 'NPL', ...})
+    sink.close()        # flush + close; sink.stats -> {'inserted': ..., 'updated': ..., 'skipped': ...}
+
+    sink = game_sink.shared(db_path, 'npl', normalize=...)    # one sink across per-game calls
+    game_sink.close_all()                                     # end of the scrape
+"""
+
+import atexit
+import sqlite3
+import time
+from datetime import datetime, timezone
+
+FLUSH_SIZE = 200           # Queued writes per transaction
+FLUSH_INTERVAL = 10.0      # Seconds a queued write may wait
+BUSY_TIMEOUT_MS = 30000
+MAX_RETRIES = 3
+
+_open_sinks = []
+_shared = {}               # (db_path, name) -> GameSink, see shared()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LEAGUE FILTERS  (existing league, new game's league) -> bool
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def LEAGUE_EXACT(existing, league):
+    """league = ?"""
+    return existing == league
+
+
+def LEAGUE_SAME_PREFIX(existing, league):
+    """league LIKE '%<first word of the new game's league>%' (ECNL / ECNL RL)"""
+    prefix = league.split()[0] if league else ''
+    return prefix.upper() in (existing or '').upper()
+
+
+def league_contains(token):
+    """league LIKE '%token%'"""
+    token = token.upper()
+    return lambda existing, league: token in (existing or '').upper()
+
+
+def _utc_now():
+    # Same text as SQLite's datetime('now'), which the scrapers used for scraped_at
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SINK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class GameSink:
+    """Deduplicating, batched writer for the games table"""
+
+    def __init__(self, db_path, normalize=None, date_column='game_date_iso', league_match=LEAGUE_EXACT,
+                 fuzzy=True, update_scores=True, flush_size=FLUSH_SIZE, flush_interval=FLUSH_INTERVAL,
+                 max_retries=MAX_RETRIES):
+        self.db_path = str(db_path)
+        self.normalize = normalize
+        self.date_column = date_column
+        self.league_match = league_match
+        self.fuzzy = fuzzy and normalize is not None   # game_id matching only without a normalizer
+        self.update_scores = update_scores
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+
+        self.conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_MS / 1000)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        self._ensure_index()
+
+        # Each known game is an entry: [rowid or None, game_id, league, has_scores]
+        # (rowid None = inserted by this sink, addressed by game_id)
+        self._buckets = {}          # (date, age_group) -> {team pair: [entry, ...]}
+        self._by_game_id = {}       # game_id -> entry
+        self._loaded_since = None   # every bucket with date >= this is loaded
+        self._inserts = {}          # game_id -> row dict, in insertion order
+        self._insert_slots = {}     # game_id -> (bucket key, team pair) of a queued insert
+        self._updates = []          # (home_score, away_score, scraped_at, rowid or None, game_id)
+        self._update_entries = []   # index entry of each queued update
+        self._last_flush = time.monotonic()
+        self.stats = {'inserted': 0, 'updated': 0, 'skipped': 0, 'flushes': 0,
+                      'failed_inserts': 0, 'failed_updates': 0, 'bucket_queries': 0, 'id_queries': 0}
+        _open_sinks.append(self)
+
+    # ─── Index ───────────────────────────────────────────────────────────────
+
+    def _ensure_index(self):
+        """Bucket loads look games up by (date, age group); without an index that is a scan per bucket"""
+        try:
+            with self.conn:
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_games_{self.date_column}_age "
+                                  f"ON games({self.date_column}, age_group)")
+        except sqlite3.Error as e:
+            print(f"[WARN] Could not create games index for {self.date_column}: {e}")
+
+    def _pair(self, home, away):
+        home, away = self.normalize(home or ''), self.normalize(away or '')
+        return (home, away) if home <= away else (away, home)
+
+    def _index(self, bucket_key, row):
+        """Add a DB row (rowid, game_id, home, away, home_score, away_score, league) to the index"""
+        rowid, game_id, home, away, home_score, away_score, league = row
+        entry = self._by_game_id.get(game_id)
+        if entry is None or entry[0] != rowid:  # Reuse the entry if a game_id lookup already made one
+            entry = [rowid, game_id, league, home_score is not None and away_score is not None]
+            if game_id:
+                self._by_game_id.setdefault(game_id, entry)
+        if bucket_key is not None:
+            self._buckets.setdefault(bucket_key, {}).setdefault(self._pair(home, away), []).append(entry)
+        return entry
+
+    def _bucket(self, date, age_group):
+        key = (date, age_group)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = {}
+            if not (self._loaded_since is not None and date is not None and str(date) >= self._loaded_since):
+                self.stats['bucket_queries'] += 1
+                rows = self.conn.execute(f"""
+                    SELECT rowid, game_id, home_team, away_team, home_score, away_score, league
+                    FROM games WHERE {self.date_column} = ? AND age_group = ? ORDER BY rowid
+                """, (date, age_group)).fetchall()
+                for row in rows:
+                    self._index(key, row)
+        return bucket
+
+    def preload(self, since):
+        """Load every game dated `since` (YYYY-MM-DD) or later with one query"""
+        rows = self.conn.execute(f"""
+            SELECT rowid, game_id, home_team, away_team, home_score, away_score, league,
+                   {self.date_column}, age_group
+            FROM games WHERE {self.date_column} >= ? ORDER BY rowid
+        """, (since,)).fetchall()
+        already_loaded = set(self._buckets)
+        for row in rows:
+            key = (row[7], row[8])
+            if key not in already_loaded:
+                self._index(key, row[:7])
+        self._loaded_since = since
+        return len(rows)
+
+    def _lookup_game_id(self, game_id):
+        entry = self._by_game_id.get(game_id)
+        if entry is None and game_id not in self._inserts:
+            self.stats['id_queries'] += 1
+            row = self.conn.execute("""
+                SELECT rowid, game_id, home_team, away_team, home_score, away_score, league
+                FROM games WHERE game_id = ?
+            """, (game_id,)).fetchone()
+            if row:
+                entry = self._index(None, row)
+        return entry
+
+    # ─── Writes ──────────────────────────────────────────────────────────────
+
+    def add(self, row, scraped_at=None, match_date=None):
+        """
+        Insert, update or skip one game. `row` maps games columns to values and
+        needs game_id, the date column, age_group, home_team, away_team and
+        league; match_date overrides the date used for the fuzzy match.
+        Returns 'inserted', 'updated' or 'skipped'.
+        """
+        game_id = row['game_id']
+        if self.fuzzy:
+            bucket = self._bucket(match_date or row.get(self.date_column), row.get('age_group'))
+            pair = self._pair(row.get('home_team'), row.get('away_team'))
+
+        # Step 1: exact game_id, then Step 2: same teams (either order) on that date/age/league
+        entry = self._lookup_game_id(game_id)
+        if entry is None and self.fuzzy:
+            league = row.get('league') or ''
+            for candidate in bucket.get(pair, ()):
+                if self.league_match(candidate[2], league):
+                    entry = candidate
+                    break
+
+        # Step 3: decide
+        if entry is not None:
+            new_has_scores = row.get('home_score') is not None
+            if self.update_scores and new_has_scores and not entry[3]:
+                entry[3] = True
+                pending = self._inserts.get(entry[1]) if entry[0] is None else None
+                if pending is not None:
+                    pending.update(home_score=row.get('home_score'), away_score=row.get('away_score'),
+                                   game_status='completed')
+                else:
+                    self._updates.append((row.get('home_score'), row.get('away_score'),
+                                          scraped_at or _utc_now(), entry[0], entry[1]))
+                    self._update_entries.append(entry)
+                action = 'updated'
+            else:
+                action = 'skipped'
+        else:
+            row = dict(row)
+            row.setdefault('scraped_at', scraped_at or _utc_now())
+            self._inserts[game_id] = row
+            entry = [None, game_id, row.get('league'), row.get('home_score') is not None and row.get('away_score') is not None]
+            self._by_game_id[game_id] = entry
+            if self.fuzzy:
+                bucket.setdefault(pair, []).append(entry)
+                self._insert_slots[game_id] = (match_date or row.get(self.date_column), row.get('age_group')), pair
+            action = 'inserted'
+
+        self.stats[action] += 1
+        if (len(self._inserts) + len(self._updates) >= self.flush_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+        return action
+
+    def flush(self):
+        """
+        Write queued inserts and updates in one transaction. Returns how many
+        of them were lost (0 when the write succeeded).
+        """
+        self._last_flush = time.monotonic()
+        if not self._inserts and not self._updates:
+            return 0
+        groups = {}
+        for row in self._inserts.values():
+            groups.setdefault(tuple(row), []).append(tuple(row.values()))
+        by_rowid = [(h, a, s, rowid) for h, a, s, rowid, _ in self._updates if rowid is not None]
+        by_game_id = [(h, a, s, game_id) for h, a, s, rowid, game_id in self._updates if rowid is None]
+
+        for attempt in range(self.max_retries):
+            try:
+                with self.conn:
+                    for columns, values in groups.items():
+                        self.conn.executemany(
+                            f"INSERT OR IGNORE INTO games ({', '.join(columns)}) "
+                            f"VALUES ({', '.join('?' * len(columns))})", values)
+                    update = """UPDATE games SET home_score = ?, away_score = ?, game_status = 'completed',
+                                scraped_at = ? WHERE {} = ?"""
+                    if by_rowid:
+                        self.conn.executemany(update.format('rowid'), by_rowid)
+                    if by_game_id:
+                        self.conn.executemany(update.format('game_id'), by_game_id)
+                break
+            except sqlite3.Error as e:
+                if "locked" in str(e).lower() and attempt < self.max_retries - 1:
+                    time.sleep(2 + attempt * 3)  # Wait 2s, 5s
+                    continue
+                return self._drop_batch(e)
+        self._clear_queue()
+        self.stats['flushes'] += 1
+        return 0
+
+    def _clear_queue(self):
+        self._inserts.clear()
+        self._insert_slots.clear()
+        self._updates.clear()
+        self._update_entries.clear()
+
+    def _drop_batch(self, error):
+        """Give up on the queued writes: count them, and forget them in the match index"""
+        lost_inserts, lost_updates = len(self._inserts), len(self._updates)
+        print(f"[WARN] Could not write {lost_inserts} new and {lost_updates} updated games "
+              f"to {self.db_path}: {error}")
+        for game_id in self._inserts:
+            entry = self._by_game_id.pop(game_id, None)
+            slot = self._insert_slots.get(game_id)
+            if entry is not None and slot is not None:
+                candidates = self._buckets.get(slot[0], {}).get(slot[1], [])
+                candidates[:] = [c for c in candidates if c is not entry]
+        for entry in self._update_entries:
+            entry[3] = False    # Still without scores in the database
+        self.stats['failed_inserts'] += lost_inserts
+        self.stats['failed_updates'] += lost_updates
+        self._clear_queue()
+        return lost_inserts + lost_updates
+
+    def failures(self):
+        """(failed_inserts, failed_updates) so far - diff two calls to see what a save lost"""
+        return self.stats['failed_inserts'], self.stats['failed_updates']
+
+    def close(self):
+        if self.conn is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self.conn.close()
+            self.conn = None
+            if self in _open_sinks:
+                _open_sinks.remove(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def shared(db_path, name, **options):
+    """
+    The process-wide sink `name` for db_path, created with `options` on first
+    use (or after close_all()). For save functions that are called per game.
+    """
+    key = (str(db_path), name)
+    sink = _shared.get(key)
+    if sink is None or sink.conn is None:
+        sink = _shared[key] = GameSink(db_path, **options)
+    return sink
+
+
+@atexit.register
+def close_all():
+    """Flush and close every open sink (also runs at interpreter exit)"""
+    for sink in list(_open_sinks):
+        try:
+            sink.close()
+        except sqlite3.Error as e:
+            print(f"[WARN] Could not write queued games to {sink.db_path}: {e}")
@@ -5,11 +5,15 @@ city/state from team names.
 """
 
 import json
+import sys
 import time
 from pathlib import Path
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
 
+sys.path.append(str(Path(__file__).resolve().parent / 'Run Rankings'))
+from rankings_artifact import load_rankings
+
 # City patterns that appear in team names
 CITY_PATTERNS = {
     'detroit': ('Detroit', 'MI'),
@@ -187,8 +191,9 @@ def main():
 
     print(f"Loading data...")
 
-    with open(rankings_path, 'r') as f:
-        rankings = json.load(f)
+    # Only the team columns used below (columnar artifact when available, else the JSON)
+    rankings = load_rankings(rankings_path, tables=['teamsData'],
+                             columns={'teamsData': ['club', 'name', 'state']})
 
     with open(addresses_path, 'r') as f:
         addresses = json.load(f)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Concurrent Playwright pages for the league scrapers.
+
+The Playwright scrapers (ECNL, NPL, California, MLS NEXT) each drive one page
+through every team in turn and sleep a fixed couple of seconds between teams,
+so a full run is the sum of every page load, scroll and sleep. PagePool runs
+N workers on one browser instead:
+
+  - each worker has its own context (cookies, cache) and page, opened once and
+    reused for every item it takes; a page that crashed or was closed is
+    replaced before the next item
+  - items come from one shared queue - a worker takes the next item as soon as
+    it is free, so one slow team does not hold back the rest
+  - politeness is per host, not global: HostLimiter caps how many pages work
+    on a host at once and spaces the start of each item on that host by
+    min_interval plus a random 0..jitter seconds. The ceiling on requests to a
+    host is set by those limits, whatever the number of workers
+
+The pool runs on one event loop, so a blocking call in a handler stalls every
+worker: run save functions that sleep between retries through
+asyncio.to_thread. game_sink is the exception - its connection belongs to the
+loop thread, so handlers call it directly.
+
+USAGE:
+    from page_pool import PagePool, HostLimiter
+
+    limiter = HostLimiter(max_concurrent=4, min_interval=2.0, jitter=1.0)
+    async with PagePool(browser, workers=4, limiter=limiter,
+                        context_options={'viewport': {'width': 1920, 'height': 1080}}) as pool:
+        await pool.run(teams, handle_team)       # await handle_team(page, team, index)
+                                                 # index is 1-based, in list order
+"""
+
+import asyncio
+import random
+import time
+from urllib.parse import urlparse
+
+WORKERS = 4                # Pages open at once
+HOST_CONCURRENCY = 4       # Pages working on one host at once
+MIN_INTERVAL = 2.0         # Seconds between item starts on one host
+JITTER = 1.0               # Up to this many seconds added to each interval
+
+
+def host_of(url):
+    """Lowercased host[:port] of url ('' for a missing or relative url)"""
+    return urlparse(url or '').netloc.lower()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PER-HOST POLITENESS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class _Host:
+    def __init__(self, max_concurrent):
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self.lock = asyncio.Lock()
+        self.next_start = 0.0   # time.monotonic() before which no new item may start
+
+
+class _Slot:
+    def __init__(self, limiter, url):
+        self.limiter = limiter
+        self.host = limiter._host(host_of(url))
+
+    async def __aenter__(self):
+        host = self.host
+        await host.slots.acquire()
+        try:
+            async with host.lock:
+                wait = host.next_start - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                host.next_start = (time.monotonic() + self.limiter.min_interval
+                                   + random.uniform(0, self.limiter.jitter))
+        except BaseException:
+            host.slots.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.host.slots.release()
+
+
+class HostLimiter:
+    """At most max_concurrent items per host, started min_interval + jitter seconds apart"""
+
+    def __init__(self, max_concurrent=HOST_CONCURRENCY, min_interval=MIN_INTERVAL, jitter=JITTER):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self.min_interval = max(0.0, min_interval)
+        self.jitter = max(0.0, jitter)
+        self._hosts = {}
+
+    def _host(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _Host(self.max_concurrent)
+        return state
+
+    def slot(self, url):
+        """async with limiter.slot(url): - hold one of url's host slots for the block"""
+        return _Slot(self, url)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# POOL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class PagePool:
+    """N worker pages on one browser, fed from a shared queue"""
+
+    def __init__(self, browser, workers=WORKERS, limiter=None, context_options=None):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.browser = browser
+        self.workers = workers
+        self.limiter = limiter or HostLimiter()
+        self.context_options = context_options or {}
+        self._contexts = []
+        self.stats = {'items': 0, 'errors': 0, 'pages_replaced': 0}
+
+    async def _open_page(self, slot):
+        context = await self.browser.new_context(**self.context_options)
+        if slot < len(self._contexts):
+            await self._close_context(self._contexts[slot])
+            self._contexts[slot] = context
+        else:
+            self._contexts.append(context)
+        return await context.new_page()
+
+    @staticmethod
+    async def _close_context(context):
+        try:
+            await context.close()
+        except Exception:
+            pass  # Browser already gone or context crashed
+
+    async def run(self, items, handler, url=lambda item: item.get('url')):
+        """
+        await handler(page, item, index) for every item, `workers` at a time.
+        url(item) picks the host the item counts against. An exception from
+        handler is counted in stats['errors'] and the worker carries on with a
+        fresh page (handlers that record their own failures re-raise so the
+        page that failed is not reused).
+        """
+        queue = asyncio.Queue()
+        for index, item in enumerate(items, 1):
+            queue.put_nowait((index, item))
+        worker_count = min(self.workers, queue.qsize())
+
+        async def worker(slot):
+            page = await self._open_page(slot)
+            while True:
+                try:
+                    index, item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                if page.is_closed():
+                    page = await self._open_page(slot)
+                    self.stats['pages_replaced'] += 1
+                try:
+                    async with self.limiter.slot(url(item)):
+                        await handler(page, item, index)
+                except Exception as e:
+                    print(f"[WARN] Page worker {slot + 1}: opening a new page after: {e}")
+                    self.stats['errors'] += 1
+                    page = await self._open_page(slot)
+                    self.stats['pages_replaced'] += 1
+                self.stats['items'] += 1
+
+        await asyncio.gather(*(worker(slot) for slot in range(worker_count)))
+
+    async def close(self):
+        for context in self._contexts:
+            await self._close_context(context)
+        self._contexts.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
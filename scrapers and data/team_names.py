@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Shared team-name normalization for the scrapers, cleanup scripts and ranker.
+
+Every league scraper used to carry its own normalize_team_for_id(), the ranker
+had four copies of its address-lookup normalizer, and each one ran its regex
+list with re.sub(pattern_string, ...) on every call. This module holds all of
+those rule sets as named PROFILES, compiled once:
+
+  - consecutive whole-word removals are fused into one \\b(?:a|b|c)\\b pattern
+    (removing a whole word never creates a new word, so one pass == N passes)
+  - ordered steps (suffixes, age patterns) stay in their original order, since
+    "x rl elite" -> "x rl" depends on it
+  - results are memoized per (profile, name) with an LRU cache
+
+The profiles reproduce the old functions exactly - game IDs built from them are
+stored in the database, so a profile must never change output for existing
+names. Note that the id profiles lowercase first, so their case-sensitive age
+patterns (G12, 12G, B12, 2013G) never match; they are kept so IDs stay stable.
+
+USAGE:
+    from team_names import normalize, normalize_many
+
+    normalize("Slammers FC HB Koge")               # default profile (ecnl_id)
+    normalize("Beach FC (CA) G12", "duplicate")    # cleanup_duplicate_games rules
+    normalize_many(df['home_team'], "lookup")      # batch: one call per distinct name
+
+Benchmark: python benchmark_team_names.py [db_path]
+"""
+
+import re
+from functools import lru_cache
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RULE DEFINITIONS
+# ═══════════════════════════════════════════════════════════════════════════════
+# A profile is an ordered list of steps applied to name.lower().strip():
+#   ('sub', pattern, replacement, flags)  - re.sub
+#   ('words', [word, ...])                - remove each whole word, case-insensitive
+#   ('strip',)                            - str.strip()
+#   ('collapse',)                         - collapse runs of whitespace to one space
+#   ('alnum', max_length)                 - keep [a-z0-9], truncate
+# plus what to return for empty input: 'unknown' for the id profiles, the input
+# itself for the others. Empty output of an id profile is also 'unknown'.
+
+_ID_SUFFIXES = [
+    (r'\s*-\s*$', ''),                   # trailing dash
+    (r'\s+(sc|fc)\s*$', ''),             # SC/FC at end
+    (r'\s+soccer\s*club\s*$', ''),       # Soccer Club
+    (r'\s+futbol\s*club\s*$', ''),       # Futbol Club
+]
+
+
+def _id_profile(suffixes, words, age_patterns, strip_parens=False):
+    steps = []
+    if strip_parens:
+        # ECNL V76b: Remove parenthetical regional identifiers - (North), (Shore), ...
+        steps.append(('sub', r'\s*\([^)]*\)', '', 0))
+    steps += [('sub', pattern, repl, re.I) for pattern, repl in suffixes]
+    steps.append(('words', words))
+    steps += [('sub', pattern, '', flags) for pattern, flags in age_patterns]
+    steps.append(('alnum', 30))
+    return {'steps': steps, 'empty': 'unknown'}
+
+
+PROFILES = {
+    # ECNL scraper (V76b) - California rules plus parenthetical removal
+    'ecnl_id': _id_profile(
+        _ID_SUFFIXES + [
+            (r'\s+football\s*club\s*$', ''),
+            (r'\s+academy\s*$', ''),
+            (r'\s+united\s*$', ''),
+            (r'\s+club\s*$', ''),
+            (r'\s+rl\s*$', ''),
+            (r'\s+elite\s*$', ''),
+        ],
+        ['soccer', 'futbol', 'football', 'fc', 'sc', 'academy', 'club', 'united'],
+        [(r'\s*\d{2}G\s*', 0), (r'\s*G\d{2}\s*', 0), (r'\s*U\d{2}\s*', re.I), (r'\s*B\d{2}\s*', 0)],
+        strip_parens=True),
+
+    # California regional leagues scraper
+    'california_id': _id_profile(
+        _ID_SUFFIXES + [
+            (r'\s+football\s*club\s*$', ''),
+            (r'\s+academy\s*$', ''),
+            (r'\s+united\s*$', ''),
+            (r'\s+club\s*$', ''),
+            (r'\s+rl\s*$', ''),
+            (r'\s+elite\s*$', ''),
+        ],
+        ['soccer', 'futbol', 'football', 'fc', 'sc', 'academy', 'club', 'united'],
+        [(r'\s*\d{2}G\s*', 0), (r'\s*G\d{2}\s*', 0), (r'\s*U\d{2}\s*', re.I), (r'\s*B\d{2}\s*', 0)]),
+
+    # Girls Academy league scraper
+    'ga_id': _id_profile(
+        _ID_SUFFIXES + [
+            (r'\s+academy\s*$', ''),
+            (r'\s+united\s*$', ''),
+            (r'\s+club\s*$', ''),
+        ],
+        ['soccer', 'futbol', 'fc', 'sc', 'academy', 'club', 'united'],
+        [(r'\s*G\d{2}\s*', 0), (r'\s*U\d{2}\s*', re.I)]),
+
+    # ASPIRE league scraper - GA rules plus the league name
+    'aspire_id': _id_profile(
+        _ID_SUFFIXES + [
+            (r'\s+academy\s*$', ''),
+            (r'\s+united\s*$', ''),
+            (r'\s+club\s*$', ''),
+        ],
+        ['soccer', 'futbol', 'fc', 'sc', 'academy', 'club', 'united', 'aspire'],
+        [(r'\s*G\d{2}\s*', 0), (r'\s*U\d{2}\s*', re.I)]),
+
+    # US Club NPL league scraper
+    'npl_id': _id_profile(
+        _ID_SUFFIXES + [
+            (r'\s+academy\s*$', ''),
+            (r'\s+united\s*$', ''),
+            (r'\s+club\s*$', ''),
+            (r'\s+npl\s*$', ''),
+            (r'\s+premier\s*$', ''),
+            (r'\s+elite\s*$', ''),
+        ],
+        ['soccer', 'futbol', 'fc', 'sc', 'academy', 'club', 'united', 'npl'],
+        [(r'\s*G\d{2}\s*', 0), (r'\s*B\d{2}\s*', 0), (r'\s*U\d{2}\s*', re.I), (r'\s*\d{4}[GB]\s*', 0)]),
+
+    # cleanup_duplicate_games.py - "Beach FC" vs "Beach FC (CA)", "Slammers FC HB Koge", ...
+    'duplicate': {
+        'steps': [
+            # Remove state/region suffixes
+            ('sub', r'\s*\(ca\)\s*', ' ', 0),
+            ('sub', r'\s*\(va\)\s*', ' ', 0),
+            ('sub', r'\s*s\.?cal\s*', ' ', 0),
+            ('sub', r'\s*ntx\s*', ' ', 0),
+            ('sub', r'\s*stx\s*', ' ', 0),
+            ('sub', r'\s*stxcl\s*', ' ', 0),
+            ('sub', r'\s*hb koge\s*', ' ', 0),
+            # Remove ECNL RL team suffixes
+            ('sub', r'\s*ecnl\s*rl\s*', ' ', 0),
+            ('sub', r'\s*g1[0-9]\s*', ' ', 0),
+            ('sub', r'\s*b1[0-9]\s*', ' ', 0),
+            # Remove Virginia prefix patterns
+            ('sub', r'^virginia', '', 0),
+            ('collapse',),
+        ],
+        'empty': None,
+    },
+
+    # Ranker address/state/club lookups (V43) - drop the age/league tail
+    'lookup': {
+        'steps': [
+            ('sub', r'\s+(\d+g|g\d+|b\d+)(\s+ga|\s+ecnl|\s+rl)?\s*$', '', re.I),
+            ('sub', r'\s+(ga|ecnl|ecnl-rl|rl|aspire|npl)\s*$', '', re.I),
+            ('strip',),
+        ],
+        'empty': None,
+    },
+}
+
+DEFAULT_PROFILE = 'ecnl_id'
+CACHE_SIZE = 65536  # Per process; well above the distinct team names in the database
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]')
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COMPILATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _compile_profile(profile):
+    """Turn a profile's step list into a list of callables on the lowered name"""
+    ops = []
+    for step in profile['steps']:
+        kind = step[0]
+        if kind == 'sub':
+            _, pattern, repl, flags = step
+            ops.append(lambda s, rx=re.compile(pattern, flags), repl=repl: rx.sub(repl, s))
+        elif kind == 'words':
+            rx = re.compile(r'\b(?:' + '|'.join(step[1]) + r')\b', re.I)
+            ops.append(lambda s, rx=rx: rx.sub('', s))
+        elif kind == 'strip':
+            ops.append(str.strip)
+        elif kind == 'collapse':
+            ops.append(lambda s: ' '.join(s.split()))
+        elif kind == 'alnum':
+            ops.append(lambda s, n=step[1]: _NON_ALNUM.sub('', s)[:n])
+        else:
+            raise ValueError(f"Unknown normalization step: {kind!r}")
+    return ops
+
+
+_COMPILED = {name: _compile_profile(profile) for name, profile in PROFILES.items()}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize(name, profile):
+    result = name.lower().strip()
+    for op in _COMPILED[profile]:
+        result = op(result)
+    return result
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PUBLIC API
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def normalize(name, profile=DEFAULT_PROFILE):
+    """Normalize one team name with the given profile (memoized)"""
+    if profile not in PROFILES:
+        raise KeyError(f"Unknown normalization profile: {profile!r} (have: {', '.join(PROFILES)})")
+    empty = PROFILES[profile]['empty']
+    if not name:
+        return empty if empty is not None else name
+    result = _normalize(name, profile)
+    if empty is not None and not result:
+        return empty
+    return result
+
+
+def normalize_many(names, profile=DEFAULT_PROFILE):
+    """Normalize an iterable of names, running the rules once per distinct name.
+    Returns a list in input order."""
+    seen = {}
+    results = []
+    for name in names:
+        try:
+            result = seen[name]
+        except KeyError:
+            result = seen[name] = normalize(name, profile)
+        except TypeError:  # unhashable
+            result = normalize(name, profile)
+        results.append(result)
+    return results
+
+
+def cache_info():
+    """LRU statistics for the shared normalize() cache"""
+    return _normalize.cache_info()